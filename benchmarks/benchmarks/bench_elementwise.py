@@ -128,3 +128,44 @@ class Elementwise(Benchmark):
 
     def time_tanh(self, *args):
         self.np.tanh(self.a)
+
+
+# asv run --python=python --bench ElementwiseDispatch
+# measures per-call overhead on small arrays, where it dominates the kernel
+# time; `*_generic` cases pass `order="C"` which bypasses the dispatch cache
+class ElementwiseDispatch(Benchmark):
+    executors = {"dpnp": dpnp, "numpy": numpy}
+    params = [
+        ["dpnp", "numpy"],
+        [1, 2**10, 2**13],
+        ["float32", "int64"],
+    ]
+    param_names = ["executor", "size", "dtype"]
+
+    def setup(self, executor, size, dtype):
+        self.np = self.executors[executor]
+        dt = getattr(self.np, dtype)
+        self.a = self.np.arange(size, dtype=dt)
+        self.b = self.np.ones(size, dtype=dt)
+
+        # warm up the dispatch cache
+        self.np.add(self.a, self.b)
+        self.np.negative(self.a)
+
+    def time_add(self, *args):
+        self.np.add(self.a, self.b)
+
+    def time_add_generic(self, *args):
+        self.np.add(self.a, self.b, order="C")
+
+    def time_add_scalar(self, *args):
+        self.np.add(self.a, 2)
+
+    def time_add_scalar_generic(self, *args):
+        self.np.add(self.a, 2, order="C")
+
+    def time_negative(self, *args):
+        self.np.negative(self.a)
+
+    def time_negative_generic(self, *args):
+        self.np.negative(self.a, order="C")
@@ -151,6 +151,40 @@ class Lstsq(Benchmark):
         np.linalg.lstsq(self.a, self.b, rcond=-1)
 
 
+class BatchedMatmul(Benchmark):
+    params = [
+        [dpnp, numpy],
+        [(10000, 8), (1000, 32), (10, 512)],
+        ["C", "F"],
+        ["new", "C", "F"],
+    ]
+    param_names = ["executor", "batch_size_n", "order", "out_order"]
+
+    @staticmethod
+    def _stack(np, a, order):
+        a = np.asarray(a)
+        if order == "F":
+            # a batch of f-contiguous matrices
+            a = np.ascontiguousarray(np.swapaxes(a, -1, -2))
+            a = np.swapaxes(a, -1, -2)
+        return a
+
+    def setup(self, np, batch_size_n, order, out_order):
+        batch_size, n = batch_size_n
+        a = numpy.random.rand(batch_size, n, n)
+        b = numpy.random.rand(batch_size, n, n)
+
+        self.a = self._stack(np, a, order)
+        self.b = self._stack(np, b, order)
+        if out_order == "new":
+            self.out = None
+        else:
+            self.out = self._stack(np, numpy.empty_like(a), out_order)
+
+    def time_matmul(self, np, *args):
+        np.matmul(self.a, self.b, out=self.out)
+
+
 # class Einsum(Benchmark):
 # param_names = ['dtype']
 # params = [[np.float64]]
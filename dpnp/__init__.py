@@ -74,6 +74,7 @@ from . import fft as fft
 from . import linalg as linalg
 from . import random as random
 from . import scipy as scipy
+from . import stats as stats
 
 # =============================================================================
 # Data types
@@ -273,6 +274,7 @@ from .dpnp_iface_types import dtype
 from .dpnp_iface_functional import (
     apply_along_axis,
     apply_over_axes,
+    fuse,
     piecewise,
 )
 
@@ -315,6 +317,7 @@ from .dpnp_flatiter import flatiter
 from .dpnp_iface_linearalgebra import (
     dot,
     einsum,
+    einsum_expression,
     einsum_path,
     inner,
     kron,
@@ -514,6 +517,7 @@ from .dpnp_iface_searching import (
     where,
 )
 from .dpnp_iface_sorting import (
+    argpartition,
     argsort,
     partition,
     sort,
@@ -536,6 +540,8 @@ from .dpnp_iface_nanfunctions import (
     nanmean,
     nanmedian,
     nanmin,
+    nanpercentile,
+    nanquantile,
     nanstd,
     nanvar,
 )
@@ -548,9 +554,12 @@ from .dpnp_iface_statistics import (
     cov,
     max,
     mean,
+    mean_var,
     median,
     min,
+    percentile,
     ptp,
+    quantile,
     std,
     var,
 )
@@ -771,6 +780,7 @@ __all__ += [
 __all__ += [
     "apply_along_axis",
     "apply_over_axes",
+    "fuse",
     "piecewise",
 ]
 
@@ -809,6 +819,7 @@ __all__ += [
 __all__ += [
     "dot",
     "einsum",
+    "einsum_expression",
     "einsum_path",
     "inner",
     "kron",
@@ -993,6 +1004,7 @@ __all__ += [
 __all__ += [
     "argmax",
     "argmin",
+    "argpartition",
     "argwhere",
     "argsort",
     "count_nonzero",
@@ -1020,15 +1032,20 @@ __all__ += [
     "histogramdd",
     "max",
     "mean",
+    "mean_var",
     "median",
     "min",
     "nanmax",
     "nanmean",
     "nanmedian",
     "nanmin",
+    "nanpercentile",
+    "nanquantile",
     "nanstd",
     "nanvar",
+    "percentile",
     "ptp",
+    "quantile",
     "std",
     "var",
 ]
@@ -1062,7 +1079,7 @@ __all__ += [
 ]
 
 # add submodules
-__all__ += ["exceptions", "fft", "linalg", "random", "scipy"]
+__all__ += ["exceptions", "fft", "linalg", "random", "scipy", "stats"]
 
 
 __version__ = get_versions()["version"]
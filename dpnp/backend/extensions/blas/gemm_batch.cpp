@@ -333,8 +333,14 @@ std::tuple<sycl::event, sycl::event, bool>
         ldb = n;
     }
 #else
+    // Use the storage layout of the 2D base of the result array, so that
+    // the result is written in place and no relayout is needed afterwards.
+    // If the base is both c- and f-contiguous (a single row or column),
+    // column major is used only when both inputs are f-contiguous.
     bool is_row_major = true;
-    if (A_base_is_f_contig && B_base_is_f_contig) {
+    if (C_base_is_f_contig &&
+        (!C_base_is_c_contig || (A_base_is_f_contig && B_base_is_f_contig)))
+    {
         is_row_major = false;
     }
 
@@ -358,10 +364,23 @@ std::tuple<sycl::event, sycl::event, bool>
         }
     }
     else {
-        transA = oneapi::mkl::transpose::N;
-        transB = oneapi::mkl::transpose::N;
-        lda = m;
-        ldb = k;
+        transA = A_base_is_c_contig ? oneapi::mkl::transpose::T
+                                    : oneapi::mkl::transpose::N;
+        transB = B_base_is_c_contig ? oneapi::mkl::transpose::T
+                                    : oneapi::mkl::transpose::N;
+
+        if (transA == oneapi::mkl::transpose::N) {
+            lda = m;
+        }
+        else {
+            lda = k;
+        }
+        if (transB == oneapi::mkl::transpose::N) {
+            ldb = k;
+        }
+        else {
+            ldb = n;
+        }
     }
 #endif // USE_ONEMATH_CUBLAS
 
@@ -26,8 +26,9 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 # *****************************************************************************
 
+import collections
 import warnings
-from functools import wraps
+from functools import partial, wraps
 
 import dpctl.tensor as dpt
 import dpctl.tensor._copy_utils as dtc
@@ -53,6 +54,16 @@ from dpnp.dpnp_utils.dpnp_utils_common import (
     find_buf_dtype_3out,
     find_buf_dtype_4out,
 )
+from dpnp.dpnp_utils.dpnp_utils_fusion import (
+    dpnp_fusion_call,
+    is_fusion_var,
+)
+from dpnp.dpnp_utils.dpnp_utils_ufunc import (
+    dpnp_ufunc_accumulate,
+    dpnp_ufunc_at,
+    dpnp_ufunc_reduce,
+    dpnp_ufunc_reduceat,
+)
 
 __all__ = [
     "DPNPI0",
@@ -75,6 +86,135 @@ __all__ = [
     "resolve_weak_types_2nd_arg_int",
 ]
 
+# Python scalar types supported by the dispatch cache of binary functions
+_SCALAR_TYPES = (bool, int, float, complex)
+
+# Maximum number of entries kept by the dispatch cache of a function
+_DISPATCH_CACHE_SIZE = 32
+
+
+class _DispatchCache:
+    """
+    A least recently used (LRU) cache of resolved data types of an
+    element-wise function.
+
+    The number of entries is bounded by `size`, so the cache does not grow
+    with every new combination of data types and SYCL queues and it does
+    not keep the queues of evicted entries alive.
+
+    """
+
+    def __init__(self, size):
+        self._size = size
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, key):
+        value = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._size:
+            self._entries.popitem(last=False)
+
+
+def _call_where(func, args, out, where, order, dtype):
+    """
+    Evaluate element-wise function `func` only at positions where the mask
+    `where` is ``True``.
+
+    The selected elements of the input arrays are gathered into contiguous
+    buffers, `func` is evaluated on them and the result is scattered into
+    `out`, so the amount of computations and of temporary memory is
+    proportional to the number of ``True`` elements in the mask. The elements
+    of `out` where the mask is ``False`` are left unchanged.
+
+    """
+
+    arrays = [x for x in args if dpnp.is_supported_array_type(x)]
+    if out is not None:
+        dpnp.check_supported_arrays_type(out)
+
+    if where is False:
+        usm_type, exec_q = get_usm_allocations(
+            arrays + ([] if out is None else [out])
+        )
+        where = dpnp.asarray(where, usm_type=usm_type, sycl_queue=exec_q)
+    elif where.dtype != dpnp.bool:
+        raise TypeError(
+            f"Cannot cast `where` array of data type {where.dtype} to "
+            "data type bool"
+        )
+
+    usm_type, exec_q = get_usm_allocations(
+        arrays + [where] + ([] if out is None else [out])
+    )
+    res_shape = dpnp.broadcast_shapes(*[x.shape for x in arrays + [where]])
+    if out is not None:
+        out = dpnp.get_result_array(out)
+        if out.shape != res_shape:
+            raise ValueError(
+                "The shape of input and output arrays are inconsistent. "
+                f"Expected output shape is {res_shape}, got {out.shape}"
+            )
+
+    # gather only the elements selected by the mask
+    mask = dpnp.broadcast_to(where, res_shape)
+    selected = [
+        (
+            dpnp.broadcast_to(x, res_shape)[mask]
+            if dpnp.is_supported_array_type(x)
+            else x
+        )
+        for x in args
+    ]
+    res = func(*selected, dtype=dtype)
+
+    if out is None:
+        if order in ["F", "f"] or (
+            order in ["A", "a", "K", "k"]
+            and all(x.flags.f_contiguous for x in arrays)
+            and not all(x.flags.c_contiguous for x in arrays)
+        ):
+            out_order = "F"
+        else:
+            out_order = "C"
+        out = dpnp.empty(
+            res_shape,
+            dtype=res.dtype,
+            order=out_order,
+            usm_type=usm_type,
+            sycl_queue=exec_q,
+        )
+    elif out.dtype != res.dtype:
+        raise ValueError(
+            f"Output array of type {res.dtype} is needed, got {out.dtype}"
+        )
+
+    # scatter the result back to the output array
+    out[mask] = res
+    return out
+
+
+def _where_scalar(where):
+    """
+    Convert a scalar `where` keyword to Python bool or raise ``TypeError``
+    if it is not a boolean scalar.
+
+    """
+
+    if isinstance(where, (bool, numpy.bool_)):
+        return bool(where)
+    raise TypeError(
+        "`where` must be a boolean scalar or an array of any of supported "
+        f"type, but got {type(where)}"
+    )
+
 
 class DPNPUnaryFunc(UnaryElementwiseFunc):
     """
@@ -160,6 +300,10 @@ class DPNPUnaryFunc(UnaryElementwiseFunc):
         )
         self.__name__ = "DPNPUnaryFunc"
 
+        # maps (dtype, queue) to the resolved result data type or to
+        # ``None`` if the input has to be cast
+        self._dispatch_cache = _DispatchCache(_DISPATCH_CACHE_SIZE)
+
     def __call__(
         self,
         x,
@@ -172,16 +316,38 @@ class DPNPUnaryFunc(UnaryElementwiseFunc):
         subok=True,
         **kwargs,
     ):
+        if (
+            out is None
+            and dtype is None
+            and order == "K"
+            and where is True
+            and subok is True
+            and not kwargs
+            and isinstance(x, dpnp_array)
+        ):
+            res = self._call_cached(x.get_array())
+            if res is not None:
+                return res
+
+        if is_fusion_var(x):
+            # the function is being traced by dpnp.fuse
+            return dpnp_fusion_call(
+                DPNPUnaryFunc.__call__,
+                self,
+                (x,),
+                out=out,
+                where=where,
+                order=order,
+                dtype=dtype,
+                subok=subok,
+                **kwargs,
+            )
+
         if kwargs:
             raise NotImplementedError(
                 f"Requested function={self.name_} with kwargs={kwargs} "
                 "isn't currently supported."
             )
-        elif where is not True:
-            raise NotImplementedError(
-                f"Requested function={self.name_} with where={where} "
-                "isn't currently supported."
-            )
         elif subok is not True:
             raise NotImplementedError(
                 f"Requested function={self.name_} with subok={subok} "
@@ -207,11 +373,24 @@ class DPNPUnaryFunc(UnaryElementwiseFunc):
                 "order must be one of 'C', 'F', 'A', or 'K' " f"(got '{order}')"
             )
 
+        out = self._unpack_out_kw(out)
+        if where is not True:
+            if not dpnp.is_supported_array_type(where):
+                where = _where_scalar(where)
+            if where is not True:
+                return _call_where(
+                    partial(DPNPUnaryFunc.__call__, self),
+                    (x,),
+                    out,
+                    where,
+                    order,
+                    dtype,
+                )
+
         x_usm = dpnp.get_usm_ndarray(x)
         if dtype is not None:
             x_usm = dpt.astype(x_usm, dtype, copy=False)
 
-        out = self._unpack_out_kw(out)
         out_usm = None if out is None else dpnp.get_usm_ndarray(out)
 
         res_usm = super().__call__(x_usm, out=out_usm, order=order)
@@ -219,6 +398,86 @@ class DPNPUnaryFunc(UnaryElementwiseFunc):
             return out
         return dpnp_array._create_from_usm_ndarray(res_usm)
 
+    def _call_cached(self, x):
+        """
+        Evaluate the function on C-contiguous array `x` without casting,
+        taking the result data type from the dispatch cache.
+
+        Return ``None`` if the fast path does not apply, so the call has to
+        go through the generic implementation.
+
+        """
+
+        if not x.flags.c_contiguous:
+            return None
+
+        exec_q = x.sycl_queue
+        key = (x.dtype, exec_q)
+        try:
+            res_dt = self._dispatch_cache[key]
+        except KeyError:
+            buf_dt, res_dt = dtu._find_buf_dtype(
+                x.dtype,
+                self.result_type_resolver_fn_,
+                x.sycl_device,
+                acceptance_fn=self.acceptance_fn_,
+            )
+            if buf_dt is not None:
+                res_dt = None
+            self._dispatch_cache[key] = res_dt
+
+        if res_dt is None:
+            return None
+
+        res = dpt.empty(
+            x.shape, dtype=res_dt, usm_type=x.usm_type, sycl_queue=exec_q
+        )
+        _manager = dpu.SequentialOrderManager[exec_q]
+        ht_ev, unary_ev = self.unary_fn_(
+            x, res, sycl_queue=exec_q, depends=_manager.submitted_events
+        )
+        _manager.add_event_pair(ht_ev, unary_ev)
+        return dpnp_array._create_from_usm_ndarray(res)
+
+    def at(self, a, indices, b=None, /):
+        """
+        Perform unbuffered in place operation on operand `a` for elements
+        specified by `indices`.
+
+        For full documentation refer to :obj:`numpy.ufunc.at`.
+
+        The function is applied once for every occurrence of an index, so
+        repeated indices are applied repeatedly.
+
+        Parameters
+        ----------
+        a : {dpnp.ndarray, usm_ndarray}
+            The array to perform in place operation on.
+        indices : {dpnp.ndarray, usm_ndarray, list, tuple, slice}
+            Index object for indexing into `a`. If `a` has multiple
+            dimensions, `indices` can be a tuple of index objects.
+        b : None, optional
+            Second operand, it has to be ``None`` for a unary function.
+
+            Default: ``None``.
+
+        See also
+        --------
+        :obj:`dpnp.put` : Replace specified elements of an array with given
+                          values.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> a = np.array([1, 2, 3, 4])
+        >>> np.negative.at(a, np.array([0, 1]))
+        >>> a
+        array([-1, -2,  3,  4])
+
+        """
+
+        dpnp_ufunc_at(self, a, indices, b)
+
     def _unpack_out_kw(self, out):
         """Unpack `out` keyword if passed as a tuple."""
 
@@ -640,6 +899,11 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
         )
         self.__name__ = "DPNPBinaryFunc"
 
+        # maps (dtype or scalar type, dtype or scalar type, queue) to the
+        # resolved data types of both arguments and of the result or to
+        # ``None`` if an argument has to be cast
+        self._dispatch_cache = _DispatchCache(_DISPATCH_CACHE_SIZE)
+
     def __call__(
         self,
         x1,
@@ -653,19 +917,44 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
         subok=True,
         **kwargs,
     ):
-        dpnp.check_supported_arrays_type(
-            x1, x2, scalar_type=True, all_scalars=False
-        )
+        if (
+            out is None
+            and dtype is None
+            and order == "K"
+            and where is True
+            and subok is True
+            and not kwargs
+        ):
+            res = self._call_cached(x1, x2)
+            if res is not None:
+                return res
+
+        try:
+            dpnp.check_supported_arrays_type(
+                x1, x2, scalar_type=True, all_scalars=False
+            )
+        except TypeError:
+            if not (is_fusion_var(x1) or is_fusion_var(x2)):
+                raise
+
+            # the function is being traced by dpnp.fuse
+            return dpnp_fusion_call(
+                DPNPBinaryFunc.__call__,
+                self,
+                (x1, x2),
+                out=out,
+                where=where,
+                order=order,
+                dtype=dtype,
+                subok=subok,
+                **kwargs,
+            )
+
         if kwargs:
             raise NotImplementedError(
                 f"Requested function={self.name_} with kwargs={kwargs} "
                 "isn't currently supported."
             )
-        elif where is not True:
-            raise NotImplementedError(
-                f"Requested function={self.name_} with where={where} "
-                "isn't currently supported."
-            )
         elif subok is not True:
             raise NotImplementedError(
                 f"Requested function={self.name_} with subok={subok} "
@@ -677,15 +966,28 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
                 "as an argument, but both were provided."
             )
 
-        x1_usm = dpnp.get_usm_ndarray_or_scalar(x1)
-        x2_usm = dpnp.get_usm_ndarray_or_scalar(x2)
-
         if isinstance(out, tuple):
             if len(out) != self.nout:
                 raise ValueError(
                     "'out' tuple must have exactly one entry per ufunc output"
                 )
             out = out[0]
+
+        if where is not True:
+            if not dpnp.is_supported_array_type(where):
+                where = _where_scalar(where)
+            if where is not True:
+                return _call_where(
+                    partial(DPNPBinaryFunc.__call__, self),
+                    (x1, x2),
+                    out,
+                    where,
+                    order,
+                    dtype,
+                )
+
+        x1_usm = dpnp.get_usm_ndarray_or_scalar(x1)
+        x2_usm = dpnp.get_usm_ndarray_or_scalar(x2)
         out_usm = None if out is None else dpnp.get_usm_ndarray(out)
 
         if (
@@ -734,6 +1036,115 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
             return out
         return dpnp_array._create_from_usm_ndarray(res_usm)
 
+    def _call_cached(self, x1, x2):
+        """
+        Evaluate the function without casting on C-contiguous arrays of the
+        same shape allocated on the same queue, or on such an array and
+        a Python scalar, taking the resolved data types from the dispatch
+        cache.
+
+        Return ``None`` if the fast path does not apply, so the call has to
+        go through the generic implementation.
+
+        """
+
+        if isinstance(x1, dpnp_array):
+            x1 = x1.get_array()
+            if isinstance(x2, dpnp_array):
+                x2 = x2.get_array()
+                if (
+                    x1.shape != x2.shape
+                    or x1.sycl_queue != x2.sycl_queue
+                    or x1.usm_type != x2.usm_type
+                    or not x2.flags.c_contiguous
+                ):
+                    return None
+                dt2 = x2.dtype
+            elif type(x2) in _SCALAR_TYPES:
+                dt2 = type(x2)
+            else:
+                return None
+            x = x1
+            dt1 = x1.dtype
+        elif isinstance(x2, dpnp_array) and type(x1) in _SCALAR_TYPES:
+            x = x2 = x2.get_array()
+            dt1 = type(x1)
+            dt2 = x2.dtype
+        else:
+            return None
+
+        if not x.flags.c_contiguous:
+            return None
+
+        exec_q = x.sycl_queue
+        key = (dt1, dt2, exec_q)
+        try:
+            dts = self._dispatch_cache[key]
+        except KeyError:
+            dts = self._resolve_dtypes(x1, x2, x.sycl_device)
+            self._dispatch_cache[key] = dts
+
+        if dts is None:
+            return None
+
+        o1_dt, o2_dt, res_dt = dts
+        if not isinstance(x1, dpt.usm_ndarray):
+            x1 = dpt.broadcast_to(
+                dpt.asarray(x1, dtype=o1_dt, sycl_queue=exec_q), x.shape
+            )
+        elif not isinstance(x2, dpt.usm_ndarray):
+            x2 = dpt.broadcast_to(
+                dpt.asarray(x2, dtype=o2_dt, sycl_queue=exec_q), x.shape
+            )
+
+        res = dpt.empty(
+            x.shape, dtype=res_dt, usm_type=x.usm_type, sycl_queue=exec_q
+        )
+        _manager = dpu.SequentialOrderManager[exec_q]
+        ht_ev, binary_ev = self.binary_fn_(
+            src1=x1,
+            src2=x2,
+            dst=res,
+            sycl_queue=exec_q,
+            depends=_manager.submitted_events,
+        )
+        _manager.add_event_pair(ht_ev, binary_ev)
+        return dpnp_array._create_from_usm_ndarray(res)
+
+    def _resolve_dtypes(self, x1, x2, sycl_dev):
+        """
+        Resolve data types of the arguments and of the result the same way
+        as the generic implementation does.
+
+        Return ``None`` if any argument has to be cast or the data types
+        depend on the value of a Python integer.
+
+        """
+
+        o1_dt = _get_dtype(x1, sycl_dev)
+        o2_dt = _get_dtype(x2, sycl_dev)
+        if not (_validate_dtype(o1_dt) and _validate_dtype(o2_dt)):
+            return None
+
+        # only the default resolver ignores values of Python integers
+        if (
+            isinstance(o1_dt, dtu.WeakIntegralType)
+            or isinstance(o2_dt, dtu.WeakIntegralType)
+        ) and self.weak_type_resolver_ is not dtu._resolve_weak_types:
+            return None
+
+        o1_dt, o2_dt = self.weak_type_resolver_(o1_dt, o2_dt, sycl_dev)
+        buf1_dt, buf2_dt, res_dt = dtu._find_buf_dtype2(
+            o1_dt,
+            o2_dt,
+            self.result_type_resolver_fn_,
+            sycl_dev,
+            acceptance_fn=self.acceptance_fn_,
+        )
+        if res_dt is None or buf1_dt is not None or buf2_dt is not None:
+            return None
+        return o1_dt, o2_dt, res_dt
+
     def outer(
         self,
         x1,
@@ -757,6 +1168,11 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
         out : {None, dpnp.ndarray, usm_ndarray}, optional
             Output array to populate.
             Array must have the correct shape and the expected data type.
+        where : {bool, dpnp.ndarray, usm_ndarray}, optional
+            This condition is broadcast over the result. At locations where
+            the condition is ``True``, the `out` array will be set to the ufunc
+            result. Elsewhere, the `out` array will retain its original value.
+            Default: ``True``.
         order : {None, "C", "F", "A", "K"}, optional
             Memory layout of the newly output array, Cannot be provided
             together with `out`. Default: ``"K"``.
@@ -772,7 +1188,7 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
 
         Limitations
         -----------
-        Parameters `where` and `subok` are supported with their default values.
+        Parameter `subok` is supported with its default value.
         Keyword argument `kwargs` is currently unsupported.
         Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -835,6 +1251,258 @@ class DPNPBinaryFunc(BinaryElementwiseFunc):
             **kwargs,
         )
 
+    def accumulate(self, array, /, axis=0, dtype=None, out=None):
+        """
+        Accumulate the result of applying the operator to all elements.
+
+        For full documentation refer to :obj:`numpy.ufunc.accumulate`.
+
+        Parameters
+        ----------
+        array : {dpnp.ndarray, usm_ndarray}
+            The array to act on.
+        axis : int, optional
+            The axis along which to apply the accumulation.
+
+            Default: ``0``.
+        dtype : {None, str, dtype object}, optional
+            The data type used to represent the intermediate results.
+
+            Default: ``None``.
+        out : {None, dpnp.ndarray, usm_ndarray}, optional
+            A location into which the result is stored.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The accumulated values. It has the same shape as `array`.
+
+        Notes
+        -----
+        The accumulation of ``add``, ``multiply`` and ``logaddexp`` is
+        computed by :obj:`dpnp.cumsum`, :obj:`dpnp.cumprod` and
+        :obj:`dpnp.cumlogsumexp`. Other associative and commutative functions
+        are accumulated by a parallel scan calling the function a logarithmic
+        number of times, while the rest ones are applied sequentially along
+        `axis`.
+
+        See also
+        --------
+        :obj:`dpnp.cumsum` : Return the cumulative sum of the elements.
+        :obj:`dpnp.cumprod` : Return the cumulative product of the elements.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> np.add.accumulate(np.array([2, 3, 5]))
+        array([ 2,  5, 10])
+        >>> np.maximum.accumulate(np.array([1, 3, 2, 5, 4]))
+        array([1, 3, 3, 5, 5])
+
+        """
+
+        return dpnp_ufunc_accumulate(self, array, axis, dtype, out)
+
+    def at(self, a, indices, b, /):
+        """
+        Perform unbuffered in place operation on operand `a` for elements
+        specified by `indices`.
+
+        For full documentation refer to :obj:`numpy.ufunc.at`.
+
+        For addition this is equivalent to ``a[indices] += b``, except that
+        results are accumulated for elements that are indexed more than once.
+
+        Parameters
+        ----------
+        a : {dpnp.ndarray, usm_ndarray}
+            The array to perform in place operation on.
+        indices : {dpnp.ndarray, usm_ndarray, list, tuple, slice}
+            Index object for indexing into `a`. If `a` has multiple
+            dimensions, `indices` can be a tuple of index objects.
+        b : {dpnp.ndarray, usm_ndarray, scalar}
+            Second operand, it has to be broadcastable over the indexed
+            elements of `a`.
+
+        Notes
+        -----
+        For associative and commutative functions the values indexed by the
+        same position are combined by a segmented scan and the result is
+        applied at once. Other functions are applied in rounds, one
+        occurrence of every index a time.
+
+        See also
+        --------
+        :obj:`dpnp.bincount` : Count number of occurrences of each value.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> a = np.array([1, 2, 3, 4])
+        >>> np.add.at(a, np.array([0, 1, 2, 2]), 1)
+        >>> a
+        array([2, 3, 5, 4])
+
+        >>> a = np.array([1, 2, 3, 4])
+        >>> b = np.array([1, 2])
+        >>> np.add.at(a, np.array([0, 1]), b)
+        >>> a
+        array([2, 4, 3, 4])
+
+        """
+
+        dpnp_ufunc_at(self, a, indices, b)
+
+    def reduce(
+        self,
+        array,
+        /,
+        axis=0,
+        dtype=None,
+        out=None,
+        keepdims=False,
+        initial=None,
+        where=True,
+    ):
+        """
+        Reduce the dimension of `array` by one, by applying the function along
+        one axis.
+
+        For full documentation refer to :obj:`numpy.ufunc.reduce`.
+
+        Parameters
+        ----------
+        array : {dpnp.ndarray, usm_ndarray}
+            The array to act on.
+        axis : {None, int, tuple of ints}, optional
+            Axis or axes along which a reduction is performed. If ``None``,
+            a reduction is performed over all the axes. Multiple axes are
+            supported only for associative and commutative functions.
+
+            Default: ``0``.
+        dtype : {None, str, dtype object}, optional
+            The data type used to perform the operation.
+
+            Default: ``None``.
+        out : {None, dpnp.ndarray, usm_ndarray}, optional
+            A location into which the result is stored.
+
+            Default: ``None``.
+        keepdims : bool, optional
+            If ``True``, the axes which are reduced are left in the result as
+            dimensions with size one.
+
+            Default: ``False``.
+        initial : {None, scalar}, optional
+            The value with which to start the reduction. If ``None``, the
+            identity of the function is used for an empty reduction.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The reduced array.
+
+        Limitations
+        -----------
+        Parameter `where` is only supported with its default value.
+        Otherwise ``NotImplementedError`` exception will be raised.
+
+        Notes
+        -----
+        The reduction of ``add``, ``multiply``, ``maximum``, ``minimum``,
+        ``logical_and``, ``logical_or``, ``logaddexp`` and ``hypot`` without
+        `initial` is computed by the corresponding reduction function, like
+        :obj:`dpnp.sum`. Other associative and commutative functions are
+        reduced by a pairwise tree, while the rest ones are applied
+        sequentially along `axis`.
+
+        See also
+        --------
+        :obj:`dpnp.sum` : Sum of array elements over a given axis.
+        :obj:`dpnp.prod` : Product of array elements over a given axis.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> np.multiply.reduce(np.array([2, 3, 5]))
+        array(30)
+        >>> a = np.arange(8).reshape(2, 2, 2)
+        >>> np.bitwise_or.reduce(a, axis=(0, 2))
+        array([5, 7])
+        >>> np.subtract.reduce(np.array([10, 3, 2]))
+        array(5)
+
+        """
+
+        return dpnp_ufunc_reduce(
+            self, array, axis, dtype, out, keepdims, initial, where
+        )
+
+    def reduceat(self, array, indices, /, axis=0, dtype=None, out=None):
+        """
+        Perform a reduction with specified slices over a single axis.
+
+        For full documentation refer to :obj:`numpy.ufunc.reduceat`.
+
+        For ``i`` in ``range(len(indices))``, it computes
+        ``ufunc.reduce(array[indices[i]:indices[i+1]])``, which becomes the
+        i-th generalized "row" parallel to `axis` in the final result. There
+        are two exceptions: if ``indices[i] >= indices[i+1]``, the i-th
+        generalized "row" is simply ``array[indices[i]]`` and for the last
+        index ``indices[i+1]`` is ``array.shape[axis]``.
+
+        Parameters
+        ----------
+        array : {dpnp.ndarray, usm_ndarray}
+            The array to act on.
+        indices : {dpnp.ndarray, usm_ndarray, list}
+            Paired indices specifying slices to reduce.
+        axis : int, optional
+            The axis along which to apply the reduction.
+
+            Default: ``0``.
+        dtype : {None, str, dtype object}, optional
+            The data type used to perform the operation.
+
+            Default: ``None``.
+        out : {None, dpnp.ndarray, usm_ndarray}, optional
+            A location into which the result is stored.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The reduced values.
+
+        Notes
+        -----
+        If `indices` are sorted and the function is associative and
+        commutative, all slices are reduced at once by a segmented scan.
+        Otherwise the slices are reduced one by one.
+
+        See also
+        --------
+        :obj:`dpnp.sum` : Sum of array elements over a given axis.
+        :obj:`dpnp.cumsum` : Return the cumulative sum of the elements.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> a = np.arange(8)
+        >>> np.add.reduceat(a, np.array([0, 4, 1, 5, 2, 6, 3, 7]))[::2]
+        array([ 6, 10, 14, 18])
+        >>> np.maximum.reduceat(np.array([3, 1, 4, 1, 5, 9]), [0, 2, 5])
+        array([3, 5, 9])
+
+        """
+
+        return dpnp_ufunc_reduceat(self, array, indices, axis, dtype, out)
+
 
 class DPNPBinaryFuncOutKw(DPNPBinaryFunc):
     """DPNPBinaryFunc that deprecates positional `out` argument."""
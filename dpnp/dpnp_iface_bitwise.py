@@ -136,6 +136,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -149,7 +158,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -227,6 +236,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -240,7 +258,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -286,6 +304,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -299,7 +326,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -372,6 +399,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -385,7 +421,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -460,6 +496,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -474,7 +519,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -546,6 +591,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -558,7 +612,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -631,6 +685,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -644,7 +707,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -41,6 +41,8 @@ it contains:
 
 # pylint: disable=protected-access
 
+import functools
+
 from dpctl.tensor._numpy_helper import (
     normalize_axis_index,
     normalize_axis_tuple,
@@ -50,9 +52,125 @@ import dpnp
 
 # pylint: disable=no-name-in-module
 from dpnp.dpnp_utils import get_usm_allocations
+from dpnp.dpnp_utils.dpnp_utils_fusion import Fusion
+
+# Names of dpnp functions which reduce or scan a 1-D slice along the given
+# axis, so they can be applied to all slices at once by passing ``axis=-1``.
+_AXIS_AWARE_FUNCS = (
+    "all",
+    "amax",
+    "amin",
+    "any",
+    "argmax",
+    "argmin",
+    "argsort",
+    "average",
+    "count_nonzero",
+    "cumlogsumexp",
+    "cumprod",
+    "cumsum",
+    "cumulative_prod",
+    "cumulative_sum",
+    "logsumexp",
+    "max",
+    "mean",
+    "median",
+    "min",
+    "nanargmax",
+    "nanargmin",
+    "nancumprod",
+    "nancumsum",
+    "nanmax",
+    "nanmean",
+    "nanmedian",
+    "nanmin",
+    "nanprod",
+    "nanstd",
+    "nansum",
+    "nanvar",
+    "prod",
+    "ptp",
+    "reduce_hypot",
+    "sort",
+    "std",
+    "sum",
+    "var",
+)
+
+# Names of dpnp reductions where reducing over several axes at once gives
+# the same result as reducing over each of them in turn.
+_MULTI_AXES_REDUCTIONS = (
+    "all",
+    "amax",
+    "amin",
+    "any",
+    "logsumexp",
+    "max",
+    "mean",
+    "min",
+    "nanmax",
+    "nanmin",
+    "nanprod",
+    "nansum",
+    "prod",
+    "reduce_hypot",
+    "sum",
+)
+
+
+def _is_dpnp_func(func, names):
+    """Check whether `func` is one of dpnp functions with the given names."""
+
+    return any(getattr(dpnp, name, None) is func for name in names)
+
+
+def _apply_along_axis_loop(
+    func1d, inarr_view, exec_q, usm_type, *args, **kwargs
+):
+    """
+    Call `func1d` on every 1-D slice of `inarr_view` along the last axis.
+
+    Return a buffer with the results where the new dimensions are added on
+    the end and the number of these dimensions.
+
+    """
+
+    # compute indices for the iteration axes, and append a trailing ellipsis to
+    # prevent 0d arrays decaying to scalars
+    inds = dpnp.ndindex(inarr_view.shape[:-1])
+    inds = (ind + (Ellipsis,) for ind in inds)
+
+    # invoke the function on the first item
+    try:
+        ind0 = next(inds)
+    except StopIteration:
+        raise ValueError(
+            "Cannot apply_along_axis when any iteration dimensions are 0"
+        ) from None
+    res = dpnp.asanyarray(
+        func1d(inarr_view[ind0], *args, **kwargs),
+        sycl_queue=exec_q,
+        usm_type=usm_type,
+    )
+
+    # build a buffer for storing evaluations of func1d.
+    # remove the requested axis, and add the new ones on the end.
+    # laid out so that each write is contiguous.
+    # for a tuple index inds, buff[inds] = func1d(inarr_view[inds])
+    buff = dpnp.empty_like(res, shape=inarr_view.shape[:-1] + res.shape)
+
+    # save the first result, then compute and save all remaining results
+    buff[ind0] = res
+    for ind in inds:
+        buff[ind] = dpnp.asanyarray(
+            func1d(inarr_view[ind], *args, **kwargs),
+            sycl_queue=exec_q,
+            usm_type=usm_type,
+        )
+    return buff, res.ndim
 
 
-def apply_along_axis(func1d, axis, arr, *args, **kwargs):
+def apply_along_axis(func1d, axis, arr, *args, vectorized=None, **kwargs):
     """
     Apply a function to 1-D slices along the given axis.
 
@@ -91,6 +209,19 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
         Input array.
     args : any
         Additional arguments to `func1d`.
+    vectorized : {None, bool}, optional
+        If ``True``, `func1d` is called only once as
+        ``func1d(a, *args, axis=-1, **kwargs)``, where `a` is `arr` with
+        `axis` moved to the end, so all 1-D slices are processed by a single
+        call. In that case `func1d` has to accept `axis` keyword and return
+        an array of shape ``(Ni..., Nk..., Nj...)``.
+        If ``False``, `func1d` is called once per every 1-D slice.
+        If ``None``, the vectorized call is used automatically when `func1d`
+        is a dpnp reduction or a cumulative function (like :obj:`dpnp.sum`,
+        :obj:`dpnp.mean` or :obj:`dpnp.cumsum`) and there are no positional
+        `args` and no `axis` or `out` keywords in `kwargs`.
+
+        Default: ``None``.
     kwargs : any
         Additional named arguments to `func1d`.
 
@@ -118,6 +249,16 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
     >>> np.apply_along_axis(my_func, 1, b)
     array([2., 5., 8.])
 
+    A function which supports `axis` keyword can process all slices by one
+    call:
+
+    >>> def normalize(a, axis=-1):
+    ...     return a / np.linalg.norm(a, axis=axis, keepdims=True)
+    >>> c = np.array([[3.0, 4.0], [6.0, 8.0]])
+    >>> np.apply_along_axis(normalize, 1, c, vectorized=True)
+    array([[0.6, 0.8],
+           [0.6, 0.8]])
+
     For a function that returns a 1D array, the number of dimensions in
     `out` is the same as `arr`.
 
@@ -153,41 +294,39 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
     # arr, with the iteration axis at the end
     inarr_view = dpnp.moveaxis(arr, axis, -1)
 
-    # compute indices for the iteration axes, and append a trailing ellipsis to
-    # prevent 0d arrays decaying to scalars
-    inds = dpnp.ndindex(inarr_view.shape[:-1])
-    inds = (ind + (Ellipsis,) for ind in inds)
-
-    # invoke the function on the first item
-    try:
-        ind0 = next(inds)
-    except StopIteration:
-        raise ValueError(
-            "Cannot apply_along_axis when any iteration dimensions are 0"
-        ) from None
-    res = dpnp.asanyarray(
-        func1d(inarr_view[ind0], *args, **kwargs),
-        sycl_queue=exec_q,
-        usm_type=usm_type,
-    )
+    if vectorized is None:
+        vectorized = (
+            not args
+            and "axis" not in kwargs
+            and "out" not in kwargs
+            and _is_dpnp_func(func1d, _AXIS_AWARE_FUNCS)
+        )
 
-    # build a buffer for storing evaluations of func1d.
-    # remove the requested axis, and add the new ones on the end.
-    # laid out so that each write is contiguous.
-    # for a tuple index inds, buff[inds] = func1d(inarr_view[inds])
-    buff = dpnp.empty_like(res, shape=inarr_view.shape[:-1] + res.shape)
+    if vectorized:
+        iter_shape = inarr_view.shape[:-1]
+        if 0 in iter_shape:
+            raise ValueError(
+                "Cannot apply_along_axis when any iteration dimensions are 0"
+            )
 
-    # save the first result, then compute and save all remaining results
-    buff[ind0] = res
-    for ind in inds:
-        buff[ind] = dpnp.asanyarray(
-            func1d(inarr_view[ind], *args, **kwargs),
+        # invoke the function once on all slices
+        buff = dpnp.asanyarray(
+            func1d(inarr_view, *args, axis=-1, **kwargs),
             sycl_queue=exec_q,
             usm_type=usm_type,
         )
+        if buff.shape[: len(iter_shape)] != iter_shape:
+            raise ValueError(
+                "function is not returning an array of the correct shape"
+            )
+        res_ndim = buff.ndim - len(iter_shape)
+    else:
+        buff, res_ndim = _apply_along_axis_loop(
+            func1d, inarr_view, exec_q, usm_type, *args, **kwargs
+        )
 
     # restore the inserted axes back to where they belong
-    for _ in range(res.ndim):
+    for _ in range(res_ndim):
         buff = dpnp.moveaxis(buff, -1, axis)
 
     return buff
@@ -204,6 +343,9 @@ def apply_over_axes(func, a, axes):
     `axis`. The call to `func` is then repeated for each axis in `axes`,
     with `res` as the first argument.
 
+    When `func` is a dpnp reduction like :obj:`dpnp.sum` or :obj:`dpnp.max`,
+    it is called only once over all `axes` with ``keepdims=True``.
+
     For full documentation refer to :obj:`numpy.apply_over_axes`.
 
     Parameters
@@ -261,6 +403,10 @@ def apply_over_axes(func, a, axes):
         axes = (axes,)
     axes = normalize_axis_tuple(axes, a.ndim)
 
+    if len(axes) > 1 and _is_dpnp_func(func, _MULTI_AXES_REDUCTIONS):
+        # reduce over all axes by one call
+        return func(a, axis=axes, keepdims=True)
+
     for axis in axes:
         res = func(a, axis)
         if res.ndim != a.ndim:
@@ -273,6 +419,77 @@ def apply_over_axes(func, a, axes):
     return res
 
 
+def fuse(*args, **kwargs):
+    """
+    Decorator that traces and replays a function made of element-wise
+    operations.
+
+    The decorated function is traced once for every distinct signature of
+    its arguments, i.e. their data types, shapes, strides, USM types and
+    SYCL queues, and for types of scalar arguments. Every further call with
+    the same signature replays the recorded chain of element-wise functions
+    and writes intermediate results into buffers which are reused as soon
+    as a value is not needed anymore, so the chain allocates only as many
+    temporaries as there are values alive at the same time and evaluates
+    in-place where possible.
+
+    The replayed chain uses the same type resolution as the eager calls,
+    so the result is identical to calling the function directly.
+
+    Note that the operations are not combined into a single kernel: every
+    element-wise function of the chain is still submitted as a separate
+    kernel making its own pass over the data. The decorator only saves the
+    tracing of the Python function, the type resolution and the allocation
+    of temporaries.
+
+    Parameters
+    ----------
+    kernel_name : {None, str}, optional
+        Name of the fused function. By default the name of the decorated
+        function is used.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : callable
+        Fused function.
+
+    Limitations
+    -----------
+    Only element-wise functions of ``dpnp`` with one or two input arrays
+    and one output, and arithmetic, bitwise and comparison operators of the
+    arguments are supported inside a fused function. Data dependent control
+    flow and the `out` keyword argument are not supported. Arguments have
+    to be passed positionally and be either arrays or scalars.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> @np.fuse
+    ... def squared_diff(x, y):
+    ...     return (x - y) * (x - y)
+    >>> x = np.arange(5)
+    >>> squared_diff(x, 2)
+    array([4, 1, 0, 1, 4])
+
+    >>> @np.fuse(kernel_name="affine_exp")
+    ... def affine_exp(a, b, c, d):
+    ...     return a * b + c * np.exp(d)
+    >>> a = np.full(3, 2.0)
+    >>> affine_exp(a, a, a, np.zeros(3))
+    array([6., 6., 6.])
+
+    """
+
+    def _fuse(func, kernel_name=None):
+        return functools.update_wrapper(Fusion(func, kernel_name), func)
+
+    if len(args) == 1 and not kwargs and callable(args[0]):
+        return _fuse(args[0])
+    return lambda func: _fuse(func, *args, **kwargs)
+
+
 def piecewise(x, condlist, funclist):
     """
     Evaluate a piecewise-defined function.
@@ -103,6 +103,19 @@ def _ravel_check_a_and_weights(a, weights):
     return a, weights, usm_type
 
 
+def _host_min_max(a):
+    """
+    Return the minimum and the maximum values of `a` as Python scalars.
+
+    Both reductions are enqueued before the results are copied to the host
+    at once, so only a single synchronization is needed.
+
+    """
+
+    bounds = dpnp.stack((dpnp.min(a), dpnp.max(a)))
+    return dpnp.asnumpy(bounds).tolist()
+
+
 def _get_outer_edges(a, range):
     """
     Determine the outer bin edges to use, from either the data or the range
@@ -134,7 +147,7 @@ def _get_outer_edges(a, range):
         first_edge, last_edge = 0, 1
 
     else:
-        first_edge, last_edge = a.min(), a.max()
+        first_edge, last_edge = _host_min_max(a)
         if not (_is_finite(first_edge) and _is_finite(last_edge)):
             raise ValueError(
                 f"autodetected range of [{first_edge}, {last_edge}] "
@@ -217,6 +230,77 @@ def _get_bin_edges(a, bins, range, usm_type):
     return bin_edges, None
 
 
+def _histogram_run_native(a, bin_edges, weights, usm_type):
+    """
+    Count the raveled `a` array into already validated `bin_edges` and
+    return the histogram. No synchronization with the host is required.
+
+    """
+
+    # Histogram is an integer or a float array depending on the weights.
+    if weights is None:
+        ntype = dpnp.dtype(dpnp.intp)
+    else:
+        ntype = weights.dtype
+
+    queue = a.sycl_queue
+    device = queue.sycl_device
+
+    supported_types = statistics_ext.histogram_dtypes()
+    a_bin_dtype, hist_dtype = _align_dtypes(
+        a.dtype, bin_edges.dtype, ntype, supported_types, device
+    )
+
+    if a_bin_dtype is None or hist_dtype is None:  # pragma: no cover
+        raise ValueError(
+            f"Input types ({a.dtype}, {bin_edges.dtype}, {ntype}) "
+            "are not supported, and the inputs could not be coerced to any "
+            "supported types"
+        )
+
+    a_casted = dpnp.asarray(a, dtype=a_bin_dtype, order="C")
+    bin_edges_casted = dpnp.asarray(bin_edges, dtype=a_bin_dtype, order="C")
+    weights_casted = (
+        dpnp.asarray(weights, dtype=hist_dtype, order="C")
+        if weights is not None
+        else None
+    )
+
+    # histogram implementation uses atomics, but atomics doesn't work with
+    # host usm memory
+    n_usm_type = "device" if usm_type == "host" else usm_type
+
+    # histogram implementation requires output array to be filled with zeros
+    n_casted = dpnp.zeros(
+        bin_edges.size - 1,
+        dtype=hist_dtype,
+        sycl_queue=a.sycl_queue,
+        usm_type=n_usm_type,
+    )
+
+    _manager = dpu.SequentialOrderManager[queue]
+
+    a_usm = dpnp.get_usm_ndarray(a_casted)
+    bins_usm = dpnp.get_usm_ndarray(bin_edges_casted)
+    weights_usm = (
+        dpnp.get_usm_ndarray(weights_casted)
+        if weights_casted is not None
+        else None
+    )
+    n_usm = dpnp.get_usm_ndarray(n_casted)
+
+    mem_ev, ht_ev = statistics_ext.histogram(
+        a_usm,
+        bins_usm,
+        weights_usm,
+        n_usm,
+        depends=_manager.submitted_events,
+    )
+    _manager.add_event_pair(mem_ev, ht_ev)
+
+    return dpnp.asarray(n_casted, dtype=ntype, usm_type=usm_type)
+
+
 def _bincount_validate(x, weights, minlength):
     dpnp.check_supported_arrays_type(x)
     if x.ndim > 1:
@@ -253,17 +337,19 @@ def _bincount_validate(x, weights, minlength):
 
 
 def _bincount_run_native(
-    x_casted, weights_casted, minlength, n_dtype, usm_type
+    x_casted, weights_casted, minlength, n_dtype, usm_type, assume_bounded
 ):
     queue = x_casted.sycl_queue
 
-    max_v = dpnp.max(x_casted)
-    min_v = dpnp.min(x_casted)
-
-    if min_v < 0:
-        raise ValueError("x argument must have no negative arguments")
+    if assume_bounded:
+        # no need to compute the bounds, values outside of them are ignored
+        min_v, max_v = 0, minlength - 1
+    else:
+        min_v, max_v = _host_min_max(x_casted)
+        if min_v < 0:
+            raise ValueError("x argument must have no negative arguments")
 
-    size = max(int(max_v) + 1, minlength)
+    size = max(max_v + 1, minlength)
 
     # bincount implementation uses atomics, but atomics doesn't work with
     # host usm memory
@@ -273,6 +359,8 @@ def _bincount_run_native(
     n_casted = dpnp.zeros(
         size, dtype=n_dtype, usm_type=n_usm_type, sycl_queue=queue
     )
+    if size == 0:
+        return n_casted
 
     _manager = dpu.SequentialOrderManager[queue]
 
@@ -286,8 +374,8 @@ def _bincount_run_native(
 
     mem_ev, bc_ev = statistics_ext.bincount(
         x_usm,
-        min_v.item(),
-        max_v.item(),
+        min_v,
+        max_v,
         weights_usm,
         n_usm,
         depends=_manager.submitted_events,
@@ -298,9 +386,9 @@ def _bincount_run_native(
     return n_casted
 
 
-def bincount(x, weights=None, minlength=0):
+def bincount(x, weights=None, minlength=0, *, assume_bounded=False):
     """
-    bincount(x, /, weights=None, minlength=0)
+    bincount(x, /, weights=None, minlength=0, *, assume_bounded=False)
 
     Count number of occurrences of each value in array of non-negative ints.
 
@@ -308,8 +396,9 @@ def bincount(x, weights=None, minlength=0):
 
     Warnings
     --------
-    This function synchronizes in order to calculate binning edges.
-    This may harm performance in some applications.
+    This function synchronizes in order to calculate binning edges, unless
+    `assume_bounded` is ``True``. This may harm performance in some
+    applications.
 
     Parameters
     ----------
@@ -323,12 +412,21 @@ def bincount(x, weights=None, minlength=0):
         A minimum number of bins for the output array.
 
         Default: ``0``
+    assume_bounded : bool, optional
+        If ``True``, the values of `x` are assumed to be in the interval
+        ``[0, minlength)`` and the output array has exactly `minlength` bins.
+        The bounds of `x` are not computed then, so the counting is enqueued
+        without any synchronization with the host. Values outside of the
+        interval are ignored.
+
+        Default: ``False``
 
     Returns
     -------
     out : dpnp.ndarray of ints
         The result of binning the input array.
-        The length of `out` is equal to ``dpnp.max(x) + 1``.
+        The length of `out` is equal to ``max(dpnp.max(x) + 1, minlength)``,
+        or to `minlength` if `assume_bounded` is ``True``.
 
     See Also
     --------
@@ -336,6 +434,13 @@ def bincount(x, weights=None, minlength=0):
     :obj:`dpnp.digitize` : Return the indices of the bins to which each value
     :obj:`dpnp.unique` : Find the unique elements of an array.
 
+    Notes
+    -----
+    With `assume_bounded` set to ``True`` the input array is not validated.
+    Unlike the default mode, no exception is raised for negative values, and
+    they are silently ignored together with the values greater than or equal
+    to `minlength`. Use the default mode if `x` is not known to be bounded.
+
     Examples
     --------
     >>> import dpnp as np
@@ -364,6 +469,12 @@ def bincount(x, weights=None, minlength=0):
     >>> np.bincount(x, weights=w)
     array([0.3, 0.7, 1.1], dtype=float32)
 
+    If the upper bound of the values is known in advance, the counting can be
+    enqueued without computing the bounds of the input array:
+
+    >>> np.bincount(x, minlength=4, assume_bounded=True)
+    array([1, 2, 3, 0])
+
     """
 
     _bincount_validate(x, weights, minlength)
@@ -399,7 +510,12 @@ def bincount(x, weights=None, minlength=0):
         weights_casted = dpnp.asarray(weights, dtype=ntype_casted, order="C")
 
     n_casted = _bincount_run_native(
-        x_casted, weights_casted, minlength, ntype_casted, usm_type
+        x_casted,
+        weights_casted,
+        minlength,
+        ntype_casted,
+        usm_type,
+        assume_bounded,
     )
 
     return dpnp.asarray(n_casted, dtype=ntype, usm_type=usm_type)
@@ -507,7 +623,9 @@ def histogram(a, bins=10, range=None, density=None, weights=None):
     Warnings
     --------
     This function may synchronize in order to check a monotonically increasing
-    array of bin edges. This may harm performance in some applications.
+    array of bin edges, or to compute the range of `a` if `range` is not
+    given. This may harm performance in some applications. See Notes for the
+    arguments which don't require any synchronization.
 
     Parameters
     ----------
@@ -571,6 +689,15 @@ def histogram(a, bins=10, range=None, density=None, weights=None):
     :obj:`dpnp.histogram_bin_edges` : Return only the edges of the bins used
                                       by the obj:`dpnp.histogram` function.
 
+    Notes
+    -----
+    The histogram is computed without any synchronization with the host if
+    `bins` is an integer and `range` is a 2-tuple of Python scalars. This
+    holds for any `weights` and `density`. An array or a sequence `bins`
+    requires a synchronization to check that the edges increase
+    monotonically, and a missing `range` requires one to compute the minimum
+    and the maximum of `a`.
+
     Examples
     --------
     >>> import dpnp as np
@@ -596,72 +723,12 @@ def histogram(a, bins=10, range=None, density=None, weights=None):
 
     bin_edges, _ = _get_bin_edges(a, bins, range, usm_type)
 
-    # Histogram is an integer or a float array depending on the weights.
-    if weights is None:
-        ntype = dpnp.dtype(dpnp.intp)
-    else:
-        ntype = weights.dtype
-
-    queue = a.sycl_queue
-    device = queue.sycl_device
-
-    supported_types = statistics_ext.histogram_dtypes()
-    a_bin_dtype, hist_dtype = _align_dtypes(
-        a.dtype, bin_edges.dtype, ntype, supported_types, device
-    )
-
-    if a_bin_dtype is None or hist_dtype is None:  # pragma: no cover
-        raise ValueError(
-            f"Input types ({a.dtype}, {bin_edges.dtype}, {ntype}) "
-            "are not supported, and the inputs could not be coerced to any "
-            "supported types"
-        )
-
-    a_casted = dpnp.asarray(a, dtype=a_bin_dtype, order="C")
-    bin_edges_casted = dpnp.asarray(bin_edges, dtype=a_bin_dtype, order="C")
-    weights_casted = (
-        dpnp.asarray(weights, dtype=hist_dtype, order="C")
-        if weights is not None
-        else None
-    )
-
-    # histogram implementation uses atomics, but atomics doesn't work with
-    # host usm memory
-    n_usm_type = "device" if usm_type == "host" else usm_type
-
-    # histogram implementation requires output array to be filled with zeros
-    n_casted = dpnp.zeros(
-        bin_edges.size - 1,
-        dtype=hist_dtype,
-        sycl_queue=a.sycl_queue,
-        usm_type=n_usm_type,
-    )
-
-    _manager = dpu.SequentialOrderManager[queue]
-
-    a_usm = dpnp.get_usm_ndarray(a_casted)
-    bins_usm = dpnp.get_usm_ndarray(bin_edges_casted)
-    weights_usm = (
-        dpnp.get_usm_ndarray(weights_casted)
-        if weights_casted is not None
-        else None
-    )
-    n_usm = dpnp.get_usm_ndarray(n_casted)
-
-    mem_ev, ht_ev = statistics_ext.histogram(
-        a_usm,
-        bins_usm,
-        weights_usm,
-        n_usm,
-        depends=_manager.submitted_events,
-    )
-    _manager.add_event_pair(mem_ev, ht_ev)
-
-    n = dpnp.asarray(n_casted, dtype=ntype, usm_type=usm_type)
+    n = _histogram_run_native(a, bin_edges, weights, usm_type)
 
     if density:
         db = dpnp.astype(
-            dpnp.diff(bin_edges), dpnp.default_float_type(sycl_queue=queue)
+            dpnp.diff(bin_edges),
+            dpnp.default_float_type(sycl_queue=a.sycl_queue),
         )
         return n / db / dpnp.sum(n), bin_edges
 
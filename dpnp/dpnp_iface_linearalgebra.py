@@ -45,7 +45,7 @@ import numpy
 import dpnp
 
 from .dpnp_utils import map_dtype_to_device
-from .dpnp_utils.dpnp_utils_einsum import dpnp_einsum
+from .dpnp_utils.dpnp_utils_einsum import EinsumExpression, dpnp_einsum
 from .dpnp_utils.dpnp_utils_linearalgebra import (
     dpnp_dot,
     dpnp_kron,
@@ -260,6 +260,8 @@ def einsum(
     -------
     :obj:`dpnp.einsum_path` : Evaluates the lowest cost contraction order
                               for an einsum expression.
+    :obj:`dpnp.einsum_expression` : Compiles an Einstein summation for
+                                    operands of given shapes.
     :obj:`dpnp.dot` : Returns the dot product of two arrays.
     :obj:`dpnp.inner` : Returns the inner product of two arrays.
     :obj:`dpnp.outer` : Returns the outer product of two arrays.
@@ -591,6 +593,107 @@ def einsum_path(*operands, optimize="greedy"):
     )
 
 
+def einsum_expression(
+    subscripts,
+    *shapes,
+    dtype=None,
+    order="K",
+    casting="same_kind",
+    optimize="greedy",
+):
+    """
+    einsum_expression(subscripts, *shapes, dtype=None, order="K", \
+        casting="same_kind", optimize="greedy")
+
+    Compiles an Einstein summation for operands of given shapes.
+
+    Parsing of the subscripts, search of the contraction path and computation
+    of all intermediate transposes and reshapes are done once, when the
+    expression is created. Calling the returned expression with the operands
+    only runs the computations on the device, which is beneficial when the
+    same contraction is evaluated many times on different data.
+
+    Parameters
+    ----------
+    subscripts : str
+        Specifies the subscripts for summation as comma separated list of
+        subscript labels, see :obj:`dpnp.einsum`.
+    *shapes : sequence of tuples of ints
+        Shapes of the operands the expression is going to be called with.
+    dtype : {None, str, dtype object}, optional
+        If provided, forces the calculation to use the data type specified.
+
+        Default: ``None``.
+    order : {None, "C", "F", "A", "K"}, optional
+        Controls the memory layout of the output, see :obj:`dpnp.einsum`.
+
+        Default: ``"K"``.
+    casting : {"no", "equiv", "safe", "same_kind", "unsafe"}, optional
+        Controls what kind of data casting may occur, see
+        :obj:`dpnp.einsum`.
+
+        Default: ``"same_kind"``.
+    optimize : {False, True, "greedy", "optimal", list, tuple}, optional
+        Controls if intermediate optimization should occur, see
+        :obj:`dpnp.einsum`.
+
+        Default: ``"greedy"``.
+
+    Returns
+    -------
+    expr : EinsumExpression
+        A callable object evaluating the Einstein summation. It is called as
+        ``expr(*operands, out=None)`` where `operands` are
+        :class:`dpnp.ndarray` or :class:`dpctl.tensor.usm_ndarray` arrays of
+        the shapes given in `shapes`, and `out` is an optional output array.
+        The contraction path is available through ``expr.path``.
+
+    Notes
+    -----
+    The plans of :obj:`dpnp.einsum` are also memoized for the recently used
+    subscripts and shapes of the operands, so repeated calls of
+    :obj:`dpnp.einsum` with operands of the same geometry reuse the
+    contraction path as well. A compiled expression additionally avoids the
+    per-call lookup and checks of the arguments.
+
+    See Also
+    --------
+    :obj:`dpnp.einsum` : Evaluates the Einstein summation convention
+                         on the operands.
+    :obj:`dpnp.einsum_path` : Evaluates the contraction order for an einsum
+                              expression.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> expr = np.einsum_expression("ij,jk,kl->il", (2, 2), (2, 5), (5, 2))
+    >>> expr.path
+    ['einsum_path', (1, 2), (0, 1)]
+    >>> a = np.ones((2, 2))
+    >>> b = np.ones((2, 5))
+    >>> c = np.ones((5, 2))
+    >>> expr(a, b, c)
+    array([[10., 10.],
+           [10., 10.]])
+    >>> expr(2 * a, b, c)
+    array([[20., 20.],
+           [20., 20.]])
+
+    """
+
+    if optimize is True:
+        optimize = "greedy"
+
+    return EinsumExpression(
+        subscripts,
+        *shapes,
+        dtype=dtype,
+        order=order,
+        casting=casting,
+        optimize=optimize,
+    )
+
+
 def inner(a, b):
     """
     Returns the inner product of two arrays.
@@ -603,6 +603,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -615,7 +624,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -685,6 +694,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -697,7 +715,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -761,6 +779,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -774,7 +801,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1051,6 +1078,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1064,7 +1100,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1299,6 +1335,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1312,7 +1357,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1359,6 +1404,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1371,7 +1425,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1698,6 +1752,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1710,7 +1773,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1774,6 +1837,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1786,7 +1858,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1849,6 +1921,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1861,7 +1942,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1924,6 +2005,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1936,7 +2026,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -1992,6 +2082,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2004,7 +2103,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -2070,6 +2169,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2082,7 +2190,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -2146,6 +2254,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2158,7 +2275,7 @@ out : dpnp.ndarray of bool dtype
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 See Also
@@ -437,67 +437,42 @@ def _unique_build_sort_indices(a, index_sh):
     Build the indices of an input array (when axis is provided) which result
     in the unique array.
 
-    """
-
-    is_inexact = dpnp.issubdtype(a, dpnp.inexact)
-    if dpnp.issubdtype(a.dtype, numpy.unsignedinteger):
-        ar_cmp = a.astype(dpnp.intp)
-    elif dpnp.issubdtype(a.dtype, dpnp.bool):
-        ar_cmp = a.astype(numpy.int8)
-    else:
-        ar_cmp = a
-
-    def compare_axis_elems(idx1, idx2):
-        comp = dpnp.trim_zeros(ar_cmp[idx1] - ar_cmp[idx2], "f")
-        if comp.shape[0] > 0:
-            diff = comp[0]
-            if is_inexact and dpnp.isnan(diff):
-                isnan1 = dpnp.isnan(ar_cmp[idx1])
-                if not isnan1.any():  # no NaN in ar_cmp[idx1]
-                    return True  # ar_cmp[idx1] goes to left
-
-                isnan2 = dpnp.isnan(ar_cmp[idx2])
-                if not isnan2.any():  # no NaN in ar_cmp[idx2]
-                    return False  # ar_cmp[idx1] goes to right
-
-                # for complex all NaNs are considered equivalent
-                if (isnan1 & isnan2).all():  # NaNs at the same places
-                    return False  # ar_cmp[idx1] goes to right
-
-                xor_nan_idx = dpnp.where(isnan1 ^ isnan2)[0]
-                if xor_nan_idx.size == 0:
-                    return False
-
-                if dpnp.isnan(ar_cmp[idx2][xor_nan_idx[0]]):
-                    # first NaN in XOR mask is from ar_cmp[idx2]
-                    return True  # ar_cmp[idx1] goes to left
-                return False
-            return diff < 0
-        return False
-
-    # sort the array `a` lexicographically using the first item
-    # of each element on the axis
-    sorted_indices = dpnp.empty_like(a, shape=index_sh, dtype=dpnp.intp)
-    queue = [(numpy.arange(0, index_sh, dtype=numpy.intp).tolist(), 0)]
-    while len(queue) != 0:
-        current, off = queue.pop(0)
-        if len(current) == 0:
-            continue
-
-        mid_elem = current[0]
-        left = []
-        right = []
-        for i in range(1, len(current)):
-            if compare_axis_elems(current[i], mid_elem):
-                left.append(current[i])
-            else:
-                right.append(current[i])
+    The rows of 2-D array `a` are sorted lexicographically on the device by a
+    sequence of stable argsorts, going from the last column (the least
+    significant key) to the first one (the most significant key). NaN values
+    are placed after all other values and are considered equal to each other.
+    For complex arrays all NaN values are considered equivalent (no matter
+    whether the NaN is in the real or imaginary part), so such columns are
+    sorted by three keys: real part, imaginary part and NaN flag.
 
-        elem_pos = off + len(left)
-        queue.append((left, off))
-        queue.append((right, elem_pos + 1))
+    """
 
-        sorted_indices[elem_pos] = mid_elem
+    def _stable_sort_by(indices, keys):
+        # reorder the current permutation by the keys taken in that order,
+        # stable sort preserves the ordering established by previous keys
+        order = dpnp.argsort(keys[indices], kind="stable")
+        return indices[order]
+
+    sorted_indices = dpnp.arange(
+        index_sh,
+        dtype=dpnp.intp,
+        usm_type=a.usm_type,
+        sycl_queue=a.sycl_queue,
+    )
+    if index_sh < 2:
+        return sorted_indices
+
+    is_complex = dpnp.issubdtype(a.dtype, dpnp.complexfloating)
+    for col in range(a.shape[1] - 1, -1, -1):
+        keys = a[:, col]
+        if is_complex:
+            nan_mask = dpnp.isnan(keys)
+            for part in (dpnp.imag(keys), dpnp.real(keys)):
+                part = dpnp.where(nan_mask, 0, part)
+                sorted_indices = _stable_sort_by(sorted_indices, part)
+            keys = nan_mask
+
+        sorted_indices = _stable_sort_by(sorted_indices, keys)
     return sorted_indices
 
 
@@ -339,6 +339,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -356,7 +365,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -413,6 +422,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -426,7 +444,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -611,6 +629,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -623,7 +650,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -751,6 +778,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -763,7 +799,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Otherwise ``NotImplementedError`` exception will be raised.
 
 Examples
@@ -810,6 +846,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -823,7 +868,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1501,6 +1546,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1514,7 +1568,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1772,6 +1826,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1787,7 +1850,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1915,6 +1978,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1928,7 +2000,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2014,6 +2086,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2026,7 +2107,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2084,6 +2165,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2098,7 +2188,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2169,6 +2259,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2182,7 +2281,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2262,6 +2361,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2275,7 +2383,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2353,6 +2461,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2366,7 +2483,7 @@ out : dpnp.ndarray
 
 Limitations
 ----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2511,6 +2628,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2523,7 +2649,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2787,6 +2913,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2799,7 +2934,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3138,6 +3273,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3150,7 +3294,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3206,6 +3350,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3218,7 +3371,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3281,6 +3434,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3304,7 +3466,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3382,6 +3544,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3405,7 +3576,7 @@ Always pass the output array as the keyword argument instead, that is
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3556,6 +3727,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3569,7 +3749,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3812,6 +3992,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3824,7 +4013,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3877,6 +4066,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3890,7 +4088,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -3944,6 +4142,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -3956,7 +4163,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4015,6 +4222,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4029,7 +4245,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4214,6 +4430,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4226,7 +4451,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4402,6 +4627,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4416,7 +4650,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4493,6 +4727,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4505,7 +4748,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4630,6 +4873,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4644,7 +4896,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4694,6 +4946,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4707,7 +4968,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4819,6 +5080,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4832,7 +5102,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -4882,6 +5152,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -4895,7 +5174,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -5192,6 +5471,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -5205,7 +5493,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -39,10 +39,30 @@ it contains:
 
 """
 
+import math
 import warnings
 
+from dpctl.tensor._numpy_helper import normalize_axis_tuple
+
 import dpnp
-from dpnp.dpnp_utils.dpnp_utils_statistics import dpnp_median
+from dpnp.dpnp_utils.dpnp_utils_statistics import dpnp_median, dpnp_quantile
+
+
+def _reduced_size(a, axis):
+    """Return the number of elements of `a` in every slice along `axis`."""
+
+    if axis is None:
+        return a.size
+    axis = normalize_axis_tuple(axis, a.ndim)
+    return math.prod(a.shape[i] for i in axis)
+
+
+def _has_nans(a):
+    """Return ``True`` if array `a` is of inexact type and contains NaNs."""
+
+    if dpnp.issubdtype(a.dtype, dpnp.inexact):
+        return bool(dpnp.any(dpnp.isnan(a)))
+    return False
 
 
 def _replace_nan_no_mask(a, val):
@@ -596,11 +616,11 @@ def nanmean(a, axis=None, dtype=None, out=None, keepdims=False, *, where=True):
     """
 
     dpnp.check_limitations(where=where)
+    dpnp.check_supported_arrays_type(a)
 
-    arr, mask = _replace_nan(a, 0)
-    if mask is None:
+    if not dpnp.issubdtype(a.dtype, dpnp.inexact):
         return dpnp.mean(
-            arr,
+            a,
             axis=axis,
             dtype=dtype,
             out=out,
@@ -617,6 +637,17 @@ def nanmean(a, axis=None, dtype=None, out=None, keepdims=False, *, where=True):
         if not dpnp.issubdtype(out.dtype, dpnp.inexact):
             raise TypeError("If input is inexact, then out must be inexact.")
 
+    if _reduced_size(a, axis) > 0:
+        # reduce the data as is first, which needs no temporary of the size
+        # of the input; only slices containing NaNs result in NaN, so the
+        # NaN-aware reduction below is needed only if any result is NaN
+        avg = dpnp.mean(a, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+        if not dpnp.isnan(avg).any():
+            return avg
+
+    mask = dpnp.isnan(a)
+    arr = dpnp.where(mask, 0, a)
+
     cnt_dtype = a.real.dtype if dtype is None else dtype
     cnt = dpnp.sum(
         ~mask, axis=axis, dtype=cnt_dtype, keepdims=keepdims, where=where
@@ -729,14 +760,8 @@ def nanmedian(a, axis=None, out=None, overwrite_input=False, keepdims=False):
     """
 
     dpnp.check_supported_arrays_type(a)
-    ignore_nan = False
-    if dpnp.issubdtype(a.dtype, dpnp.inexact):
-        mask = dpnp.isnan(a)
-        if dpnp.any(mask):
-            ignore_nan = True
-
     return dpnp_median(
-        a, axis, out, overwrite_input, keepdims, ignore_nan=ignore_nan
+        a, axis, out, overwrite_input, keepdims, ignore_nan=_has_nans(a)
     )
 
 
@@ -834,6 +859,148 @@ def nanmin(a, axis=None, out=None, keepdims=False, initial=None, where=True):
     return res
 
 
+def nanpercentile(
+    a,
+    q,
+    axis=None,
+    out=None,
+    overwrite_input=False,
+    method="linear",
+    keepdims=False,
+    *,
+    weights=None,
+):
+    """
+    Compute the q-th percentile of the data along the specified axis,
+    while ignoring NaN values.
+
+    For full documentation refer to :obj:`numpy.nanpercentile`.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    q : {scalar, array_like}
+        Percentage or sequence of percentages for the percentiles to compute.
+        Values must be between 0 and 100 inclusive.
+    axis : {None, int, tuple or list of ints}, optional
+        Axis or axes along which the percentiles are computed. The default,
+        ``axis=None``, will compute the percentiles along a flattened version of
+        the array. If a sequence of axes, the array is first flattened along
+        the given axes, then the percentiles are computed along the resulting
+        flattened axis.
+
+        Default: ``None``.
+    out : {None, dpnp.ndarray, usm_ndarray}, optional
+        Alternative output array in which to place the result. It must have
+        the same shape as the expected output but the type (of the calculated
+        values) will be cast if necessary.
+
+        Default: ``None``.
+    overwrite_input : bool, optional
+       If ``True``, then allow the input array `a` to be modified by
+       intermediate calculations, to save memory. In this case, the contents
+       of the input `a` after this function completes is undefined.
+
+       Default: ``False``.
+    method : str, optional
+        This parameter specifies the method to use for estimating the
+        percentiles. There are many different methods, some unique to NumPy.
+        The options sorted by their R type as summarized in the H&F paper
+        are:
+
+        1. 'inverted_cdf'
+        2. 'averaged_inverted_cdf'
+        3. 'closest_observation'
+        4. 'interpolated_inverted_cdf'
+        5. 'hazen'
+        6. 'weibull'
+        7. 'linear'  (default)
+        8. 'median_unbiased'
+        9. 'normal_unbiased'
+
+        The first three methods are discontinuous. NumPy further defines the
+        following discontinuous variations of the default 'linear' (7.)
+        option:
+
+        * 'lower'
+        * 'higher'
+        * 'midpoint'
+        * 'nearest'
+
+        Default: ``"linear"``.
+    keepdims : bool, optional
+        If ``True``, the axes which are reduced are left in the result as
+        dimensions with size one. With this option, the result will broadcast
+        correctly against the original array `a`.
+
+        Default: ``False``.
+    weights : {None, dpnp.ndarray, usm_ndarray}, optional
+        Weights associated with the values in `a`. Only ``None`` is
+        supported.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        If `q` is a single percentile and ``axis=None``, then the result is
+        a scalar. If multiple percentiles are given, first axis of the result
+        corresponds to the percentiles. The other axes are the axes that remain
+        after the reduction of `a`. If the input contains integers or
+        floats smaller than the default floating point data type, the output
+        data type is the default floating point data type for the device
+        where input array `a` is allocated, unless one of the discontinuous
+        methods preserving data type of the input is used.
+
+    Limitations
+    -----------
+    Parameter `weights` is only supported with its default value.
+    Otherwise ``NotImplementedError`` exception will be raised.
+
+    See Also
+    --------
+    :obj:`dpnp.nanmean` : Compute the arithmetic mean along the specified
+                          axis, ignoring NaNs.
+    :obj:`dpnp.nanmedian` : Compute the median along the specified axis,
+                            while ignoring NaNs.
+    :obj:`dpnp.percentile` : Compute the q-th percentile of the data
+                             along the specified axis.
+    :obj:`dpnp.nanquantile` : Compute the q-th quantile of the data
+                              along the specified axis, while ignoring NaNs.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[10.0, 7, 4], [3, 2, 1]])
+    >>> a[0, 1] = np.nan
+    >>> np.percentile(a, 50)
+    array(nan)
+    >>> np.nanpercentile(a, 50)
+    array(3.)
+    >>> np.nanpercentile(a, 50, axis=0)
+    array([6.5, 2. , 2.5])
+    >>> np.nanpercentile(a, [25, 75], axis=1)
+    array([[5.5 , 1.5 ],
+           [8.5 , 2.5 ]])
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    return dpnp_quantile(
+        a,
+        q,
+        axis=axis,
+        out=out,
+        overwrite_input=overwrite_input,
+        method=method,
+        keepdims=keepdims,
+        weights=weights,
+        ignore_nan=_has_nans(a),
+        percentile=True,
+    )
+
+
 def nanprod(
     a,
     axis=None,
@@ -1035,6 +1202,145 @@ def nansum(
     )
 
 
+def nanquantile(
+    a,
+    q,
+    axis=None,
+    out=None,
+    overwrite_input=False,
+    method="linear",
+    keepdims=False,
+    *,
+    weights=None,
+):
+    """
+    Compute the q-th quantile of the data along the specified axis,
+    while ignoring NaN values.
+
+    For full documentation refer to :obj:`numpy.nanquantile`.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    q : {scalar, array_like}
+        Probability or sequence of probabilities of the quantiles to compute.
+        Values must be between 0 and 1 inclusive.
+    axis : {None, int, tuple or list of ints}, optional
+        Axis or axes along which the quantiles are computed. The default,
+        ``axis=None``, will compute the quantiles along a flattened version of
+        the array. If a sequence of axes, the array is first flattened along
+        the given axes, then the quantiles are computed along the resulting
+        flattened axis.
+
+        Default: ``None``.
+    out : {None, dpnp.ndarray, usm_ndarray}, optional
+        Alternative output array in which to place the result. It must have
+        the same shape as the expected output but the type (of the calculated
+        values) will be cast if necessary.
+
+        Default: ``None``.
+    overwrite_input : bool, optional
+       If ``True``, then allow the input array `a` to be modified by
+       intermediate calculations, to save memory. In this case, the contents
+       of the input `a` after this function completes is undefined.
+
+       Default: ``False``.
+    method : str, optional
+        This parameter specifies the method to use for estimating the
+        quantiles. There are many different methods, some unique to NumPy.
+        The options sorted by their R type as summarized in the H&F paper
+        are:
+
+        1. 'inverted_cdf'
+        2. 'averaged_inverted_cdf'
+        3. 'closest_observation'
+        4. 'interpolated_inverted_cdf'
+        5. 'hazen'
+        6. 'weibull'
+        7. 'linear'  (default)
+        8. 'median_unbiased'
+        9. 'normal_unbiased'
+
+        The first three methods are discontinuous. NumPy further defines the
+        following discontinuous variations of the default 'linear' (7.)
+        option:
+
+        * 'lower'
+        * 'higher'
+        * 'midpoint'
+        * 'nearest'
+
+        Default: ``"linear"``.
+    keepdims : bool, optional
+        If ``True``, the axes which are reduced are left in the result as
+        dimensions with size one. With this option, the result will broadcast
+        correctly against the original array `a`.
+
+        Default: ``False``.
+    weights : {None, dpnp.ndarray, usm_ndarray}, optional
+        Weights associated with the values in `a`. Only ``None`` is
+        supported.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        If `q` is a single probability and ``axis=None``, then the result is
+        a scalar. If multiple probabilities are given, first axis of the result
+        corresponds to the quantiles. The other axes are the axes that remain
+        after the reduction of `a`. If the input contains integers or
+        floats smaller than the default floating point data type, the output
+        data type is the default floating point data type for the device
+        where input array `a` is allocated, unless one of the discontinuous
+        methods preserving data type of the input is used.
+
+    Limitations
+    -----------
+    Parameter `weights` is only supported with its default value.
+    Otherwise ``NotImplementedError`` exception will be raised.
+
+    See Also
+    --------
+    :obj:`dpnp.nanmean` : Compute the arithmetic mean along the specified
+                          axis, ignoring NaNs.
+    :obj:`dpnp.nanmedian` : Compute the median along the specified axis,
+                            while ignoring NaNs.
+    :obj:`dpnp.quantile` : Compute the q-th quantile of the data
+                           along the specified axis.
+    :obj:`dpnp.nanpercentile` : Compute the q-th percentile of the data
+                                along the specified axis, while ignoring
+                                NaNs.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[10.0, 7, 4], [3, 2, 1]])
+    >>> a[0, 1] = np.nan
+    >>> np.quantile(a, 0.5)
+    array(nan)
+    >>> np.nanquantile(a, 0.5)
+    array(3.)
+    >>> np.nanquantile(a, 0.5, axis=0)
+    array([6.5, 2. , 2.5])
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    return dpnp_quantile(
+        a,
+        q,
+        axis=axis,
+        out=out,
+        overwrite_input=overwrite_input,
+        method=method,
+        keepdims=keepdims,
+        weights=weights,
+        ignore_nan=_has_nans(a),
+    )
+
+
 def nanstd(
     a,
     axis=None,
@@ -1315,16 +1621,17 @@ def nanvar(
             f"An integer or float is required, but got {type(ddof)}"
         )
 
-    arr, mask = _replace_nan(a, 0)
-    if mask is None:
+    dpnp.check_supported_arrays_type(a)
+    if not dpnp.issubdtype(a.dtype, dpnp.inexact):
         return dpnp.var(
-            arr,
+            a,
             axis=axis,
             dtype=dtype,
             out=out,
             ddof=ddof,
             keepdims=keepdims,
             where=where,
+            mean=mean,
             correction=correction,
         )
 
@@ -1345,6 +1652,26 @@ def nanvar(
             )
         ddof = correction
 
+    if _reduced_size(a, axis) - ddof > 0:
+        # compute the variance of the data as is first, which needs no mask
+        # and no copy of the input; only slices containing NaNs result in
+        # NaN, so the NaN-aware computation below is needed only if any
+        # result is NaN
+        var = dpnp.var(
+            a,
+            axis=axis,
+            dtype=dtype,
+            out=out,
+            ddof=ddof,
+            keepdims=keepdims,
+            mean=mean,
+        )
+        if not dpnp.isnan(var).any():
+            return var
+
+    mask = dpnp.isnan(a)
+    arr = dpnp.where(mask, 0, a)
+
     # Compute mean
     cnt = dpnp.sum(
         ~mask, axis=axis, dtype=dpnp.intp, keepdims=True, where=where
@@ -1383,10 +1710,8 @@ def nanvar(
     dof = cnt - ddof
     dpnp.divide(var, dof, out=var)
 
-    isbad = dof <= 0
-    if dpnp.any(isbad):
-        # NaN, inf, or negative numbers are all possible bad
-        # values, so explicitly replace them with NaN.
-        dpnp.copyto(var, dpnp.nan, where=isbad)
+    # NaN, inf, or negative numbers are all possible bad values, so
+    # explicitly replace them with NaN
+    dpnp.copyto(var, dpnp.nan, where=dof <= 0)
 
     return var
@@ -46,14 +46,11 @@ from dpctl.tensor._numpy_helper import normalize_axis_index
 
 import dpnp
 
-# pylint: disable=no-name-in-module
-from .dpnp_algo import (
-    dpnp_partition,
-)
 from .dpnp_array import dpnp_array
 from .dpnp_utils import (
     map_dtype_to_device,
 )
+from .dpnp_utils.dpnp_utils_sorting import dpnp_introselect
 
 
 def _wrap_sort_argsort(
@@ -94,6 +91,124 @@ def _wrap_sort_argsort(
     return dpnp_array._create_from_usm_ndarray(usm_res)
 
 
+def _wrap_partition_argpartition(
+    a, kth, axis, kind, order, return_indices=False
+):
+    """Validate arguments of partition and argpartition calls."""
+
+    dpnp.check_supported_arrays_type(a)
+
+    if kind != "introselect":
+        raise NotImplementedError(
+            "`kind` keyword argument is only supported with its default value."
+        )
+    if order is not None:
+        raise NotImplementedError(
+            "`order` keyword argument is only supported with its default value."
+        )
+
+    if axis is None:
+        a = dpnp.ravel(a)
+        axis = -1
+
+    nd = a.ndim
+    axis = normalize_axis_index(axis, nd)
+    length = a.shape[axis]
+
+    if isinstance(kth, int):
+        kth = (kth,)
+    elif not isinstance(kth, Sequence):
+        raise TypeError(
+            f"kth must be int or sequence of ints, but got {type(kth)}"
+        )
+    elif not all(isinstance(k, int) for k in kth):
+        raise TypeError("kth is a sequence, but not all elements are integers")
+
+    nkth = len(kth)
+    if nkth == 0 or a.size == 0:
+        if return_indices:
+            return dpnp.argsort(a, axis=axis)
+        return dpnp.copy(a)
+
+    # validate kth
+    kth = list(kth)
+    for i in range(nkth):
+        if kth[i] < 0:
+            kth[i] += length
+
+        if not 0 <= kth[i] < length:
+            raise ValueError(f"kth(={kth[i]}) out of bounds {length}")
+
+    return dpnp_introselect(a, kth, axis=axis, return_indices=return_indices)
+
+
+def argpartition(a, kth, axis=-1, kind="introselect", order=None):
+    """
+    Perform an indirect partition along the given axis.
+
+    For full documentation refer to :obj:`numpy.argpartition`.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Array to sort.
+    kth : {int, sequence of ints}
+        Element index to partition by. The k-th element will be in its final
+        sorted position and all smaller elements will be moved before it and
+        all larger elements behind it. The order of all elements in the
+        partitions is undefined. If provided with a sequence of k-th it will
+        partition all of them into their sorted position at once.
+    axis : {None, int}, optional
+        Axis along which to sort. If ``None``, the array is flattened before
+        sorting. The default is ``-1``, which sorts along the last axis.
+
+        Default: ``-1``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        Array of indices that partition `a` along the specified axis.
+        If `a` is one-dimensional, ``a[index_array]`` yields a partitioned `a`.
+        More generally, ``dpnp.take_along_axis(a, index_array, axis=axis)``
+        always yields the partitioned `a`, irrespective of dimensionality.
+        The return array has default array index data type.
+
+    Limitations
+    -----------
+    Parameters `kind` and `order` are only supported with its default value.
+    Otherwise ``NotImplementedError`` exception will be raised.
+
+    See Also
+    --------
+    :obj:`dpnp.ndarray.argpartition` : Equivalent method.
+    :obj:`dpnp.partition` : Describes partition algorithms used.
+    :obj:`dpnp.argsort` : Full indirect sort.
+    :obj:`dpnp.take_along_axis` : Apply ``index_array`` from
+                                  :obj:`dpnp.argpartition` to an array as if
+                                  by calling partition.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> x = np.array([3, 4, 2, 1])
+    >>> x[np.argpartition(x, 3)]
+    array([2, 1, 3, 4]) # may vary
+    >>> x[np.argpartition(x, (1, 3))]
+    array([1, 2, 3, 4]) # may vary
+
+    >>> x = np.array([[3, 4, 2], [1, 3, 1]])
+    >>> index_array = np.argpartition(x, kth=1, axis=-1)
+    >>> np.take_along_axis(x, index_array, axis=-1)  # same as partition
+    array([[2, 3, 4],
+           [1, 1, 3]])
+
+    """
+
+    return _wrap_partition_argpartition(
+        a, kth, axis, kind, order, return_indices=True
+    )
+
+
 def argsort(
     a, axis=-1, kind=None, order=None, *, descending=False, stable=None
 ):
@@ -269,60 +384,7 @@ def partition(a, kth, axis=-1, kind="introselect", order=None):
 
     """
 
-    dpnp.check_supported_arrays_type(a)
-
-    if kind != "introselect":
-        raise NotImplementedError(
-            "`kind` keyword argument is only supported with its default value."
-        )
-    if order is not None:
-        raise NotImplementedError(
-            "`order` keyword argument is only supported with its default value."
-        )
-
-    if axis is None:
-        a = dpnp.ravel(a)
-        axis = -1
-
-    nd = a.ndim
-    axis = normalize_axis_index(axis, nd)
-    length = a.shape[axis]
-
-    if isinstance(kth, int):
-        kth = (kth,)
-    elif not isinstance(kth, Sequence):
-        raise TypeError(
-            f"kth must be int or sequence of ints, but got {type(kth)}"
-        )
-    elif not all(isinstance(k, int) for k in kth):
-        raise TypeError("kth is a sequence, but not all elements are integers")
-
-    nkth = len(kth)
-    if nkth == 0 or a.size == 0:
-        return dpnp.copy(a)
-
-    # validate kth
-    kth = list(kth)
-    for i in range(nkth):
-        if kth[i] < 0:
-            kth[i] += length
-
-        if not 0 <= kth[i] < length:
-            raise ValueError(f"kth(={kth[i]}) out of bounds {length}")
-
-    dt = a.dtype
-    if (
-        nd > 1
-        or nkth > 1
-        or dpnp.issubdtype(dt, dpnp.unsignedinteger)
-        or dt in (dpnp.int8, dpnp.int16)
-        or dpnp.is_cuda_backend(a.get_array())
-    ):
-        # sort is a faster path in case of ndim > 1
-        return dpnp.sort(a, axis=axis)
-
-    desc = dpnp.get_dpnp_descriptor(a, copy_when_nondefault_queue=False)
-    return dpnp_partition(desc, kth[0], axis, kind, order).get_pyobj()
+    return _wrap_partition_argpartition(a, kth, axis, kind, order)
 
 
 def sort(a, axis=-1, kind=None, order=None, *, descending=False, stable=None):
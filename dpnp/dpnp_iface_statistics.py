@@ -39,8 +39,6 @@ it contains:
 
 """
 
-import math
-
 import dpctl.tensor as dpt
 import dpctl.tensor._tensor_elementwise_impl as ti
 import dpctl.utils as dpu
@@ -58,7 +56,11 @@ from dpnp.dpnp_utils.dpnp_utils_common import (
 
 from .dpnp_utils import get_usm_allocations
 from .dpnp_utils.dpnp_utils_reduction import dpnp_wrap_reduction_call
-from .dpnp_utils.dpnp_utils_statistics import dpnp_cov, dpnp_median
+from .dpnp_utils.dpnp_utils_statistics import (
+    dpnp_cov,
+    dpnp_median,
+    dpnp_quantile,
+)
 
 
 def _count_reduce_items(arr, axis, where=True):
@@ -141,6 +143,66 @@ def _divide_by_scalar(a, v):
     return a
 
 
+def _mean_var(a, axis, dtype, out, ddof, keepdims, where, mean=None):
+    """
+    Compute the mean and the variance of `a` along the specified axis.
+
+    The variance is computed as the sum of squared deviations from the mean
+    divided by the degrees of freedom, so the returned mean can be reused
+    by the caller without another pass over `a`.
+
+    Returns
+    -------
+    arrmean : dpnp.ndarray
+        The mean of `a`, or `mean` if provided, with the reduced axes kept
+        as singleton dimensions.
+    result : dpnp.ndarray
+        The variance of `a`.
+
+    """
+
+    # cast bool and integer types to default floating type
+    if dtype is None and not dpnp.issubdtype(a.dtype, dpnp.inexact):
+        dtype = dpnp.default_float_type(device=a.device)
+
+    if mean is not None:
+        arrmean = mean
+    else:
+        # Compute the mean.
+        # Note that if dtype is not of inexact type
+        # then `arrmean` will not be either.
+        arrmean = dpnp.mean(
+            a, axis=axis, dtype=dtype, keepdims=True, where=where
+        )
+
+    # Compute sum of squared deviations from mean.
+    # Note that `x` may not be inexact.
+    x = dpnp.subtract(a, arrmean)
+    if dpnp.issubdtype(x.dtype, dpnp.complexfloating):
+        x = dpnp.multiply(x, x.conj(), out=x).real
+    else:
+        x = dpnp.square(x, out=x)
+
+    result = dpnp.sum(
+        x,
+        axis=axis,
+        dtype=dtype,
+        out=out,
+        keepdims=keepdims,
+        where=where,
+    )
+
+    # compute degrees of freedom and make sure it is not negative
+    cnt = _count_reduce_items(a, axis, where)
+    cnt = numpy.max(cnt - ddof, 0).astype(result.dtype, casting="same_kind")
+    if not cnt:
+        cnt = dpnp.nan
+
+    # divide by degrees of freedom
+    result = _divide_by_scalar(result, cnt)
+    return arrmean, result
+
+
 def amax(a, axis=None, out=None, keepdims=False, initial=None, where=True):
     """
     Return the maximum of an array or maximum along an axis.
@@ -700,12 +762,18 @@ def _convolve_fft(a, v, l_pad, r_pad, rtype):
 
     # +1 is needed to avoid circular convolution
     padded_size = a.size + r_pad + 1
-    fft_size = 2 ** int(math.ceil(math.log2(padded_size)))
+    fft_size = dpnp.scipy.fft.next_fast_len(padded_size)
 
-    af = dpnp.fft.fft(a, fft_size)
-    vf = dpnp.fft.fft(v, fft_size)
+    if dpnp.issubdtype(rtype, dpnp.complexfloating):
+        af = dpnp.fft.fft(a, fft_size)
+        vf = dpnp.fft.fft(v, fft_size)
+        r = dpnp.scipy.fft.ifft(af * vf, overwrite_x=True)
+    else:
+        # real input: half of the spectrum is enough
+        af = dpnp.fft.rfft(a, fft_size)
+        vf = dpnp.fft.rfft(v, fft_size)
+        r = dpnp.scipy.fft.irfft(af * vf, fft_size, overwrite_x=True)
 
-    r = dpnp.fft.ifft(af * vf)
     if dpnp.issubdtype(rtype, dpnp.floating):
         r = r.real
     elif dpnp.issubdtype(rtype, dpnp.integer) or rtype == dpnp.bool:
@@ -1209,6 +1277,123 @@ def mean(a, /, axis=None, dtype=None, out=None, keepdims=False, *, where=True):
     return dpnp.get_result_array(usm_res, out, casting="unsafe")
 
 
+def mean_var(
+    a,
+    axis=None,
+    dtype=None,
+    ddof=0,
+    keepdims=False,
+    *,
+    where=True,
+    correction=None,
+):
+    """
+    Compute the arithmetic mean and the variance along the specified axis.
+
+    The mean is computed once and reused for the variance, so both are
+    obtained with one pass less over `a` than calling :obj:`dpnp.mean` and
+    :obj:`dpnp.var` separately.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    axis : {None, int, tuple of ints}, optional
+        Axis or axes along which the means and the variances must be
+        computed. If a tuple of unique integers is given, they are computed
+        over multiple axes. If ``None``, they are computed over the entire
+        array.
+
+        Default: ``None``.
+    dtype : {None, str, dtype object}, optional
+        Type to use in computing the mean and the variance. By default, if
+        `a` has a floating-point data type, the returned arrays will have the
+        same data type as `a`. If `a` has a boolean or integral data type, the
+        returned arrays will have the default floating point data type for
+        the device where input array `a` is allocated.
+
+        Default: ``None``.
+    ddof : {int, float}, optional
+        Means Delta Degrees of Freedom. The divisor used in the variance
+        calculation is ``N - ddof``, where ``N`` corresponds to the total
+        number of elements over which the variance is calculated.
+
+        Default: ``0``.
+    keepdims : {None, bool}, optional
+        If ``True``, the reduced axes (dimensions) are included in the results
+        as singleton dimensions, so that the returned arrays remain compatible
+        with the input array according to Array Broadcasting rules. Otherwise,
+        if ``False``, the reduced axes are not included in the returned arrays.
+
+        Default: ``False``.
+    correction : {None, int, float}, optional
+        Array API compatible name for the `ddof` parameter. Only one of them
+        can be provided at the same time.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    mean : dpnp.ndarray
+        An array containing the arithmetic means.
+    var : dpnp.ndarray
+        An array containing the variances. The variances of complex input
+        are real-valued.
+
+    Limitations
+    -----------
+    Parameters `where` is only supported with its default value.
+    Otherwise ``NotImplementedError`` exception will be raised.
+
+    See Also
+    --------
+    :obj:`dpnp.mean` : Compute the arithmetic mean along the specified axis.
+    :obj:`dpnp.var` : Compute the variance along the specified axis.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[1, 2], [3, 4]])
+    >>> mean, var = np.mean_var(a, axis=0)
+    >>> mean
+    array([2., 3.])
+    >>> var
+    array([1., 1.])
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    dpnp.check_limitations(where=where)
+
+    if correction is not None:
+        if ddof != 0:
+            raise ValueError(
+                "ddof and correction can't be provided simultaneously."
+            )
+        ddof = correction
+
+    if not isinstance(ddof, (int, float)):
+        raise TypeError(
+            f"An integer or float is required, but got {type(ddof)}"
+        )
+
+    arrmean, result = _mean_var(
+        a,
+        axis=axis,
+        dtype=dtype,
+        out=None,
+        ddof=ddof,
+        keepdims=keepdims,
+        where=where,
+    )
+    if not keepdims:
+        arrmean = arrmean.reshape(result.shape)
+
+    if dtype is not None:
+        result = result.astype(dtype, casting="same_kind")
+    return arrmean, result
+
+
 def median(a, axis=None, out=None, overwrite_input=False, keepdims=False):
     """
     Compute the median along the specified axis.
@@ -1399,6 +1584,157 @@ def min(a, axis=None, out=None, keepdims=False, initial=None, where=True):
     )
 
 
+def percentile(
+    a,
+    q,
+    axis=None,
+    out=None,
+    overwrite_input=False,
+    method="linear",
+    keepdims=False,
+    *,
+    weights=None,
+):
+    """
+    Compute the q-th percentile of the data along the specified axis.
+
+    For full documentation refer to :obj:`numpy.percentile`.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    q : {scalar, array_like}
+        Percentage or sequence of percentages for the percentiles to compute.
+        Values must be between 0 and 100 inclusive.
+    axis : {None, int, tuple or list of ints}, optional
+        Axis or axes along which the percentiles are computed. The default,
+        ``axis=None``, will compute the percentiles along a flattened version of
+        the array. If a sequence of axes, the array is first flattened along
+        the given axes, then the percentiles are computed along the resulting
+        flattened axis.
+
+        Default: ``None``.
+    out : {None, dpnp.ndarray, usm_ndarray}, optional
+        Alternative output array in which to place the result. It must have
+        the same shape as the expected output but the type (of the calculated
+        values) will be cast if necessary.
+
+        Default: ``None``.
+    overwrite_input : bool, optional
+       If ``True``, then allow the input array `a` to be modified by
+       intermediate calculations, to save memory. In this case, the contents
+       of the input `a` after this function completes is undefined.
+
+       Default: ``False``.
+    method : str, optional
+        This parameter specifies the method to use for estimating the
+        percentiles. There are many different methods, some unique to NumPy.
+        The options sorted by their R type as summarized in the H&F paper
+        are:
+
+        1. 'inverted_cdf'
+        2. 'averaged_inverted_cdf'
+        3. 'closest_observation'
+        4. 'interpolated_inverted_cdf'
+        5. 'hazen'
+        6. 'weibull'
+        7. 'linear'  (default)
+        8. 'median_unbiased'
+        9. 'normal_unbiased'
+
+        The first three methods are discontinuous. NumPy further defines the
+        following discontinuous variations of the default 'linear' (7.)
+        option:
+
+        * 'lower'
+        * 'higher'
+        * 'midpoint'
+        * 'nearest'
+
+        Default: ``"linear"``.
+    keepdims : bool, optional
+        If ``True``, the axes which are reduced are left in the result as
+        dimensions with size one. With this option, the result will broadcast
+        correctly against the original array `a`.
+
+        Default: ``False``.
+    weights : {None, dpnp.ndarray, usm_ndarray}, optional
+        Weights associated with the values in `a`. Only ``None`` is
+        supported.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        If `q` is a single percentile and ``axis=None``, then the result is
+        a scalar. If multiple percentiles are given, first axis of the result
+        corresponds to the percentiles. The other axes are the axes that remain
+        after the reduction of `a`. If the input contains integers or
+        floats smaller than the default floating point data type, the output
+        data type is the default floating point data type for the device
+        where input array `a` is allocated, unless one of the discontinuous
+        methods preserving data type of the input is used.
+
+    Limitations
+    -----------
+    Parameter `weights` is only supported with its default value.
+    Otherwise ``NotImplementedError`` exception will be raised.
+
+    See Also
+    --------
+    :obj:`dpnp.mean` : Compute the arithmetic mean along the specified axis.
+    :obj:`dpnp.median` : Compute the median along the specified axis.
+    :obj:`dpnp.nanpercentile` : Compute the q-th percentile of the data
+                                along the specified axis, while ignoring
+                                NaNs.
+    :obj:`dpnp.quantile` : Compute the q-th quantile of the data along
+                           the specified axis.
+
+    Notes
+    -----
+    The order statistics are gathered from a sorted copy of the data. If only
+    a few percentiles are requested, the needed order statistics are selected
+    instead, so the whole array is not sorted: the smallest and the largest
+    elements are selected if the percentiles lie close to both ends of the data,
+    otherwise the selection used by :obj:`dpnp.partition` is applied to
+    large arrays without NaNs.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[10, 7, 4], [3, 2, 1]])
+    >>> np.percentile(a, 50)
+    array(3.5)
+    >>> np.percentile(a, 50, axis=0)
+    array([6.5, 4.5, 2.5])
+    >>> np.percentile(a, [25, 75], axis=1)
+    array([[5.5, 1.5],
+           [8.5, 2.5]])
+    >>> np.percentile(a, 50, axis=1, keepdims=True)
+    array([[7.],
+           [2.]])
+    >>> np.percentile(a, 50, method="lower")
+    array(3)
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    return dpnp_quantile(
+        a,
+        q,
+        axis=axis,
+        out=out,
+        overwrite_input=overwrite_input,
+        method=method,
+        keepdims=keepdims,
+        weights=weights,
+        ignore_nan=False,
+        percentile=True,
+    )
+
+
 def ptp(
     a,
     /,
@@ -1473,6 +1809,152 @@ def ptp(
 
 
 # pylint: disable=redefined-outer-name
+def quantile(
+    a,
+    q,
+    axis=None,
+    out=None,
+    overwrite_input=False,
+    method="linear",
+    keepdims=False,
+    *,
+    weights=None,
+):
+    """
+    Compute the q-th quantile of the data along the specified axis.
+
+    For full documentation refer to :obj:`numpy.quantile`.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    q : {scalar, array_like}
+        Probability or sequence of probabilities of the quantiles to compute.
+        Values must be between 0 and 1 inclusive.
+    axis : {None, int, tuple or list of ints}, optional
+        Axis or axes along which the quantiles are computed. The default,
+        ``axis=None``, will compute the quantiles along a flattened version of
+        the array. If a sequence of axes, the array is first flattened along
+        the given axes, then the quantiles are computed along the resulting
+        flattened axis.
+
+        Default: ``None``.
+    out : {None, dpnp.ndarray, usm_ndarray}, optional
+        Alternative output array in which to place the result. It must have
+        the same shape as the expected output but the type (of the calculated
+        values) will be cast if necessary.
+
+        Default: ``None``.
+    overwrite_input : bool, optional
+       If ``True``, then allow the input array `a` to be modified by
+       intermediate calculations, to save memory. In this case, the contents
+       of the input `a` after this function completes is undefined.
+
+       Default: ``False``.
+    method : str, optional
+        This parameter specifies the method to use for estimating the
+        quantiles. There are many different methods, some unique to NumPy.
+        The options sorted by their R type as summarized in the H&F paper
+        are:
+
+        1. 'inverted_cdf'
+        2. 'averaged_inverted_cdf'
+        3. 'closest_observation'
+        4. 'interpolated_inverted_cdf'
+        5. 'hazen'
+        6. 'weibull'
+        7. 'linear'  (default)
+        8. 'median_unbiased'
+        9. 'normal_unbiased'
+
+        The first three methods are discontinuous. NumPy further defines the
+        following discontinuous variations of the default 'linear' (7.)
+        option:
+
+        * 'lower'
+        * 'higher'
+        * 'midpoint'
+        * 'nearest'
+
+        Default: ``"linear"``.
+    keepdims : bool, optional
+        If ``True``, the axes which are reduced are left in the result as
+        dimensions with size one. With this option, the result will broadcast
+        correctly against the original array `a`.
+
+        Default: ``False``.
+    weights : {None, dpnp.ndarray, usm_ndarray}, optional
+        Weights associated with the values in `a`. Only ``None`` is
+        supported.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        If `q` is a single probability and ``axis=None``, then the result is
+        a scalar. If multiple probabilities are given, first axis of the result
+        corresponds to the quantiles. The other axes are the axes that remain
+        after the reduction of `a`. If the input contains integers or
+        floats smaller than the default floating point data type, the output
+        data type is the default floating point data type for the device
+        where input array `a` is allocated, unless one of the discontinuous
+        methods preserving data type of the input is used.
+
+    Limitations
+    -----------
+    Parameter `weights` is only supported with its default value.
+    Otherwise ``NotImplementedError`` exception will be raised.
+
+    See Also
+    --------
+    :obj:`dpnp.mean` : Compute the arithmetic mean along the specified axis.
+    :obj:`dpnp.median` : Compute the median along the specified axis.
+    :obj:`dpnp.nanquantile` : Compute the q-th quantile of the data along
+                              the specified axis, while ignoring NaNs.
+    :obj:`dpnp.percentile` : Compute the q-th percentile of the data along
+                             the specified axis.
+
+    Notes
+    -----
+    The order statistics are gathered from a sorted copy of the data. If only
+    a few quantiles are requested, the needed order statistics are selected
+    instead, so the whole array is not sorted: the smallest and the largest
+    elements are selected if the quantiles lie close to both ends of the data,
+    otherwise the selection used by :obj:`dpnp.partition` is applied to
+    large arrays without NaNs.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[10, 7, 4], [3, 2, 1]])
+    >>> np.quantile(a, 0.5)
+    array(3.5)
+    >>> np.quantile(a, 0.5, axis=0)
+    array([6.5, 4.5, 2.5])
+    >>> np.quantile(a, [0.25, 0.75], axis=1)
+    array([[5.5, 1.5],
+           [8.5, 2.5]])
+    >>> np.quantile(a, 0.5, method="higher")
+    array(4)
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    return dpnp_quantile(
+        a,
+        q,
+        axis=axis,
+        out=out,
+        overwrite_input=overwrite_input,
+        method=method,
+        keepdims=keepdims,
+        weights=weights,
+        ignore_nan=False,
+    )
+
+
 def std(
     a,
     axis=None,
@@ -1791,6 +2273,8 @@ def var(
     :obj:`dpnp.ndarray.var` : corresponding function for ndarrays.
     :obj:`dpnp.std` : Compute the standard deviation along the specified axis.
     :obj:`dpnp.mean` : Compute the arithmetic mean along the specified axis.
+    :obj:`dpnp.mean_var` : Compute the arithmetic mean and the variance along
+                           the specified axis.
     :obj:`dpnp.nanmean` : Compute the arithmetic mean along the specified axis,
                           ignoring NaNs.
     :obj:`dpnp.nanstd` : Compute the standard deviation along
@@ -1834,45 +2318,16 @@ def var(
         )
 
     if dpnp.issubdtype(a.dtype, dpnp.complexfloating) or mean is not None:
-        # cast bool and integer types to default floating type
-        if dtype is None and not dpnp.issubdtype(a.dtype, dpnp.inexact):
-            dtype = dpnp.default_float_type(device=a.device)
-
-        if mean is not None:
-            arrmean = mean
-        else:
-            # Compute the mean.
-            # Note that if dtype is not of inexact type
-            # then `arrmean` will not be either.
-            arrmean = dpnp.mean(
-                a, axis=axis, dtype=dtype, keepdims=True, where=where
-            )
-
-        # Compute sum of squared deviations from mean.
-        # Note that `x` may not be inexact.
-        x = dpnp.subtract(a, arrmean)
-        if dpnp.issubdtype(x.dtype, dpnp.complexfloating):
-            x = dpnp.multiply(x, x.conj(), out=x).real
-        else:
-            x = dpnp.square(x, out=x)
-
-        result = dpnp.sum(
-            x,
+        _, result = _mean_var(
+            a,
             axis=axis,
             dtype=dtype,
             out=out,
+            ddof=ddof,
             keepdims=keepdims,
             where=where,
+            mean=mean,
         )
-
-        # compute degrees of freedom and make sure it is not negative
-        cnt = _count_reduce_items(a, axis, where)
-        cnt = numpy.max(cnt - ddof, 0).astype(result.dtype, casting="same_kind")
-        if not cnt:
-            cnt = dpnp.nan
-
-        # divide by degrees of freedom
-        result = _divide_by_scalar(result, cnt)
     else:
         usm_a = dpnp.get_usm_ndarray(a)
         usm_res = dpt.var(usm_a, axis=axis, correction=ddof, keepdims=keepdims)
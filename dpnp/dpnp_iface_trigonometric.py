@@ -84,6 +84,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -98,7 +107,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -168,6 +177,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -182,7 +200,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -252,6 +270,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -266,7 +293,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -340,6 +367,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -354,7 +390,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -423,6 +459,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -437,7 +482,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -514,6 +559,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -528,7 +582,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -601,6 +655,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -615,7 +678,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -680,6 +743,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -693,7 +765,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -740,6 +812,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -753,7 +834,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -803,6 +884,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -816,7 +906,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -957,6 +1047,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -971,7 +1070,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1021,6 +1120,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1035,7 +1143,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1091,6 +1199,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1105,7 +1222,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1150,6 +1267,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1164,7 +1290,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1210,6 +1336,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1224,7 +1359,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1286,6 +1421,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1299,7 +1443,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1362,6 +1506,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1375,7 +1528,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1438,6 +1591,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1451,7 +1613,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1518,6 +1680,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1531,7 +1702,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1602,6 +1773,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1615,7 +1795,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1688,6 +1868,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1701,7 +1890,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1768,6 +1957,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1781,7 +1979,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1934,6 +2132,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -1948,7 +2155,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -1998,6 +2205,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2012,7 +2228,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2069,6 +2285,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2082,7 +2307,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2213,6 +2438,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is `None`.
     Default: ``"K"``
@@ -2226,7 +2460,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2272,6 +2506,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2285,7 +2528,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2335,6 +2578,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2348,7 +2600,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2395,6 +2647,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2408,7 +2669,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2471,6 +2732,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2484,7 +2754,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2530,6 +2800,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2543,7 +2822,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
@@ -2595,6 +2874,15 @@ out : {None, dpnp.ndarray, usm_ndarray, tuple of ndarray}, optional
     number of outputs.
 
     Default: ``None``.
+where : {bool, dpnp.ndarray, usm_ndarray}, optional
+    This condition is broadcast over the input. At locations where the
+    condition is ``True``, the `out` array will be set to the ufunc result.
+    Elsewhere, the `out` array will retain its original value. Note that if
+    an uninitialized `out` array is created via the default ``out=None``,
+    locations within it where the condition is ``False`` will remain
+    uninitialized. A data type of the array must be boolean.
+
+    Default: ``True``.
 order : {None, "C", "F", "A", "K"}, optional
     Memory layout of the newly output array, if parameter `out` is ``None``.
 
@@ -2608,7 +2896,7 @@ out : dpnp.ndarray
 
 Limitations
 -----------
-Parameters `where` and `subok` are supported with their default values.
+Parameter `subok` is supported with its default value.
 Keyword argument `kwargs` is currently unsupported.
 Otherwise ``NotImplementedError`` exception will be raised.
 
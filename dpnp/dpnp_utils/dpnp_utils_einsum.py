@@ -27,9 +27,11 @@
 # *****************************************************************************
 
 import copy
+import functools
 import itertools
 import operator
 import warnings
+from typing import NamedTuple
 
 import dpctl
 import numpy
@@ -42,7 +44,33 @@ from dpnp.exceptions import ExecutionPlacementError
 _einsum_symbols = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
 
-__all__ = ["dpnp_einsum"]
+__all__ = ["EinsumExpression", "dpnp_einsum"]
+
+
+class _EinsumPlan(NamedTuple):
+    """Steps of einsum computed by :obj:`_make_einsum_plan`."""
+
+    diagonals: tuple
+    zeros_shape: tuple
+    squeeze_axes: tuple
+    sum_axes: tuple
+    returns_view: bool
+    path: tuple
+    memory_warning: bool
+    steps: tuple
+    transpose_axes: tuple
+    out_shape: tuple
+
+
+def _check_out(out, exec_q):
+    """Validate the output array of einsum."""
+
+    if out is not None:
+        dpnp.check_supported_arrays_type(out)
+        if dpctl.utils.get_execution_queue((exec_q, out.sycl_queue)) is None:
+            raise ExecutionPlacementError(
+                "Input and output allocation queues are not compatible"
+            )
 
 
 def _chr(label):
@@ -111,18 +139,25 @@ def _compute_size_by_dict(indices, idx_dict):
     return ret
 
 
-def _einsum_diagonals(input_subscripts, operands):
+def _einsum_diagonals(input_subscripts, shapes):
     """
     Adopted from _einsum_diagonals in cupy/core/_einsum.py
 
-    Compute the diagonal for each operand.
+    Compute the axes taking the diagonal for each operand.
 
     Parameters
     ----------
-    input_subscripts : tuple or list of str
-        Strings representing the Einstein summation notation for each operand.
-    operands : tuple or list of dpnp.ndarray or usm_ndarray
-        Input arrays.
+    input_subscripts : list of lists of ints
+        Parsed Einstein summation notation for each operand.
+    shapes : list of tuples of ints
+        Shapes of the input arrays.
+
+    Returns
+    -------
+    axeses : list
+        For each operand either ``None`` if the operand has no repeated
+        subscripts or the axes to be passed to :obj:`_transpose_ex` to take
+        the diagonal.
 
     Raises
     ------
@@ -131,47 +166,142 @@ def _einsum_diagonals(input_subscripts, operands):
 
     Notes
     -----
-    This function mutates `input_subscripts` and `operands`.
+    This function mutates `input_subscripts` and `shapes`.
 
     Examples
     --------
-    >>> import dpnp as np
     >>> import dpnp.dpnp_utils.dpnp_utils_einsum as np_util
-    >>> a = np.arange(9).reshape(3, 3)
-    >>> input_subscripts = ["ii"]
-    >>> operands = [a]
-    >>> np_util._einsum_diagonals(input_subscripts, operands)
+    >>> input_subscripts = [[105, 105]]
+    >>> shapes = [(3, 3)]
+    >>> np_util._einsum_diagonals(input_subscripts, shapes)
+    [((0, 1),)]
     >>> input_subscripts
-    [['i']]
-    >>> operands
-    [array([0, 4, 8])]
+    [[105]]
+    >>> shapes
+    [(3,)]
 
     """
 
-    for idx in range(len(input_subscripts)):
-        sub = input_subscripts[idx]
-        arr = operands[idx]
+    diagonals = []
+    for idx, sub in enumerate(input_subscripts):
+        shape = shapes[idx]
 
         # repetitive index in the input_subscripts
-        if len(set(sub)) < len(sub):
-            axeses = {}
-            for axis, label in enumerate(sub):
-                axeses.setdefault(label, []).append(axis)
-
-            axeses = list(axeses.items())
-            for label, axes in axeses:
-                dims = {arr.shape[axis] for axis in axes}
-                if len(dims) >= 2:
-                    dim1 = dims.pop()
-                    dim0 = dims.pop()
-                    raise ValueError(
-                        f"dimensions in operand {idx} "
-                        f"for collapsing index '{label}' don't match ({dim0} != {dim1})"
-                    )
+        if len(set(sub)) == len(sub):
+            diagonals.append(None)
+            continue
+
+        axeses = {}
+        for axis, label in enumerate(sub):
+            axeses.setdefault(label, []).append(axis)
+
+        axeses = list(axeses.items())
+        for label, axes in axeses:
+            dims = {shape[axis] for axis in axes}
+            if len(dims) >= 2:
+                dim1 = dims.pop()
+                dim0 = dims.pop()
+                raise ValueError(
+                    f"dimensions in operand {idx} "
+                    f"for collapsing index '{label}' don't match ({dim0} != {dim1})"
+                )
 
-            sub, axeses = zip(*axeses)  # axeses is not empty
-            input_subscripts[idx] = list(sub)
-            operands[idx] = _transpose_ex(arr, axeses)
+        sub, axeses = zip(*axeses)  # axeses is not empty
+        axeses = tuple(tuple(axes) for axes in axeses)
+        input_subscripts[idx] = list(sub)
+        shapes[idx] = tuple(shape[axes[0]] for axes in axeses)
+        diagonals.append(axeses)
+    return diagonals
+
+
+def _einsum_execute(
+    plan, operands, out, dtype, order, casting, usm_type, exec_q
+):
+    """
+    Evaluate the Einstein summation on the operands following the `plan`.
+
+    Parameters
+    ----------
+    plan : _EinsumPlan
+        The plan computed by :obj:`_make_einsum_plan` for the shapes of the
+        operands.
+    operands : list of {dpnp.ndarray, usm_ndarray}
+        Input arrays.
+    out : {dpnp.ndarray, usm_ndarray, None}
+        Output array.
+    dtype : {None, str, dtype object}
+        Data type of the result.
+    order : {None, "C", "F", "A", "K"}
+        Memory layout of the result.
+    casting : {"no", "equiv", "safe", "same_kind", "unsafe"}
+        Kind of data casting allowed.
+    usm_type : str
+        USM type of the result.
+    exec_q : dpctl.SyclQueue
+        Execution queue.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The result of the Einstein summation.
+
+    """
+
+    result_dtype = dpnp.result_type(*operands) if dtype is None else dtype
+    if order is not None and order in "aA":
+        order = "F" if all(arr.flags.fnc for arr in operands) else "C"
+
+    operands = [
+        arr if axeses is None else _transpose_ex(arr, axeses)
+        for arr, axeses in zip(operands, plan.diagonals)
+    ]
+
+    if plan.zeros_shape is not None:
+        return dpnp.zeros(
+            plan.zeros_shape,
+            dtype=result_dtype,
+            usm_type=usm_type,
+            sycl_queue=exec_q,
+        )
+
+    for idx, axes in enumerate(plan.squeeze_axes):
+        if axes:
+            operands[idx] = dpnp.squeeze(operands[idx], axis=axes)
+
+    for idx, axes in enumerate(plan.sum_axes):
+        if axes:
+            operands[idx] = operands[idx].sum(axis=axes, dtype=result_dtype)
+
+    if plan.returns_view:
+        operands = [a.view() for a in operands]
+    else:
+        operands = [
+            dpnp.astype(a, result_dtype, copy=False, casting=casting)
+            for a in operands
+        ]
+
+    # no more casts
+    if plan.memory_warning:
+        warnings.warn(
+            "memory efficient einsum is not supported yet",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+    for idx0, idx1, step in plan.steps:
+        # "reduced" binary einsum
+        arr0 = operands.pop(idx0)
+        arr1 = operands.pop(idx1)
+        operands.append(_reduced_binary_einsum(arr0, arr1, step))
+        del arr0, arr1
+
+    # unary einsum at last
+    (arr0,) = operands
+    arr_out = arr0.transpose(plan.transpose_axes).reshape(plan.out_shape)
+
+    arr_out = dpnp.asarray(arr_out, order=order)
+    assert plan.returns_view or arr_out.dtype == result_dtype
+    return dpnp.get_result_array(arr_out, out, casting=casting)
 
 
 def _expand_dims_transpose(arr, mode, mode_out):
@@ -371,6 +501,34 @@ def _flop_count(idx_contraction, inner, num_terms, size_dictionary):
     return overall_size * op_factor
 
 
+def _get_einsum_plan(input_subscripts, output_subscript, shapes, optimize):
+    """
+    Return the plan of the Einstein summation for operands of given shapes.
+
+    The plan is taken from the cache of :obj:`_make_einsum_plan` whenever the
+    arguments are hashable, otherwise it is computed on every call.
+
+    """
+
+    if isinstance(optimize, list):
+        # a path passed as a list of lists, like returned by einsum_path
+        optimize = tuple(
+            tuple(item) if isinstance(item, list) else item for item in optimize
+        )
+    args = (
+        tuple(input_subscripts),
+        output_subscript,
+        tuple(tuple(shape) for shape in shapes),
+        optimize,
+    )
+
+    try:
+        hash(args)
+    except TypeError:
+        return _make_einsum_plan.__wrapped__(*args)
+    return _make_einsum_plan(*args)
+
+
 def _greedy_path(input_sets, output_set, idx_dict, memory_limit):
     """
     Copied from _greedy_path in numpy/core/einsumfunc.py
@@ -517,6 +675,214 @@ def _iter_path_pairs(path):
                 yield -1, idx
 
 
+@functools.lru_cache(maxsize=256, typed=True)
+def _make_einsum_plan(input_subscripts, output_subscript, shapes, optimize):
+    """
+    Compute the plan of the Einstein summation for operands of given shapes.
+
+    All the symbolic work of einsum, i.e. parsing and validation of the
+    subscripts, search of the contraction path and the axes of every
+    transpose and reshape, depends only on the subscripts, the shapes of the
+    operands and `optimize`. It is done once and memoized, so repeated calls
+    with operands of the same geometry only run the computations on the
+    device.
+
+    Parameters
+    ----------
+    input_subscripts : tuple of str
+        Subscripts of the operands as returned by :obj:`_parse_einsum_input`.
+    output_subscript : {None, str}
+        Subscript of the output as returned by :obj:`_parse_einsum_input`.
+    shapes : tuple of tuples of ints
+        Shapes of the operands.
+    optimize : {False, str, tuple}
+        Controls if intermediate optimization should occur.
+
+    Returns
+    -------
+    plan : _EinsumPlan
+        The plan of the Einstein summation.
+
+    """
+
+    input_subscripts = [
+        _parse_ellipsis_subscript(sub, idx, ndim=len(shape))
+        for idx, (sub, shape) in enumerate(zip(input_subscripts, shapes))
+    ]
+    shapes = list(shapes)
+
+    # Get length of each unique dimension and ensure all dimensions are correct
+    dimension_dict = {}
+    for idx, sub in enumerate(input_subscripts):
+        sh = shapes[idx]
+        for axis, label in enumerate(sub):
+            dim = sh[axis]
+            if label in dimension_dict.keys():
+                # For broadcasting cases we always want the largest dim size
+                if dimension_dict[label] == 1:
+                    dimension_dict[label] = dim
+                elif dim not in (1, dimension_dict[label]):
+                    dim_old = dimension_dict[label]
+                    raise ValueError(
+                        f"Size of label '{_chr(label)}' for operand {idx} ({dim}) "
+                        f"does not match previous terms ({dim_old})."
+                    )
+            else:
+                dimension_dict[label] = dim
+
+    if output_subscript is None:
+        # Build output subscripts
+        tmp_subscripts = list(itertools.chain.from_iterable(input_subscripts))
+        output_subscript = [
+            label
+            for label in sorted(set(tmp_subscripts))
+            if label < 0 or tmp_subscripts.count(label) == 1
+        ]
+    else:
+        if "@" not in output_subscript and -1 in dimension_dict:
+            raise ValueError(
+                "output has more dimensions than subscripts "
+                "given in einstein sum, but no '...' ellipsis "
+                "provided to broadcast the extra dimensions."
+            )
+        output_subscript = _parse_ellipsis_subscript(
+            output_subscript,
+            None,
+            ellipsis_len=sum(label < 0 for label in dimension_dict.keys()),
+        )
+
+        # Make sure output subscripts are in the input
+        tmp_subscripts = set(itertools.chain.from_iterable(input_subscripts))
+        for label in output_subscript:
+            if label not in tmp_subscripts:
+                raise ValueError(
+                    "einstein sum subscripts string included output subscript "
+                    f"'{_chr(label)}' which never appeared in an input."
+                )
+        if len(output_subscript) != len(set(output_subscript)):
+            repeated_subscript = []
+            for label in output_subscript:
+                if output_subscript.count(label) >= 2:
+                    repeated_subscript.append(_chr(label))
+            raise ValueError(
+                "einstein sum subscripts string includes output "
+                f"subscript {set(repeated_subscript)} multiple times."
+            )
+
+    diagonals = _einsum_diagonals(input_subscripts, shapes)
+    out_shape = tuple(dimension_dict[label] for label in output_subscript)
+
+    num_operands = len(shapes)
+    squeeze_axes = [()] * num_operands
+    if num_operands >= 2:
+        if any(0 in shape for shape in shapes):
+            return _EinsumPlan(
+                diagonals=tuple(diagonals),
+                zeros_shape=out_shape,
+                squeeze_axes=(),
+                sum_axes=(),
+                returns_view=False,
+                path=(),
+                memory_warning=False,
+                steps=(),
+                transpose_axes=(),
+                out_shape=out_shape,
+            )
+
+        # Don't squeeze if unary, because this affects later (in trivial sum)
+        # whether the return is a writeable view.
+        for idx, shape in enumerate(shapes):
+            if 1 in shape:
+                squeeze_axes[idx] = tuple(
+                    axis for axis, dim in enumerate(shape) if dim == 1
+                )
+                input_subscripts[idx] = [
+                    label
+                    for label, dim in zip(input_subscripts[idx], shape)
+                    if dim != 1
+                ]
+
+    # unary einsum without summation should return a (writeable) view
+    returns_view = num_operands == 1
+
+    # unary sum
+    sum_axes = [()] * num_operands
+    for idx, sub in enumerate(input_subscripts):
+        other_subscripts = copy.copy(input_subscripts)
+        other_subscripts[idx] = output_subscript
+        other_subscripts = set(itertools.chain.from_iterable(other_subscripts))
+        sum_axes[idx] = tuple(
+            axis
+            for axis, label in enumerate(sub)
+            if label not in other_subscripts
+        )
+        if sum_axes[idx]:
+            returns_view = False
+            input_subscripts[idx] = [
+                label
+                for axis, label in enumerate(sub)
+                if axis not in sum_axes[idx]
+            ]
+
+    optimize_algorithms = {
+        "greedy": _greedy_path,
+        "optimal": _optimal_path,
+    }
+    memory_warning = False
+    if optimize is False:
+        path = [tuple(range(num_operands))]
+    elif len(optimize) and (optimize[0] == "einsum_path"):
+        path = optimize[1:]
+    else:
+        try:
+            if len(optimize) == 2 and isinstance(optimize[1], (int, float)):
+                algo = optimize_algorithms[optimize[0]]
+                memory_limit = int(optimize[1])
+            else:
+                algo = optimize_algorithms[optimize]
+                memory_limit = 2**31
+        except (TypeError, KeyError):  # unhashable type or not found
+            raise TypeError(
+                f"Did not understand the path (optimize): {str(optimize)}"
+            )
+        input_sets = [set(sub) for sub in input_subscripts]
+        output_set = set(output_subscript)
+        path = algo(input_sets, output_set, dimension_dict, memory_limit)
+        memory_warning = any(len(indices) > 2 for indices in path)
+
+    steps = []
+    for idx0, idx1 in _iter_path_pairs(path):
+        sub0 = input_subscripts.pop(idx0)
+        sub1 = input_subscripts.pop(idx1)
+        sub_others = list(
+            itertools.chain(
+                output_subscript,
+                itertools.chain.from_iterable(input_subscripts),
+            )
+        )
+        step, sub_out = _plan_reduced_binary_einsum(sub0, sub1, sub_others)
+        steps.append((idx0, idx1, step))
+        input_subscripts.append(sub_out)
+
+    (sub0,) = input_subscripts
+    transpose_axes = tuple(
+        sub0.index(label) for label in output_subscript if label in sub0
+    )
+
+    return _EinsumPlan(
+        diagonals=tuple(diagonals),
+        zeros_shape=None,
+        squeeze_axes=tuple(squeeze_axes),
+        sum_axes=tuple(sum_axes),
+        returns_view=returns_view,
+        path=tuple(tuple(indices) for indices in path),
+        memory_warning=memory_warning,
+        steps=tuple(steps),
+        transpose_axes=transpose_axes,
+        out_shape=out_shape,
+    )
+
+
 def _make_transpose_axes(sub, b_dims, c_dims):
     """Copied from _make_transpose_axes in cupy/core/_einsum.py"""
     bs = []
@@ -877,8 +1243,27 @@ def _parse_possible_contraction(
     return [sort, positions, new_input_sets]
 
 
-def _reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
-    """Copied from _reduced_binary_einsum in cupy/core/_einsum.py"""
+def _plan_reduced_binary_einsum(sub0, sub1, sub_others):
+    """
+    Adopted from _reduced_binary_einsum in cupy/core/_einsum.py
+
+    Compute the step contracting a pair of "reduced" operands.
+
+    Parameters
+    ----------
+    sub0, sub1 : list of ints
+        Subscripts of the operands, with no repeated labels.
+    sub_others : list of ints
+        Subscripts of the output and of the remaining operands.
+
+    Returns
+    -------
+    step : tuple
+        The step to be passed to :obj:`_reduced_binary_einsum`.
+    sub_out : list of ints
+        Subscripts of the result of the step.
+
+    """
 
     set0 = set(sub0)
     set1 = set(sub1)
@@ -886,7 +1271,7 @@ def _reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
     assert len(set1) == len(sub1), "operand 1 should be reduced: diagonal"
 
     if len(sub0) == 0 or len(sub1) == 0:
-        return arr0 * arr1, sub0 + sub1
+        return ("multiply",), sub0 + sub1
 
     set_others = set(sub_others)
     shared = set0 & set1
@@ -909,16 +1294,34 @@ def _reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
         if len(sub_out) == len(sub_others):
             # to assure final output of einsum is C-contiguous
             sub_out = sub_others
-        arr0 = _expand_dims_transpose(arr0, sub0, sub_out)
-        arr1 = _expand_dims_transpose(arr1, sub1, sub_out)
-        return arr0 * arr1, sub_out
+        step = ("multiply", tuple(sub0), tuple(sub1), tuple(sub_out))
+        return step, sub_out
+
+    return ("matmul", (bs0, ts0, cs0), (bs1, cs1, ts1)), sub_out
+
+
+def _reduced_binary_einsum(arr0, arr1, step):
+    """
+    Adopted from _reduced_binary_einsum in cupy/core/_einsum.py
+
+    Contract a pair of "reduced" operands following the `step` computed by
+    :obj:`_plan_reduced_binary_einsum`.
+
+    """
 
-    tmp0, shapes0 = _flatten_transpose(arr0, [bs0, ts0, cs0])
-    tmp1, shapes1 = _flatten_transpose(arr1, [bs1, cs1, ts1])
+    if step[0] == "multiply":
+        if len(step) > 1:
+            _, sub0, sub1, sub_out = step
+            arr0 = _expand_dims_transpose(arr0, sub0, sub_out)
+            arr1 = _expand_dims_transpose(arr1, sub1, sub_out)
+        return arr0 * arr1
+
+    _, axeses0, axeses1 = step
+    tmp0, shapes0 = _flatten_transpose(arr0, axeses0)
+    tmp1, shapes1 = _flatten_transpose(arr1, axeses1)
     shapes_out = shapes0[0] + shapes0[1] + shapes1[2]
     assert shapes0[0] == shapes1[0]
-    arr_out = dpnp.matmul(tmp0, tmp1).reshape(shapes_out)
-    return arr_out, sub_out
+    return dpnp.matmul(tmp0, tmp1).reshape(shapes_out)
 
 
 def _transpose_ex(a, axeses):
@@ -1005,224 +1408,142 @@ def _update_other_results(results, best):
     return mod_results
 
 
-def dpnp_einsum(
-    *operands, out=None, dtype=None, order="K", casting="safe", optimize=False
-):
-    """Evaluates the Einstein summation convention on the operands."""
+class EinsumExpression:
+    """
+    A compiled Einstein summation for operands of given shapes.
 
-    input_subscripts, output_subscript, operands = _parse_einsum_input(operands)
-    assert isinstance(input_subscripts, list)
-    assert isinstance(operands, list)
+    The expression should not be created directly, use
+    :obj:`dpnp.einsum_expression` instead.
 
-    dpnp.check_supported_arrays_type(*operands, scalar_type=True)
-    arrays = []
-    for a in operands:
-        if dpnp.is_supported_array_type(a):
-            arrays.append(a)
+    """
 
-    res_usm_type, exec_q = get_usm_allocations(arrays)
-    if out is not None:
-        dpnp.check_supported_arrays_type(out)
-        if dpctl.utils.get_execution_queue((exec_q, out.sycl_queue)) is None:
-            raise ExecutionPlacementError(
-                "Input and output allocation queues are not compatible"
+    def __init__(
+        self,
+        subscripts,
+        *shapes,
+        dtype=None,
+        order="K",
+        casting="same_kind",
+        optimize="greedy",
+    ):
+        if not isinstance(subscripts, str):
+            raise TypeError(
+                f"subscripts must be a string, but got {type(subscripts)}"
             )
 
-    for id, a in enumerate(operands):
-        if dpnp.isscalar(a):
-            scalar_dtype = map_dtype_to_device(type(a), exec_q.sycl_device)
-            operands[id] = dpnp.array(
-                a, dtype=scalar_dtype, usm_type=res_usm_type, sycl_queue=exec_q
+        shapes = tuple(
+            (
+                (operator.index(shape),)
+                if not isinstance(shape, (tuple, list))
+                else tuple(operator.index(dim) for dim in shape)
             )
-            arrays.append(operands[id])
-    result_dtype = dpnp.result_type(*arrays) if dtype is None else dtype
-    if order is not None and order in "aA":
-        order = "F" if all(arr.flags.fnc for arr in arrays) else "C"
-
-    input_subscripts = [
-        _parse_ellipsis_subscript(sub, idx, ndim=arr.ndim)
-        for idx, (sub, arr) in enumerate(zip(input_subscripts, operands))
-    ]
+            for shape in shapes
+        )
+        input_subscripts, output_subscript, _ = _parse_einsum_input(
+            (subscripts,) + shapes
+        )
 
-    # Get length of each unique dimension and ensure all dimensions are correct
-    dimension_dict = {}
-    for idx, sub in enumerate(input_subscripts):
-        sh = operands[idx].shape
-        for axis, label in enumerate(sub):
-            dim = sh[axis]
-            if label in dimension_dict.keys():
-                # For broadcasting cases we always want the largest dim size
-                if dimension_dict[label] == 1:
-                    dimension_dict[label] = dim
-                elif dim not in (1, dimension_dict[label]):
-                    dim_old = dimension_dict[label]
-                    raise ValueError(
-                        f"Size of label '{_chr(label)}' for operand {idx} ({dim}) "
-                        f"does not match previous terms ({dim_old})."
-                    )
-            else:
-                dimension_dict[label] = dim
+        self._subscripts = subscripts
+        self._shapes = shapes
+        self._dtype = dtype
+        self._order = order
+        self._casting = casting
+        self._plan = _get_einsum_plan(
+            input_subscripts, output_subscript, shapes, optimize
+        )
 
-    if output_subscript is None:
-        # Build output subscripts
-        tmp_subscripts = list(itertools.chain.from_iterable(input_subscripts))
-        output_subscript = [
-            label
-            for label in sorted(set(tmp_subscripts))
-            if label < 0 or tmp_subscripts.count(label) == 1
-        ]
-    else:
-        if "@" not in output_subscript and -1 in dimension_dict:
+    def __call__(self, *operands, out=None):
+        if len(operands) != len(self._shapes):
             raise ValueError(
-                "output has more dimensions than subscripts "
-                "given in einstein sum, but no '...' ellipsis "
-                "provided to broadcast the extra dimensions."
+                f"The expression is created for {len(self._shapes)} "
+                f"operands, but got {len(operands)} operands."
             )
-        output_subscript = _parse_ellipsis_subscript(
-            output_subscript,
-            None,
-            ellipsis_len=sum(label < 0 for label in dimension_dict.keys()),
-        )
 
-        # Make sure output subscripts are in the input
-        tmp_subscripts = set(itertools.chain.from_iterable(input_subscripts))
-        for label in output_subscript:
-            if label not in tmp_subscripts:
+        dpnp.check_supported_arrays_type(*operands)
+        for idx, (a, shape) in enumerate(zip(operands, self._shapes)):
+            if a.shape != shape:
                 raise ValueError(
-                    "einstein sum subscripts string included output subscript "
-                    f"'{_chr(label)}' which never appeared in an input."
+                    f"The expression is created for operand {idx} of shape "
+                    f"{shape}, but got an array of shape {a.shape}."
                 )
-        if len(output_subscript) != len(set(output_subscript)):
-            repeated_subscript = []
-            for label in output_subscript:
-                if output_subscript.count(label) >= 2:
-                    repeated_subscript.append(_chr(label))
-            raise ValueError(
-                "einstein sum subscripts string includes output "
-                f"subscript {set(repeated_subscript)} multiple times."
-            )
 
-    _einsum_diagonals(input_subscripts, operands)
+        res_usm_type, exec_q = get_usm_allocations(operands)
+        _check_out(out, exec_q)
+        return _einsum_execute(
+            self._plan,
+            list(operands),
+            out,
+            self._dtype,
+            self._order,
+            self._casting,
+            res_usm_type,
+            exec_q,
+        )
 
-    # no more raises
-    if len(operands) >= 2:
-        if any(arr.size == 0 for arr in operands):
-            return dpnp.zeros(
-                tuple(dimension_dict[label] for label in output_subscript),
-                dtype=result_dtype,
-                usm_type=res_usm_type,
-                sycl_queue=exec_q,
-            )
+    def __repr__(self):
+        return (
+            f"<EinsumExpression subscripts={self._subscripts!r} "
+            f"shapes={self._shapes}>"
+        )
 
-        # Don't squeeze if unary, because this affects later (in trivial sum)
-        # whether the return is a writeable view.
-        for idx in range(len(operands)):
-            arr = operands[idx]
-            if 1 in arr.shape:
-                squeeze_indices = []
-                sub = []
-                for axis, label in enumerate(input_subscripts[idx]):
-                    if arr.shape[axis] == 1:
-                        squeeze_indices.append(axis)
-                    else:
-                        sub.append(label)
-                input_subscripts[idx] = sub
-                operands[idx] = dpnp.squeeze(arr, axis=tuple(squeeze_indices))
-                assert operands[idx].ndim == len(input_subscripts[idx])
-            del arr
+    @property
+    def path(self):
+        """
+        The contraction path of the expression in a form accepted by
+        :obj:`dpnp.einsum` as `optimize` argument.
 
-    # unary einsum without summation should return a (writeable) view
-    returns_view = len(operands) == 1
+        """
+        return ["einsum_path", *self._plan.path]
 
-    # unary sum
-    for idx, sub in enumerate(input_subscripts):
-        other_subscripts = copy.copy(input_subscripts)
-        other_subscripts[idx] = output_subscript
-        other_subscripts = set(itertools.chain.from_iterable(other_subscripts))
-        sum_axes = tuple(
-            axis
-            for axis, label in enumerate(sub)
-            if label not in other_subscripts
-        )
-        if sum_axes:
-            returns_view = False
-            input_subscripts[idx] = [
-                label for axis, label in enumerate(sub) if axis not in sum_axes
-            ]
+    @property
+    def shapes(self):
+        """The shapes of the operands."""
+        return self._shapes
 
-            operands[idx] = operands[idx].sum(axis=sum_axes, dtype=result_dtype)
+    @property
+    def subscripts(self):
+        """The subscripts of the Einstein summation."""
+        return self._subscripts
 
-    if returns_view:
-        operands = [a.view() for a in operands]
-    else:
-        operands = [
-            dpnp.astype(a, result_dtype, copy=False, casting=casting)
-            for a in operands
-        ]
 
-    # no more casts
-    optimize_algorithms = {
-        "greedy": _greedy_path,
-        "optimal": _optimal_path,
-    }
-    if optimize is False:
-        path = [tuple(range(len(operands)))]
-    elif len(optimize) and (optimize[0] == "einsum_path"):
-        path = optimize[1:]
-    else:
-        try:
-            if len(optimize) == 2 and isinstance(optimize[1], (int, float)):
-                algo = optimize_algorithms[optimize[0]]
-                memory_limit = int(optimize[1])
-            else:
-                algo = optimize_algorithms[optimize]
-                memory_limit = 2**31
-        except (TypeError, KeyError):  # unhashable type or not found
-            raise TypeError(
-                f"Did not understand the path (optimize): {str(optimize)}"
-            )
-        input_sets = [set(sub) for sub in input_subscripts]
-        output_set = set(output_subscript)
-        path = algo(input_sets, output_set, dimension_dict, memory_limit)
-        if any(len(indices) > 2 for indices in path):
-            warnings.warn(
-                "memory efficient einsum is not supported yet",
-                RuntimeWarning,
-                stacklevel=2,
-            )
+def dpnp_einsum(
+    *operands, out=None, dtype=None, order="K", casting="safe", optimize=False
+):
+    """Evaluates the Einstein summation convention on the operands."""
 
-    for idx0, idx1 in _iter_path_pairs(path):
-        # "reduced" binary einsum
-        arr0 = operands.pop(idx0)
-        sub0 = input_subscripts.pop(idx0)
-        arr1 = operands.pop(idx1)
-        sub1 = input_subscripts.pop(idx1)
-        sub_others = list(
-            itertools.chain(
-                output_subscript,
-                itertools.chain.from_iterable(input_subscripts),
-            )
-        )
-        arr_out, sub_out = _reduced_binary_einsum(
-            arr0, sub0, arr1, sub1, sub_others
-        )
-        operands.append(arr_out)
-        input_subscripts.append(sub_out)
-        del arr0, arr1
+    input_subscripts, output_subscript, operands = _parse_einsum_input(operands)
+    assert isinstance(input_subscripts, list)
+    assert isinstance(operands, list)
 
-    # unary einsum at last
-    (arr0,) = operands
-    (sub0,) = input_subscripts
+    dpnp.check_supported_arrays_type(*operands, scalar_type=True)
+    arrays = []
+    for a in operands:
+        if dpnp.is_supported_array_type(a):
+            arrays.append(a)
 
-    transpose_axes = []
-    for label in output_subscript:
-        if label in sub0:
-            transpose_axes.append(sub0.index(label))
+    res_usm_type, exec_q = get_usm_allocations(arrays)
+    _check_out(out, exec_q)
 
-    arr_out = arr0.transpose(transpose_axes).reshape(
-        [dimension_dict[label] for label in output_subscript]
-    )
+    for id, a in enumerate(operands):
+        if dpnp.isscalar(a):
+            scalar_dtype = map_dtype_to_device(type(a), exec_q.sycl_device)
+            operands[id] = dpnp.array(
+                a, dtype=scalar_dtype, usm_type=res_usm_type, sycl_queue=exec_q
+            )
 
-    arr_out = dpnp.asarray(arr_out, order=order)
-    assert returns_view or arr_out.dtype == result_dtype
-    return dpnp.get_result_array(arr_out, out, casting=casting)
+    plan = _get_einsum_plan(
+        input_subscripts,
+        output_subscript,
+        [arr.shape for arr in operands],
+        optimize,
+    )
+    return _einsum_execute(
+        plan,
+        operands,
+        out,
+        dtype,
+        order,
+        casting,
+        res_usm_type,
+        exec_q,
+    )
@@ -0,0 +1,484 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Tracing and replaying of chains of element-wise functions.
+
+A function decorated with :obj:`dpnp.fuse` is traced once per signature of
+its arguments: it is called with placeholder variables and every
+element-wise function applied to them is recorded together with the
+array it produced. The recorded chain is then replayed for every further
+call with the same signature. Replaying writes the results of the
+intermediate functions into buffers which are recycled as soon as the
+intermediate value is not used anymore, so a chain needs only as many
+temporaries as there are values alive at the same time, and a function
+whose argument is consumed is evaluated in-place.
+
+Since the replay calls the same element-wise functions with the same
+arguments and only passes ``out`` of exactly the data type and layout
+the function would allocate by itself, the results are the same as of
+the eager evaluation, bit for bit.
+
+"""
+
+import dpnp
+from dpnp.dpnp_array import dpnp_array
+
+__all__ = ["Fusion", "dpnp_fusion_call", "is_fusion_var"]
+
+
+class _FusionVar:
+    """
+    A placeholder for an argument of a traced function or a result of an
+    element-wise function applied during tracing.
+
+    It wraps the value computed during tracing, so the data type and the
+    shape of the variable are known.
+
+    """
+
+    __slots__ = ("_array", "_history", "_slot")
+
+    # variables are compared element-wise
+    __hash__ = None
+
+    def __init__(self, history, slot, array):
+        self._history = history
+        self._slot = slot
+        self._array = array
+
+    def __repr__(self):
+        return f"<fusion variable dtype={self.dtype} shape={self.shape}>"
+
+    def __bool__(self):
+        raise TypeError(
+            "The truth value of a fused variable can not be determined, "
+            "data dependent control flow is not supported by dpnp.fuse."
+        )
+
+    @property
+    def dtype(self):
+        """Data type of the variable."""
+        return dpnp.result_type(self._array)
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the variable."""
+        return dpnp.ndim(self._array)
+
+    @property
+    def shape(self):
+        """Shape of the variable."""
+        return dpnp.shape(self._array)
+
+    @property
+    def size(self):
+        """Number of elements of the variable."""
+        return dpnp.size(self._array)
+
+    def __abs__(self):
+        return dpnp.absolute(self)
+
+    def __add__(self, other):
+        return dpnp.add(self, other)
+
+    def __and__(self, other):
+        return dpnp.bitwise_and(self, other)
+
+    def __eq__(self, other):
+        return dpnp.equal(self, other)
+
+    def __floordiv__(self, other):
+        return dpnp.floor_divide(self, other)
+
+    def __ge__(self, other):
+        return dpnp.greater_equal(self, other)
+
+    def __gt__(self, other):
+        return dpnp.greater(self, other)
+
+    def __invert__(self):
+        return dpnp.invert(self)
+
+    def __le__(self, other):
+        return dpnp.less_equal(self, other)
+
+    def __lshift__(self, other):
+        return dpnp.left_shift(self, other)
+
+    def __lt__(self, other):
+        return dpnp.less(self, other)
+
+    def __mod__(self, other):
+        return dpnp.remainder(self, other)
+
+    def __mul__(self, other):
+        return dpnp.multiply(self, other)
+
+    def __ne__(self, other):
+        return dpnp.not_equal(self, other)
+
+    def __neg__(self):
+        return dpnp.negative(self)
+
+    def __or__(self, other):
+        return dpnp.bitwise_or(self, other)
+
+    def __pos__(self):
+        return dpnp.positive(self)
+
+    def __pow__(self, other):
+        return dpnp.power(self, other)
+
+    def __radd__(self, other):
+        return dpnp.add(other, self)
+
+    def __rand__(self, other):
+        return dpnp.bitwise_and(other, self)
+
+    def __rfloordiv__(self, other):
+        return dpnp.floor_divide(other, self)
+
+    def __rlshift__(self, other):
+        return dpnp.left_shift(other, self)
+
+    def __rmod__(self, other):
+        return dpnp.remainder(other, self)
+
+    def __rmul__(self, other):
+        return dpnp.multiply(other, self)
+
+    def __ror__(self, other):
+        return dpnp.bitwise_or(other, self)
+
+    def __rpow__(self, other):
+        return dpnp.power(other, self)
+
+    def __rrshift__(self, other):
+        return dpnp.right_shift(other, self)
+
+    def __rshift__(self, other):
+        return dpnp.right_shift(self, other)
+
+    def __rsub__(self, other):
+        return dpnp.subtract(other, self)
+
+    def __rtruediv__(self, other):
+        return dpnp.true_divide(other, self)
+
+    def __rxor__(self, other):
+        return dpnp.bitwise_xor(other, self)
+
+    def __sub__(self, other):
+        return dpnp.subtract(self, other)
+
+    def __truediv__(self, other):
+        return dpnp.true_divide(self, other)
+
+    def __xor__(self, other):
+        return dpnp.bitwise_xor(self, other)
+
+
+class _FusionHistory:
+    """Record of element-wise functions applied during tracing."""
+
+    def __init__(self):
+        # values of the arguments and of the recorded results
+        self.values = []
+        # tuples of (method, func, args, kwargs, slot) where every item of
+        # `args` and every value of `kwargs` is a pair of a flag whether it
+        # is a variable and either a slot of the variable or the argument
+        # itself
+        self.nodes = []
+
+    def add_param(self, value):
+        """Add an argument of the traced function."""
+
+        self.values.append(value)
+        return _FusionVar(self, len(self.values) - 1, value)
+
+    def call(self, method, func, args, kwargs):
+        """Apply the element-wise function and record the call."""
+
+        if kwargs.pop("out", None) is not None:
+            raise NotImplementedError(
+                "`out` keyword argument is not supported in a fused function."
+            )
+
+        refs = tuple(self._ref(arg) for arg in args)
+        kw_refs = {key: self._ref(val) for key, val in kwargs.items()}
+
+        res = method(
+            func,
+            *(self._value(ref) for ref in refs),
+            **{key: self._value(ref) for key, ref in kw_refs.items()},
+        )
+        self.values.append(res)
+        slot = len(self.values) - 1
+        self.nodes.append((method, func, refs, kw_refs, slot))
+        return _FusionVar(self, slot, res)
+
+    def _ref(self, arg):
+        """Return a reference to an argument of a recorded call."""
+
+        if isinstance(arg, _FusionVar):
+            if arg._history is not self:
+                raise ValueError(
+                    "Variables of different fused functions can not be mixed."
+                )
+            return (True, arg._slot)
+        return (False, arg)
+
+    def _value(self, ref):
+        """Return the value traced for a reference."""
+
+        is_var, val = ref
+        return self.values[val] if is_var else val
+
+
+def _buffer_spec(res, kw_refs):
+    """
+    Return specification of a buffer to hold the result `res` of a
+    recorded call or ``None`` if the result has to be allocated by the
+    function itself.
+
+    """
+
+    if kw_refs.get("dtype", (False, None))[1] is not None or not isinstance(
+        res, dpnp_array
+    ):
+        return None
+
+    # a masked call leaves the unselected elements of `out` unchanged,
+    # so it must not write into a recycled buffer
+    is_var, where = kw_refs.get("where", (False, True))
+    if is_var or where is not True:
+        return None
+
+    flags = res.flags
+    if flags.c_contiguous:
+        order = "C"
+    elif flags.f_contiguous:
+        order = "F"
+    else:
+        return None
+    return (res.shape, res.dtype, order, res.usm_type, res.sycl_queue)
+
+
+class _FusionPlan:
+    """A traced chain of element-wise functions ready to be replayed."""
+
+    def __init__(self, history, n_params, out_refs, out_type):
+        nodes = history.nodes
+        n_nodes = len(nodes)
+
+        # index of the last call which uses every slot
+        last_use = {}
+        for i, (_, _, refs, kw_refs, _) in enumerate(nodes):
+            for is_var, slot in refs + tuple(kw_refs.values()):
+                if is_var:
+                    last_use[slot] = i
+        for is_var, slot in out_refs:
+            if is_var:
+                last_use[slot] = n_nodes
+
+        self._specs = []
+        self._calls = []
+        free = {}
+        slot_buffer = {}
+        for i, (method, func, refs, kw_refs, slot) in enumerate(nodes):
+            # buffers of temporaries consumed by this call are released
+            # first, so the call may be evaluated in-place
+            for is_var, ref in refs + tuple(kw_refs.values()):
+                if (
+                    is_var
+                    and ref >= n_params
+                    and last_use[ref] == i
+                    and ref in slot_buffer
+                ):
+                    buf = slot_buffer.pop(ref)
+                    free.setdefault(self._specs[buf], []).append(buf)
+
+            spec = _buffer_spec(history.values[slot], kw_refs)
+            buf = None
+            if spec is not None and slot in last_use:
+                if free.get(spec):
+                    buf = free[spec].pop()
+                else:
+                    self._specs.append(spec)
+                    buf = len(self._specs) - 1
+                slot_buffer[slot] = buf
+            self._calls.append((method, func, refs, kw_refs, slot, buf))
+
+        self._n_slots = len(history.values)
+        self._out_refs = out_refs
+        self.out_type = out_type
+
+    def __call__(self, args):
+        values = list(args) + [None] * (self._n_slots - len(args))
+        buffers = [None] * len(self._specs)
+        for method, func, refs, kw_refs, slot, buf in self._calls:
+            call_args = [values[r] if is_var else r for is_var, r in refs]
+            kwargs = {
+                key: values[r] if is_var else r
+                for key, (is_var, r) in kw_refs.items()
+            }
+            if buf is None:
+                values[slot] = method(func, *call_args, **kwargs)
+                continue
+
+            if buffers[buf] is None:
+                shape, dtype, order, usm_type, sycl_queue = self._specs[buf]
+                arr = dpnp.empty(
+                    shape,
+                    dtype=dtype,
+                    order=order,
+                    usm_type=usm_type,
+                    sycl_queue=sycl_queue,
+                )
+                # a distinct object of the same memory is passed as `out`
+                # to not mistake the call for an in-place operator
+                out = dpnp_array._create_from_usm_ndarray(arr.get_array())
+                buffers[buf] = (arr, out)
+
+            arr, out = buffers[buf]
+            method(func, *call_args, out=out, **kwargs)
+            values[slot] = arr
+
+        return [values[r] if is_var else r for is_var, r in self._out_refs]
+
+
+def _signature(args):
+    """Return a hashable key of the arguments of a fused function."""
+
+    key = []
+    for arg in args:
+        if dpnp.is_supported_array_type(arg):
+            key.append(
+                (
+                    type(arg),
+                    arg.dtype,
+                    arg.shape,
+                    arg.strides,
+                    arg.usm_type,
+                    arg.sycl_queue,
+                )
+            )
+        elif dpnp.isscalar(arg):
+            key.append(type(arg))
+        else:
+            raise TypeError(
+                "Arguments of a fused function must be arrays or scalars, "
+                f"but got {type(arg)}"
+            )
+    return tuple(key)
+
+
+class Fusion:
+    """
+    A function which chain of element-wise functions is traced once per
+    signature of arguments and then replayed with recycled buffers.
+
+    """
+
+    def __init__(self, func, name=None):
+        self.func = func
+        self.name = func.__name__ if name is None else name
+        self._cache = {}
+
+    def __repr__(self):
+        return f"<Fusion name={self.name}>"
+
+    def __call__(self, *args):
+        key = _signature(args)
+        plan = self._cache.get(key)
+        if plan is None:
+            plan, res = self._trace(args)
+            self._cache[key] = plan
+        else:
+            res = plan(args)
+
+        if plan.out_type is None:
+            return res[0]
+        return plan.out_type(res)
+
+    def _trace(self, args):
+        """
+        Trace the function with the arguments and return the plan to
+        replay it together with the results of tracing.
+
+        """
+
+        history = _FusionHistory()
+        params = [history.add_param(arg) for arg in args]
+        out = self.func(*params)
+
+        if isinstance(out, (tuple, list)):
+            out_type = type(out)
+        else:
+            out_type = None
+            out = (out,)
+
+        out_refs = []
+        for o in out:
+            if isinstance(o, _FusionVar):
+                if o._history is not history:
+                    raise ValueError(
+                        "A fused function returned a variable of another "
+                        "fused function."
+                    )
+                out_refs.append((True, o._slot))
+            else:
+                out_refs.append((False, o))
+
+        plan = _FusionPlan(history, len(args), tuple(out_refs), out_type)
+
+        # results of tracing are already evaluated
+        res = [history.values[r] if is_var else r for is_var, r in out_refs]
+        return plan, res
+
+    def clear_cache(self):
+        """Drop the traced chains of all signatures."""
+        self._cache.clear()
+
+
+def dpnp_fusion_call(method, func, args, **kwargs):
+    """
+    Record a call of element-wise function `func` with its implementation
+    `method` to the history of the fused function the variables among
+    `args` belong to.
+
+    """
+
+    history = next(a._history for a in args if isinstance(a, _FusionVar))
+    return history.call(method, func, args, kwargs)
+
+
+def is_fusion_var(x):
+    """Check if `x` is a variable of a traced function."""
+    return isinstance(x, _FusionVar)
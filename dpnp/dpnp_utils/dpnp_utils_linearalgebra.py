@@ -253,53 +253,43 @@ def _gemm_batch_matmul(exec_q, x1, x2, res):
     # split the batch into smaller chunks, the size depnends on device
     chunk = 4096 * 4096 - 2
     batch_size = res_shape[0]
+    x1_usm = dpnp.get_usm_ndarray(x1)
+    x2_usm = dpnp.get_usm_ndarray(x2)
+    res_usm = dpnp.get_usm_ndarray(res)
     for i in range(0, batch_size, chunk):
-        if x1_shape[0] == 1:
-            # x1 is repeatedly multiplied with each matrix in x2
-            x1_usm = dpnp.get_usm_ndarray(x1)
-            x2_usm = dpnp.get_usm_ndarray(x2[i : i + chunk, ...])
-        elif x2_shape[0] == 1:
-            x1_usm = dpnp.get_usm_ndarray(x1[i : i + chunk, ...])
-            x2_usm = dpnp.get_usm_ndarray(x2)
+        if batch_size > chunk:
+            # an array with a single matrix is repeatedly multiplied with
+            # each matrix in the other array
+            chunk_slice = slice(i, i + chunk)
+            x1_chunk = x1_usm if x1.shape[0] == 1 else x1_usm[chunk_slice]
+            x2_chunk = x2_usm if x2.shape[0] == 1 else x2_usm[chunk_slice]
+            res_chunk = res_usm[chunk_slice]
         else:
-            x1_usm = dpnp.get_usm_ndarray(x1[i : i + chunk, ...])
-            x2_usm = dpnp.get_usm_ndarray(x2[i : i + chunk, ...])
-        res_usm = dpnp.get_usm_ndarray(res[i : i + chunk, ...])
+            x1_chunk, x2_chunk, res_chunk = x1_usm, x2_usm, res_usm
 
         ht_ev, blas_ev, row_major = bi._gemm_batch(
             exec_q,
-            x1_usm,
-            x2_usm,
-            res_usm,
+            x1_chunk,
+            x2_chunk,
+            res_chunk,
             depends=_manager.submitted_events,
         )
         _manager.add_event_pair(ht_ev, blas_ev)
 
+    # gemm_batch writes the result in the layout of its 2D base, except for
+    # oneMath cuBLAS backend which supports only column major layout.
+    # In that case each 2D array of the batch is stored in the opposite
+    # order, which is reinterpreted by a view whenever the batch is
+    # contiguous, rather than by copying the data
     _, res_is_c_contig, res_is_f_contig = _define_contig_flag(res)
-    if row_major:
-        if res_is_f_contig:
-            # Considering the multiplication for one of the batches,
-            # we have result[0, 1] = a[0, :]*b[1, :]. In row_major mode,
-            # it is assumed result array is c-contiguous, i.e. the value of
-            # result[0, 1] is has the second place memory.
-            # however, the result array is batches of 2D f-contiguous array,
-            # i.e. the second place of memory points out to res[1, 0].
-            # So, we need to read data of each 2D array in the batch in
-            # "F" order and write it in "C" order
-            res = (
-                res.ravel(order="F")
-                .reshape(res_shape[1], res_shape[2], batch_size)
-                .transpose(2, 0, 1)
-            )
-    else:
-        if res_is_c_contig:
-            # read data of each 2D array in the batch in "C" order and
-            # write it in "F" order
-            res = (
-                res.ravel(order="C")
-                .reshape(batch_size, res_shape[2], res_shape[1])
-                .transpose(0, 2, 1)
-            )
+    if row_major and not res_is_c_contig:
+        # the second place of memory holds res[0, 1] instead of res[1, 0]
+        res = dpnp.swapaxes(res, 1, 2).reshape(res_shape)
+    elif not row_major and not res_is_f_contig:
+        # the second place of memory holds res[1, 0] instead of res[0, 1]
+        res = dpnp.swapaxes(
+            res.reshape(batch_size, res_shape[2], res_shape[1]), 1, 2
+        )
 
     if res_shape != orig_shape:
         res = res.reshape(orig_shape)
@@ -0,0 +1,176 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Selection based partitioning of arrays.
+
+The order statistics requested by ``kth`` are found with a batched
+Floyd-Rivest selection: a regular sample of every slice is sorted to pick
+a pair of bounds around each requested rank, the elements lying strictly
+between the bounds are gathered and only those candidates are sorted.
+The partitioned result is then produced by a stable radix sort of a small
+integer key telling which of the intervals between the selected values
+every element belongs to. Both steps take linear time in the length of
+a slice, which is cheaper than the full sort used otherwise.
+
+"""
+
+import math
+
+import dpnp
+
+__all__ = ["dpnp_introselect"]
+
+# Slices shorter than that are sorted, since the selection has a few
+# extra passes over the data which do not pay off for small sizes
+_SELECTION_MIN_SIZE = 2048
+
+# Maximum number of `kth` values handled by the selection, every value
+# needs extra passes over the data to be located
+_SELECTION_MAX_KTH = 8
+
+
+def _select_kth_values(a, kth):
+    """
+    Find the values of order statistics `kth` along the last axis of
+    2-D array `a` which has no NaNs.
+
+    Return an array of shape ``(a.shape[0], len(kth))`` with the values or
+    ``None`` if a sample did not bound the requested rank for some slice.
+
+    """
+
+    m, n = a.shape
+
+    # sample of about n**(2/3) elements and half-width of the window in it
+    step = max(n // int(n ** (2.0 / 3.0)), 1)
+    sample = dpnp.sort(a[:, ::step], axis=-1)
+    ns = sample.shape[-1]
+    delta = int(math.sqrt(ns * math.log(n))) + 1
+
+    rows = dpnp.arange(m, sycl_queue=a.sycl_queue)
+    values = []
+    for k in kth:
+        rank = k * ns // n
+        lo_rank = max(rank - delta, 0)
+        hi_rank = min(rank + delta, ns - 1)
+
+        if lo_rank == 0:
+            lo = dpnp.min(a, axis=-1, keepdims=True)
+        else:
+            lo = sample[:, lo_rank : lo_rank + 1]
+
+        if hi_rank == ns - 1:
+            hi = dpnp.max(a, axis=-1, keepdims=True)
+        else:
+            hi = sample[:, hi_rank : hi_rank + 1]
+
+        # number of elements up to each bound
+        n_lt_lo = dpnp.count_nonzero(a < lo, axis=-1)
+        n_le_lo = dpnp.count_nonzero(a <= lo, axis=-1)
+        n_lt_hi = dpnp.count_nonzero(a < hi, axis=-1)
+        n_le_hi = dpnp.count_nonzero(a <= hi, axis=-1)
+        if not dpnp.all((n_lt_lo <= k) & (k < n_le_hi)):
+            return None
+
+        # sort candidates strictly between the bounds slice by slice:
+        # by value first and then stably by the slice index
+        mask = (a > lo) & (a < hi)
+        cand = a[mask]
+        if cand.size > 0:
+            cand_rows = dpnp.broadcast_to(rows[:, None], a.shape)[mask]
+            order = dpnp.argsort(cand, kind="stable")
+            cand = dpnp.take(cand, order)
+            cand_rows = dpnp.take(cand_rows, order)
+            cand = dpnp.take(cand, dpnp.argsort(cand_rows, kind="stable"))
+
+            n_cand = n_lt_hi - n_le_lo
+            offsets = dpnp.cumsum(n_cand) - n_cand
+            pos = dpnp.clip(offsets + k - n_le_lo, 0, cand.size - 1)
+            cand = dpnp.take(cand, pos)
+        else:
+            cand = lo[:, 0]
+
+        # k-th value is one of the bounds if it has duplicates there
+        val = dpnp.where(k < n_le_lo, lo[:, 0], cand)
+        val = dpnp.where(k >= n_lt_hi, hi[:, 0], val)
+        values.append(val)
+
+    return dpnp.stack(values, axis=-1)
+
+
+def dpnp_introselect(a, kth, axis=-1, return_indices=False):
+    """
+    Partition array `a` along `axis` so that every element with index in
+    `kth` is in its sorted position.
+
+    `kth` must be a sequence of non-negative integers in range of
+    ``a.shape[axis]``. If `return_indices` is ``True``, the indices which
+    partition the array are returned instead of the partitioned array.
+
+    """
+
+    sort_func = dpnp.argsort if return_indices else dpnp.sort
+
+    n = a.shape[axis]
+    kth = sorted(set(kth))
+    if (
+        n < _SELECTION_MIN_SIZE
+        or len(kth) > _SELECTION_MAX_KTH
+        or not dpnp.issubdtype(a.dtype, dpnp.number)
+        or dpnp.issubdtype(a.dtype, dpnp.complexfloating)
+    ):
+        return sort_func(a, axis=axis)
+
+    # NaNs are sorted to the end, there is no need to select in that case
+    if dpnp.issubdtype(a.dtype, dpnp.inexact) and dpnp.isnan(a).any():
+        return sort_func(a, axis=axis)
+
+    a_moved = dpnp.moveaxis(a, axis, -1)
+    a_2d = a_moved.reshape(-1, n)
+
+    values = _select_kth_values(a_2d, kth)
+    if values is None:
+        return sort_func(a, axis=axis)
+
+    # every element is keyed by the number of selected values which are
+    # less than it plus the number of ones which are less or equal to it,
+    # the key is increasing with the value and equal for equal elements,
+    # so after stable sorting by the key every selected value arrives at
+    # its position
+    key = dpnp.zeros_like(a_2d, dtype=dpnp.uint8)
+    for j in range(len(kth)):
+        v = values[:, j : j + 1]
+        key += a_2d > v
+        key += a_2d >= v
+
+    ind = dpnp.argsort(key, axis=-1, kind="radixsort")
+    if not return_indices:
+        ind = dpnp.take_along_axis(a_2d, ind, axis=-1)
+    res = ind.reshape(a_moved.shape)
+    return dpnp.moveaxis(res, -1, axis)
@@ -34,9 +34,28 @@ from dpctl.tensor._numpy_helper import normalize_axis_tuple
 
 import dpnp
 from dpnp.dpnp_array import dpnp_array
+from dpnp.dpnp_utils import get_usm_allocations
+from dpnp.dpnp_utils.dpnp_utils_sorting import (
+    _SELECTION_MAX_KTH,
+    _SELECTION_MIN_SIZE,
+    _select_kth_values,
+    dpnp_introselect,
+)
 from dpnp.exceptions import ExecutionPlacementError
 
-__all__ = ["dpnp_cov", "dpnp_median"]
+__all__ = ["dpnp_cov", "dpnp_median", "dpnp_quantile"]
+
+# Maximum number of quantiles for which the order statistics are selected
+# instead of sorting the whole array
+_QUANTILE_SELECTION_MAX_Q = 8
+
+# The selection is used only if the requested order statistics lie within
+# `n // _QUANTILE_SELECTION_RATIO` elements in total from both ends
+_QUANTILE_SELECTION_RATIO = 8
+
+# Maximum number of elements of the centered copy of the data which
+# `dpnp_cov` holds at once, the samples are processed in chunks beyond that
+_COV_CHUNK_SIZE = 2**26
 
 
 def _calc_median(a, axis, out=None):
@@ -93,6 +112,171 @@ def _calc_nanmedian(a, out=None):
     return dpnp.squeeze(res)
 
 
+def _compute_virtual_index(n, q, alpha, beta):
+    """
+    Compute the floating point indexes of an array for the linear
+    interpolation of quantiles.
+
+    `alpha` and `beta` are constants defined by the method, see
+    R. J. Hyndman and Y. Fan, "Sample quantiles in statistical packages,"
+    The American Statistician, 50(4), pp. 361-365, 1996.
+
+    """
+
+    return n * q + (alpha + q * (1 - alpha - beta)) - 1
+
+
+def _discrete_interpolation_to_boundaries(index, gamma_condition_fun):
+    """
+    Compute the integral indexes of an array for the discontinuous methods.
+
+    The previous index is taken where `gamma_condition_fun` is ``True`` and
+    the next one otherwise. The resulting indexes are clipped to be
+    non-negative.
+
+    """
+
+    previous = dpnp.floor(index)
+    gamma = index - previous
+    res = dpnp.where(gamma_condition_fun(gamma, index), previous, previous + 1)
+    return dpnp.maximum(res, 0)
+
+
+def _closest_observation(n, q):
+    """Compute the indexes for ``method="closest_observation"``."""
+
+    # "choose the nearest even order statistic at g=0" (H&F (1996) pp. 362).
+    # Order is 1-based so for zero-based indexing round to nearest odd index.
+    return _discrete_interpolation_to_boundaries(
+        n * q - 1.5,
+        lambda gamma, index: (gamma == 0) & (dpnp.floor(index) % 2 == 1),
+    )
+
+
+def _inverted_cdf(n, q):
+    """Compute the indexes for ``method="inverted_cdf"``."""
+
+    return _discrete_interpolation_to_boundaries(
+        n * q - 1, lambda gamma, _: gamma == 0
+    )
+
+
+# Every method is described by a pair of functions: the first one computes
+# the virtual indexes of the quantiles, the second one adjusts the fraction
+# used for the interpolation between the neighboring order statistics.
+# ``None`` as the second function means the virtual indexes are integral,
+# so no interpolation is needed.
+_QUANTILE_METHODS = {
+    # discontinuous methods of Hyndman and Fan
+    "inverted_cdf": (_inverted_cdf, None),
+    "averaged_inverted_cdf": (
+        lambda n, q: n * q - 1,
+        lambda gamma, _: dpnp.where(gamma == 0, 0.5, 1.0),
+    ),
+    "closest_observation": (_closest_observation, None),
+    # continuous methods of Hyndman and Fan
+    "interpolated_inverted_cdf": (
+        lambda n, q: _compute_virtual_index(n, q, 0, 1),
+        lambda gamma, _: gamma,
+    ),
+    "hazen": (
+        lambda n, q: _compute_virtual_index(n, q, 0.5, 0.5),
+        lambda gamma, _: gamma,
+    ),
+    "weibull": (
+        lambda n, q: _compute_virtual_index(n, q, 0, 0),
+        lambda gamma, _: gamma,
+    ),
+    # `(n - 1) * q` is mathematically equivalent to
+    # `_compute_virtual_index(n, q, 1, 1)` but has less rounding issues
+    "linear": (lambda n, q: (n - 1) * q, lambda gamma, _: gamma),
+    "median_unbiased": (
+        lambda n, q: _compute_virtual_index(n, q, 1 / 3.0, 1 / 3.0),
+        lambda gamma, _: gamma,
+    ),
+    "normal_unbiased": (
+        lambda n, q: _compute_virtual_index(n, q, 3 / 8.0, 3 / 8.0),
+        lambda gamma, _: gamma,
+    ),
+    # other methods
+    "lower": (lambda n, q: dpnp.floor((n - 1) * q), None),
+    "higher": (lambda n, q: dpnp.ceil((n - 1) * q), None),
+    "midpoint": (
+        lambda n, q: 0.5 * (dpnp.floor((n - 1) * q) + dpnp.ceil((n - 1) * q)),
+        lambda gamma, index: dpnp.where(index % 1 == 0, 0.0, 0.5),
+    ),
+    "nearest": (lambda n, q: dpnp.round((n - 1) * q), None),
+}
+
+
+def _select_order_statistics(a, kth):
+    """
+    Select the order statistics with indexes `kth` along the last axis.
+
+    If all the requested order statistics lie close to both ends, the
+    smallest and the largest elements are selected by
+    :obj:`dpctl.tensor.top_k` and sorted. Otherwise, the values of the order
+    statistics are found by the selection used in partitioning. Both avoid
+    sorting of the whole array. Return a tuple of the array with the
+    selected order statistics and a function mapping the indexes of the
+    order statistics to the positions in that array, or ``(None, None)`` if
+    the selection is not applicable.
+
+    """
+
+    n = a.shape[-1]
+    low = [k for k in kth if k < n // 2]
+    high = [k for k in kth if k >= n // 2]
+    k_small = max(low) + 1 if low else 0
+    k_large = n - min(high) if high else 0
+    if k_small + k_large > n // _QUANTILE_SELECTION_RATIO:
+        return _select_interior_order_statistics(a, kth)
+
+    usm_a = dpnp.get_usm_ndarray(a)
+    parts = []
+    if k_small > 0:
+        parts.append(dpt.top_k(usm_a, k_small, axis=-1, mode="smallest")[0])
+    if k_large > 0:
+        parts.append(dpt.top_k(usm_a, k_large, axis=-1, mode="largest")[0])
+    selected = dpt.sort(dpt.concat(parts, axis=-1), axis=-1)
+
+    # the largest elements are placed right after the smallest ones
+    shift = n - k_large - k_small
+    return (
+        dpnp_array._create_from_usm_ndarray(selected),
+        lambda idx: dpnp.where(idx < k_small, idx, idx - shift),
+    )
+
+
+def _select_interior_order_statistics(a, kth):
+    """
+    Select the values of the order statistics with indexes `kth` along the
+    last axis by :obj:`dpnp.dpnp_utils.dpnp_utils_sorting._select_kth_values`.
+
+    Return the same tuple as `_select_order_statistics`.
+
+    """
+
+    n = a.shape[-1]
+    if n < _SELECTION_MIN_SIZE or len(kth) > _SELECTION_MAX_KTH:
+        return None, None
+
+    # NaNs are sorted to the end, there is no need to select in that case
+    if dpnp.issubdtype(a.dtype, dpnp.inexact) and dpnp.isnan(a).any():
+        return None, None
+
+    kth = sorted(kth)
+    values = _select_kth_values(a.reshape(-1, n), kth)
+    if values is None:
+        return None, None
+
+    kth = dpnp.asarray(kth, usm_type=a.usm_type, sycl_queue=a.sycl_queue)
+    return (
+        values.reshape(a.shape[:-1] + (kth.size,)),
+        lambda idx: dpnp.searchsorted(kth, idx),
+    )
+
+
 def _flatten_array_along_axes(a, axes_to_flatten, overwrite_input):
     """Flatten an array along a specific set of axes."""
 
@@ -121,43 +305,77 @@ def _flatten_array_along_axes(a, axes_to_flatten, overwrite_input):
     return a_flatten, overwrite_input
 
 
+def _cov_chunk(arrays, start, stop, dtype, usm_type, sycl_queue):
+    """
+    Gather samples from `start` to `stop` of all variables in `arrays` into
+    a new C-contiguous array of data type `dtype`.
+
+    """
+
+    n_vars = sum(x.shape[0] for x in arrays)
+    chunk = dpnp.empty(
+        (n_vars, stop - start),
+        dtype=dtype,
+        usm_type=usm_type,
+        sycl_queue=sycl_queue,
+    )
+
+    row = 0
+    for x in arrays:
+        chunk[row : row + x.shape[0]] = x[:, start:stop]
+        row += x.shape[0]
+    return chunk
+
+
+def _cov_variables(a, rowvar):
+    """Return a 2-D view of `a` with variables in rows."""
+
+    if a.ndim < 2:
+        return a.reshape(1, -1)
+    return a if rowvar else a.T
+
+
 def dpnp_cov(
     m, y=None, rowvar=True, ddof=1, dtype=None, fweights=None, aweights=None
 ):
     """
     Estimate a covariance matrix based on passed data.
 
-    The implementation is done through existing dpnp functions.
+    The implementation is done through existing dpnp functions. The samples
+    are copied, centered in-place and multiplied in chunks of at most
+    ``_COV_CHUNK_SIZE`` elements, so that no temporary of the size of the
+    input is needed for large data. Without weights the product of a real
+    chunk with its transpose is computed by ``syrk``.
 
     """
 
-    # need to create a copy of input, since it will be modified in-place
-    x = dpnp.array(m, ndmin=2, dtype=dtype)
-    if not rowvar and m.ndim != 1:
-        x = x.T
-
+    x = _cov_variables(m, rowvar)
     if x.shape[0] == 0:
         return dpnp.empty_like(
             x, shape=(0, 0), dtype=dpnp.default_float_type(m.sycl_queue)
         )
 
+    arrays = [x]
     if y is not None:
-        y_ndim = y.ndim
-        y = dpnp.array(y, copy=None, ndmin=2, dtype=dtype)
-        if not rowvar and y_ndim != 1:
-            y = y.T
-        x = dpnp.concatenate((x, y), axis=0)
+        y = _cov_variables(y, rowvar)
+        if y.shape[1] != x.shape[1]:
+            raise ValueError("m and y must have the same number of samples")
+        arrays.append(y)
+
+    usm_type, sycl_queue = get_usm_allocations(arrays)
+    n_vars = sum(x.shape[0] for x in arrays)
+    n = x.shape[1]
 
     # get the product of frequencies and weights
     w = None
     if fweights is not None:
-        if fweights.shape[0] != x.shape[1]:
+        if fweights.shape[0] != n:
             raise ValueError("incompatible numbers of samples and fweights")
 
         w = fweights
 
     if aweights is not None:
-        if aweights.shape[0] != x.shape[1]:
+        if aweights.shape[0] != n:
             raise ValueError("incompatible numbers of samples and aweights")
 
         if w is None:
@@ -165,12 +383,26 @@ def dpnp_cov(
         else:
             w *= aweights
 
-    avg, w_sum = dpnp.average(x, axis=1, weights=w, returned=True)
-    w_sum = w_sum[0]
+    step = max(1, _COV_CHUNK_SIZE // n_vars)
+    bounds = [(i, min(i + step, n)) for i in range(0, n, step)] or [(0, 0)]
+
+    # the first pass computes the (weighted) mean of every variable,
+    # a single chunk is kept to be centered in the second pass
+    chunk = None
+    avg = 0
+    for start, stop in bounds:
+        chunk = _cov_chunk(arrays, start, stop, dtype, usm_type, sycl_queue)
+        if w is None:
+            avg += dpnp.sum(chunk, axis=1)
+        else:
+            avg += dpnp.matmul(chunk, w[start:stop])
+
+    w_sum = n if w is None else dpnp.sum(w)
+    avg /= w_sum
 
     # determine the normalization
     if w is None:
-        fact = x.shape[1] - ddof
+        fact = n - ddof
     elif ddof == 0:
         fact = w_sum
     elif aweights is None:
@@ -184,16 +416,197 @@ def dpnp_cov(
         )
         fact = 0.0
 
-    x -= avg[:, None]
-    if w is None:
-        x_t = x.T
-    else:
-        x_t = (x * w).T
+    is_complex = dpnp.issubdtype(dtype, dpnp.complexfloating)
+    c = None
+    for start, stop in bounds:
+        if len(bounds) > 1:
+            chunk = _cov_chunk(arrays, start, stop, dtype, usm_type, sycl_queue)
+        chunk -= avg[:, None]
+
+        if w is None:
+            # the transposed view shares the data with the chunk,
+            # so that `matmul` fills the product by `syrk`
+            chunk_t = chunk.T
+        else:
+            chunk_t = (chunk * w[start:stop]).T
+        if is_complex:
+            chunk_t = chunk_t.conj()
+
+        if c is None:
+            c = dpnp.matmul(chunk, chunk_t)
+        else:
+            c += dpnp.matmul(chunk, chunk_t)
 
-    c = dpnp.dot(x, x_t.conj()) / fact
+    c /= fact
     return c.squeeze()
 
 
+def dpnp_quantile(
+    a,
+    q,
+    axis=None,
+    out=None,
+    overwrite_input=False,
+    method="linear",
+    keepdims=False,
+    weights=None,
+    ignore_nan=False,
+    percentile=False,
+):
+    """
+    Compute the q-th quantiles of an array along a specified axis.
+
+    If `percentile` is ``True``, `q` is interpreted as percentages in the
+    range ``[0, 100]``. The result holds the quantiles in the leading
+    dimensions.
+
+    The order statistics are gathered from a sorted copy of `a`. If only
+    a few quantiles are requested, the order statistics are selected instead
+    of sorting the whole array: by :obj:`dpctl.tensor.top_k` if they lie
+    close to both ends of the data, or by the selection used in
+    partitioning otherwise.
+
+    """
+
+    if dpnp.issubdtype(a.dtype, dpnp.complexfloating):
+        raise TypeError("a must be an array of real numbers")
+    if weights is not None:
+        raise NotImplementedError(
+            "weights keyword argument is only supported with its default value."
+        )
+    if method not in _QUANTILE_METHODS:
+        raise ValueError(
+            f"{method!r} is not a valid method. Use one of: "
+            f"{tuple(_QUANTILE_METHODS.keys())}"
+        )
+    get_virtual_index, fix_gamma = _QUANTILE_METHODS[method]
+
+    usm_type, exec_q = get_usm_allocations([a, q])
+    q = dpnp.asarray(
+        q,
+        dtype=dpnp.default_float_type(sycl_queue=exec_q),
+        usm_type=usm_type,
+        sycl_queue=exec_q,
+    )
+    if q.ndim > 1:
+        raise ValueError("q must be a scalar or 1d")
+    if percentile:
+        q = q / 100
+    if not dpnp.all((q >= 0) & (q <= 1)):
+        if percentile:
+            raise ValueError("Percentiles must be in the range [0, 100]")
+        raise ValueError("Quantiles must be in the range [0, 1]")
+
+    a_ndim = a.ndim
+    a_shape = a.shape
+    _axis = range(a_ndim) if axis is None else axis
+    _axis = normalize_axis_tuple(_axis, a_ndim)
+
+    # move the reduced axes to the end and flatten them into a single one
+    if axis is None:
+        a = dpnp.ravel(a)
+    elif len(_axis) == 1:
+        a = dpnp.moveaxis(a, _axis[0], -1)
+    else:
+        a, overwrite_input = _flatten_array_along_axes(
+            a, _axis, overwrite_input
+        )
+
+    n = a.shape[-1]
+    if n == 0:
+        raise ValueError("cannot compute quantiles of an empty slice")
+
+    # the integral methods preserve data type of the input
+    if fix_gamma is None or dpnp.issubdtype(a.dtype, dpnp.inexact):
+        res_dt = a.dtype
+    else:
+        res_dt = dpnp.default_float_type(sycl_queue=a.sycl_queue)
+
+    q_flat = dpnp.ravel(q)
+    has_nans = dpnp.issubdtype(a.dtype, dpnp.inexact)
+    if ignore_nan:
+        # NaNs are sorted to the end, so every slice has its own number of
+        # valid values and the indexes differ between the slices
+        n = dpnp.sum(~dpnp.isnan(a), axis=-1)
+        q_flat = q_flat.reshape((-1,) + (1,) * n.ndim)
+
+    def _clip_index(index):
+        index = dpnp.maximum(dpnp.minimum(index, n - 1), 0)
+        return index.astype(dpnp.intp)
+
+    virtual_index = get_virtual_index(n, q_flat)
+    floor_index = dpnp.floor(virtual_index)
+    prev_index = _clip_index(floor_index)
+    if fix_gamma is None:
+        next_index = prev_index
+    else:
+        next_index = _clip_index(floor_index + 1)
+
+    a_sorted, map_index = None, None
+    if (
+        not ignore_nan
+        and q_flat.size <= _QUANTILE_SELECTION_MAX_Q
+        and a.dtype != dpnp.bool
+    ):
+        kth = dpnp.asnumpy(dpnp.concatenate((prev_index, next_index)))
+        a_sorted, map_index = _select_order_statistics(a, set(kth.tolist()))
+
+    if a_sorted is not None:
+        prev_index = map_index(prev_index)
+        next_index = map_index(next_index)
+        if has_nans:
+            nan_mask = dpnp.isnan(a).any(axis=-1)
+    else:
+        if overwrite_input:
+            if isinstance(a, dpt.usm_ndarray):
+                # dpnp.ndarray.sort only works with dpnp_array
+                a = dpnp_array._create_from_usm_ndarray(a)
+            a.sort(axis=-1)
+            a_sorted = a
+        else:
+            a_sorted = dpnp.sort(a, axis=-1)
+
+        if has_nans:
+            # sorting puts NaNs at the end
+            nan_mask = dpnp.isnan(a_sorted[..., -1])
+
+    def _take(index):
+        if ignore_nan:
+            index = dpnp.moveaxis(index, 0, -1)
+            res = dpnp.take_along_axis(a_sorted, index, axis=-1)
+        else:
+            res = dpnp.take(a_sorted, index, axis=-1)
+        return dpnp.moveaxis(res, -1, 0).astype(res_dt, copy=False)
+
+    res = _take(prev_index)
+    if fix_gamma is not None:
+        gamma = virtual_index - floor_index
+        gamma = fix_gamma(gamma, virtual_index).astype(res_dt, copy=False)
+        gamma = gamma.reshape(gamma.shape + (1,) * (res.ndim - gamma.ndim))
+
+        # linear interpolation which is exact at both ends
+        res_next = _take(next_index)
+        diff = res_next - res
+        res = dpnp.where(
+            gamma >= 0.5, res_next - diff * (1 - gamma), res + diff * gamma
+        )
+
+    if has_nans and not ignore_nan:
+        res = dpnp.where(nan_mask, dpnp.nan, res)
+    elif ignore_nan and dpnp.any(n == 0):
+        warnings.warn("All-NaN slice encountered", RuntimeWarning, stacklevel=4)
+
+    res_shape = list(a_shape)
+    if keepdims:
+        for i in _axis:
+            res_shape[i] = 1
+    else:
+        res_shape = [s for i, s in enumerate(res_shape) if i not in _axis]
+    res = res.reshape(q.shape + tuple(res_shape))
+
+    return dpnp.get_result_array(res, out, casting="unsafe")
+
+
 def dpnp_median(
     a,
     axis=None,
@@ -226,14 +639,19 @@ def dpnp_median(
             )
         axis = -1
 
-    if overwrite_input:
-        if isinstance(a, dpt.usm_ndarray):
-            # dpnp.ndarray.sort only works with dpnp_array
-            a = dpnp_array._create_from_usm_ndarray(a)
-        a.sort(axis=axis)
-        a_sorted = a
+    if ignore_nan:
+        if overwrite_input:
+            if isinstance(a, dpt.usm_ndarray):
+                # dpnp.ndarray.sort only works with dpnp_array
+                a = dpnp_array._create_from_usm_ndarray(a)
+            a.sort(axis=axis)
+            a_sorted = a
+        else:
+            a_sorted = dpnp.sort(a, axis=axis)
     else:
-        a_sorted = dpnp.sort(a, axis=axis)
+        # only the middle elements have to be in their sorted positions
+        n = a.shape[axis]
+        a_sorted = dpnp_introselect(a, [(n - 1) // 2, n // 2], axis=axis)
 
     if ignore_nan:
         # sorting puts NaNs at the end
@@ -0,0 +1,453 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Implementation of ``reduce``, ``accumulate``, ``reduceat`` and ``at`` methods
+of element-wise functions.
+
+Reductions and cumulative operations having a dedicated implementation
+(``add``, ``multiply``, ``maximum``, ...) are delegated to it. For other
+reorderable, i.e. associative and commutative, functions a reduction is
+computed by a pairwise tree and an accumulation by a Hillis-Steele scan, so
+the function is called a logarithmic number of times on the whole array.
+Segmented operations (``reduceat`` and ``at``) are based on a segmented
+scan, where every step is masked with `where` keyword not to combine elements
+from different segments. Functions which are not reorderable, like
+``subtract``, are applied sequentially along the axis to keep the order of
+evaluation defined by NumPy.
+
+"""
+
+import math
+
+from dpctl.tensor._numpy_helper import (
+    normalize_axis_index,
+    normalize_axis_tuple,
+)
+
+import dpnp
+
+__all__ = [
+    "dpnp_ufunc_accumulate",
+    "dpnp_ufunc_at",
+    "dpnp_ufunc_reduce",
+    "dpnp_ufunc_reduceat",
+]
+
+# Associative and commutative functions, the order in which the elements are
+# combined doesn't matter for them
+_REORDERABLE = frozenset(
+    [
+        "add",
+        "bitwise_and",
+        "bitwise_or",
+        "bitwise_xor",
+        "fmax",
+        "fmin",
+        "gcd",
+        "hypot",
+        "lcm",
+        "logaddexp",
+        "logaddexp2",
+        "logical_and",
+        "logical_or",
+        "logical_xor",
+        "maximum",
+        "minimum",
+        "multiply",
+    ]
+)
+
+# Non-reorderable functions for which applying the function with several
+# values in a row is the same as applying it once with the values combined
+# by a reorderable function, i.e. f(f(a, b1), b2) == f(a, g(b1, b2))
+_COMBINERS = {
+    "divide": "multiply",
+    "subtract": "add",
+}
+
+# Identity values used to reduce over an empty axis, the all-ones identity of
+# "bitwise_and" depends on the data type and is given by `_identity`
+_IDENTITY = {
+    "add": 0,
+    "bitwise_or": 0,
+    "bitwise_xor": 0,
+    "gcd": 0,
+    "hypot": 0,
+    "logaddexp": -math.inf,
+    "logaddexp2": -math.inf,
+    "logical_and": True,
+    "logical_or": False,
+    "logical_xor": False,
+    "multiply": 1,
+}
+
+
+def _identity(name, dtype):
+    """Identity value of function `name` for the result data type `dtype`."""
+
+    if name == "bitwise_and":
+        if dtype == dpnp.bool:
+            return True
+        if dpnp.issubdtype(dtype, dpnp.unsignedinteger):
+            return dpnp.iinfo(dtype).max
+        return -1
+    return _IDENTITY.get(name)
+
+
+def _astype(a, dtype):
+    return a if dtype is None else dpnp.astype(a, dtype, copy=False)
+
+
+# Functions with a dedicated reduction implementation
+_REDUCTIONS = {
+    "add": lambda a, **kw: dpnp.sum(a, **kw),
+    "hypot": lambda a, axis, **kw: dpnp.reduce_hypot(a, axis=axis, **kw),
+    "logaddexp": lambda a, axis, **kw: dpnp.logsumexp(a, axis=axis, **kw),
+    "logical_and": lambda a, dtype, **kw: dpnp.all(_astype(a, dtype), **kw),
+    "logical_or": lambda a, dtype, **kw: dpnp.any(_astype(a, dtype), **kw),
+    "maximum": lambda a, dtype, **kw: dpnp.max(_astype(a, dtype), **kw),
+    "minimum": lambda a, dtype, **kw: dpnp.min(_astype(a, dtype), **kw),
+    "multiply": lambda a, **kw: dpnp.prod(a, **kw),
+}
+
+# Functions with a dedicated cumulative implementation
+_ACCUMULATIONS = {
+    "add": lambda a, **kw: dpnp.cumsum(a, **kw),
+    "logaddexp": lambda a, axis, **kw: dpnp.cumlogsumexp(a, axis=axis, **kw),
+    "multiply": lambda a, **kw: dpnp.cumprod(a, **kw),
+}
+
+
+def _result_type(func, x):
+    """Data type of the result of binary function `func` applied to `x`."""
+
+    empty = x[..., :0]
+    return func(empty, empty).dtype
+
+
+def _segmented_scan(func, x, seg_start):
+    """
+    Compute an inclusive scan of `x` along the last axis in-place, restarting
+    it at every segment.
+
+    `seg_start` is a 1-D array holding for every position along the last axis
+    the index of the first element of the segment containing that position.
+    The function `func` must be reorderable.
+
+    """
+
+    n = x.shape[-1]
+    pos = dpnp.arange(n, usm_type=x.usm_type, sycl_queue=x.sycl_queue)
+
+    k = 1
+    while k < n:
+        # combine only the elements belonging to the same segment
+        mask = pos[:-k] >= seg_start[k:]
+        func(x[..., :-k], x[..., k:], out=x[..., k:], where=mask)
+        k *= 2
+    return x
+
+
+def _segment_starts(first):
+    """
+    Return the index of the first element of the segment for every position
+    of 1-D boolean array `first` marking the beginnings of the segments.
+
+    """
+
+    pos = dpnp.arange(
+        first.size, usm_type=first.usm_type, sycl_queue=first.sycl_queue
+    )
+    return dpnp.maximum.accumulate(dpnp.where(first, pos, 0))
+
+
+def dpnp_ufunc_accumulate(func, a, axis, dtype, out):
+    """Accumulate the result of applying `func` to all elements along axis."""
+
+    dpnp.check_supported_arrays_type(a)
+    if a.ndim == 0:
+        raise TypeError("cannot accumulate on a scalar")
+
+    name = func.name_
+    axis = normalize_axis_index(axis, a.ndim)
+    if name in _ACCUMULATIONS:
+        return _ACCUMULATIONS[name](a, axis=axis, dtype=dtype, out=out)
+
+    x = dpnp.moveaxis(_astype(a, dtype), axis, -1)
+    res = dpnp.astype(x, _result_type(func, x))
+    n = res.shape[-1]
+    if name in _REORDERABLE:
+        k = 1
+        while k < n:
+            func(res[..., :-k], res[..., k:], out=res[..., k:])
+            k *= 2
+    else:
+        for i in range(1, n):
+            func(res[..., i - 1], res[..., i], out=res[..., i])
+
+    res = dpnp.moveaxis(res, -1, axis)
+    return dpnp.get_result_array(res, out, casting="same_kind")
+
+
+def dpnp_ufunc_at(func, a, indices, b):
+    """
+    Perform unbuffered in place operation on `a` for elements specified by
+    `indices`.
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    if func.nin == 1 and b is not None:
+        raise ValueError("second operand provided when ufunc is unary")
+    if func.nin == 2 and b is None:
+        raise ValueError("second operand needed for ufunc")
+
+    usm_type, exec_q = a.usm_type, a.sycl_queue
+    if isinstance(indices, list):
+        indices = dpnp.asarray(indices, usm_type=usm_type, sycl_queue=exec_q)
+    elif isinstance(indices, tuple):
+        indices = tuple(
+            (
+                dpnp.asarray(ind, usm_type=usm_type, sycl_queue=exec_q)
+                if isinstance(ind, list)
+                else ind
+            )
+            for ind in indices
+        )
+
+    # linear positions of the elements selected by the indices
+    pos = dpnp.arange(a.size, usm_type=usm_type, sycl_queue=exec_q)
+    pos = dpnp.reshape(pos, a.shape)[indices]
+    if b is not None:
+        if dpnp.isscalar(b):
+            b = dpnp.asarray(b, usm_type=usm_type, sycl_queue=exec_q)
+        else:
+            dpnp.check_supported_arrays_type(b)
+        b = dpnp.ravel(dpnp.broadcast_to(b, pos.shape))
+    pos = dpnp.ravel(pos)
+
+    m = pos.size
+    if m == 0:
+        return
+
+    flat = dpnp.reshape(a, -1)
+
+    # group repeated indices together keeping the order of the operations
+    order = dpnp.argsort(pos, kind="stable")
+    pos = pos[order]
+    first = dpnp.empty_like(pos, dtype=dpnp.bool)
+    first[0] = True
+    first[1:] = pos[1:] != pos[:-1]
+    seg_start = _segment_starts(first)
+
+    if b is not None:
+        b = b[order]
+
+    name = func.name_
+    if b is not None and (name in _REORDERABLE or name in _COMBINERS):
+        # combine all values of every group first and then apply the result
+        combine = getattr(dpnp, _COMBINERS.get(name, name))
+        last = dpnp.empty_like(first)
+        last[-1] = True
+        last[:-1] = first[1:]
+        b = dpnp.astype(b, func(flat[:0], b[:0]).dtype)
+        b = _segmented_scan(combine, b, seg_start)
+        ind = pos[last]
+        flat[ind] = func(flat[ind], b[last])
+    else:
+        # the values can't be combined, so apply the function in rounds,
+        # one occurrence of every index a time
+        rank = dpnp.arange(m, usm_type=usm_type, sycl_queue=exec_q)
+        rank -= seg_start
+        for r in range(int(rank.max()) + 1):
+            mask = rank == r
+            ind = pos[mask]
+            if b is None:
+                flat[ind] = func(flat[ind])
+            else:
+                flat[ind] = func(flat[ind], b[mask])
+
+    if not a.flags.c_contiguous:
+        a[...] = dpnp.reshape(flat, a.shape)
+
+
+def dpnp_ufunc_reduce(func, a, axis, dtype, out, keepdims, initial, where):
+    """Reduce the array `a` by applying `func` along axis."""
+
+    dpnp.check_supported_arrays_type(a)
+    dpnp.check_limitations(where=where)
+
+    name = func.name_
+    reorderable = name in _REORDERABLE
+    if axis is None:
+        if not reorderable and a.ndim > 1:
+            raise ValueError(
+                f"reduction operation '{name}' is not reorderable, so at "
+                "most one axis may be specified"
+            )
+        axis = tuple(range(a.ndim))
+    axis = normalize_axis_tuple(axis, a.ndim)
+    if not reorderable and len(axis) > 1:
+        raise ValueError(
+            f"reduction operation '{name}' is not reorderable, so at most "
+            "one axis may be specified"
+        )
+
+    if initial is None and name in _REDUCTIONS:
+        return _REDUCTIONS[name](
+            a, axis=axis, dtype=dtype, out=out, keepdims=keepdims
+        )
+
+    # move the reduced axes to the end and merge them into one
+    a = _astype(a, dtype)
+    kept = [i for i in range(a.ndim) if i not in axis]
+    x = dpnp.transpose(a, kept + list(axis))
+    shape = tuple(a.shape[i] for i in kept)
+    x = dpnp.reshape(x, shape + (math.prod(a.shape[i] for i in axis),))
+
+    res_dt = _result_type(func, x)
+    n = x.shape[-1]
+    if n == 0:
+        if initial is None:
+            initial = _identity(name, res_dt)
+        if initial is None:
+            raise ValueError(
+                f"zero-size array to reduction operation {name} which has no "
+                "identity"
+            )
+        res = dpnp.full(
+            x.shape[:-1],
+            initial,
+            dtype=res_dt,
+            usm_type=x.usm_type,
+            sycl_queue=x.sycl_queue,
+        )
+    elif reorderable:
+        # pairwise tree reduction
+        while n > 1:
+            h = n // 2
+            y = func(x[..., :h], x[..., h : 2 * h])
+            if n % 2:
+                func(y[..., :1], x[..., -1:], out=y[..., :1])
+            x, n = y, h
+        res = dpnp.astype(x[..., 0], res_dt)
+        if initial is not None:
+            res = func(initial, res)
+    else:
+        res = dpnp.astype(x[..., 0], res_dt)
+        if initial is not None:
+            res = func(initial, res)
+        for i in range(1, n):
+            res = func(res, x[..., i])
+
+    if keepdims:
+        res = dpnp.expand_dims(res, axis)
+    return dpnp.get_result_array(res, out, casting="same_kind")
+
+
+def dpnp_ufunc_reduceat(func, a, indices, axis, dtype, out):
+    """Perform a reduction of `a` with specified slices over a single axis."""
+
+    dpnp.check_supported_arrays_type(a)
+    if a.ndim == 0:
+        raise TypeError("cannot reduceat on a scalar")
+
+    name = func.name_
+    axis = normalize_axis_index(axis, a.ndim)
+    x = dpnp.moveaxis(_astype(a, dtype), axis, -1)
+    n = x.shape[-1]
+
+    if dpnp.is_supported_array_type(indices):
+        dpnp.get_usm_allocations([a, indices])
+    indices = dpnp.asarray(
+        indices, usm_type=a.usm_type, sycl_queue=a.sycl_queue
+    )
+    if indices.ndim != 1:
+        raise ValueError("indices must be a 1-D array")
+    if not dpnp.issubdtype(indices.dtype, dpnp.integer):
+        raise TypeError(
+            f"Cannot cast array data from {indices.dtype} to an integer data "
+            "type according to the rule 'safe'"
+        )
+
+    res_dt = _result_type(func, x)
+    m = indices.size
+    if m == 0:
+        res = dpnp.empty_like(x, dtype=res_dt, shape=x.shape[:-1] + (0,))
+        res = dpnp.moveaxis(res, -1, axis)
+        return dpnp.get_result_array(res, out, casting="same_kind")
+
+    ends = dpnp.empty_like(indices)
+    ends[:-1] = indices[1:]
+    ends[-1] = n
+    lengths = dpnp.maximum(ends - indices, 0)
+    nonempty = lengths > 0
+
+    # validate the indices and get the total and the largest length of the
+    # segments with a single copy to the host
+    in_range = dpnp.all((indices >= 0) & (indices < n))
+    in_range, total, longest = dpnp.asnumpy(
+        dpnp.stack(
+            [dpnp.astype(in_range, lengths.dtype), lengths.sum(), lengths.max()]
+        )
+    ).tolist()
+    if not in_range:
+        raise IndexError(f"index out-of-bounds in {name}.reduceat [0, {n})")
+
+    if name in _REORDERABLE:
+        # gather the elements of every non-empty segment one after another,
+        # so unordered and overlapping segments are reduced by a single
+        # segmented scan
+        seg_end = dpnp.cumsum(lengths)
+        pos = dpnp.arange(
+            total,
+            dtype=seg_end.dtype,
+            usm_type=indices.usm_type,
+            sycl_queue=indices.sycl_queue,
+        )
+        seg = dpnp.searchsorted(seg_end, pos, side="right")
+        seg_start = (seg_end - lengths)[seg]
+        src = indices[seg] + (pos - seg_start)
+
+        res = dpnp.astype(dpnp.take(x, src, axis=-1), res_dt, copy=False)
+        res = _segmented_scan(func, res, seg_start)
+        res = dpnp.take(res, dpnp.where(nonempty, seg_end - 1, 0), axis=-1)
+        res = dpnp.where(nonempty, res, dpnp.take(x, indices, axis=-1))
+    else:
+        # fold all the segments at once, one element of each a time
+        res = dpnp.astype(dpnp.take(x, indices, axis=-1), res_dt)
+        for i in range(1, longest):
+            ind = dpnp.minimum(indices + i, n - 1)
+            res = dpnp.where(
+                i < lengths, func(res, dpnp.take(x, ind, axis=-1)), res
+            )
+
+    res = dpnp.moveaxis(dpnp.astype(res, res_dt, copy=False), -1, axis)
+    return dpnp.get_result_array(res, out, casting="same_kind")
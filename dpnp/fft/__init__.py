@@ -153,12 +153,15 @@ References
 
 """
 
+from . import config
 from .dpnp_iface_fft import (
+    FFTPlan,
     fft,
     fft2,
     fftfreq,
     fftn,
     fftshift,
+    get_fft_plan,
     hfft,
     ifft,
     ifft2,
@@ -175,11 +178,13 @@ from .dpnp_iface_fft import (
 )
 
 __all__ = [
+    "FFTPlan",
     "fft",
     "fft2",
     "fftfreq",
     "fftn",
     "fftshift",
+    "get_fft_plan",
     "hfft",
     "ifft",
     "ifft2",
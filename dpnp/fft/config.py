@@ -0,0 +1,301 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Configuration of the cache of FFT plans.
+
+Committing a oneMKL DFT descriptor is the most expensive step of an FFT call,
+so the committed descriptors are kept in a bounded least recently used (LRU)
+cache and reused by subsequent calls with the same transform parameters.
+Since a descriptor is committed to a SYCL queue, there is a separate cache per
+queue.
+
+"""
+
+import collections
+import operator
+import threading
+
+import dpnp
+
+__all__ = [
+    "PlanCache",
+    "clear_plan_cache",
+    "get_plan_cache",
+    "get_plan_cache_size",
+    "set_plan_cache_size",
+    "show_plan_cache_info",
+]
+
+# Maximum number of plans kept by a cache, unless changed by the user
+_DEFAULT_PLAN_CACHE_SIZE = 16
+
+_plan_cache_size = _DEFAULT_PLAN_CACHE_SIZE
+_plan_caches = {}
+_plan_caches_lock = threading.Lock()
+
+
+def _validate_size(size):
+    size = operator.index(size)
+    if size < 0:
+        raise ValueError(f"Cache size must be non-negative, but got {size}")
+    return size
+
+
+class PlanCache:
+    """
+    A least recently used (LRU) cache of committed FFT plans of a SYCL queue.
+
+    The cache should not be created directly, use
+    :obj:`dpnp.fft.config.get_plan_cache` to get the cache of a queue.
+
+    Parameters
+    ----------
+    size : int
+        Maximum number of plans kept by the cache. The value ``0`` disables
+        the caching.
+    sycl_queue : dpctl.SyclQueue
+        The SYCL queue the plans are committed to.
+
+    """
+
+    def __init__(self, size, sycl_queue):
+        self._sycl_queue = sycl_queue
+        self._size = _validate_size(size)
+        self._plans = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._plans)
+
+    def __repr__(self):
+        return (
+            f"<PlanCache size={self._size} curr_size={len(self._plans)} "
+            f"hits={self._hits} misses={self._misses}>"
+        )
+
+    def _evict(self):
+        while len(self._plans) > self._size:
+            self._plans.popitem(last=False)
+
+    def get(self, key):
+        """
+        Return the plan stored by `key` and mark it as the most recently used
+        one, or ``None`` if there is no such plan in the cache.
+
+        """
+
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._plans.move_to_end(key)
+            return plan
+
+    def insert(self, key, plan):
+        """
+        Store `plan` by `key` evicting the least recently used plans if the
+        cache is full.
+
+        """
+
+        with self._lock:
+            self._plans[key] = plan
+            self._plans.move_to_end(key)
+            self._evict()
+
+    def clear(self):
+        """Remove all plans from the cache and reset its statistics."""
+
+        with self._lock:
+            self._plans.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def get_curr_size(self):
+        """Return the number of plans currently stored in the cache."""
+        return len(self._plans)
+
+    def get_size(self):
+        """Return the maximum number of plans kept by the cache."""
+        return self._size
+
+    def set_size(self, size):
+        """
+        Set the maximum number of plans kept by the cache. The least recently
+        used plans are evicted if the cache has more plans.
+
+        """
+
+        size = _validate_size(size)
+        with self._lock:
+            self._size = size
+            self._evict()
+
+    @property
+    def hits(self):
+        """Number of lookups which found a plan in the cache."""
+        return self._hits
+
+    @property
+    def misses(self):
+        """Number of lookups which did not find a plan in the cache."""
+        return self._misses
+
+    @property
+    def sycl_queue(self):
+        """The SYCL queue the cached plans are committed to."""
+        return self._sycl_queue
+
+    def show_info(self):
+        """Print the state of the cache."""
+
+        print(
+            f"------------ dpnp.fft plan cache ({self._sycl_queue}) "
+            "------------\n"
+            f"cache enabled? {self._size > 0}\n"
+            f"current / max size: {len(self._plans)} / {self._size} "
+            "(counts)\n"
+            f"hits: {self._hits}, misses: {self._misses}"
+        )
+
+
+def clear_plan_cache():
+    """
+    Remove all plans from the caches of all SYCL queues.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.ones(16)
+    >>> _ = np.fft.rfft(a)
+    >>> np.fft.config.get_plan_cache().get_curr_size()
+    1
+    >>> np.fft.config.clear_plan_cache()
+    >>> np.fft.config.get_plan_cache().get_curr_size()
+    0
+
+    """
+
+    with _plan_caches_lock:
+        caches = list(_plan_caches.values())
+    for cache in caches:
+        cache.clear()
+
+
+def get_plan_cache(sycl_queue=None):
+    """
+    Get the cache of FFT plans of a SYCL queue.
+
+    Parameters
+    ----------
+    sycl_queue : {None, dpctl.SyclQueue}, optional
+        The SYCL queue to get the cache for. The default queue is used if
+        ``None``.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.fft.config.PlanCache
+        The cache of the queue.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.ones(16)
+    >>> for _ in range(3):
+    ...     _ = np.fft.rfft(a)
+    >>> cache = np.fft.config.get_plan_cache(a.sycl_queue)
+    >>> cache.hits, cache.misses
+    (2, 1)
+
+    """
+
+    sycl_queue = dpnp.get_normalized_queue_device(sycl_queue=sycl_queue)
+    with _plan_caches_lock:
+        cache = _plan_caches.get(sycl_queue)
+        if cache is None:
+            cache = PlanCache(_plan_cache_size, sycl_queue)
+            _plan_caches[sycl_queue] = cache
+        return cache
+
+
+def get_plan_cache_size():
+    """
+    Get the maximum number of plans kept by a cache of a SYCL queue.
+
+    Returns
+    -------
+    out : int
+        The maximum number of plans per queue.
+
+    """
+
+    return _plan_cache_size
+
+
+def set_plan_cache_size(size):
+    """
+    Set the maximum number of plans kept by a cache of a SYCL queue.
+
+    The size is applied to the caches of all queues, including the ones
+    created later.
+
+    Parameters
+    ----------
+    size : int
+        The maximum number of plans per queue. The value ``0`` disables the
+        caching.
+
+    """
+
+    global _plan_cache_size  # pylint: disable=global-statement
+
+    size = _validate_size(size)
+    with _plan_caches_lock:
+        _plan_cache_size = size
+        caches = list(_plan_caches.values())
+    for cache in caches:
+        cache.set_size(size)
+
+
+def show_plan_cache_info():
+    """Print the state of the caches of all SYCL queues."""
+
+    with _plan_caches_lock:
+        caches = list(_plan_caches.values())
+    if not caches:
+        print("dpnp.fft plan cache is empty")
+    for cache in caches:
+        cache.show_info()
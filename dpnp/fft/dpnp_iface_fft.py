@@ -40,10 +40,16 @@ it contains:
 
 import dpnp
 
-from .dpnp_utils_fft import dpnp_fft, dpnp_fftn, dpnp_fillfreq, swap_direction
+from .dpnp_utils_fft import (
+    FFTPlan,
+    dpnp_fft,
+    dpnp_fftn,
+    dpnp_fillfreq,
+    swap_direction,
+)
 
 
-def fft(a, n=None, axis=-1, norm=None, out=None):
+def fft(a, n=None, axis=-1, norm=None, out=None, *, plan=None):
     """
     Compute the one-dimensional discrete Fourier Transform.
 
@@ -79,6 +85,13 @@ def fft(a, n=None, axis=-1, norm=None, out=None):
         If provided, the result will be placed in this array. It should be of
         the appropriate shape (consistent with the choice of `n`) and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -120,11 +133,18 @@ def fft(a, n=None, axis=-1, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fft(
-        a, forward=True, real=False, n=n, axis=axis, norm=norm, out=out
+        a,
+        forward=True,
+        real=False,
+        n=n,
+        axis=axis,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
-def fft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+def fft2(a, s=None, axes=(-2, -1), norm=None, out=None, *, plan=None):
     """
     Compute the 2-dimensional discrete Fourier Transform.
 
@@ -171,6 +191,13 @@ def fft2(a, s=None, axes=(-2, -1), norm=None, out=None):
         If provided, the result will be placed in this array. It should be of
         the appropriate shape (consistent with the choice of `s`) and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -223,7 +250,14 @@ def fft2(a, s=None, axes=(-2, -1), norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=True, real=False, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=True,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
@@ -338,7 +372,7 @@ def fftfreq(
     return dpnp_fillfreq(results, m, n, val)
 
 
-def fftn(a, s=None, axes=None, norm=None, out=None):
+def fftn(a, s=None, axes=None, norm=None, out=None, *, plan=None):
     """
     Compute the *N*-dimensional discrete Fourier Transform.
 
@@ -385,6 +419,13 @@ def fftn(a, s=None, axes=None, norm=None, out=None):
         If provided, the result will be placed in this array. It should be of
         the appropriate shape (consistent with the choice of `s`) and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -440,7 +481,14 @@ def fftn(a, s=None, axes=None, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=True, real=False, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=True,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
@@ -507,6 +555,71 @@ def fftshift(x, axes=None):
     return dpnp.roll(x, shift, axes)
 
 
+def get_fft_plan(a, s=None, axes=None, value_type="C2C"):
+    """
+    Generate a plan of the FFT that can be reused for arrays of the same
+    geometry.
+
+    The plan keeps the committed oneMKL DFT descriptors of the transform, so
+    they are not looked up in the plan cache of :obj:`dpnp.fft.config` on
+    every call and are never evicted from it. The plan can be passed as
+    `plan` keyword to the FFT functions, used as a context manager, so that
+    FFT functions called in the ``with plan:`` block compute the transform
+    with it, or executed directly with :meth:`FFTPlan.execute`, which skips
+    the validation of the transform parameters.
+
+    Parameters
+    ----------
+    a : {dpnp.ndarray, usm_ndarray}
+        An array of the shape, data type and SYCL queue of the arrays the plan
+        is generated for.
+    s : {None, int, sequence of ints}, optional
+        Shape (length of each transformed axis) of the transform. For "C2R"
+        transform it is the shape of the output, as in
+        :obj:`dpnp.fft.irfftn`. If not given, the shape of the input along
+        `axes` is used.
+
+        Default: ``None``.
+    axes : {None, int, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, all axes are used.
+
+        Default: ``None``.
+    value_type : {"C2C", "R2C", "C2R"}, optional
+        The type of the transform: complex-to-complex (:obj:`dpnp.fft.fftn`,
+        :obj:`dpnp.fft.ifftn`), real-to-complex (:obj:`dpnp.fft.rfftn`) or
+        complex-to-real (:obj:`dpnp.fft.irfftn`).
+
+        Default: ``"C2C"``.
+
+    Returns
+    -------
+    out : dpnp.fft.FFTPlan
+        The plan of the transform.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.config.get_plan_cache` : Get the cache of FFT plans.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.random.rand(8, 64)
+    >>> plan = np.fft.get_fft_plan(a, axes=-1, value_type="R2C")
+    >>> res = plan.execute(a)
+    >>> np.allclose(res, np.fft.rfft(a))
+    array(True)
+
+    >>> with plan:
+    ...     res = np.fft.rfft(a)
+
+    >>> out = np.empty((8, 33), dtype=np.complex128)
+    >>> res = np.fft.rfft(a, out=out, plan=plan)
+
+    """
+
+    return FFTPlan(a, s=s, axes=axes, value_type=value_type)
+
+
 def hfft(a, n=None, axis=-1, norm=None, out=None):
     """
     Compute the FFT of a signal that has Hermitian symmetry, i.e.,
@@ -607,7 +720,7 @@ def hfft(a, n=None, axis=-1, norm=None, out=None):
     return irfft(dpnp.conjugate(a), n=n, axis=axis, norm=new_norm, out=out)
 
 
-def ifft(a, n=None, axis=-1, norm=None, out=None):
+def ifft(a, n=None, axis=-1, norm=None, out=None, *, plan=None):
     """
     Compute the one-dimensional inverse discrete Fourier Transform.
 
@@ -658,6 +771,13 @@ def ifft(a, n=None, axis=-1, norm=None, out=None):
         If provided, the result will be placed in this array. It should be of
         the appropriate shape (consistent with the choice of `n`) and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -692,11 +812,18 @@ def ifft(a, n=None, axis=-1, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fft(
-        a, forward=False, real=False, n=n, axis=axis, norm=norm, out=out
+        a,
+        forward=False,
+        real=False,
+        n=n,
+        axis=axis,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
-def ifft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+def ifft2(a, s=None, axes=(-2, -1), norm=None, out=None, *, plan=None):
     """
     Compute the 2-dimensional inverse discrete Fourier Transform.
 
@@ -753,6 +880,13 @@ def ifft2(a, s=None, axes=(-2, -1), norm=None, out=None):
         If provided, the result will be placed in this array. It should be of
         the appropriate shape (consistent with the choice of `s`) and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -797,11 +931,18 @@ def ifft2(a, s=None, axes=(-2, -1), norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=False, real=False, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=False,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
-def ifftn(a, s=None, axes=None, norm=None, out=None):
+def ifftn(a, s=None, axes=None, norm=None, out=None, *, plan=None):
     """
     Compute the *N*-dimensional inverse discrete Fourier Transform.
 
@@ -857,6 +998,13 @@ def ifftn(a, s=None, axes=None, norm=None, out=None):
         If provided, the result will be placed in this array. It should be of
         the appropriate shape (consistent with the choice of `s`) and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -900,7 +1048,14 @@ def ifftn(a, s=None, axes=None, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=False, real=False, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=False,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
@@ -1037,7 +1192,7 @@ def ihfft(a, n=None, axis=-1, norm=None, out=None):
     return dpnp.conjugate(res, out=out)
 
 
-def irfft(a, n=None, axis=-1, norm=None, out=None):
+def irfft(a, n=None, axis=-1, norm=None, out=None, *, plan=None):
     """
     Computes the inverse of :obj:`dpnp.fft.rfft`.
 
@@ -1084,6 +1239,13 @@ def irfft(a, n=None, axis=-1, norm=None, out=None):
         If provided, the result will be placed in this array. It should be
         of the appropriate shape and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -1144,11 +1306,18 @@ def irfft(a, n=None, axis=-1, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fft(
-        a, forward=False, real=True, n=n, axis=axis, norm=norm, out=out
+        a,
+        forward=False,
+        real=True,
+        n=n,
+        axis=axis,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
-def irfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+def irfft2(a, s=None, axes=(-2, -1), norm=None, out=None, *, plan=None):
     """
     Computes the inverse of :obj:`dpnp.fft.rfft2`.
 
@@ -1194,6 +1363,13 @@ def irfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
         the appropriate dtype and shape for the last transformation
         (consistent with the choice of `s`).
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -1235,11 +1411,18 @@ def irfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=False, real=True, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=False,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
-def irfftn(a, s=None, axes=None, norm=None, out=None):
+def irfftn(a, s=None, axes=None, norm=None, out=None, *, plan=None):
     """
     Computes the inverse of :obj:`dpnp.fft.rfftn`.
 
@@ -1297,6 +1480,13 @@ def irfftn(a, s=None, axes=None, norm=None, out=None):
         the appropriate dtype and shape for the last transformation
         (consistent with the choice of `s`).
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -1357,11 +1547,18 @@ def irfftn(a, s=None, axes=None, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=False, real=True, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=False,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
-def rfft(a, n=None, axis=-1, norm=None, out=None):
+def rfft(a, n=None, axis=-1, norm=None, out=None, *, plan=None):
     """
     Compute the one-dimensional discrete Fourier Transform for real input.
 
@@ -1398,6 +1595,13 @@ def rfft(a, n=None, axis=-1, norm=None, out=None):
         If provided, the result will be placed in this array. It should be
         of the appropriate shape and dtype.
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -1453,11 +1657,18 @@ def rfft(a, n=None, axis=-1, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fft(
-        a, forward=True, real=True, n=n, axis=axis, norm=norm, out=out
+        a,
+        forward=True,
+        real=True,
+        n=n,
+        axis=axis,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
-def rfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
+def rfft2(a, s=None, axes=(-2, -1), norm=None, out=None, *, plan=None):
     """
     Compute the 2-dimensional FFT of a real array.
 
@@ -1501,6 +1712,13 @@ def rfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
         the appropriate dtype and shape for the last transformation
         (consistent with the choice of `s`).
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -1537,7 +1755,14 @@ def rfft2(a, s=None, axes=(-2, -1), norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=True, real=True, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=True,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
 
 
@@ -1663,7 +1888,7 @@ def rfftfreq(
     return results * val
 
 
-def rfftn(a, s=None, axes=None, norm=None, out=None):
+def rfftn(a, s=None, axes=None, norm=None, out=None, *, plan=None):
     """
     Compute the *N*-dimensional discrete Fourier Transform for real input.
 
@@ -1714,6 +1939,13 @@ def rfftn(a, s=None, axes=None, norm=None, out=None):
         the appropriate dtype and shape for the last transformation
         (consistent with the choice of `s`).
 
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
         Default: ``None``.
 
     Returns
@@ -1767,5 +1999,12 @@ def rfftn(a, s=None, axes=None, norm=None, out=None):
 
     dpnp.check_supported_arrays_type(a)
     return dpnp_fftn(
-        a, forward=True, real=True, s=s, axes=axes, norm=norm, out=out
+        a,
+        forward=True,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        out=out,
+        plan=plan,
     )
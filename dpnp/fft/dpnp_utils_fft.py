@@ -39,6 +39,8 @@ available as a pybind11 extension.
 # pylint: disable=protected-access
 # pylint: disable=no-name-in-module
 
+import contextlib
+import threading
 from collections.abc import Sequence
 
 import dpctl
@@ -59,6 +61,235 @@ from ..dpnp_utils import map_dtype_to_device
 from ..dpnp_utils.dpnp_utils_linearalgebra import (
     _standardize_strides_to_nonzero,
 )
+from . import config
+
+__all__ = [
+    "FFTPlan",
+    "dpnp_fft",
+    "dpnp_fftn",
+    "dpnp_fillfreq",
+    "swap_direction",
+]
+
+# Per-thread state of FFT plans: a stack of plans entered by `with plan:`
+# and the plan being executed, together with a flag whether the plan is
+# only being committed without computing the transform
+_plan_state = threading.local()
+
+
+class FFTPlan:
+    """
+    A reusable plan of the FFT of arrays of a given geometry.
+
+    The plan should not be created directly, use
+    :obj:`dpnp.fft.get_fft_plan` instead.
+
+    """
+
+    def __init__(self, a, s=None, axes=None, value_type="C2C"):
+        dpnp.check_supported_arrays_type(a)
+        if value_type not in ("C2C", "R2C", "C2R"):
+            raise ValueError(
+                f"Invalid value_type {value_type}; should be "
+                '"C2C", "R2C" or "C2R".'
+            )
+        if a.ndim == 0:
+            raise ValueError("Input array must be at least 1D")
+
+        real = value_type != "C2C"
+        forward = value_type != "C2R"
+        if value_type == "R2C" and dpnp.issubdtype(
+            a.dtype, dpnp.complexfloating
+        ):
+            raise TypeError("Input array must be real")
+
+        if axes is not None and not isinstance(axes, Sequence):
+            axes = (axes,)
+        if s is not None and not isinstance(s, Sequence):
+            s = (s,)
+        _validate_s_axes(a, s, axes)
+        s, axes = _cook_nd_args(a, s, axes, c2r=value_type == "C2R")
+        if len(axes) == 0:
+            raise IndexError("Empty axes.")
+
+        self._value_type = value_type
+        self._shape = a.shape
+        self._dtype = a.dtype
+        self._sycl_queue = a.sycl_queue
+        self._s = tuple(s)
+        self._axes = _normalize_axes(axes, a.ndim)
+        self._descriptors = {}
+
+        # commit the descriptors of the transform without computing it
+        _plan_state.dry_run = True
+        try:
+            with self._activated():
+                _fftn_core(dpnp.empty_like(a), forward, real, s, axes)
+        finally:
+            _plan_state.dry_run = False
+
+    def __enter__(self):
+        if not hasattr(_plan_state, "stack"):
+            _plan_state.stack = []
+        _plan_state.stack.append(self)
+        return self
+
+    def __exit__(self, *args):
+        _plan_state.stack.pop()
+
+    def __repr__(self):
+        return (
+            f"<FFTPlan value_type={self._value_type} shape={self._shape} "
+            f"dtype={self._dtype} s={self._s} axes={self._axes}>"
+        )
+
+    @contextlib.contextmanager
+    def _activated(self):
+        """Use the descriptors of the plan while the context is active."""
+
+        prev = getattr(_plan_state, "active", None)
+        _plan_state.active = self
+        try:
+            yield
+        finally:
+            _plan_state.active = prev
+
+    def _check(self, a, s, axes, value_type):
+        """Validate the plan can be used to compute the requested FFT."""
+
+        if value_type != self._value_type:
+            raise ValueError(
+                f"The plan is created for {self._value_type} transform, "
+                f"but {value_type} transform is requested."
+            )
+        if a.shape != self._shape or a.dtype != self._dtype:
+            raise ValueError(
+                f"The plan is created for an array of shape {self._shape} and "
+                f"data type {self._dtype}, but got an array of shape "
+                f"{a.shape} and data type {a.dtype}."
+            )
+        if a.sycl_queue != self._sycl_queue:
+            raise ExecutionPlacementError(
+                "Input array and the plan are allocated on different queues"
+            )
+        axes = _normalize_axes(axes, a.ndim)
+        if tuple(s) != self._s or axes != self._axes:
+            raise ValueError(
+                f"The plan is created for s={self._s} and axes={self._axes}, "
+                f"but s={tuple(s)} and axes={axes} are requested."
+            )
+
+    @property
+    def axes(self):
+        """The axes over which the FFT is computed."""
+        return self._axes
+
+    @property
+    def s(self):
+        """The shape of the transform along `axes`."""
+        return self._s
+
+    @property
+    def shape(self):
+        """The shape of the input array."""
+        return self._shape
+
+    @property
+    def dtype(self):
+        """The data type of the input array."""
+        return self._dtype
+
+    @property
+    def sycl_queue(self):
+        """The SYCL queue the plan is committed to."""
+        return self._sycl_queue
+
+    @property
+    def value_type(self):
+        """The type of the transform: "C2C", "R2C" or "C2R"."""
+        return self._value_type
+
+    def execute(self, a, out=None, forward=None, norm=None):
+        """
+        Compute the FFT of `a` with the plan.
+
+        Parameters
+        ----------
+        a : {dpnp.ndarray, usm_ndarray}
+            Input array, it must have the shape and the data type the plan is
+            created for.
+        out : {None, dpnp.ndarray, usm_ndarray}, optional
+            If provided, the result will be placed in this array. It should be
+            of the appropriate shape and dtype.
+
+            Default: ``None``.
+        forward : {None, bool}, optional
+            Whether to compute the forward or the inverse transform. If
+            ``None``, the inverse transform is computed for "C2R" plans and
+            the forward transform otherwise.
+
+            Default: ``None``.
+        norm : {None, "backward", "ortho", "forward"}, optional
+            Normalization mode (see :obj:`dpnp.fft`).
+
+            Default: ``"backward"``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The transformed array.
+
+        """
+
+        if forward is None:
+            forward = self._value_type != "C2R"
+        elif self._value_type != "C2C" and forward != (
+            self._value_type == "R2C"
+        ):
+            raise ValueError(
+                f"The direction of {self._value_type} transform can't be "
+                "changed."
+            )
+
+        dpnp.check_supported_arrays_type(a)
+        if (
+            a.shape != self._shape
+            or a.dtype != self._dtype
+            or a.sycl_queue != self._sycl_queue
+        ):
+            self._check(a, self._s, self._axes, self._value_type)
+
+        _check_norm(norm)
+        real = self._value_type != "C2C"
+        _validate_out_keyword(
+            a,
+            out,
+            self._s,
+            self._axes,
+            not real,
+            real and not forward,
+            real and forward,
+        )
+        with self._activated():
+            return _fftn_core(a, forward, real, self._s, self._axes, norm, out)
+
+
+def _normalize_axes(axes, ndim):
+    """Normalize axes keeping the repeated ones."""
+    return tuple(normalize_axis_index(axis, ndim) for axis in axes)
+
+
+def _get_plan(plan):
+    """Return the plan to use: the given one or the one set by `with`."""
+
+    if plan is None:
+        stack = getattr(_plan_state, "stack", None)
+        return stack[-1] if stack else None
+    if not isinstance(plan, FFTPlan):
+        raise TypeError(
+            f"`plan` must be None or dpnp.fft.FFTPlan, but got {type(plan)}"
+        )
+    return plan
 
 
 def _check_norm(norm):
@@ -70,19 +301,59 @@ def _check_norm(norm):
 
 
 def _commit_descriptor(a, forward, in_place, c2c, a_strides, index, batch_fft):
-    """Commit the FFT descriptor for the input array."""
+    """
+    Commit the FFT descriptor for the input array or take the committed one
+    from the plan cache of the queue.
+
+    """
 
     a_shape = a.shape
     shape = a_shape[index:]
     strides = (0,) + a_strides[index:]
     if c2c:  # c2c FFT
         assert dpnp.issubdtype(a.dtype, dpnp.complexfloating)
+    else:  # r2c/c2r FFT
+        assert dpnp.issubdtype(a.dtype, dpnp.inexact)
+
+    out_strides = list(strides[1:])
+    fwd_distance = bwd_distance = batch_size = None
+    if batch_fft:
+        fwd_distance = a_strides[0]
+        if not c2c and forward and strides[-1] == 1:
+            bwd_distance = shape[-1] // 2 + 1
+        else:
+            bwd_distance = fwd_distance
+        batch_size = a_shape[0]
+        out_strides.insert(0, bwd_distance)
+
+    key = (
+        a.dtype,
+        c2c,
+        shape,
+        strides,
+        fwd_distance,
+        bwd_distance,
+        batch_size,
+        in_place,
+        forward,
+    )
+    plan = getattr(_plan_state, "active", None)
+    if plan is not None:
+        # the descriptors of a plan are kept by the plan itself
+        dsc = plan._descriptors.get(key)
+        cache = None
+    else:
+        cache = config.get_plan_cache(a.sycl_queue)
+        dsc = cache.get(key)
+    if dsc is not None:
+        return dsc, out_strides
+
+    if c2c:  # c2c FFT
         if a.dtype == dpnp.complex64:
             dsc = fi.Complex64Descriptor(shape)
         else:
             dsc = fi.Complex128Descriptor(shape)
     else:  # r2c/c2r FFT
-        assert dpnp.issubdtype(a.dtype, dpnp.inexact)
         if a.dtype in [dpnp.float32, dpnp.complex64]:
             dsc = fi.Real32Descriptor(shape)
         else:
@@ -91,22 +362,16 @@ def _commit_descriptor(a, forward, in_place, c2c, a_strides, index, batch_fft):
     dsc.fwd_strides = strides
     dsc.bwd_strides = dsc.fwd_strides
     dsc.transform_in_place = in_place
-    out_strides = dsc.bwd_strides[1:]
     if batch_fft:
-        dsc.fwd_distance = a_strides[0]
-        if c2c:
-            dsc.bwd_distance = dsc.fwd_distance
-        elif dsc.fwd_strides[-1] == 1:
-            if forward:
-                dsc.bwd_distance = shape[-1] // 2 + 1
-            else:
-                dsc.bwd_distance = dsc.fwd_distance
-        else:
-            dsc.bwd_distance = dsc.fwd_distance
-        dsc.number_of_transforms = a_shape[0]  # batch_size
-        out_strides.insert(0, dsc.bwd_distance)
+        dsc.fwd_distance = fwd_distance
+        dsc.bwd_distance = bwd_distance
+        dsc.number_of_transforms = batch_size
 
     dsc.commit(a.sycl_queue)
+    if plan is not None:
+        plan._descriptors[key] = dsc
+    else:
+        cache.insert(key, dsc)
 
     return dsc, out_strides
 
@@ -140,25 +405,33 @@ def _c2c_nd_fft(
         # cannot use out in the intermediate steps if size changes
         res = None if size_changes else out
 
+        # whether `a` is a temporary array owned by this function, which can
+        # be overwritten, i.e. a copy of the input made by `_copy_array`
+        owned = in_place
         for i, (s_chunk, a_chunk) in enumerate(zip(shape_chunk, axes_chunk)):
+            # zero-padding allocates a new array which can be reused in-place
+            owned |= any(n > a.shape[x] for n, x in zip(s_chunk, a_chunk))
             a = _truncate_or_pad(a, shape=s_chunk, axes=a_chunk)
             # if size_changes, out cannot be used in intermediate steps
             if size_changes and i == len(axes_chunk) - 1:
                 res = out
 
+            # the result is scaled once after the last pass
             a = _fft(
                 a,
-                norm=norm,
+                norm=_unscaled_norm(forward),
                 out=res,
                 forward=forward,
-                in_place=in_place,
+                in_place=owned and res is None,
                 c2c=True,
                 axes=a_chunk,
             )
+            # the result of the pass is the scratch buffer of the next one
+            owned = True
             if not size_changes:
                 # Default output for next iteration.
                 res = a
-        return a
+        return _scale_result(a, s, norm, forward, 0)
 
     a = _truncate_or_pad(a, s, axes)
     if a.size == 0:
@@ -183,14 +456,19 @@ def _compute_result(dsc, a, out, forward, c2c, out_strides):
     _manager = dpu.SequentialOrderManager[exec_q]
     dep_evs = _manager.submitted_events
 
+    # only the geometry of the result is needed while committing a plan
+    dry_run = getattr(_plan_state, "dry_run", False)
+
     a_usm = dpnp.get_usm_ndarray(a)
     if dsc.transform_in_place:
         # in-place transform
         # TODO: investigate the performance of in-place implementation
         # for r2c/c2r, see SAT-7154
-        ht_fft_event, fft_event = fi._fft_in_place(
-            dsc, a_usm, forward, depends=dep_evs
-        )
+        if not dry_run:
+            ht_fft_event, fft_event = fi._fft_in_place(
+                dsc, a_usm, forward, depends=dep_evs
+            )
+            _manager.add_event_pair(ht_fft_event, fft_event)
         result = a
     else:
         out_usm = None if out is None else dpnp.get_usm_ndarray(out)
@@ -236,10 +514,11 @@ def _compute_result(dsc, a, out, forward, c2c, out_strides):
                 sycl_queue=exec_q,
             )
             res_usm = result.get_array()
-        ht_fft_event, fft_event = fi._fft_out_of_place(
-            dsc, a_usm, res_usm, forward, depends=dep_evs
-        )
-    _manager.add_event_pair(ht_fft_event, fft_event)
+        if not dry_run:
+            ht_fft_event, fft_event = fi._fft_out_of_place(
+                dsc, a_usm, res_usm, forward, depends=dep_evs
+            )
+            _manager.add_event_pair(ht_fft_event, fft_event)
 
     if not isinstance(result, dpnp_array):
         return dpnp_array._create_from_usm_ndarray(result)
@@ -400,10 +679,19 @@ def _fft(a, norm, out, forward, in_place, c2c, axes, batch_fft=True):
         # if input and output are the same array, use in-place FFT
         in_place = dpnp.are_same_logical_tensors(a, out)
     if batch_fft:
-        len_axes = 1 if fft_1d else len(axes)
-        local_axes = numpy.arange(-len_axes, 0)
-        a = dpnp.moveaxis(a, axes, local_axes)
+        fft_axes = _normalize_axes((axes,) if fft_1d else axes, a.ndim)
+        # fold all other axes into a single batch dimension; they are sorted
+        # by decreasing stride, so folding is done without a copy whenever
+        # they span a dense block of memory, whatever the layout of `a` is
+        a_strides = dpnp.get_usm_ndarray(a).strides
+        batch_axes = sorted(
+            (i for i in range(a.ndim) if i not in fft_axes),
+            key=lambda i: (a.shape[i] != 1, -a_strides[i]),
+        )
+        perm = tuple(batch_axes) + fft_axes
+        a = dpnp.transpose(a, perm)
         a_shape_orig = a.shape
+        len_axes = len(fft_axes)
         local_shape = (-1,) + a_shape_orig[-len_axes:]
         a = dpnp.reshape(a, local_shape)
         index = 1
@@ -439,7 +727,7 @@ def _fft(a, norm, out, forward, in_place, c2c, axes, batch_fft=True):
     if batch_fft:
         tmp_shape = a_shape_orig[:-1] + (res.shape[-1],)
         res = dpnp.reshape(res, tmp_shape)
-        res = dpnp.moveaxis(res, local_axes, axes)
+        res = dpnp.transpose(res, tuple(numpy.argsort(perm).tolist()))
 
     result = dpnp.get_result_array(res, out=out, casting="same_kind")
     if out is None and not (
@@ -499,10 +787,16 @@ def _scale_result(res, a_shape, norm, forward, index):
     elif norm in [None, "backward"] and not forward:
         norm_factor = scale
 
-    res /= norm_factor
+    if norm_factor != 1:
+        res /= norm_factor
     return res
 
 
+def _unscaled_norm(forward):
+    """Return the normalization mode which does not scale the result."""
+    return "backward" if forward else "forward"
+
+
 def _truncate_or_pad(a, shape, axes):
     """Truncating or zero-padding the input array along the specified axes."""
 
@@ -609,8 +903,24 @@ def _validate_s_axes(a, s, axes):
             )
 
 
-def dpnp_fft(a, forward, real, n=None, axis=-1, norm=None, out=None):
-    """Calculates 1-D FFT of the input array along axis"""
+def dpnp_fft(
+    a,
+    forward,
+    real,
+    n=None,
+    axis=-1,
+    norm=None,
+    out=None,
+    plan=None,
+    overwrite_x=False,
+):
+    """
+    Calculates 1-D FFT of the input array along axis.
+
+    If `overwrite_x` is ``True``, the input array can be used as a scratch
+    buffer and the transform is computed in-place where possible.
+
+    """
 
     _check_norm(norm)
     a_orig = a
@@ -635,10 +945,21 @@ def dpnp_fft(a, forward, real, n=None, axis=-1, norm=None, out=None):
     if n < 1:
         raise ValueError(f"Invalid number of FFT data points ({n}) specified")
 
+    plan = _get_plan(plan)
+    if plan is not None:
+        value_type = "C2C" if c2c else "R2C" if r2c else "C2R"
+        plan._check(a, (n,), (axis,), value_type)
+        _validate_out_keyword(a, out, (n,), (axis,), c2c, c2r, r2c)
+        with plan._activated():
+            return _fftn_core(
+                a, forward, real, (n,), (axis,), norm, out, overwrite_x
+            )
+
     a = _truncate_or_pad(a, (n,), (axis,))
     _validate_out_keyword(a, out, (n,), (axis,), c2c, c2r, r2c)
     # if input array is copied, in-place FFT can be used
     a, in_place = _copy_array(a, c2c or c2r)
+    in_place |= overwrite_x
 
     if a.size == 0:
         return dpnp.get_result_array(a, out=out, casting="same_kind")
@@ -646,7 +967,9 @@ def dpnp_fft(a, forward, real, n=None, axis=-1, norm=None, out=None):
     if c2r:
         # input array should be Hermitian for c2r FFT
         a = _make_array_hermitian(
-            a, axis, dpnp.are_same_logical_tensors(a, a_orig)
+            a,
+            axis,
+            not in_place and dpnp.are_same_logical_tensors(a, a_orig),
         )
 
     return _fft(
@@ -662,10 +985,25 @@ def dpnp_fft(a, forward, real, n=None, axis=-1, norm=None, out=None):
     )
 
 
-def dpnp_fftn(a, forward, real, s=None, axes=None, norm=None, out=None):
-    """Calculates N-D FFT of the input array along axes"""
+def dpnp_fftn(
+    a,
+    forward,
+    real,
+    s=None,
+    axes=None,
+    norm=None,
+    out=None,
+    plan=None,
+    overwrite_x=False,
+):
+    """
+    Calculates N-D FFT of the input array along axes.
+
+    If `overwrite_x` is ``True``, the input array can be used as a scratch
+    buffer and the transform is computed in-place where possible.
+
+    """
 
-    a_orig = a
     if isinstance(axes, Sequence) and len(axes) == 0:
         if real:
             raise IndexError("Empty axes.")
@@ -690,14 +1028,42 @@ def dpnp_fftn(a, forward, real, s=None, axes=None, norm=None, out=None):
     _validate_s_axes(a, s, axes)
     s, axes = _cook_nd_args(a, s, axes, c2r)
     _validate_out_keyword(a, out, s, axes, c2c, c2r, r2c)
+
+    plan = _get_plan(plan)
+    if plan is None:
+        return _fftn_core(a, forward, real, s, axes, norm, out, overwrite_x)
+
+    value_type = "C2C" if c2c else "R2C" if r2c else "C2R"
+    plan._check(a, s, axes, value_type)
+    with plan._activated():
+        return _fftn_core(a, forward, real, s, axes, norm, out, overwrite_x)
+
+
+def _fftn_core(
+    a, forward, real, s, axes, norm=None, out=None, overwrite_x=False
+):
+    """
+    Calculates N-D FFT of the input array along axes, assuming all arguments
+    are already validated.
+
+    """
+
+    a_orig = a
+    c2c = not real  # complex-to-complex FFT
+    r2c = real and forward  # real-to-complex FFT
+    c2r = real and not forward  # complex-to-real FFT
     a, in_place = _copy_array(a, c2c or c2r)
+    # the input array can be overwritten if requested
+    in_place |= overwrite_x
 
     len_axes = len(axes)
     if len_axes == 1:
         a = _truncate_or_pad(a, (s[-1],), (axes[-1],))
         if c2r:
             a = _make_array_hermitian(
-                a, axes[-1], dpnp.are_same_logical_tensors(a, a_orig)
+                a,
+                axes[-1],
+                not in_place and dpnp.are_same_logical_tensors(a, a_orig),
             )
         return _fft(
             a, norm, out, forward, in_place and c2c, c2c, axes[-1], a.ndim != 1
@@ -721,13 +1087,15 @@ def dpnp_fftn(a, forward, real, s=None, axes=None, norm=None, out=None):
             axes=axes[-1],
             batch_fft=a.ndim != 1,
         )
+        # the result of real-to-complex FFT is a new array (or `out`), so
+        # complex-to-complex FFT can overwrite it
         return _c2c_nd_fft(
             a,
             s=s[:-1],
             norm=norm,
             out=out,
             forward=forward,
-            in_place=in_place,
+            in_place=True,
             axes=axes[:-1],
             batch_fft=a.ndim != len_axes - 1,
         )
@@ -749,7 +1117,9 @@ def dpnp_fftn(a, forward, real, s=None, axes=None, norm=None, out=None):
         )
         a = _truncate_or_pad(a, (s[-1],), (axes[-1],))
         a = _make_array_hermitian(
-            a, axes[-1], dpnp.are_same_logical_tensors(a, a_orig)
+            a,
+            axes[-1],
+            not in_place and dpnp.are_same_logical_tensors(a, a_orig),
         )
         return _fft(
             a,
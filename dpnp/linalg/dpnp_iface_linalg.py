@@ -1647,7 +1647,7 @@ def qr(a, mode="reduced"):
     return dpnp_qr(a, mode)
 
 
-def solve(a, b):
+def solve(a, b, *, mixed_precision=False):
     """
     Solve a linear matrix equation, or system of linear scalar equations.
 
@@ -1659,6 +1659,14 @@ def solve(a, b):
         Coefficient matrix.
     b : {(M,), (..., M, K)} {dpnp.ndarray, usm_ndarray}
         Ordinate or "dependent variable" values.
+    mixed_precision : bool, optional
+        If ``True`` and the solution has a double precision data type,
+        factor a single coefficient matrix `a` of shape ``(M, M)`` in single
+        precision and iteratively refine the solution to double precision
+        accuracy. The working precision solver is used if the refinement
+        does not converge.
+
+        Default: ``False``.
 
     Returns
     -------
@@ -1675,6 +1683,14 @@ def solve(a, b):
     exactly 1-dimensional. In all other instances it is treated as a stack
     of (M, K) matrices.
 
+    With ``mixed_precision=True`` the residuals are computed in double
+    precision and the refinement stops once they are at the level of its
+    rounding error, as in LAPACK ``dsgesv``. This is faster than factoring
+    in double precision for large well-conditioned systems, while
+    ill-conditioned systems fall back to the double precision solver.
+    Stacked coefficient matrices are always factored in the working
+    precision.
+
     Examples
     --------
     >>> import dpnp as dp
@@ -1709,7 +1725,7 @@ def solve(a, b):
                 "for one-dimensional b"
             )
         b = dpnp.broadcast_to(b, a_shape[:-1])
-        return dpnp_solve(a, b)
+        return dpnp_solve(a, b, mixed_precision=mixed_precision)
 
     if a_shape[-1] != b_shape[-2]:
         raise ValueError(
@@ -1727,7 +1743,7 @@ def solve(a, b):
     if b_shape != b_broadcasted_shape:
         b = dpnp.broadcast_to(b, b_broadcasted_shape)
 
-    return dpnp_solve(a, b)
+    return dpnp_solve(a, b, mixed_precision=mixed_precision)
 
 
 def svd(a, full_matrices=True, compute_uv=True, hermitian=False):
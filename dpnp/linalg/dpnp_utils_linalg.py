@@ -78,6 +78,28 @@ class SVDResult(NamedTuple):
 _jobz = {"N": 0, "V": 1}
 _upper_lower = {"U": 0, "L": 1}
 
+# the largest size of matrices factorized by getrf_batch on GPU
+_getrf_batch_gpu_max_n = 64
+
+# the largest size of stacked matrices factorized over the whole stack at
+# once instead of by oneMKL LAPACK batch routines
+_small_matrix_max_n = 32
+
+# the largest size of stacked matrices with determinants computed by the
+# closed-form expressions
+_closed_form_max_n = 3
+
+# the largest size of stacked Hermitian matrices diagonalized by the Jacobi
+# eigenvalue algorithm instead of oneMKL LAPACK batch routines
+_small_eigh_max_n = 8
+
+# the largest number of sweeps of the Jacobi eigenvalue algorithm
+_jacobi_max_sweeps = 30
+
+# the largest number of iterative refinement steps of the mixed-precision
+# solver before falling back to a solve in the working precision
+_refine_max_iter = 30
+
 _real_types_map = {
     "float32": "float32",  # single : single
     "float64": "float64",  # double : double
@@ -85,6 +107,11 @@ _real_types_map = {
     "complex128": "float64",  # cdouble : cdouble
 }
 
+_single_types_map = {
+    "float64": "float32",  # double : single
+    "complex128": "complex64",  # cdouble : csingle
+}
+
 
 def _batched_eigh(a, UPLO, eigen_mode, w_type, v_type):
     """
@@ -259,17 +286,13 @@ def _batched_inv(a, res_type):
 def _batched_lu_factor(a, res_type):
     """Compute pivoted LU decomposition for a batch of matrices."""
 
-    # TODO: Find out at which array sizes the best performance is obtained
-    # getrf_batch implementation shows slow results with large arrays on GPU.
-    # Use getrf_batch only on CPU.
-    # On GPU call getrf for each two-dimensional array by loop
-    use_batch = a.sycl_device.has_aspect_cpu
+    n = a.shape[-2]
+    use_batch = _use_getrf_batch(a.sycl_device, n)
 
     a_sycl_queue = a.sycl_queue
     a_usm_type = a.usm_type
     _manager = dpu.SequentialOrderManager[a_sycl_queue]
 
-    n = a.shape[-2]
     orig_shape = a.shape
     # get 3d input arrays by reshape
     a = dpnp.reshape(a, (-1, n, n))
@@ -1279,6 +1302,418 @@ def _real_type(dtype, device=None):
     return dpnp.dtype(real_type)
 
 
+def _refined_solve(a, b, res_usm_type, res_type):
+    """
+    Solve a system of linear equations by mixed-precision iterative
+    refinement.
+
+    The coefficient matrix is factored in single precision and the solution
+    is refined with residuals computed in the double precision of
+    `res_type`, like LAPACK ``dsgesv`` and ``zcgesv`` do.
+
+    Parameters
+    ----------
+    a : (M, M) {dpnp.ndarray, usm_ndarray}
+        Coefficient matrix.
+    b : {(M,), (M, K)} {dpnp.ndarray, usm_ndarray}
+        Ordinate or "dependent variable" values.
+    res_usm_type : str
+        USM type of the result.
+    res_type : dpnp.dtype
+        Specifies the data type of the result.
+        Acceptable data types are float64 or complex128.
+
+    Returns
+    -------
+    out : {None, dpnp.ndarray}
+        Solution to the system `ax = b` or ``None`` if the coefficient matrix
+        can not be represented or factored in single precision, or if the
+        refinement does not converge.
+
+    """
+
+    a_sycl_queue = a.sycl_queue
+    low_type = dpnp.dtype(_single_types_map[res_type.name])
+
+    a = a.astype(res_type, copy=False)
+    b = b.astype(res_type, copy=False)
+
+    # entries which overflow in single precision make the refinement useless
+    low_max = dpnp.finfo(low_type).max
+    if not (dpnp.abs(a).max() <= low_max and dpnp.abs(b).max() <= low_max):
+        return None
+
+    n = a.shape[0]
+    a_norm = float(dpnp.abs(a).sum(axis=1).max())
+    tol = a_norm * dpnp.finfo(res_type).eps * numpy.sqrt(n)
+
+    _manager = dpu.SequentialOrderManager[a_sycl_queue]
+
+    # oneMKL LAPACK getrf overwrites `a` and getrs overwrites `b`,
+    # both assume fortran-like arrays as input
+    a_l = dpnp.empty_like(a, order="F", dtype=low_type, usm_type=res_usm_type)
+    ht_ev, a_copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+        src=dpnp.get_usm_ndarray(a),
+        dst=a_l.get_array(),
+        sycl_queue=a_sycl_queue,
+        depends=_manager.submitted_events,
+    )
+    _manager.add_event_pair(ht_ev, a_copy_ev)
+
+    ipiv_h = dpnp.empty(
+        n,
+        dtype=dpnp.int64,
+        order="C",
+        usm_type=res_usm_type,
+        sycl_queue=a_sycl_queue,
+    )
+    dev_info_h = [0]
+
+    ht_ev, getrf_ev = li._getrf(
+        a_sycl_queue,
+        a_l.get_array(),
+        ipiv_h.get_array(),
+        dev_info_h,
+        depends=[a_copy_ev],
+    )
+    _manager.add_event_pair(ht_ev, getrf_ev)
+
+    if any(dev_info_h):
+        # singular in single precision
+        return None
+
+    def _low_solve(rhs):
+        rhs_l = dpnp.empty_like(
+            rhs, order="F", dtype=low_type, usm_type=res_usm_type
+        )
+        ht_ev, rhs_copy_ev = ti._copy_usm_ndarray_into_usm_ndarray(
+            src=dpnp.get_usm_ndarray(rhs),
+            dst=rhs_l.get_array(),
+            sycl_queue=a_sycl_queue,
+            depends=_manager.submitted_events,
+        )
+        _manager.add_event_pair(ht_ev, rhs_copy_ev)
+
+        ht_ev, getrs_ev = li._getrs(
+            a_sycl_queue,
+            a_l.get_array(),
+            ipiv_h.get_array(),
+            rhs_l.get_array(),
+            depends=[rhs_copy_ev],
+        )
+        _manager.add_event_pair(ht_ev, getrs_ev)
+        return rhs_l
+
+    x = _low_solve(b).astype(res_type, order="F")
+    for _ in range(_refine_max_iter + 1):
+        r = b - dpnp.matmul(a, x)
+
+        # stop once the residual of every column is at the level of
+        # the rounding error of the working precision
+        x_norm = dpnp.abs(x).max(axis=0)
+        r_norm = dpnp.abs(r).max(axis=0)
+        if dpnp.all(r_norm <= x_norm * tol):
+            return x
+
+        x += _low_solve(r)
+
+    return None
+
+
+def _small_cholesky(a, upper):
+    """
+    Return the Cholesky decomposition of a stack of matrices `a` of size
+    ``n <= _small_matrix_max_n`` computed over the whole stack at once.
+
+    The factor is computed column by column by the right-looking algorithm,
+    every step updates the trailing submatrices of all the matrices of the
+    stack. Only the lower (or upper) triangle and the diagonal of `a` are
+    used.
+
+    """
+
+    n = a.shape[-1]
+    is_complex = dpnp.issubdtype(a.dtype, dpnp.complexfloating)
+
+    def _conj(x):
+        return dpnp.conj(x) if is_complex else x
+
+    # the lower triangle of the Hermitian matrices
+    if upper:
+        low = dpnp.tril(_conj(dpnp.swapaxes(a, -1, -2)))
+    else:
+        low = dpnp.tril(a)
+
+    positive = None
+    for j in range(n):
+        d = low[..., j, j].real
+        if positive is None:
+            positive = d > 0
+        else:
+            positive &= d > 0
+        d = dpnp.sqrt(d)
+        low[..., j, j] = d
+
+        if j + 1 < n:
+            col = low[..., j + 1 :, j] / d[..., None]
+            low[..., j + 1 :, j] = col
+            low[..., j + 1 :, j + 1 :] -= col[..., :, None] * _conj(
+                col[..., None, :]
+            )
+
+    if not positive.all():
+        raise li.LinAlgError("Matrix is not positive definite.")
+
+    # the trailing updates also changed the strictly upper triangle
+    low = dpnp.tril(low)
+    if upper:
+        return dpnp.ascontiguousarray(_conj(dpnp.swapaxes(low, -1, -2)))
+    return low
+
+
+def _small_lu(a):
+    """
+    Return the LU factorization with partial pivoting of a stack of matrices
+    `a` of size ``n <= _small_matrix_max_n`` computed over the whole stack at
+    once.
+
+    The elimination loops over the columns, every step swaps the pivot rows
+    and updates the trailing submatrices of all the matrices of the stack.
+    Return a tuple of the combined unit lower and upper triangular factors,
+    the row permutations, the signs of the permutations and the mask of
+    singular matrices.
+
+    """
+
+    n = a.shape[-1]
+    lu = dpnp.array(a, order="C", copy=True)
+    rows = dpnp.arange(n, usm_type=a.usm_type, sycl_queue=a.sycl_queue)
+    perm = dpnp.broadcast_to(rows, a.shape[:-1]).copy()
+    sign = dpnp.ones_like(a, shape=a.shape[:-2])
+    singular = dpnp.zeros_like(sign, dtype=dpnp.bool)
+
+    for k in range(n):
+        # swap the row with the largest element in the column into the row k
+        piv = dpnp.argmax(dpnp.abs(lu[..., k:, k]), axis=-1) + k
+        is_piv = rows == piv[..., None]
+
+        row_piv = dpnp.sum(
+            dpnp.where(is_piv[..., None], lu, 0), axis=-2, keepdims=True
+        )
+        lu = dpnp.where(is_piv[..., None], lu[..., k : k + 1, :], lu)
+        lu[..., k : k + 1, :] = row_piv
+
+        perm_piv = dpnp.sum(dpnp.where(is_piv, perm, 0), axis=-1)
+        perm = dpnp.where(is_piv, perm[..., k : k + 1], perm)
+        perm[..., k] = perm_piv
+        sign = dpnp.where(piv != k, -sign, sign)
+
+        # with partial pivoting, a zero pivot means the rest of the column
+        # is zero, so the multipliers are zero too
+        pivot = lu[..., k, k]
+        zero = pivot == 0
+        singular |= zero
+        if k + 1 < n:
+            mult = lu[..., k + 1 :, k] / dpnp.where(zero, 1, pivot)[..., None]
+            lu[..., k + 1 :, k] = mult
+            lu[..., k + 1 :, k + 1 :] -= (
+                mult[..., :, None] * lu[..., k : k + 1, k + 1 :]
+            )
+
+    return lu, perm, sign, singular
+
+
+def _small_lu_solve(lu, x):
+    """
+    Solve the systems of linear equations with the LU factors `lu` returned
+    by `_small_lu` in-place of the row-permuted dependent variables `x`.
+
+    """
+
+    n = lu.shape[-1]
+
+    # forward substitution with the unit lower triangular factor
+    for k in range(n - 1):
+        x[..., k + 1 :, :] -= lu[..., k + 1 :, k : k + 1] * x[..., k : k + 1, :]
+
+    # back substitution with the upper triangular factor
+    for k in range(n - 1, -1, -1):
+        x[..., k : k + 1, :] /= lu[..., k : k + 1, k : k + 1]
+        if k > 0:
+            x[..., :k, :] -= lu[..., :k, k : k + 1] * x[..., k : k + 1, :]
+    return x
+
+
+def _small_det(a):
+    """
+    Return the determinants of a stack of matrices `a` of size
+    ``n <= _small_matrix_max_n``.
+
+    The closed-form expressions are used for ``n <= _closed_form_max_n``,
+    and the LU factorization computed over the whole stack otherwise.
+
+    """
+
+    n = a.shape[-1]
+    if n == 1:
+        return a[..., 0, 0].copy()
+    if n == 2:
+        return a[..., 0, 0] * a[..., 1, 1] - a[..., 0, 1] * a[..., 1, 0]
+    if n <= _closed_form_max_n:
+        # expansion by the cofactors of the first row
+        e = a[..., 1:, :]
+        e = dpnp.concatenate((e, e[..., :2]), axis=-1)
+        c = e[..., 0, 1:4] * e[..., 1, 2:5] - e[..., 0, 2:5] * e[..., 1, 1:4]
+        return dpnp.sum(a[..., 0, :] * c, axis=-1)
+
+    lu, _, sign, _ = _small_lu(a)
+    diag = dpnp.diagonal(lu, axis1=-2, axis2=-1)
+    return sign * dpnp.prod(diag, axis=-1)
+
+
+def _small_inv(a):
+    """
+    Return the inverses of a stack of matrices `a` of size
+    ``n <= _small_matrix_max_n`` computed by the LU factorization with
+    partial pivoting over the whole stack.
+
+    """
+
+    lu, perm, _, singular = _small_lu(a)
+    if singular.any():
+        raise li.LinAlgError("Singular matrix")
+
+    # the identity matrices with the rows permuted
+    rows = dpnp.arange(
+        lu.shape[-1], usm_type=a.usm_type, sycl_queue=a.sycl_queue
+    )
+    x = dpnp.astype(perm[..., :, None] == rows, lu.dtype)
+    return _small_lu_solve(lu, x)
+
+
+def _small_solve(a, b):
+    """
+    Return the solution to the systems of linear equations of a stack of
+    matrices `a` of size ``n <= _small_matrix_max_n`` and dependent variables
+    `b` having the same batch shape, computed by the LU factorization with
+    partial pivoting over the whole stack.
+
+    """
+
+    lu, perm, _, singular = _small_lu(a)
+    if singular.any():
+        raise li.LinAlgError("Singular matrix")
+
+    vector = b.ndim == a.ndim - 1
+    if vector:
+        b = b[..., None]
+
+    idx = dpnp.broadcast_to(perm[..., :, None], b.shape)
+    x = _small_lu_solve(lu, dpnp.take_along_axis(b, idx, axis=-2))
+    return x[..., 0] if vector else x
+
+
+def _small_eigh(a, UPLO, eigen_mode, w_type, v_type):
+    """
+    Return the eigenvalues and, if `eigen_mode` is ``"V"``, the eigenvectors
+    of a stack of Hermitian matrices `a` of size ``n <= _small_eigh_max_n``
+    computed by the cyclic Jacobi eigenvalue algorithm over the whole stack.
+
+    Every step of a sweep annihilates the off-diagonal elements of
+    ``n // 2`` disjoint pairs of rows and columns at once by a unitary
+    rotation applied with batched matrix products. The sweeps are repeated
+    until the off-diagonal parts of all the matrices are negligible.
+
+    """
+
+    batch_shape = a.shape[:-2]
+    n = a.shape[-1]
+    a = dpnp.reshape(a.astype(v_type, copy=False), (-1, n, n))
+    usm_type, sycl_queue = a.usm_type, a.sycl_queue
+    is_complex = dpnp.issubdtype(v_type, dpnp.complexfloating)
+
+    def _conj(x):
+        return dpnp.conj(x) if is_complex else x
+
+    def _abs2(x):
+        if is_complex:
+            return dpnp.square(x.real) + dpnp.square(x.imag)
+        return dpnp.square(x)
+
+    # restore the Hermitian matrices from the referenced triangle
+    rows = dpnp.arange(n, usm_type=usm_type, sycl_queue=sycl_queue)
+    t = dpnp.tril(a, k=-1) if UPLO == "L" else dpnp.triu(a, k=1)
+    h = t + _conj(dpnp.swapaxes(t, -1, -2))
+    h[:, rows, rows] = a[:, rows, rows].real
+
+    eye = dpnp.astype(rows[:, None] == rows, v_type)
+    eye = dpnp.broadcast_to(eye, a.shape)
+    if eigen_mode == "V":
+        v = eye.copy()
+
+    # the disjoint pairs of the round-robin ordering of every step, with an
+    # odd size padded by a dummy index
+    m = n + n % 2
+    order = list(range(m))
+    steps = []
+    for _ in range(m - 1):
+        pairs = [sorted((order[i], order[m - 1 - i])) for i in range(m // 2)]
+        pairs = [pair for pair in pairs if pair[1] < n]
+        if pairs:
+            p, q = zip(*pairs)
+            steps.append(
+                tuple(
+                    dpnp.asarray(ind, usm_type=usm_type, sycl_queue=sycl_queue)
+                    for ind in (p, q)
+                )
+            )
+        order = order[:1] + order[-1:] + order[1:-1]
+
+    # the rounding errors of every rotation leave off-diagonal elements of
+    # the order of the machine epsilon relative to the norm of the matrix
+    off_diag = rows[:, None] != rows
+    tol = (n * dpnp.finfo(w_type).eps) ** 2
+    tol = tol * dpnp.sum(_abs2(h), axis=(-2, -1))
+    for _ in range(_jacobi_max_sweeps):
+        off = dpnp.sum(dpnp.where(off_diag, _abs2(h), 0), axis=(-2, -1))
+        if not (off > tol).any():
+            break
+
+        for p, q in steps:
+            h_pq = h[:, p, q]
+            r = dpnp.abs(h_pq)
+            theta = 0.5 * dpnp.arctan2(2 * r, h[:, q, q].real - h[:, p, p].real)
+            c, s = dpnp.cos(theta), dpnp.sin(theta)
+
+            j = eye.copy()
+            j[:, p, p] = c
+            j[:, p, q] = s
+            if is_complex:
+                # the phase turns the element (p, q) into a real one
+                phase = dpnp.where(
+                    r == 0, 1, _conj(h_pq) / dpnp.where(r == 0, 1, r)
+                )
+                j[:, q, p] = -s * phase
+                j[:, q, q] = c * phase
+            else:
+                j[:, q, p] = -s
+                j[:, q, q] = c
+
+            h = dpnp.matmul(_conj(dpnp.swapaxes(j, -1, -2)), dpnp.matmul(h, j))
+            if eigen_mode == "V":
+                v = dpnp.matmul(v, j)
+
+    # sort the eigenvalues in ascending order
+    w = dpnp.astype(dpnp.diagonal(h, axis1=-2, axis2=-1).real, w_type)
+    idx = dpnp.argsort(w, axis=-1)
+    w = dpnp.take_along_axis(w, idx, axis=-1).reshape(batch_shape + (n,))
+    if eigen_mode == "V":
+        idx = dpnp.broadcast_to(idx[:, None, :], v.shape)
+        v = dpnp.take_along_axis(v, idx, axis=-1)
+        return EighResult(w, v.reshape(batch_shape + (n, n)))
+    return w
+
+
 def _stacked_identity(
     batch_shape, n, dtype, usm_type="device", sycl_queue=None
 ):
@@ -1401,6 +1836,21 @@ def _triu_inplace(a):
     return out
 
 
+def _use_getrf_batch(sycl_device, n):
+    """
+    Check whether a batch of matrices of size `n` is factorized by
+    getrf_batch or by calling getrf for each matrix in a loop.
+
+    getrf_batch is always used on CPU. On GPU it shows slow results with
+    large matrices, but for small matrices the loop is dominated by the
+    overhead of submitting a kernel per matrix, so getrf_batch is used if
+    `n` does not exceed ``_getrf_batch_gpu_max_n``.
+
+    """
+
+    return sycl_device.has_aspect_cpu or n <= _getrf_batch_gpu_max_n
+
+
 def _zero_batched_qr(a, mode, m, n, k, res_type):
     """
     _zero_batched_qr(a, mode, m, n, k, res_type)
@@ -1881,6 +2331,8 @@ def dpnp_cholesky(a, upper):
     upper_lower = int(upper)
 
     if a.ndim > 2:
+        if a_shape[-1] <= _small_matrix_max_n:
+            return _small_cholesky(a.astype(res_type, copy=False), upper)
         return dpnp_cholesky_batch(a, upper_lower, res_type)
 
     a_usm_arr = dpnp.get_usm_ndarray(a)
@@ -1978,6 +2430,9 @@ def dpnp_det(a):
         )
         return det
 
+    if a.ndim > 2 and n <= _small_matrix_max_n:
+        return _small_det(a.astype(res_type, copy=False))
+
     lu, ipiv, dev_info = _lu_factor(a, res_type)
 
     diag = dpnp.diagonal(lu, axis1=-2, axis2=-1)
@@ -2021,6 +2476,8 @@ def dpnp_eigh(a, UPLO="L", eigen_mode="V"):
         return w
 
     if a.ndim > 2:
+        if a.shape[-1] <= _small_eigh_max_n:
+            return _small_eigh(a, UPLO, eigen_mode, w_type, v_type)
         return _batched_eigh(a, UPLO, eigen_mode, w_type, v_type)
 
     # `eigen_mode` can be either "N" or "V", specifying the computation mode
@@ -2118,6 +2575,8 @@ def dpnp_inv(a):
         return dpnp.empty_like(a, dtype=res_type)
 
     if a.ndim >= 3:
+        if a.shape[-1] <= _small_matrix_max_n:
+            return _small_inv(a.astype(res_type, copy=False))
         return _batched_inv(a, res_type)
 
     a_usm_arr = dpnp.get_usm_ndarray(a)
@@ -2552,9 +3011,9 @@ def dpnp_qr(a, mode="reduced"):
     return QRResult(q, r)
 
 
-def dpnp_solve(a, b):
+def dpnp_solve(a, b, mixed_precision=False):
     """
-    dpnp_solve(a, b)
+    dpnp_solve(a, b, mixed_precision=False)
 
     Return the solution to the system of linear equations with
     a square coefficient matrix `a` and multiple dependent variables
@@ -2569,8 +3028,17 @@ def dpnp_solve(a, b):
         return dpnp.empty_like(b, dtype=res_type, usm_type=res_usm_type)
 
     if a.ndim > 2:
+        if a.shape[-1] <= _small_matrix_max_n:
+            return _small_solve(
+                a.astype(res_type, copy=False), b.astype(res_type, copy=False)
+            )
         return _batched_solve(a, b, exec_q, res_usm_type, res_type)
 
+    if mixed_precision and res_type.name in _single_types_map:
+        x = _refined_solve(a, b, res_usm_type, res_type)
+        if x is not None:
+            return x
+
     a_usm_arr = dpnp.get_usm_ndarray(a)
     b_usm_arr = dpnp.get_usm_ndarray(b)
 
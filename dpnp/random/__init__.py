@@ -26,6 +26,8 @@
 # THE POSSIBILITY OF SUCH DAMAGE.
 # *****************************************************************************
 
+from .dpnp_bit_generator import BitGenerator, Philox
+from .dpnp_generator import Generator, default_rng
 from .dpnp_iface_random import (
     beta,
     binomial,
@@ -84,6 +86,7 @@ __all__ = [
     "bytes",
     "chisquare",
     "choice",
+    "default_rng",
     "dirichlet",
     "exponential",
     "f",
@@ -127,5 +130,8 @@ __all__ = [
     "wald",
     "weibull",
     "zipf",
+    "BitGenerator",
+    "Generator",
+    "Philox",
     "RandomState",
 ]
@@ -0,0 +1,478 @@
+# cython: language_level=3
+# *****************************************************************************
+# Copyright (c) 2016, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Module Intel NumPy BitGenerator
+
+Set of classes to implement NumPy random bit generators API
+
+    .. seealso:: :obj:`numpy.random.BitGenerator`
+
+"""
+
+import numpy
+
+import dpnp
+
+from .dpnp_utils_random import _normalize_size
+
+__all__ = ["BitGenerator", "Philox"]
+
+
+_UINT32_MASK = 0xFFFFFFFF
+_UINT64_MASK = 0xFFFFFFFFFFFFFFFF
+
+# Philox4x32-10 constants: round multipliers and Weyl increments of the key
+_PHILOX_M0 = 0xD2511F53
+_PHILOX_M1 = 0xCD9E8D57
+_PHILOX_W0 = 0x9E3779B9
+_PHILOX_W1 = 0xBB67AE85
+_PHILOX_ROUNDS = 10
+_PHILOX_COUNTER_BITS = 128
+
+
+def _words_to_int(value, n_words, name):
+    """
+    Convert `value` to a Python integer of `n_words` 32-bit words.
+
+    `value` can be an integer or a sequence of 32-bit words, where the first
+    word is the least significant one.
+
+    """
+
+    n_bits = 32 * n_words
+    if dpnp.is_supported_array_type(value):
+        value = dpnp.asnumpy(value)
+
+    if numpy.ndim(value) == 0:
+        value = int(value)
+    else:
+        words = [int(w) for w in numpy.ravel(value)]
+        if len(words) != n_words:
+            raise ValueError(f"{name} must have {n_words} 32-bit words")
+        if any(w < 0 or w > _UINT32_MASK for w in words):
+            raise ValueError(f"{name} words must be between 0 and 2**32 - 1")
+        value = sum(w << (32 * i) for i, w in enumerate(words))
+
+    if value < 0 or value >= (1 << n_bits):
+        raise ValueError(f"{name} must be between 0 and 2**{n_bits} - 1")
+    return value
+
+
+def _int_to_words(value, n_words):
+    """Split a Python integer into a NumPy array of 32-bit words."""
+
+    return numpy.array(
+        [(value >> (32 * i)) & _UINT32_MASK for i in range(n_words)],
+        dtype=numpy.uint32,
+    )
+
+
+class BitGenerator:
+    """
+    Base class for bit generators used by :class:`dpnp.random.Generator`.
+
+    A bit generator produces streams of random bits on a SYCL device, which
+    are transformed by :class:`dpnp.random.Generator` into samples from
+    various distributions. A derived class has to implement
+    :meth:`_next_uint32` method and may also override :meth:`spawn`.
+
+    For full documentation refer to :obj:`numpy.random.BitGenerator`.
+
+    Parameters
+    ----------
+    seed : {None, int, array_like[ints], numpy.random.SeedSequence}, optional
+        A seed to initialize the bit generator. If ``None`` (the default),
+        fresh entropy is pulled from the OS. Otherwise, the seed is passed to
+        :class:`numpy.random.SeedSequence` to derive the initial state.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the output array is created.
+        `device` can be ``None``, a oneAPI filter selector string, an instance
+        of :class:`dpctl.SyclDevice` corresponding to a non-partitioned SYCL
+        device, an instance of :class:`dpctl.SyclQueue`, or a
+        :class:`dpctl.tensor.Device` object returned by
+        :attr:`dpnp.ndarray.device`.
+
+        Default: ``None``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for output array allocation and copying. The
+        `sycl_queue` can be passed as ``None`` (the default), which means
+        to get the SYCL queue from `device` keyword if present or to use
+        a default queue.
+
+        Default: ``None``.
+
+    """
+
+    def __init__(self, seed=None, device=None, sycl_queue=None):
+        self._sycl_queue = dpnp.get_normalized_queue_device(
+            device=device, sycl_queue=sycl_queue
+        )
+        self._sycl_device = self._sycl_queue.sycl_device
+
+        if isinstance(seed, numpy.random.SeedSequence):
+            self._seed_seq = seed
+        else:
+            if dpnp.is_supported_array_type(seed):
+                seed = dpnp.asnumpy(seed)
+            self._seed_seq = numpy.random.SeedSequence(seed)
+
+    def __repr__(self):
+        return self.__str__() + " at 0x{:X}".format(id(self))
+
+    def __str__(self):
+        return self.__class__.__name__
+
+    def _next_uint32(self, n, usm_type="device"):
+        """
+        Return the next `n` 32-bit random words of the stream.
+
+        The words are returned as a 1-D array of :obj:`dpnp.uint64` data type
+        allocated on the SYCL queue of the bit generator, so the following
+        arithmetic on them does not overflow.
+
+        """
+
+        raise NotImplementedError(
+            f"{self.__class__.__name__} has to implement _next_uint32 method"
+        )
+
+    def _next_uint64(self, n, usm_type="device"):
+        """Return the next `n` 64-bit random words of the stream."""
+
+        words = self._next_uint32(2 * n, usm_type=usm_type)
+        return (words[1::2] << 32) | words[::2]
+
+    @property
+    def seed_seq(self):
+        """
+        Get the seed sequence used to initialize the bit generator.
+
+        Returns
+        -------
+        seed_seq : numpy.random.SeedSequence
+            The seed sequence used to initialize the bit generator.
+
+        """
+
+        return self._seed_seq
+
+    def get_sycl_queue(self):
+        """
+        Return an instance of :class:`dpctl.SyclQueue` used within the
+        bit generator for data allocation.
+
+        Returns
+        -------
+        queue : dpctl.SyclQueue
+            A SYCL queue used for data allocation.
+
+        """
+
+        return self._sycl_queue
+
+    def get_sycl_device(self):
+        """
+        Return an instance of :class:`dpctl.SyclDevice` used within the
+        bit generator to allocate data on.
+
+        Returns
+        -------
+        device : dpctl.SyclDevice
+            A SYCL device used to allocate data on.
+
+        """
+
+        return self._sycl_device
+
+    def random_raw(self, size=None, usm_type="device"):
+        """
+        Return random unsigned 64-bit integers.
+
+        For full documentation refer to
+        :obj:`numpy.random.BitGenerator.random_raw`.
+
+        Parameters
+        ----------
+        size : {None, int, tuple of ints}, optional
+            Output shape. If ``None`` (the default), a zero-dimensional array
+            is returned.
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+            Default: ``"device"``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Array of random 64-bit words of :obj:`dpnp.uint64` data type.
+
+        """
+
+        shape = _normalize_size(size)
+        n = int(numpy.prod(shape, dtype=numpy.int64))
+        return self._next_uint64(n, usm_type=usm_type).reshape(shape)
+
+    def spawn(self, n_children):
+        """
+        Create new independent child bit generators.
+
+        The child bit generators are initialized with the seed sequences
+        spawned from the seed sequence of the bit generator and use the same
+        SYCL queue.
+
+        For full documentation refer to :obj:`numpy.random.BitGenerator.spawn`.
+
+        Parameters
+        ----------
+        n_children : int
+            Number of child bit generators to create.
+
+        Returns
+        -------
+        child_bit_generators : list of BitGenerator
+            The list of child bit generators.
+
+        """
+
+        return [
+            self.__class__(seed=seed_seq, sycl_queue=self._sycl_queue)
+            for seed_seq in self._seed_seq.spawn(n_children)
+        ]
+
+
+class Philox(BitGenerator):
+    """
+    Container for the Philox4x32-10 counter-based pseudo-random number
+    generator.
+
+    The output of the generator is a pure function of a 128-bit counter and
+    a 64-bit key, so any block of the stream is computed on the device in
+    parallel and the stream can be advanced by an arbitrary number of steps
+    at no cost. Each call of the generator consumes an integral number of
+    blocks of four 32-bit words.
+
+    For full documentation refer to :obj:`numpy.random.Philox`.
+
+    Parameters
+    ----------
+    seed : {None, int, array_like[ints], numpy.random.SeedSequence}, optional
+        A seed to initialize the key of the generator. If ``None`` (the
+        default) and `key` is not provided, fresh entropy is pulled from
+        the OS. Cannot be used together with `key`.
+    counter : {None, int, array_like[ints]}, optional
+        The initial 128-bit counter of the generator, either an integer or
+        four 32-bit words with the least significant word first.
+        If ``None`` (the default), the counter is set to zero.
+    key : {None, int, array_like[ints]}, optional
+        The 64-bit key of the generator, either an integer or two 32-bit
+        words with the least significant word first. If ``None`` (the
+        default), the key is derived from `seed`.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the output array is created.
+        `device` can be ``None``, a oneAPI filter selector string, an instance
+        of :class:`dpctl.SyclDevice` corresponding to a non-partitioned SYCL
+        device, an instance of :class:`dpctl.SyclQueue`, or a
+        :class:`dpctl.tensor.Device` object returned by
+        :attr:`dpnp.ndarray.device`.
+
+        Default: ``None``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for output array allocation and copying. The
+        `sycl_queue` can be passed as ``None`` (the default), which means
+        to get the SYCL queue from `device` keyword if present or to use
+        a default queue.
+
+        Default: ``None``.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> bg = np.random.Philox(1234)
+    >>> streams = [np.random.Generator(bg.jumped(i)) for i in range(1, 4)]
+
+    """
+
+    def __init__(
+        self, seed=None, counter=None, key=None, device=None, sycl_queue=None
+    ):
+        if seed is not None and key is not None:
+            raise ValueError("seed and key cannot be both used")
+
+        super().__init__(seed=seed, device=device, sycl_queue=sycl_queue)
+
+        if key is None:
+            key = self._seed_seq.generate_state(2, numpy.uint32)
+        self._key = _words_to_int(key, 2, "key")
+
+        if counter is None:
+            counter = 0
+        self._counter = _words_to_int(counter, 4, "counter")
+
+    def _next_uint32(self, n, usm_type="device"):
+        n_blocks = -(-n // 4)
+        words = self._philox_blocks(n_blocks, usm_type)
+        self.advance(n_blocks)
+        return dpnp.stack(words, axis=1).ravel()[:n]
+
+    def _philox_blocks(self, n_blocks, usm_type):
+        """
+        Compute `n_blocks` consecutive blocks of the Philox4x32-10 stream
+        starting from the current counter.
+
+        Return a tuple of four arrays holding the words of every block.
+        All words are kept in :obj:`dpnp.uint64` arrays, so the product of
+        two 32-bit words is computed without overflow.
+
+        """
+
+        blocks = dpnp.arange(
+            n_blocks,
+            dtype=dpnp.uint64,
+            usm_type=usm_type,
+            sycl_queue=self._sycl_queue,
+        )
+
+        # 128-bit counter of every block split into two 64-bit halves,
+        # the addition wraps around modulo 2**64, so detect the carry
+        ctr_lo = blocks + (self._counter & _UINT64_MASK)
+        ctr_hi = (ctr_lo < blocks).astype(dpnp.uint64)
+        ctr_hi += self._counter >> 64
+
+        x0 = ctr_lo & _UINT32_MASK
+        x1 = ctr_lo >> 32
+        x2 = ctr_hi & _UINT32_MASK
+        x3 = ctr_hi >> 32
+
+        k0 = self._key & _UINT32_MASK
+        k1 = self._key >> 32
+        for _ in range(_PHILOX_ROUNDS):
+            p0 = x0 * _PHILOX_M0
+            p1 = x2 * _PHILOX_M1
+            x0, x1, x2, x3 = (
+                (p1 >> 32) ^ x1 ^ k0,
+                p1 & _UINT32_MASK,
+                (p0 >> 32) ^ x3 ^ k1,
+                p0 & _UINT32_MASK,
+            )
+            k0 = (k0 + _PHILOX_W0) & _UINT32_MASK
+            k1 = (k1 + _PHILOX_W1) & _UINT32_MASK
+        return x0, x1, x2, x3
+
+    @property
+    def state(self):
+        """
+        Get or set the state of the generator.
+
+        The state is a dictionary with the counter and the key of the
+        generator stored as arrays of 32-bit words, least significant
+        word first.
+
+        """
+
+        return {
+            "bit_generator": self.__class__.__name__,
+            "state": {
+                "counter": _int_to_words(self._counter, 4),
+                "key": _int_to_words(self._key, 2),
+            },
+        }
+
+    @state.setter
+    def state(self, value):
+        if not isinstance(value, dict):
+            raise TypeError("state must be a dict")
+        if value.get("bit_generator") != self.__class__.__name__:
+            raise ValueError(
+                "state must be for a {0} PRNG".format(self.__class__.__name__)
+            )
+
+        state = value["state"]
+        self._counter = _words_to_int(state["counter"], 4, "counter")
+        self._key = _words_to_int(state["key"], 2, "key")
+
+    def advance(self, delta):
+        """
+        Advance the counter of the generator by `delta` blocks in place.
+
+        Every block holds four 32-bit words, so advancing by `delta` is
+        equivalent to drawing ``4 * delta`` 32-bit words.
+
+        For full documentation refer to :obj:`numpy.random.Philox.advance`.
+
+        Parameters
+        ----------
+        delta : int
+            Number of blocks to advance the counter by. The counter wraps
+            around modulo ``2**128``.
+
+        Returns
+        -------
+        self : dpnp.random.Philox
+            The bit generator with the advanced counter.
+
+        """
+
+        self._counter = (self._counter + int(delta)) % (
+            1 << _PHILOX_COUNTER_BITS
+        )
+        return self
+
+    def jumped(self, jumps=1):
+        """
+        Return a new bit generator with the counter jumped ahead.
+
+        The jump is ``2**64`` blocks, so the streams of the jumped generators
+        do not overlap in practice. It allows to create independent streams
+        for parallel computations without reseeding.
+
+        For full documentation refer to :obj:`numpy.random.Philox.jumped`.
+
+        Parameters
+        ----------
+        jumps : int, optional
+            Number of times to jump the counter ahead.
+
+            Default: ``1``.
+
+        Returns
+        -------
+        bit_generator : dpnp.random.Philox
+            A new instance of the generator with the same key and the jumped
+            counter allocating data on the same SYCL queue.
+
+        """
+
+        bit_generator = self.__class__(
+            counter=self._counter,
+            key=self._key,
+            sycl_queue=self._sycl_queue,
+        )
+        bit_generator._seed_seq = self._seed_seq
+        return bit_generator.advance(int(jumps) << 64)
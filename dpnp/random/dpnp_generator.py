@@ -0,0 +1,766 @@
+# cython: language_level=3
+# *****************************************************************************
+# Copyright (c) 2016, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Module Intel NumPy Generator
+
+Set of functions to implement NumPy random Generator API
+
+    .. seealso:: :obj:`numpy.random.Generator`
+
+"""
+
+# pylint: disable=protected-access
+
+import dpctl.utils as dpu
+import numpy
+
+import dpnp
+from dpnp.dpnp_utils.dpnp_algo_utils import map_dtype_to_device
+from dpnp.exceptions import ExecutionPlacementError
+
+from .dpnp_bit_generator import BitGenerator, Philox
+from .dpnp_utils_random import (
+    _broadcast_params,
+    _check_params,
+    _normalize_size,
+    dpnp_beta,
+    dpnp_chisquare,
+    dpnp_choice,
+    dpnp_exponential,
+    dpnp_gamma,
+    dpnp_lognormal,
+    dpnp_normal,
+    dpnp_standard_gamma,
+    dpnp_uniform,
+)
+
+__all__ = ["Generator", "default_rng"]
+
+
+class Generator:
+    """
+    Container for the bit generators.
+
+    A generator exposes methods drawing samples from a variety of
+    probability distributions. The random bits are produced by a pluggable
+    bit generator, and all transformations are done on the SYCL device of
+    the bit generator.
+
+    For full documentation refer to :obj:`numpy.random.Generator`.
+
+    Parameters
+    ----------
+    bit_generator : dpnp.random.BitGenerator
+        Bit generator to use as the source of random bits.
+
+    See Also
+    --------
+    :obj:`dpnp.random.default_rng` : Recommended constructor of the generator.
+
+    """
+
+    def __init__(self, bit_generator):
+        if not isinstance(bit_generator, BitGenerator):
+            raise TypeError(
+                "bit_generator must be an instance of dpnp.random.BitGenerator"
+            )
+
+        self._bit_generator = bit_generator
+        self._sycl_queue = bit_generator.get_sycl_queue()
+        self._sycl_device = bit_generator.get_sycl_device()
+
+        # 'float32' is default floating data type if device doesn't support
+        # 'float64'
+        self._def_float_type = map_dtype_to_device(
+            dpnp.float64, self._sycl_device
+        )
+
+    def __repr__(self):
+        return self.__str__() + " at 0x{:X}".format(id(self))
+
+    def __str__(self):
+        _str = self.__class__.__name__
+        _str += "(" + self._bit_generator.__class__.__name__ + ")"
+        return _str
+
+    def _validate_float_dtype(self, dtype, supported_types):
+        """
+        Validate an input floating type.
+
+        Test an input floating type if it is listed in `supported_types` and
+        if it is supported by the used SYCL device.
+        If `dtype` is ``None``, default floating type will be validating.
+        Return the examined floating type if it follows all validation checks.
+        """
+
+        if dtype is None:
+            dtype = self._def_float_type
+
+        if dtype not in supported_types:
+            raise TypeError(f"dtype={dtype} is unsupported.")
+        elif dtype != map_dtype_to_device(dtype, self._sycl_device):
+            raise RuntimeError(
+                f"dtype={dtype} is not supported by SYCL device "
+                f"'{self._sycl_device}'"
+            )
+        return dpnp.dtype(dtype)
+
+    def _prepare_out(self, size, dtype, out, usm_type):
+        """
+        Validate the output parameters of a floating-point distribution.
+
+        Return a tuple of the data type, the shape and the USM type of the
+        output array. If `out` is provided, the samples are written directly
+        into it, so it has to match `size` and `dtype` and to be allocated
+        on a SYCL queue compatible with the one of the bit generator.
+
+        """
+
+        supported_types = (dpnp.float32, dpnp.float64)
+        if out is None:
+            dtype = self._validate_float_dtype(dtype, supported_types)
+            dpu.validate_usm_type(usm_type, allow_none=False)
+            return dtype, _normalize_size(size), usm_type
+
+        dpnp.check_supported_arrays_type(out)
+        if dtype is None:
+            dtype = out.dtype
+        dtype = self._validate_float_dtype(dtype, supported_types)
+        if out.dtype != dtype:
+            raise TypeError(
+                "Supplied output array has the wrong type. "
+                f"Expected {dtype}, got {out.dtype}"
+            )
+        if size is not None and _normalize_size(size) != out.shape:
+            raise ValueError("size must match out.shape when used together")
+        if dpu.get_execution_queue((self._sycl_queue, out.sycl_queue)) is None:
+            raise ExecutionPlacementError(
+                "Input and output allocation queues are not compatible"
+            )
+        return dtype, out.shape, out.usm_type
+
+    @property
+    def bit_generator(self):
+        """
+        Get the bit generator instance used by the generator.
+
+        Returns
+        -------
+        bit_generator : dpnp.random.BitGenerator
+            The bit generator instance used by the generator.
+
+        """
+
+        return self._bit_generator
+
+    def get_sycl_queue(self):
+        """
+        Return an instance of :class:`dpctl.SyclQueue` used within the
+        generator for data allocation.
+
+        Returns
+        -------
+        queue : dpctl.SyclQueue
+            A SYCL queue used for data allocation.
+
+        """
+
+        return self._sycl_queue
+
+    def get_sycl_device(self):
+        """
+        Return an instance of :class:`dpctl.SyclDevice` used within the
+        generator to allocate data on.
+
+        Returns
+        -------
+        device : dpctl.SyclDevice
+            A SYCL device used to allocate data on.
+
+        """
+
+        return self._sycl_device
+
+    def beta(self, a, b, size=None, usm_type="device"):
+        """
+        Draw samples from a Beta distribution.
+
+        For full documentation refer to :obj:`numpy.random.Generator.beta`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized beta distribution.
+
+        """
+
+        dpu.validate_usm_type(usm_type, allow_none=False)
+        return dpnp_beta(self, a, b, size, usm_type=usm_type)
+
+    def bytes(self, length):
+        """
+        Return random bytes.
+
+        For full documentation refer to :obj:`numpy.random.Generator.bytes`.
+
+        Returns
+        -------
+        out : bytes
+            String of length `length`.
+
+        """
+
+        res = self.integers(0, 256, size=length, dtype=dpnp.uint8)
+        return dpnp.asnumpy(res).tobytes()
+
+    def chisquare(self, df, size=None, usm_type="device"):
+        """
+        Draw samples from a chi-square distribution.
+
+        For full documentation refer to
+        :obj:`numpy.random.Generator.chisquare`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized chi-square distribution.
+
+        """
+
+        dpu.validate_usm_type(usm_type, allow_none=False)
+        return dpnp_chisquare(self, df, size, usm_type=usm_type)
+
+    def choice(self, a, size=None, replace=True, p=None, usm_type="device"):
+        """
+        Generate a random sample from a given 1-D array.
+
+        For full documentation refer to :obj:`numpy.random.Generator.choice`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The generated random samples.
+
+        Limitations
+        -----------
+        Parameter `a` is supported only as an integer or a 1-D array.
+        Parameters `axis` and `shuffle` are not supported.
+
+        """
+
+        dpu.validate_usm_type(usm_type, allow_none=False)
+        return dpnp_choice(self, a, size, replace, p, usm_type=usm_type)
+
+    def exponential(self, scale=1.0, size=None, usm_type="device"):
+        """
+        Draw samples from an exponential distribution.
+
+        For full documentation refer to
+        :obj:`numpy.random.Generator.exponential`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized exponential distribution.
+
+        """
+
+        dpu.validate_usm_type(usm_type, allow_none=False)
+        return dpnp_exponential(self, scale, size, usm_type=usm_type)
+
+    def gamma(self, shape, scale=1.0, size=None, usm_type="device"):
+        """
+        Draw samples from a Gamma distribution.
+
+        For full documentation refer to :obj:`numpy.random.Generator.gamma`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized gamma distribution.
+
+        """
+
+        dpu.validate_usm_type(usm_type, allow_none=False)
+        return dpnp_gamma(self, shape, scale, size, usm_type=usm_type)
+
+    def integers(
+        self,
+        low,
+        high=None,
+        size=None,
+        dtype=numpy.int64,
+        endpoint=False,
+        usm_type="device",
+    ):
+        """
+        Return random integers from `low` (inclusive) to `high` (exclusive),
+        or if ``endpoint=True``, `low` (inclusive) to `high` (inclusive).
+
+        For full documentation refer to
+        :obj:`numpy.random.Generator.integers`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            `size`-shaped array of random integers from the appropriate
+            distribution.
+
+        Limitations
+        -----------
+        Parameters `low` and `high` are supported only within the range of
+        :obj:`dpnp.int64` data type.
+
+        Notes
+        -----
+        The integers are obtained by reducing 64-bit random words modulo the
+        range, so the bias of the distribution does not exceed
+        ``(high - low) / 2**64``.
+
+        """
+
+        if high is None:
+            low, high = 0, low
+
+        dtype = dpnp.dtype(dtype)
+        if not (dpnp.issubdtype(dtype, dpnp.integer) or dtype == dpnp.bool):
+            raise TypeError(f"Unsupported dtype {dtype} for integers")
+        dpu.validate_usm_type(usm_type, allow_none=False)
+
+        (low, high), shape = _broadcast_params(
+            self, (low, high), size, dtype=dpnp.int64, usm_type=usm_type
+        )
+        if not endpoint:
+            high = high - 1
+
+        if dtype == dpnp.bool:
+            min_int, max_int = 0, 1
+        else:
+            int64_info = dpnp.iinfo(dpnp.int64)
+            min_int = max(dpnp.iinfo(dtype).min, int64_info.min)
+            max_int = min(dpnp.iinfo(dtype).max, int64_info.max)
+        _check_params(
+            (low < min_int, f"low is out of bounds for {dtype}"),
+            (high > max_int, f"high is out of bounds for {dtype}"),
+            (low > high, "low > high" if endpoint else "low >= high"),
+        )
+
+        # the range wraps around to zero for the full range of int64 values
+        rng = (high - low).astype(dpnp.uint64) + 1
+        raw = self._bit_generator.random_raw(shape, usm_type=usm_type)
+        offset = dpnp.where(rng == 0, raw, raw % dpnp.where(rng == 0, 1, rng))
+
+        res = offset.astype(dpnp.int64) + low
+        return res.astype(dtype, copy=False)
+
+    def lognormal(self, mean=0.0, sigma=1.0, size=None, usm_type="device"):
+        """
+        Draw samples from a log-normal distribution.
+
+        For full documentation refer to
+        :obj:`numpy.random.Generator.lognormal`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized log-normal distribution.
+
+        """
+
+        dpu.validate_usm_type(usm_type, allow_none=False)
+        return dpnp_lognormal(self, mean, sigma, size, usm_type=usm_type)
+
+    def normal(
+        self, loc=0.0, scale=1.0, size=None, dtype=None, usm_type="device"
+    ):
+        """
+        Draw random samples from a normal (Gaussian) distribution.
+
+        For full documentation refer to :obj:`numpy.random.Generator.normal`.
+
+        Parameters
+        ----------
+        dtype : {None, dpnp.float32, dpnp.float64}, optional
+            Desired data type of the output array. If ``None`` (the default),
+            :obj:`dpnp.float64` type will be used if device supports it, or
+            :obj:`dpnp.float32` otherwise.
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized normal distribution.
+
+        """
+
+        dtype = self._validate_float_dtype(dtype, (dpnp.float32, dpnp.float64))
+        if not dpnp.isscalar(loc) or not dpnp.isscalar(scale):
+            dpu.validate_usm_type(usm_type, allow_none=False)
+            return dpnp_normal(
+                self, loc, scale, size, dtype=dtype, usm_type=usm_type
+            )
+
+        if scale < 0:
+            raise ValueError("scale < 0")
+
+        res = self.standard_normal(size=size, dtype=dtype, usm_type=usm_type)
+        if scale != 1:
+            res *= scale
+        if loc != 0:
+            res += loc
+        return res
+
+    def random(self, size=None, dtype=None, out=None, usm_type="device"):
+        """
+        Return random floats in the half-open interval [0.0, 1.0).
+
+        For full documentation refer to :obj:`numpy.random.Generator.random`.
+
+        Parameters
+        ----------
+        dtype : {None, dpnp.float32, dpnp.float64}, optional
+            Desired data type of the output array. If ``None`` (the default),
+            :obj:`dpnp.float64` type will be used if device supports it, or
+            :obj:`dpnp.float32` otherwise.
+        out : {None, dpnp.ndarray, usm_ndarray}, optional
+            Alternative output array in which to place the result. If
+            provided, it must have the shape of `size` and the data type of
+            `dtype`.
+
+            Default: ``None``.
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array. It is
+            ignored if `out` is provided.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Array of random floats of shape `size`.
+
+        Examples
+        --------
+        >>> import dpnp as np
+        >>> rng = np.random.default_rng(1234)
+        >>> out = np.empty((2, 3))
+        >>> s = rng.random(out=out)
+
+        """
+
+        dtype, shape, usm_type = self._prepare_out(size, dtype, out, usm_type)
+        n = int(numpy.prod(shape, dtype=numpy.int64))
+
+        # take the most significant bits fitting into the mantissa
+        if dtype == dpnp.float32:
+            bits = self._bit_generator._next_uint32(n, usm_type=usm_type) >> 8
+            scale = 2.0**-24
+        else:
+            bits = self._bit_generator._next_uint64(n, usm_type=usm_type) >> 11
+            scale = 2.0**-53
+
+        bits = bits.astype(dtype).reshape(shape)
+        return dpnp.multiply(bits, scale, out=out)
+
+    def spawn(self, n_children):
+        """
+        Create new independent child generators.
+
+        For full documentation refer to :obj:`numpy.random.Generator.spawn`.
+
+        Parameters
+        ----------
+        n_children : int
+            Number of child generators to create.
+
+        Returns
+        -------
+        child_generators : list of Generator
+            The list of child generators using the bit generators spawned
+            from the bit generator of the generator.
+
+        """
+
+        return [
+            self.__class__(bit_generator)
+            for bit_generator in self._bit_generator.spawn(n_children)
+        ]
+
+    def standard_exponential(
+        self, size=None, dtype=None, out=None, usm_type="device"
+    ):
+        """
+        Draw samples from the standard exponential distribution.
+
+        For full documentation refer to
+        :obj:`numpy.random.Generator.standard_exponential`.
+
+        Parameters
+        ----------
+        dtype : {None, dpnp.float32, dpnp.float64}, optional
+            Desired data type of the output array. If ``None`` (the default),
+            :obj:`dpnp.float64` type will be used if device supports it, or
+            :obj:`dpnp.float32` otherwise.
+        out : {None, dpnp.ndarray, usm_ndarray}, optional
+            Alternative output array in which to place the result. If
+            provided, it must have the shape of `size` and the data type of
+            `dtype`.
+
+            Default: ``None``.
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array. It is
+            ignored if `out` is provided.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the standard exponential distribution.
+
+        Limitations
+        -----------
+        Parameter `method` is not supported, the inversion method is always
+        used.
+
+        """
+
+        dtype, shape, usm_type = self._prepare_out(size, dtype, out, usm_type)
+
+        # the uniform samples are drawn directly into `out` if provided and
+        # transformed in-place
+        u = self.random(size=shape, dtype=dtype, out=out, usm_type=usm_type)
+        dpnp.negative(u, out=u)
+        dpnp.log1p(u, out=u)
+        return dpnp.negative(u, out=u)
+
+    def standard_gamma(self, shape, size=None, usm_type="device"):
+        """
+        Draw samples from a standard Gamma distribution.
+
+        For full documentation refer to
+        :obj:`numpy.random.Generator.standard_gamma`.
+
+        Parameters
+        ----------
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized standard gamma distribution.
+
+        """
+
+        dpu.validate_usm_type(usm_type, allow_none=False)
+        return dpnp_standard_gamma(self, shape, size, usm_type=usm_type)
+
+    def standard_normal(
+        self, size=None, dtype=None, out=None, usm_type="device"
+    ):
+        """
+        Draw samples from a standard Normal distribution ``(mean=0, stdev=1)``.
+
+        For full documentation refer to
+        :obj:`numpy.random.Generator.standard_normal`.
+
+        Parameters
+        ----------
+        dtype : {None, dpnp.float32, dpnp.float64}, optional
+            Desired data type of the output array. If ``None`` (the default),
+            :obj:`dpnp.float64` type will be used if device supports it, or
+            :obj:`dpnp.float32` otherwise.
+        out : {None, dpnp.ndarray, usm_ndarray}, optional
+            Alternative output array in which to place the result. If
+            provided, it must have the shape of `size` and the data type of
+            `dtype`.
+
+            Default: ``None``.
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array. It is
+            ignored if `out` is provided.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            A floating-point array of shape `size` of drawn samples.
+
+        """
+
+        dtype, shape, usm_type = self._prepare_out(size, dtype, out, usm_type)
+        n = int(numpy.prod(shape, dtype=numpy.int64))
+        m = -(-n // 2)
+
+        # Box-Muller transform of pairs of uniform samples
+        u = self.random(size=2 * m, dtype=dtype, usm_type=usm_type)
+        r = dpnp.sqrt(-2 * dpnp.log1p(-u[:m]))
+        theta = (2 * numpy.pi) * u[m:]
+
+        r = dpnp.concatenate((r, r))[:n].reshape(shape)
+        theta = dpnp.concatenate((dpnp.cos(theta), dpnp.sin(theta)))
+        return dpnp.multiply(r, theta[:n].reshape(shape), out=out)
+
+    def uniform(
+        self, low=0.0, high=1.0, size=None, dtype=None, usm_type="device"
+    ):
+        """
+        Draw samples from a uniform distribution.
+
+        Samples are uniformly distributed over the half-open interval
+        [low, high) (includes low, but excludes high).
+
+        For full documentation refer to :obj:`numpy.random.Generator.uniform`.
+
+        Parameters
+        ----------
+        dtype : {None, dpnp.float32, dpnp.float64}, optional
+            Desired data type of the output array. If ``None`` (the default),
+            :obj:`dpnp.float64` type will be used if device supports it, or
+            :obj:`dpnp.float32` otherwise.
+        usm_type : {"device", "shared", "host"}, optional
+            The type of SYCL USM allocation for the output array.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            Drawn samples from the parameterized uniform distribution.
+
+        """
+
+        dtype = self._validate_float_dtype(dtype, (dpnp.float32, dpnp.float64))
+        if not dpnp.isscalar(low) or not dpnp.isscalar(high):
+            dpu.validate_usm_type(usm_type, allow_none=False)
+            return dpnp_uniform(
+                self, low, high, size, dtype=dtype, usm_type=usm_type
+            )
+
+        if not numpy.isfinite(high - low):
+            raise OverflowError("Range exceeds valid bounds")
+
+        res = self.random(size=size, dtype=dtype, usm_type=usm_type)
+        if high - low != 1:
+            res *= high - low
+        if low != 0:
+            res += low
+        return res
+
+
+def default_rng(seed=None, device=None, sycl_queue=None):
+    """
+    Construct a new Generator with the default bit generator (Philox).
+
+    For full documentation refer to :obj:`numpy.random.default_rng`.
+
+    Parameters
+    ----------
+    seed : {None, int, array_like[ints], numpy.random.SeedSequence,
+            BitGenerator, Generator}, optional
+        A seed to initialize the bit generator. If passed a
+        :class:`dpnp.random.BitGenerator`, it will be wrapped by
+        :class:`dpnp.random.Generator`. If passed a
+        :class:`dpnp.random.Generator`, it will be returned unaltered.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the output array is created.
+        `device` can be ``None``, a oneAPI filter selector string, an instance
+        of :class:`dpctl.SyclDevice` corresponding to a non-partitioned SYCL
+        device, an instance of :class:`dpctl.SyclQueue`, or a
+        :class:`dpctl.tensor.Device` object returned by
+        :attr:`dpnp.ndarray.device`.
+
+        Default: ``None``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for output array allocation and copying. The
+        `sycl_queue` can be passed as ``None`` (the default), which means
+        to get the SYCL queue from `device` keyword if present or to use
+        a default queue.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.random.Generator
+        The initialized generator object.
+
+    Notes
+    -----
+    Unlike NumPy, the default bit generator is :class:`dpnp.random.Philox`,
+    since a counter-based generator computes any block of its stream
+    independently, which suits the parallel execution on a SYCL device.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> rng = np.random.default_rng(1234)
+    >>> s = rng.standard_normal(size=(2, 3))
+
+    Independent streams, e.g. one per worker, are created without reseeding:
+
+    >>> streams = rng.spawn(4)
+
+    """
+
+    if isinstance(seed, Generator):
+        return seed
+    if isinstance(seed, BitGenerator):
+        return Generator(seed)
+    return Generator(Philox(seed, device=device, sycl_queue=sycl_queue))
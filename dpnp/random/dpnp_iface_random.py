@@ -46,6 +46,40 @@ from dpnp.dpnp_utils import *
 
 from .dpnp_algo_random import *
 from .dpnp_random_state import RandomState
+from .dpnp_utils_random import (
+    dpnp_beta,
+    dpnp_binomial,
+    dpnp_bytes,
+    dpnp_chisquare,
+    dpnp_choice,
+    dpnp_dirichlet,
+    dpnp_exponential,
+    dpnp_f,
+    dpnp_gamma,
+    dpnp_geometric,
+    dpnp_gumbel,
+    dpnp_hypergeometric,
+    dpnp_laplace,
+    dpnp_logistic,
+    dpnp_lognormal,
+    dpnp_logseries,
+    dpnp_multinomial,
+    dpnp_negative_binomial,
+    dpnp_noncentral_chisquare,
+    dpnp_noncentral_f,
+    dpnp_pareto,
+    dpnp_poisson,
+    dpnp_power,
+    dpnp_random_integers,
+    dpnp_rayleigh,
+    dpnp_standard_gamma,
+    dpnp_standard_t,
+    dpnp_triangular,
+    dpnp_vonmises,
+    dpnp_wald,
+    dpnp_weibull,
+    dpnp_zipf,
+)
 
 
 def _get_random_state(device=None, sycl_queue=None):
@@ -69,6 +103,20 @@ def _get_random_state(device=None, sycl_queue=None):
     return _dpnp_random_states[sycl_queue]
 
 
+def _get_params_random_state(*params):
+    """
+    Return a random state and USM type to draw samples with the given
+    distribution parameters following compute follows data paradigm.
+
+    """
+
+    arrays = [p for p in params if dpnp.is_supported_array_type(p)]
+    usm_type, sycl_queue = get_usm_allocations(arrays)
+    if usm_type is None:
+        usm_type = "device"
+    return _get_random_state(sycl_queue=sycl_queue), usm_type
+
+
 def _is_type_supported(obj_type):
     """Return True if type is supported by dpnp.random"""
 
@@ -85,9 +133,8 @@ def beta(a, b, size=None):
 
     Limitations
     -----------
-    Parameters `a` and `b` are supported as scalar.
-    Otherwise, :obj:`numpy.random.beta(a, b, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `a` and `b`
+    are scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -104,13 +151,11 @@ def beta(a, b, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `a`, `b`
-        if not dpnp.isscalar(a):
-            pass
-        elif not dpnp.isscalar(b):
-            pass
-        elif a <= 0:
+        if not dpnp.isscalar(a) or not dpnp.isscalar(b):
+            rs, usm_type = _get_params_random_state(a, b)
+            return dpnp_beta(rs, a, b, size, usm_type=usm_type)
+
+        if a <= 0:
             pass
         elif b <= 0:
             pass
@@ -128,9 +173,8 @@ def binomial(n, p, size=None):
 
     Limitations
     -----------
-    Output array data type is :obj:`dpnp.int32`.
-    Parameters `n` and `p` are supported as scalar.
-    Otherwise, :obj:`numpy.random.binomial(n, p, size)` samples are drawn.
+    Output array data type is :obj:`dpnp.int32` if parameters `n` and `p` are
+    scalar, otherwise :obj:`dpnp.int64` is used.
 
     Examples
     --------
@@ -155,13 +199,11 @@ def binomial(n, p, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `p` param
-        if not dpnp.isscalar(n):
-            pass
-        elif not dpnp.isscalar(p):
-            pass
-        elif p > 1 or p < 0:
+        if not dpnp.isscalar(n) or not dpnp.isscalar(p):
+            rs, usm_type = _get_params_random_state(n, p)
+            return dpnp_binomial(rs, n, p, size, usm_type=usm_type)
+
+        if p > 1 or p < 0:
             pass
         elif n < 0:
             pass
@@ -172,18 +214,31 @@ def binomial(n, p, size=None):
 
 
 def bytes(length):
-    """
+    r"""
     Return random bytes.
 
     For full documentation refer to :obj:`numpy.random.bytes`.
 
     Notes
     -----
-    The function uses `numpy.random.bytes` on the backend and will be
-    executed on fallback backend.
+    The random bytes are generated on the default SYCL device and then copied
+    to the host to construct the returned object.
+
+    Examples
+    --------
+    >>> dpnp.random.bytes(10)
+    b' eh\x85\x022SZ\xbf\xa4' # random
 
     """
 
+    if not use_origin_backend(length):
+        if dpnp.is_cuda_backend():  # pragma: no cover
+            raise NotImplementedError(
+                "Running on CUDA is currently not supported"
+            )
+
+        return dpnp_bytes(_get_random_state(), length)
+
     return call_origin(numpy.random.bytes, length)
 
 
@@ -195,8 +250,6 @@ def chisquare(df, size=None):
 
     Limitations
     -----------
-    Parameter `df` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.chisquare(df, size)` samples are drawn.
     Output array data type is default float type.
 
     Examples
@@ -212,11 +265,11 @@ def chisquare(df, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `df`
         if not dpnp.isscalar(df):
-            pass
-        elif df <= 0:
+            rs, usm_type = _get_params_random_state(df)
+            return dpnp_chisquare(rs, df, size, usm_type=usm_type)
+
+        if df <= 0:
             pass
         else:
             # TODO:
@@ -232,13 +285,35 @@ def choice(a, size=None, replace=True, p=None):
 
     For full documentation refer to :obj:`numpy.random.choice`.
 
-    Notes
-    -----
-    The function uses `numpy.random.choice` on the backend and will be
-    executed on fallback backend.
+    Limitations
+    -----------
+    Output array data type is :obj:`dpnp.int64` if `a` is an integer,
+    otherwise it is the data type of `a`.
+
+    Examples
+    --------
+    Generate a uniform random sample from ``dpnp.arange(5)`` of size 3:
+
+    >>> dpnp.random.choice(5, 3)
+    array([0, 3, 4]) # random
+
+    Generate a non-uniform random sample from ``dpnp.arange(5)`` of size 3
+    without replacement:
+
+    >>> dpnp.random.choice(5, 3, replace=False, p=[0.1, 0, 0.3, 0.6, 0])
+    array([2, 3, 0]) # random
 
     """
 
+    if not use_origin_backend(a):
+        if dpnp.is_cuda_backend():  # pragma: no cover
+            raise NotImplementedError(
+                "Running on CUDA is currently not supported"
+            )
+
+        rs, usm_type = _get_params_random_state(a, p)
+        return dpnp_choice(rs, a, size, replace, p, usm_type=usm_type)
+
     return call_origin(numpy.random.choice, a, size, replace, p)
 
 
@@ -248,13 +323,27 @@ def dirichlet(alpha, size=None):
 
     For full documentation refer to :obj:`numpy.random.dirichlet`.
 
-    Notes
-    -----
-    The function uses `numpy.random.dirichlet` on the backend and will be
-    executed on fallback backend.
+    Limitations
+    -----------
+    Output array data type is default float type.
+
+    Examples
+    --------
+    >>> s = dpnp.random.dirichlet((10, 5, 3), 20)
+    >>> s.shape
+    (20, 3)
 
     """
 
+    if not use_origin_backend(alpha):
+        if dpnp.is_cuda_backend():  # pragma: no cover
+            raise NotImplementedError(
+                "Running on CUDA is currently not supported"
+            )
+
+        rs, usm_type = _get_params_random_state(alpha)
+        return dpnp_dirichlet(rs, alpha, size, usm_type=usm_type)
+
     return call_origin(numpy.random.dirichlet, alpha, size)
 
 
@@ -266,9 +355,8 @@ def exponential(scale=1.0, size=None):
 
     Limitations
     -----------
-    Parameter `scale` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.exponential(scale, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `scale` is
+    scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -285,11 +373,11 @@ def exponential(scale=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `scale`
         if not dpnp.isscalar(scale):
-            pass
-        elif scale < 0:
+            rs, usm_type = _get_params_random_state(scale)
+            return dpnp_exponential(rs, scale, size, usm_type=usm_type)
+
+        if scale < 0:
             pass
         else:
             return dpnp_rng_exponential(scale, size).get_pyobj()
@@ -305,9 +393,9 @@ def f(dfnum, dfden, size=None):
 
     Limitations
     -----------
-    Parameters `dfnum` and `dfden` are supported as scalar.
-    Otherwise, :obj:`numpy.random.f(dfnum, dfden, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `dfnum` and
+    `dfden` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -322,13 +410,11 @@ def f(dfnum, dfden, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `dfnum` and `dfden`
-        if not dpnp.isscalar(dfnum):
-            pass
-        elif not dpnp.isscalar(dfden):
-            pass
-        elif dfnum <= 0:
+        if not dpnp.isscalar(dfnum) or not dpnp.isscalar(dfden):
+            rs, usm_type = _get_params_random_state(dfnum, dfden)
+            return dpnp_f(rs, dfnum, dfden, size, usm_type=usm_type)
+
+        if dfnum <= 0:
             pass
         elif dfden <= 0:
             pass
@@ -346,9 +432,9 @@ def gamma(shape, scale=1.0, size=None):
 
     Limitations
     -----------
-    Parameters `shape` and `scale` are supported as scalar.
-    Otherwise, :obj:`numpy.random.gamma(shape, scale, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `shape` and
+    `scale` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -365,13 +451,11 @@ def gamma(shape, scale=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `scale` and `shape`
-        if not dpnp.isscalar(scale):
-            pass
-        elif not dpnp.isscalar(shape):
-            pass
-        elif scale < 0:
+        if not dpnp.isscalar(scale) or not dpnp.isscalar(shape):
+            rs, usm_type = _get_params_random_state(shape, scale)
+            return dpnp_gamma(rs, shape, scale, size, usm_type=usm_type)
+
+        if scale < 0:
             pass
         elif shape < 0:
             pass
@@ -389,9 +473,8 @@ def geometric(p, size=None):
 
     Limitations
     -----------
-    Parameter `p` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.geometric(p, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.int32`.
+    Output array data type is :obj:`dpnp.int32` if parameter `p` is scalar,
+    otherwise :obj:`dpnp.int64` is used.
 
     Examples
     --------
@@ -408,11 +491,11 @@ def geometric(p, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `p` param
         if not dpnp.isscalar(p):
-            pass
-        elif p > 1 or p <= 0:
+            rs, usm_type = _get_params_random_state(p)
+            return dpnp_geometric(rs, p, size, usm_type=usm_type)
+
+        if p > 1 or p <= 0:
             pass
         else:
             return dpnp_rng_geometric(p, size).get_pyobj()
@@ -428,9 +511,9 @@ def gumbel(loc=0.0, scale=1.0, size=None):
 
     Limitations
     -----------
-    Parameters `loc` and `scale` are supported as scalar.
-    Otherwise, :obj:`numpy.random.gumbel(loc, scale, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `loc` and
+    `scale` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -447,13 +530,11 @@ def gumbel(loc=0.0, scale=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `loc` and `scale` params
-        if not dpnp.isscalar(scale):
-            pass
-        elif not dpnp.isscalar(loc):
-            pass
-        elif scale < 0:
+        if not dpnp.isscalar(scale) or not dpnp.isscalar(loc):
+            rs, usm_type = _get_params_random_state(loc, scale)
+            return dpnp_gumbel(rs, loc, scale, size, usm_type=usm_type)
+
+        if scale < 0:
             pass
         else:
             return dpnp_rng_gumbel(loc, scale, size).get_pyobj()
@@ -469,10 +550,8 @@ def hypergeometric(ngood, nbad, nsample, size=None):
 
     Limitations
     -----------
-    Parameters `ngood`, `nbad` and `nsample` are supported as scalar.
-    Otherwise, :obj:`numpy.random.hypergeometric(shape, scale, size)` samples
-    are drawn.
-    Output array data type is :obj:`dpnp.int32`.
+    Output array data type is :obj:`dpnp.int32` if parameters `ngood`, `nbad`
+    and `nsample` are scalar, otherwise :obj:`dpnp.int64` is used.
 
     Examples
     --------
@@ -490,15 +569,17 @@ def hypergeometric(ngood, nbad, nsample, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of ints for `ngood`, `nbad`, `nsample` param
-        if not dpnp.isscalar(ngood):
-            pass
-        elif not dpnp.isscalar(nbad):
-            pass
-        elif not dpnp.isscalar(nsample):
-            pass
-        elif ngood < 0:
+        if (
+            not dpnp.isscalar(ngood)
+            or not dpnp.isscalar(nbad)
+            or not dpnp.isscalar(nsample)
+        ):
+            rs, usm_type = _get_params_random_state(ngood, nbad, nsample)
+            return dpnp_hypergeometric(
+                rs, ngood, nbad, nsample, size, usm_type=usm_type
+            )
+
+        if ngood < 0:
             pass
         elif nbad < 0:
             pass
@@ -526,9 +607,9 @@ def laplace(loc=0.0, scale=1.0, size=None):
 
     Limitations
     -----------
-    Parameters `loc` and `scale` are supported as scalar.
-    Otherwise, :obj:`numpy.random.laplace(loc, scale, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `loc` and
+    `scale` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -543,13 +624,11 @@ def laplace(loc=0.0, scale=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `loc` and `scale`
-        if not dpnp.isscalar(loc):
-            pass
-        elif not dpnp.isscalar(scale):
-            pass
-        elif scale < 0:
+        if not dpnp.isscalar(loc) or not dpnp.isscalar(scale):
+            rs, usm_type = _get_params_random_state(loc, scale)
+            return dpnp_laplace(rs, loc, scale, size, usm_type=usm_type)
+
+        if scale < 0:
             pass
         else:
             return dpnp_rng_laplace(loc, scale, size).get_pyobj()
@@ -565,9 +644,9 @@ def logistic(loc=0.0, scale=1.0, size=None):
 
     Limitations
     -----------
-    Parameters `loc` and `scale` are supported as scalar.
-    Otherwise, :obj:`numpy.random.logistic(loc, scale, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `loc` and
+    `scale` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -582,13 +661,11 @@ def logistic(loc=0.0, scale=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `loc` and `scale`
-        if not dpnp.isscalar(loc):
-            pass
-        elif not dpnp.isscalar(scale):
-            pass
-        elif scale < 0:
+        if not dpnp.isscalar(loc) or not dpnp.isscalar(scale):
+            rs, usm_type = _get_params_random_state(loc, scale)
+            return dpnp_logistic(rs, loc, scale, size, usm_type=usm_type)
+
+        if scale < 0:
             pass
         else:
             result = dpnp_rng_logistic(loc, scale, size).get_pyobj()
@@ -608,10 +685,9 @@ def lognormal(mean=0.0, sigma=1.0, size=None):
 
     Limitations
     -----------
-    Parameters `mean` and `sigma` are supported as scalar.
-    Otherwise, :obj:`numpy.random.lognormal(mean, sigma, size)` samples
-    are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `mean` and
+    `sigma` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -628,13 +704,11 @@ def lognormal(mean=0.0, sigma=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `mean` and `sigma` params
-        if not dpnp.isscalar(mean):
-            pass
-        elif not dpnp.isscalar(sigma):
-            pass
-        elif sigma < 0:
+        if not dpnp.isscalar(mean) or not dpnp.isscalar(sigma):
+            rs, usm_type = _get_params_random_state(mean, sigma)
+            return dpnp_lognormal(rs, mean, sigma, size, usm_type=usm_type)
+
+        if sigma < 0:
             pass
         else:
             return dpnp_rng_lognormal(mean, sigma, size).get_pyobj()
@@ -648,13 +722,28 @@ def logseries(p, size=None):
 
     For full documentation refer to :obj:`numpy.random.logseries`.
 
-    Notes
-    -----
-    The function uses `numpy.random.logseries` on the backend and will be
-    executed on fallback backend.
+    Limitations
+    -----------
+    Output array data type is :obj:`dpnp.int64`.
+
+    Examples
+    --------
+    Draw samples from the distribution:
+
+    >>> a = .6
+    >>> s = dpnp.random.logseries(a, 10000)
 
     """
 
+    if not use_origin_backend(p):
+        if dpnp.is_cuda_backend():  # pragma: no cover
+            raise NotImplementedError(
+                "Running on CUDA is currently not supported"
+            )
+
+        rs, usm_type = _get_params_random_state(p)
+        return dpnp_logseries(rs, p, size, usm_type=usm_type)
+
     return call_origin(numpy.random.logseries, p, size)
 
 
@@ -666,10 +755,12 @@ def multinomial(n, pvals, size=None):
 
     Limitations
     -----------
-    Parameter `n` limited with int32 max. See, `numpy.iinfo(numpy.int32).max`.
-    Sum of ``pvals``, `sum(pvals)` should be between (0, 1).
-    Otherwise, :obj:`numpy.random.multinomial(n, pvals, size)`
-    samples are drawn.
+    If parameter `n` is scalar and `pvals` is not an array, `n` is limited
+    with int32 max, see `numpy.iinfo(numpy.int32).max`, and the sum of
+    ``pvals``, `sum(pvals)`, should be between (0, 1). Otherwise,
+    :obj:`numpy.random.multinomial(n, pvals, size)` samples are drawn.
+    Parameter `n` may be an array broadcastable to `size`, and then the output
+    array data type is :obj:`dpnp.int64`.
 
     Examples
     --------
@@ -682,6 +773,15 @@ def multinomial(n, pvals, size=None):
     """
 
     if not use_origin_backend(n):
+        if not dpnp.isscalar(n) or dpnp.is_supported_array_type(pvals):
+            if dpnp.is_cuda_backend():  # pragma: no cover
+                raise NotImplementedError(
+                    "Running on CUDA is currently not supported"
+                )
+
+            rs, usm_type = _get_params_random_state(n, pvals)
+            return dpnp_multinomial(rs, n, pvals, size, usm_type=usm_type)
+
         pvals_sum = sum(pvals)
         pvals_desc = dpnp.get_dpnp_descriptor(dpnp.array(pvals))
         d = len(pvals)
@@ -776,10 +876,8 @@ def negative_binomial(n, p, size=None):
 
     Limitations
     -----------
-    Parameters `n` and `p` are supported as scalar.
-    Otherwise, :obj:`numpy.random.negative_binomial(n, p, size)` samples
-    are drawn.
-    Output array data type is :obj:`dpnp.int32`.
+    Output array data type is :obj:`dpnp.int32` if parameters `n` and `p` are
+    scalar, otherwise :obj:`dpnp.int64` is used.
 
     Examples
     --------
@@ -803,13 +901,11 @@ def negative_binomial(n, p, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `p` and `n` params
-        if not dpnp.isscalar(n):
-            pass
-        elif not dpnp.isscalar(p):
-            pass
-        elif p > 1 or p < 0:
+        if not dpnp.isscalar(n) or not dpnp.isscalar(p):
+            rs, usm_type = _get_params_random_state(n, p)
+            return dpnp_negative_binomial(rs, n, p, size, usm_type=usm_type)
+
+        if p > 1 or p < 0:
             pass
         elif n <= 0:
             pass
@@ -861,8 +957,6 @@ def normal(
 
     Limitations
     -----------
-    Parameters `loc` and `scale` are supported as scalar.
-    Otherwise, :obj:`numpy.random.normal(loc, scale, size)` samples are drawn.
     Parameter `dtype` is supported only as :obj:`dpnp.float32`, :obj:`dpnp.float64` or ``None``.
 
     Examples
@@ -886,7 +980,16 @@ def noncentral_chisquare(df, nonc, size=None):
 
     For full documentation refer to :obj:`numpy.random.noncentral_chisquare`.
 
-    TODO
+    Limitations
+    -----------
+    Output array data type is :obj:`dpnp.float64` if parameters `df` and
+    `nonc` are scalar, otherwise the default floating type of the device is
+    used.
+
+    Examples
+    --------
+    >>> df, nonc = 3., 20.
+    >>> s = dpnp.random.noncentral_chisquare(df, nonc, 1000)
 
     """
 
@@ -896,13 +999,13 @@ def noncentral_chisquare(df, nonc, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `mean` and `scale`
-        if not dpnp.isscalar(df):
-            pass
-        elif not dpnp.isscalar(nonc):
-            pass
-        elif df <= 0:
+        if not dpnp.isscalar(df) or not dpnp.isscalar(nonc):
+            rs, usm_type = _get_params_random_state(df, nonc)
+            return dpnp_noncentral_chisquare(
+                rs, df, nonc, size, usm_type=usm_type
+            )
+
+        if df <= 0:
             pass
         elif nonc < 0:
             pass
@@ -918,13 +1021,28 @@ def noncentral_f(dfnum, dfden, nonc, size=None):
 
     For full documentation refer to :obj:`numpy.random.noncentral_f`.
 
-    Notes
-    -----
-    The function uses `numpy.random.noncentral_f` on the backend and
-    will be executed on fallback backend.
+    Limitations
+    -----------
+    Output array data type is default float type.
+
+    Examples
+    --------
+    >>> dfnum, dfden, nonc = 3., 20., 3.
+    >>> s = dpnp.random.noncentral_f(dfnum, dfden, nonc, 1000)
 
     """
 
+    if not use_origin_backend(dfnum):
+        if dpnp.is_cuda_backend():  # pragma: no cover
+            raise NotImplementedError(
+                "Running on CUDA is currently not supported"
+            )
+
+        rs, usm_type = _get_params_random_state(dfnum, dfden, nonc)
+        return dpnp_noncentral_f(
+            rs, dfnum, dfden, nonc, size, usm_type=usm_type
+        )
+
     return call_origin(numpy.random.noncentral_f, dfnum, dfden, nonc, size)
 
 
@@ -936,9 +1054,8 @@ def pareto(a, size=None):
 
     Limitations
     -----------
-    Parameter `a` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.pareto(a, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `a` is
+    scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -955,11 +1072,11 @@ def pareto(a, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `a`
         if not dpnp.isscalar(a):
-            pass
-        elif a <= 0:
+            rs, usm_type = _get_params_random_state(a)
+            return dpnp_pareto(rs, a, size, usm_type=usm_type)
+
+        if a <= 0:
             pass
         else:
             return dpnp_rng_pareto(a, size).get_pyobj()
@@ -1010,9 +1127,8 @@ def poisson(lam=1.0, size=None):
 
     Limitations
     -----------
-    Parameter `lam` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.poisson(lam, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.int32`.
+    Output array data type is :obj:`dpnp.int32` if parameter `lam` is scalar,
+    otherwise :obj:`dpnp.int64` is used.
 
     Examples
     --------
@@ -1029,10 +1145,12 @@ def poisson(lam=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `lam` param
-        if not dpnp.isscalar(lam):
+        if lam is None:
+            # NumPy raises TypeError
             pass
+        elif not dpnp.isscalar(lam):
+            rs, usm_type = _get_params_random_state(lam)
+            return dpnp_poisson(rs, lam, size, usm_type=usm_type)
         elif lam < 0:
             pass
         else:
@@ -1050,9 +1168,8 @@ def power(a, size=None):
 
     Limitations
     -----------
-    Parameter `a` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.power(a, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `a` is
+    scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -1069,11 +1186,11 @@ def power(a, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `a`
         if not dpnp.isscalar(a):
-            pass
-        elif a <= 0:
+            rs, usm_type = _get_params_random_state(a)
+            return dpnp_power(rs, a, size, usm_type=usm_type)
+
+        if a <= 0:
             pass
         else:
             return dpnp_rng_power(a, size).get_pyobj()
@@ -1349,8 +1466,8 @@ def random_integers(
 
     Limitations
     -----------
-    Parameters `low` and `high` are supported as scalar.
-    Otherwise, :obj:`numpy.random.random_integers(low, high, size)` samples are drawn.
+    Output array data type is :obj:`dpnp.int32` if parameters `low` and
+    `high` are scalar, otherwise :obj:`dpnp.int64` is used.
 
     See Also
     --------
@@ -1362,12 +1479,13 @@ def random_integers(
         high = low
         low = 0
 
-    # TODO:
-    # array_like of floats for `low` and `high` params
-    if not dpnp.isscalar(low):
-        pass
-    elif not dpnp.isscalar(high):
-        pass
+    if not dpnp.isscalar(low) or not dpnp.isscalar(high):
+        if not use_origin_backend(low):
+            if device is None and sycl_queue is None:
+                rs, _ = _get_params_random_state(low, high)
+            else:
+                rs = _get_random_state(device=device, sycl_queue=sycl_queue)
+            return dpnp_random_integers(rs, low, high, size, usm_type=usm_type)
     else:
         return randint(
             low,
@@ -1491,9 +1609,8 @@ def rayleigh(scale=1.0, size=None):
 
     Limitations
     -----------
-    Parameter `scale` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.rayleigh(scale, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `scale` is
+    scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -1510,11 +1627,11 @@ def rayleigh(scale=1.0, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `scale` params
         if not dpnp.isscalar(scale):
-            pass
-        elif scale < 0:
+            rs, usm_type = _get_params_random_state(scale)
+            return dpnp_rayleigh(rs, scale, size, usm_type=usm_type)
+
+        if scale < 0:
             pass
         else:
             return dpnp_rng_rayleigh(scale, size).get_pyobj()
@@ -1732,10 +1849,8 @@ def standard_gamma(shape, size=None):
 
     Limitations
     -----------
-    Parameter `shape` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.standard_gamma(shape, size)` samples
-    are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `shape` is
+    scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -1752,11 +1867,11 @@ def standard_gamma(shape, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `shape`
         if not dpnp.isscalar(shape):
-            pass
-        elif shape < 0:
+            rs, usm_type = _get_params_random_state(shape)
+            return dpnp_standard_gamma(rs, shape, size, usm_type=usm_type)
+
+        if shape < 0:
             pass
         else:
             return dpnp_rng_standard_gamma(shape, size).get_pyobj()
@@ -1818,10 +1933,8 @@ def standard_t(df, size=None):
 
     Limitations
     -----------
-    Parameter `df` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.standard_t(df, size)` samples
-    are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `df` is
+    scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -1838,11 +1951,11 @@ def standard_t(df, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `df`
         if not dpnp.isscalar(df):
-            pass
-        elif df <= 0:
+            rs, usm_type = _get_params_random_state(df)
+            return dpnp_standard_t(rs, df, size, usm_type=usm_type)
+
+        if df <= 0:
             pass
         else:
             return dpnp_rng_standard_t(df, size).get_pyobj()
@@ -1859,10 +1972,9 @@ def triangular(left, mode, right, size=None):
 
     Limitations
     -----------
-    Parameters `left`, `mode` and `right` are supported as scalar.
-    Otherwise, :obj:`numpy.random.triangular(left, mode, right, size)`
-    samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `left`,
+    `mode` and `right` are scalar, otherwise the default floating type of
+    the device is used.
 
     Examples
     --------
@@ -1879,15 +1991,13 @@ def triangular(left, mode, right, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `left`, `mode`, `right`.
-        if not dpnp.isscalar(left):
-            pass
-        elif not dpnp.isscalar(mode):
-            pass
-        elif not dpnp.isscalar(right):
-            pass
-        elif left > mode:
+        if not all(dpnp.isscalar(x) for x in (left, mode, right)):
+            rs, usm_type = _get_params_random_state(left, mode, right)
+            return dpnp_triangular(
+                rs, left, mode, right, size, usm_type=usm_type
+            )
+
+        if left > mode:
             pass
         elif mode > right:
             pass
@@ -1944,8 +2054,6 @@ def uniform(
 
     Limitations
     -----------
-    Parameters `low` and `high` are supported as a scalar. Otherwise,
-    :obj:`numpy.random.uniform(low, high, size)` samples are drawn.
     Parameter `dtype` is supported only as :obj:`dpnp.int32`, :obj:`dpnp.float32`, :obj:`dpnp.float64` or ``None``.
 
     Examples
@@ -1975,10 +2083,9 @@ def vonmises(mu, kappa, size=None):
 
     Limitations
     -----------
-    Parameters `mu` and `kappa` are supported as scalar.
-    Otherwise, :obj:`numpy.random.vonmises(mu, kappa, size)`
-    samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `mu` and
+    `kappa` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -1995,13 +2102,11 @@ def vonmises(mu, kappa, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `mu`, `kappa`.
-        if not dpnp.isscalar(mu):
-            pass
-        elif not dpnp.isscalar(kappa):
-            pass
-        elif numpy.isnan(kappa):
+        if not dpnp.isscalar(mu) or not dpnp.isscalar(kappa):
+            rs, usm_type = _get_params_random_state(mu, kappa)
+            return dpnp_vonmises(rs, mu, kappa, size, usm_type=usm_type)
+
+        if numpy.isnan(kappa):
             return dpnp.nan
         elif kappa < 0:
             pass
@@ -2019,9 +2124,9 @@ def wald(mean, scale, size=None):
 
     Limitations
     -----------
-    Parameters `mean` and `scale` are supported as scalar.
-    Otherwise, :obj:`numpy.random.wald(mean, scale, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameters `mean` and
+    `scale` are scalar, otherwise the default floating type of the device is
+    used.
 
     Examples
     --------
@@ -2036,13 +2141,11 @@ def wald(mean, scale, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `mean` and `scale`
-        if not dpnp.isscalar(mean):
-            pass
-        elif not dpnp.isscalar(scale):
-            pass
-        elif mean <= 0:
+        if not dpnp.isscalar(mean) or not dpnp.isscalar(scale):
+            rs, usm_type = _get_params_random_state(mean, scale)
+            return dpnp_wald(rs, mean, scale, size, usm_type=usm_type)
+
+        if mean <= 0:
             pass
         elif scale <= 0:
             pass
@@ -2060,9 +2163,8 @@ def weibull(a, size=None):
 
     Limitations
     -----------
-    Parameter `a` is supported as a scalar.
-    Otherwise, :obj:`numpy.random.weibull(a, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `a` is
+    scalar, otherwise the default floating type of the device is used.
 
     Examples
     --------
@@ -2077,11 +2179,11 @@ def weibull(a, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `a` param
         if not dpnp.isscalar(a):
-            pass
-        elif a < 0:
+            rs, usm_type = _get_params_random_state(a)
+            return dpnp_weibull(rs, a, size, usm_type=usm_type)
+
+        if a < 0:
             pass
         else:
             return dpnp_rng_weibull(a, size).get_pyobj()
@@ -2097,9 +2199,8 @@ def zipf(a, size=None):
 
     Limitations
     -----------
-    Parameter `a`` is supported as a scalar.
-    Otherwise, :obj:`numpy.zipf.weibull(a, size)` samples are drawn.
-    Output array data type is :obj:`dpnp.float64`.
+    Output array data type is :obj:`dpnp.float64` if parameter `a` is
+    scalar, otherwise :obj:`dpnp.int64` is used.
 
     Examples
     --------
@@ -2114,11 +2215,11 @@ def zipf(a, size=None):
                 "Running on CUDA is currently not supported"
             )
 
-        # TODO:
-        # array_like of floats for `a` param
         if not dpnp.isscalar(a):
-            pass
-        elif a <= 1:
+            rs, usm_type = _get_params_random_state(a)
+            return dpnp_zipf(rs, a, size, usm_type=usm_type)
+
+        if a <= 1:
             pass
         else:
             return dpnp_rng_zipf(a, size).get_pyobj()
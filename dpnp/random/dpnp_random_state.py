@@ -46,6 +46,7 @@ from dpnp.dpnp_utils.dpnp_algo_utils import (
     use_origin_backend,
 )
 from dpnp.random.dpnp_algo_random import MCG59, MT19937
+from dpnp.random.dpnp_utils_random import dpnp_normal, dpnp_uniform
 
 
 class RandomState:
@@ -217,8 +218,6 @@ class RandomState:
 
         Limitations
         -----------
-        Parameters `loc` and `scale` are supported as a scalar. Otherwise,
-        :obj:`numpy.random.RandomState.normal(loc, scale, size)` samples are drawn.
         Parameter `dtype` is supported only as :obj:`dpnp.float32`, :obj:`dpnp.float64` or ``None``.
 
         Examples
@@ -241,10 +240,14 @@ class RandomState:
                     "Running on CUDA is currently not supported"
                 )
 
-            if not dpnp.isscalar(loc):
-                pass
-            elif not dpnp.isscalar(scale):
-                pass
+            if not dpnp.isscalar(loc) or not dpnp.isscalar(scale):
+                dtype = self._validate_float_dtype(
+                    dtype, (dpnp.float32, dpnp.float64)
+                )
+                dpu.validate_usm_type(usm_type, allow_none=False)
+                return dpnp_normal(
+                    self, loc, scale, size, dtype=dtype, usm_type=usm_type
+                )
             else:
                 dtype = self._validate_float_dtype(
                     dtype, (dpnp.float32, dpnp.float64)
@@ -576,9 +579,9 @@ class RandomState:
 
         Limitations
         -----------
-        Parameters `low` and `high` are supported as a scalar. Otherwise,
-        :obj:`numpy.random.RandomState.uniform(low, high, size)` samples are drawn.
         Parameter `dtype` is supported only as :obj:`dpnp.int32`, :obj:`dpnp.float32`, :obj:`dpnp.float64` or ``None``.
+        If `low` or `high` is an array, `dtype` is supported only as :obj:`dpnp.float32`, :obj:`dpnp.float64` or ``None``.
+        Otherwise, :obj:`numpy.random.RandomState.uniform(low, high, size)` samples are drawn.
 
         Examples
         --------
@@ -604,10 +607,18 @@ class RandomState:
                     "Running on CUDA is currently not supported"
                 )
 
-            if not dpnp.isscalar(low):
-                pass
-            elif not dpnp.isscalar(high):
-                pass
+            if not dpnp.isscalar(low) or not dpnp.isscalar(high):
+                if dtype is None or dpnp.dtype(dtype) in (
+                    dpnp.float32,
+                    dpnp.float64,
+                ):
+                    dtype = self._validate_float_dtype(
+                        dtype, (dpnp.float32, dpnp.float64)
+                    )
+                    dpu.validate_usm_type(usm_type, allow_none=False)
+                    return dpnp_uniform(
+                        self, low, high, size, dtype=dtype, usm_type=usm_type
+                    )
             else:
                 min_double = dpnp.finfo("double").min
                 max_double = dpnp.finfo("double").max
@@ -0,0 +1,1165 @@
+# *****************************************************************************
+# Copyright (c) 2024, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+"""
+Helping functions to implement the random sampling interface.
+
+These include functions drawing samples on a SYCL device for distributions
+with array-like parameters or without a dedicated oneMKL kernel. The samples
+are produced by transforming the output of the uniform and normal generators
+of :class:`dpnp.random.RandomState` or :class:`dpnp.random.Generator` with
+element-wise dpnp functions, so the data never leaves the device.
+
+"""
+
+# pylint: disable=protected-access
+
+import operator
+
+import numpy
+
+import dpnp
+
+__all__ = [
+    "dpnp_beta",
+    "dpnp_binomial",
+    "dpnp_bytes",
+    "dpnp_chisquare",
+    "dpnp_choice",
+    "dpnp_dirichlet",
+    "dpnp_exponential",
+    "dpnp_f",
+    "dpnp_gamma",
+    "dpnp_geometric",
+    "dpnp_gumbel",
+    "dpnp_hypergeometric",
+    "dpnp_laplace",
+    "dpnp_logistic",
+    "dpnp_lognormal",
+    "dpnp_logseries",
+    "dpnp_multinomial",
+    "dpnp_negative_binomial",
+    "dpnp_noncentral_chisquare",
+    "dpnp_noncentral_f",
+    "dpnp_normal",
+    "dpnp_pareto",
+    "dpnp_poisson",
+    "dpnp_power",
+    "dpnp_random_integers",
+    "dpnp_rayleigh",
+    "dpnp_standard_gamma",
+    "dpnp_standard_t",
+    "dpnp_triangular",
+    "dpnp_uniform",
+    "dpnp_vonmises",
+    "dpnp_wald",
+    "dpnp_weibull",
+    "dpnp_zipf",
+]
+
+
+def _broadcast_params(rs, params, size, dtype=None, usm_type="device"):
+    """
+    Convert distribution parameters to arrays allocated on the SYCL queue of
+    the random state `rs` and broadcast them to the output shape.
+
+    If `size` is ``None``, the output shape is the broadcast shape of all
+    parameters. Otherwise, the parameters have to be broadcastable to `size`.
+
+    """
+
+    if dtype is None:
+        dtype = rs._def_float_type
+
+    params = tuple(
+        dpnp.asarray(
+            p, dtype=dtype, usm_type=usm_type, sycl_queue=rs.get_sycl_queue()
+        )
+        for p in params
+    )
+    shape = numpy.broadcast_shapes(*(p.shape for p in params))
+    if size is not None:
+        size = _normalize_size(size)
+        if numpy.broadcast_shapes(shape, size) != size:
+            raise ValueError(
+                "shape mismatch: objects cannot be broadcast to a single shape"
+            )
+        shape = size
+    return tuple(dpnp.broadcast_to(p, shape) for p in params), shape
+
+
+# the acceptance rate of the rejection samplers is high, so this limit is
+# reached only if the parameters can't be sampled at all
+_MAX_REJECTION_ROUNDS = 1000
+
+# log(k!) is looked up in a table of that size, the Stirling series is used
+# for larger values
+_LOG_FACTORIAL_TABLE_SIZE = 126
+_HALF_LOG_2PI = 0.9189385332046728
+
+# constants of the HRUA algorithm of hypergeometric sampling
+_HRUA_D1 = 1.7155277699214135
+_HRUA_D2 = 0.8989161620588988
+
+_INT64_MAX = float(numpy.iinfo(numpy.int64).max)
+
+# the largest rate of the Poisson distribution which keeps the samples within
+# the range of int64 type, the same limit is used by NumPy
+_POISSON_LAM_MAX = _INT64_MAX - numpy.sqrt(_INT64_MAX) * 10
+
+# the Zipf samples are equal to one with a probability indistinguishable from
+# one in double precision if `a` exceeds that
+_ZIPF_A_MAX = 1025
+
+
+def _check_params(*conditions):
+    """
+    Raise ValueError if any element of a condition array is ``True``.
+
+    Every condition is passed as a tuple of an array and an error message.
+
+    """
+
+    for cond, msg in conditions:
+        if dpnp.any(cond):
+            raise ValueError(msg)
+
+
+def _not_positive(x):
+    """Return a mask of elements which are not positive finite numbers."""
+    return ~(x > 0) | dpnp.isinf(x)
+
+
+def _not_non_negative(x):
+    """Return a mask of elements which are negative or NaN."""
+    return ~(x >= 0)
+
+
+def _normalize_size(size):
+    """Convert `size` keyword to a tuple."""
+
+    if size is None:
+        return ()
+    if isinstance(size, (int, numpy.integer)):
+        return (int(size),)
+    return tuple(int(s) for s in size)
+
+
+def _random_sample(rs, shape, usm_type):
+    """Draw samples from the uniform distribution over ``[0, 1)``."""
+    return rs.uniform(size=shape, usm_type=usm_type)
+
+
+def _standard_exponential(rs, shape, usm_type):
+    """Draw samples from the standard exponential distribution."""
+    return -dpnp.log1p(-_random_sample(rs, shape, usm_type))
+
+
+def _standard_gamma(rs, shape_param, usm_type):
+    """
+    Draw samples from the standard gamma distribution with array of shapes.
+
+    The Marsaglia-Tsang rejection method is applied to all elements at once.
+    Only the rejected elements are resampled on the next iteration, so the
+    number of iterations is small since the acceptance rate exceeds 95%.
+    For shape below one, the sample is drawn with shape increased by one and
+    then scaled by ``U**(1/shape)``.
+
+    """
+
+    out_shape = shape_param.shape
+    shape_param = shape_param.ravel()
+    boost = shape_param < 1
+    d = dpnp.where(boost, shape_param + 1, shape_param) - 1.0 / 3
+    c = 1.0 / dpnp.sqrt(9 * d)
+
+    res = dpnp.empty_like(shape_param)
+    pending = dpnp.arange(
+        res.size, usm_type=res.usm_type, sycl_queue=res.sycl_queue
+    )
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        d_p = d[pending]
+        c_p = c[pending]
+        x = rs.standard_normal(size=pending.shape, usm_type=usm_type)
+        u = _random_sample(rs, pending.shape, usm_type)
+
+        v = (1 + c_p * x) ** 3
+        accept = v > 0
+        accept &= dpnp.log(u) < 0.5 * x * x + d_p - d_p * v + d_p * dpnp.log(
+            dpnp.where(accept, v, 1)
+        )
+        res[pending[accept]] = (d_p * v)[accept]
+        pending = pending[~accept]
+    else:
+        raise RuntimeError("rejection sampling of gamma variates failed")
+
+    u = _random_sample(rs, res.shape, usm_type)
+    res = dpnp.where(boost, res * u ** (1 / shape_param), res)
+    res = dpnp.where(shape_param == 0, 0, res)
+    return res.reshape(out_shape)
+
+
+def _chisquare(rs, df, usm_type):
+    """Draw samples from the chi-square distribution with array of `df`."""
+    return 2 * _standard_gamma(rs, df / 2, usm_type)
+
+
+def _log_factorial(k):
+    """
+    Return ``log(k!)`` for an array of non-negative integral values.
+
+    The values for ``k < 126`` are taken from a table and the Stirling
+    series is used otherwise, the same way as NumPy computes them.
+
+    """
+
+    n = _LOG_FACTORIAL_TABLE_SIZE
+    table = dpnp.arange(
+        1, n, dtype=k.dtype, usm_type=k.usm_type, sycl_queue=k.sycl_queue
+    )
+    table = dpnp.concat(
+        (dpnp.zeros_like(table[:1]), dpnp.cumsum(dpnp.log(table)))
+    )
+
+    small = k < n
+    idx = dpnp.where(small, k, 0).astype(dpnp.int64)
+    x = dpnp.where(small, n, k)
+    stirling = (x + 0.5) * dpnp.log(x) - x + _HALF_LOG_2PI
+    stirling += (1.0 / 12 - 1.0 / (360 * x * x)) / x
+    return dpnp.where(small, dpnp.take(table, idx), stirling)
+
+
+def _poisson(rs, lam, usm_type):
+    """
+    Draw samples from the Poisson distribution with array of rates.
+
+    Rates below ``10`` are sampled by multiplying uniform variates until the
+    product drops below ``exp(-lam)``. Larger rates are sampled by the PTRS
+    transformed rejection method of Hörmann. In both cases all elements are
+    processed at once and only the unfinished elements are iterated further.
+    The samples are returned as integral floating-point values.
+
+    """
+
+    out_shape = lam.shape
+    lam = lam.ravel()
+    small = lam < 10
+    res = dpnp.zeros_like(lam)
+
+    enlam = dpnp.exp(-lam)
+    prod = dpnp.ones_like(lam)
+    pending = dpnp.flatnonzero(small)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        prod[pending] *= _random_sample(rs, pending.shape, usm_type)
+        pending = pending[prod[pending] > enlam[pending]]
+        res[pending] += 1
+    else:
+        raise RuntimeError("sampling of Poisson variates failed")
+
+    lam_l = dpnp.where(small, 10, lam)
+    log_lam = dpnp.log(lam_l)
+    b = 0.931 + 2.53 * dpnp.sqrt(lam_l)
+    a = -0.059 + 0.02483 * b
+    log_alpha = dpnp.log(1.1239 + 1.1328 / (b - 3.4))
+    vr = 0.9277 - 3.6224 / (b - 2)
+
+    pending = dpnp.flatnonzero(~small)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        a_p = a[pending]
+        b_p = b[pending]
+        lam_p = lam_l[pending]
+        u = _random_sample(rs, pending.shape, usm_type) - 0.5
+        v = _random_sample(rs, pending.shape, usm_type)
+        us = 0.5 - dpnp.abs(u)
+        k = dpnp.floor((2 * a_p / us + b_p) * u + lam_p + 0.43)
+
+        reject = ~(k >= 0) | dpnp.isinf(k) | ((us < 0.013) & (v > us))
+        k = dpnp.where(reject, 0, k)
+        accept = (us >= 0.07) & (v <= vr[pending])
+        accept |= ~reject & (
+            dpnp.log(v) + log_alpha[pending] - dpnp.log(a_p / (us * us) + b_p)
+            <= k * log_lam[pending] - lam_p - _log_factorial(k)
+        )
+        res[pending[accept]] = k[accept]
+        pending = pending[~accept]
+    else:
+        raise RuntimeError("rejection sampling of Poisson variates failed")
+
+    return res.reshape(out_shape)
+
+
+def _binomial(rs, n, p, usm_type):
+    """
+    Draw samples from the binomial distribution with arrays of parameters.
+
+    The distribution is sampled for ``min(p, 1 - p)`` and then reflected if
+    needed. When the mean ``n * p`` is below ``10``, the inversion of the
+    cumulative distribution function is done by a sequential search, and the
+    BTRS transformed rejection method of Hörmann is used otherwise. All
+    elements are processed at once and only the unfinished elements are
+    iterated further. The samples are returned as integral floating-point
+    values.
+
+    """
+
+    out_shape = n.shape
+    n = n.ravel()
+    p = p.ravel()
+    flip = p > 0.5
+    p = dpnp.where(flip, 1 - p, p)
+    q = 1 - p
+    mean = n * p
+    small = mean < 10
+    res = dpnp.zeros_like(n)
+
+    # inversion with a restart if the search runs too far into the tail
+    bound = dpnp.minimum(n, mean + 10 * dpnp.sqrt(mean * q + 1))
+    qn = dpnp.exp(n * dpnp.log1p(-p))
+    px = qn.copy()
+    u = _random_sample(rs, n.shape, usm_type)
+    pending = dpnp.flatnonzero(small)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        pending = pending[u[pending] > px[pending]]
+        if pending.size == 0:
+            break
+
+        x = res[pending] + 1
+        restart = x > bound[pending]
+        px_p = (n[pending] - x + 1) * p[pending] * px[pending]
+        px_p /= x * q[pending]
+        u_p = u[pending] - px[pending]
+
+        res[pending] = dpnp.where(restart, 0, x)
+        px[pending] = dpnp.where(restart, qn[pending], px_p)
+        u[pending] = dpnp.where(
+            restart, _random_sample(rs, pending.shape, usm_type), u_p
+        )
+    else:
+        raise RuntimeError("sampling of binomial variates failed")
+
+    p_l = dpnp.where(small, 0.5, p)
+    n_l = dpnp.where(small, 40, n)
+    spq = dpnp.sqrt(n_l * p_l * (1 - p_l))
+    b = 1.15 + 2.53 * spq
+    a = -0.0873 + 0.0248 * b + 0.01 * p_l
+    c = n_l * p_l + 0.5
+    log_alpha = dpnp.log((2.83 + 5.1 / b) * spq)
+    vr = 0.92 - 4.2 / b
+    m = dpnp.floor((n_l + 1) * p_l)
+    log_r = dpnp.log(p_l / (1 - p_l))
+    log_fm = _log_factorial(m) + _log_factorial(n_l - m)
+
+    pending = dpnp.flatnonzero(~small)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        a_p = a[pending]
+        b_p = b[pending]
+        n_p = n_l[pending]
+        u = _random_sample(rs, pending.shape, usm_type) - 0.5
+        v = _random_sample(rs, pending.shape, usm_type)
+        us = 0.5 - dpnp.abs(u)
+        k = dpnp.floor((2 * a_p / us + b_p) * u + c[pending])
+
+        in_range = (k >= 0) & (k <= n_p)
+        k = dpnp.where(in_range, k, 0)
+        accept = (us >= 0.07) & (v <= vr[pending])
+        accept |= (
+            dpnp.log(v) + log_alpha[pending] - dpnp.log(a_p / (us * us) + b_p)
+            <= log_fm[pending]
+            - _log_factorial(k)
+            - _log_factorial(n_p - k)
+            + (k - m[pending]) * log_r[pending]
+        )
+        accept &= in_range
+        res[pending[accept]] = k[accept]
+        pending = pending[~accept]
+    else:
+        raise RuntimeError("rejection sampling of binomial variates failed")
+
+    res = dpnp.where(flip, n - res, res)
+    return res.reshape(out_shape)
+
+
+def _noncentral_chisquare(rs, df, nonc, usm_type):
+    """
+    Draw samples from the noncentral chi-square distribution with arrays of
+    parameters.
+
+    The distribution is sampled as a Poisson mixture of central chi-square
+    distributions, ``chisquare(df + 2 * poisson(nonc / 2))``, which is valid
+    for any positive `df`.
+
+    """
+
+    i = _poisson(rs, nonc / 2, usm_type)
+    return _chisquare(rs, df + 2 * i, usm_type)
+
+
+def dpnp_beta(rs, a, b, size, usm_type="device"):
+    """Draw samples from the Beta distribution with array-like parameters."""
+
+    (a, b), _ = _broadcast_params(rs, (a, b), size, usm_type=usm_type)
+    _check_params((_not_positive(a), "a <= 0"), (_not_positive(b), "b <= 0"))
+
+    x = _standard_gamma(rs, a, usm_type)
+    y = _standard_gamma(rs, b, usm_type)
+    return x / (x + y)
+
+
+def dpnp_binomial(rs, n, p, size, usm_type="device"):
+    """Draw binomial distribution samples with array-like parameters."""
+
+    (n, p), _ = _broadcast_params(rs, (n, p), size, usm_type=usm_type)
+    _check_params(
+        (_not_non_negative(n) | dpnp.isinf(n), "n < 0"),
+        (~((p >= 0) & (p <= 1)), "p < 0, p > 1 or p is NaN"),
+    )
+    return _binomial(rs, dpnp.trunc(n), p, usm_type).astype(dpnp.int64)
+
+
+def dpnp_bytes(rs, length):
+    """Return `length` random bytes generated on the device."""
+
+    res = rs.randint(0, 256, size=length)
+    return dpnp.asnumpy(res.astype(dpnp.uint8)).tobytes()
+
+
+def dpnp_chisquare(rs, df, size, usm_type="device"):
+    """Draw chi-square samples with array-like degrees of freedom."""
+
+    (df,), _ = _broadcast_params(rs, (df,), size, usm_type=usm_type)
+    _check_params((_not_positive(df), "df <= 0"))
+    return _chisquare(rs, df, usm_type)
+
+
+def dpnp_choice(rs, a, size, replace, p, usm_type="device"):
+    """
+    Generate a random sample from a given 1-D array on the device.
+
+    Sampling with replacement uses inversion of the cumulative distribution
+    function by :obj:`dpnp.searchsorted`. Sampling without replacement sorts
+    exponentially distributed keys scaled by the probabilities, which is
+    equivalent to the sequential drawing of the samples.
+
+    """
+
+    shape = _normalize_size(size)
+    n_samples = int(numpy.prod(shape, dtype=numpy.int64))
+
+    sycl_queue = rs.get_sycl_queue()
+    if dpnp.isscalar(a):
+        try:
+            pop_size = operator.index(a)
+        except TypeError as e:
+            raise ValueError("a must be 1-dimensional or an integer") from e
+        if pop_size <= 0 and n_samples != 0:
+            raise ValueError(
+                "a must be a positive integer unless no samples are taken"
+            )
+        a = None
+    else:
+        a = dpnp.asarray(a, usm_type=usm_type, sycl_queue=sycl_queue)
+        if a.ndim != 1:
+            raise ValueError("a must be 1-dimensional")
+        pop_size = a.shape[0]
+        if pop_size == 0 and n_samples != 0:
+            raise ValueError("a cannot be empty unless no samples are taken")
+
+    if p is not None:
+        p = dpnp.asarray(
+            p,
+            dtype=rs._def_float_type,
+            usm_type=usm_type,
+            sycl_queue=sycl_queue,
+        )
+        if p.ndim != 1:
+            raise ValueError("p must be 1-dimensional")
+        if p.size != pop_size:
+            raise ValueError("a and p must have same size")
+
+        atol = numpy.sqrt(dpnp.finfo(p.dtype).eps)
+        _check_params(
+            (p < 0, "probabilities are not non-negative"),
+            (
+                dpnp.abs(dpnp.sum(p) - 1) > atol,
+                "probabilities do not sum to 1",
+            ),
+        )
+
+    if replace:
+        u = _random_sample(rs, (n_samples,), usm_type)
+        if p is None:
+            idx = dpnp.floor(u * pop_size).astype(dpnp.int64)
+        else:
+            cdf = dpnp.cumsum(p)
+            cdf /= cdf[-1]
+            idx = dpnp.searchsorted(cdf, u, side="right")
+        # guard against rounding of the last bin
+        idx = dpnp.minimum(idx, pop_size - 1)
+    else:
+        if n_samples > pop_size:
+            raise ValueError(
+                "Cannot take a larger sample than population when "
+                "'replace=False'"
+            )
+
+        keys = _standard_exponential(rs, (pop_size,), usm_type)
+        if p is not None:
+            if dpnp.count_nonzero(p) < n_samples:
+                raise ValueError("Fewer non-zero entries in p than size")
+            keys /= p
+        idx = dpnp.argsort(keys)[:n_samples]
+
+    if a is not None:
+        return a[idx].reshape(shape)
+    return idx.astype(dpnp.int64, copy=False).reshape(shape)
+
+
+def dpnp_dirichlet(rs, alpha, size, usm_type="device"):
+    """Draw samples from the Dirichlet distribution on the device."""
+
+    alpha = dpnp.asarray(
+        alpha,
+        dtype=rs._def_float_type,
+        usm_type=usm_type,
+        sycl_queue=rs.get_sycl_queue(),
+    )
+    if alpha.ndim != 1:
+        raise ValueError("object of too small depth for desired array")
+    _check_params((_not_positive(alpha), "alpha <= 0"))
+
+    shape = _normalize_size(size) + alpha.shape
+    g = _standard_gamma(rs, dpnp.broadcast_to(alpha, shape), usm_type)
+    return g / dpnp.sum(g, axis=-1, keepdims=True)
+
+
+def dpnp_exponential(rs, scale, size, usm_type="device"):
+    """Draw exponential samples with array-like `scale`."""
+
+    (scale,), shape = _broadcast_params(rs, (scale,), size, usm_type=usm_type)
+    _check_params((scale < 0, "scale < 0"))
+    return scale * _standard_exponential(rs, shape, usm_type)
+
+
+def dpnp_f(rs, dfnum, dfden, size, usm_type="device"):
+    """Draw F distribution samples with array-like parameters."""
+
+    (dfnum, dfden), _ = _broadcast_params(
+        rs, (dfnum, dfden), size, usm_type=usm_type
+    )
+    _check_params(
+        (_not_positive(dfnum), "dfnum <= 0"),
+        (_not_positive(dfden), "dfden <= 0"),
+    )
+
+    num = _chisquare(rs, dfnum, usm_type) * dfden
+    den = _chisquare(rs, dfden, usm_type) * dfnum
+    return num / den
+
+
+def dpnp_gamma(rs, shape, scale, size, usm_type="device"):
+    """Draw Gamma distribution samples with array-like parameters."""
+
+    (shape, scale), _ = _broadcast_params(
+        rs, (shape, scale), size, usm_type=usm_type
+    )
+    _check_params(
+        (_not_non_negative(shape) | dpnp.isinf(shape), "shape < 0"),
+        (_not_non_negative(scale), "scale < 0"),
+    )
+    return scale * _standard_gamma(rs, shape, usm_type)
+
+
+def dpnp_geometric(rs, p, size, usm_type="device"):
+    """Draw geometric distribution samples with array-like `p`."""
+
+    (p,), shape = _broadcast_params(rs, (p,), size, usm_type=usm_type)
+    _check_params(((p <= 0) | (p > 1), "p <= 0, p > 1 or p contains NaNs"))
+
+    u = _random_sample(rs, shape, usm_type)
+    res = dpnp.ceil(dpnp.log1p(-u) / dpnp.log1p(-p))
+    res = dpnp.where(p == 1, 1, dpnp.maximum(res, 1))
+    return res.astype(dpnp.int64)
+
+
+def dpnp_gumbel(rs, loc, scale, size, usm_type="device"):
+    """Draw Gumbel distribution samples with array-like parameters."""
+
+    (loc, scale), shape = _broadcast_params(
+        rs, (loc, scale), size, usm_type=usm_type
+    )
+    _check_params((scale < 0, "scale < 0"))
+    return loc - scale * dpnp.log(_standard_exponential(rs, shape, usm_type))
+
+
+def dpnp_hypergeometric(rs, ngood, nbad, nsample, size, usm_type="device"):
+    """
+    Draw samples from a hypergeometric distribution on the device.
+
+    If the sample is taken close to the whole population or consists of less
+    than ``10`` items, its items are drawn one by one, which takes not more
+    than ``10`` iterations. Otherwise, the HRUA ratio-of-uniforms rejection
+    method of Stadlober is used. Both algorithms are the same as in NumPy and
+    are applied to all elements at once.
+
+    """
+
+    (ngood, nbad, nsample), shape = _broadcast_params(
+        rs, (ngood, nbad, nsample), size, usm_type=usm_type
+    )
+    ngood, nbad, nsample = (
+        dpnp.trunc(x).ravel() for x in (ngood, nbad, nsample)
+    )
+    total = ngood + nbad
+    _check_params(
+        (_not_non_negative(ngood) | dpnp.isinf(ngood), "ngood < 0"),
+        (_not_non_negative(nbad) | dpnp.isinf(nbad), "nbad < 0"),
+        (~(nsample >= 1), "nsample < 1"),
+        (total < nsample, "ngood + nbad < nsample"),
+    )
+
+    # draw the smaller of the sample and its complement to the population
+    sample = dpnp.minimum(nsample, total - nsample)
+    use_hrua = (nsample >= 10) & (nsample <= total - 10)
+
+    rem_good = ngood.copy()
+    rem_total = total.copy()
+    rem_sample = sample.copy()
+    pending = dpnp.flatnonzero(~use_hrua)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        pending = pending[
+            (rem_sample[pending] > 0)
+            & (rem_good[pending] > 0)
+            & (rem_total[pending] > rem_good[pending])
+        ]
+        if pending.size == 0:
+            break
+
+        u = _random_sample(rs, pending.shape, usm_type)
+        good = dpnp.floor(u * rem_total[pending]) < rem_good[pending]
+        rem_good[pending] -= good
+        rem_total[pending] -= 1
+        rem_sample[pending] -= 1
+    else:
+        raise RuntimeError("sampling of hypergeometric variates failed")
+
+    rem_good = dpnp.where(
+        rem_total == rem_good, rem_good - rem_sample, rem_good
+    )
+    res = dpnp.where(nsample > total / 2, rem_good, ngood - rem_good)
+
+    min_gb = dpnp.where(use_hrua, dpnp.minimum(ngood, nbad), 10)
+    max_gb = dpnp.where(use_hrua, dpnp.maximum(ngood, nbad), 10)
+    sample_h = dpnp.where(use_hrua, sample, 10)
+    total_h = min_gb + max_gb
+    p = min_gb / total_h
+    a = sample_h * p + 0.5
+    c = dpnp.sqrt(
+        (total_h - sample_h) * sample_h * p * (1 - p) / (total_h - 1) + 0.5
+    )
+    h = _HRUA_D1 * c + _HRUA_D2
+    m = dpnp.floor((sample_h + 1) * (min_gb + 1) / (total_h + 2))
+    g = (
+        _log_factorial(m)
+        + _log_factorial(min_gb - m)
+        + _log_factorial(sample_h - m)
+        + _log_factorial(max_gb - sample_h + m)
+    )
+    b = dpnp.minimum(dpnp.minimum(sample_h, min_gb) + 1, dpnp.floor(a + 16 * c))
+
+    pending = dpnp.flatnonzero(use_hrua)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        b_p = b[pending]
+        min_p = min_gb[pending]
+        max_p = max_gb[pending]
+        sample_p = sample_h[pending]
+        u = _random_sample(rs, pending.shape, usm_type)
+        v = _random_sample(rs, pending.shape, usm_type)
+        x = a[pending] + h[pending] * (v - 0.5) / u
+
+        in_range = (x >= 0) & (x < b_p)
+        k = dpnp.where(in_range, dpnp.floor(x), 0)
+        t = g[pending] - (
+            _log_factorial(k)
+            + _log_factorial(min_p - k)
+            + _log_factorial(sample_p - k)
+            + _log_factorial(max_p - sample_p + k)
+        )
+        accept = in_range & (2 * dpnp.log(u) <= t)
+
+        k = dpnp.where(ngood[pending] > nbad[pending], sample_p - k, k)
+        k = dpnp.where(sample_p < nsample[pending], ngood[pending] - k, k)
+        res[pending[accept]] = k[accept]
+        pending = pending[~accept]
+    else:
+        raise RuntimeError(
+            "rejection sampling of hypergeometric variates failed"
+        )
+
+    return res.astype(dpnp.int64).reshape(shape)
+
+
+def dpnp_laplace(rs, loc, scale, size, usm_type="device"):
+    """Draw Laplace distribution samples with array-like parameters."""
+
+    (loc, scale), shape = _broadcast_params(
+        rs, (loc, scale), size, usm_type=usm_type
+    )
+    _check_params((scale < 0, "scale < 0"))
+
+    # a difference of two standard exponential variates is Laplace distributed
+    e1 = _standard_exponential(rs, shape, usm_type)
+    e2 = _standard_exponential(rs, shape, usm_type)
+    return loc + scale * (e1 - e2)
+
+
+def dpnp_logistic(rs, loc, scale, size, usm_type="device"):
+    """Draw logistic distribution samples with array-like parameters."""
+
+    (loc, scale), shape = _broadcast_params(
+        rs, (loc, scale), size, usm_type=usm_type
+    )
+    _check_params((scale < 0, "scale < 0"))
+
+    u = _random_sample(rs, shape, usm_type)
+    return loc + scale * dpnp.log(u / (1 - u))
+
+
+def dpnp_lognormal(rs, mean, sigma, size, usm_type="device"):
+    """Draw log-normal distribution samples with array-like parameters."""
+
+    (mean, sigma), shape = _broadcast_params(
+        rs, (mean, sigma), size, usm_type=usm_type
+    )
+    _check_params((sigma < 0, "sigma < 0"))
+
+    x = rs.standard_normal(size=shape, usm_type=usm_type)
+    return dpnp.exp(mean + sigma * x)
+
+
+def dpnp_logseries(rs, p, size, usm_type="device"):
+    """
+    Draw samples from a logarithmic series distribution on the device.
+
+    The Kemp's algorithm is applied to all elements at once, and only the
+    rejected elements are resampled on the next iteration.
+
+    """
+
+    (p,), shape = _broadcast_params(rs, (p,), size, usm_type=usm_type)
+    _check_params((~((p >= 0) & (p < 1)), "p < 0, p >= 1 or p is NaN"))
+
+    p = p.ravel()
+    r = dpnp.log1p(-p)
+    res = dpnp.empty_like(p, dtype=dpnp.int64)
+    pending = dpnp.arange(
+        res.size, usm_type=res.usm_type, sycl_queue=res.sycl_queue
+    )
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        p_p = p[pending]
+        v = _random_sample(rs, pending.shape, usm_type)
+        u = _random_sample(rs, pending.shape, usm_type)
+        q = -dpnp.expm1(r[pending] * u)
+
+        in_tail = v <= q * q
+        val = dpnp.floor(1 + dpnp.log(v) / dpnp.log(q))
+        val = dpnp.where(in_tail, val, dpnp.where(v >= q, 1, 2))
+        val = dpnp.where(v >= p_p, 1, val)
+
+        reject = (v < p_p) & in_tail & ((val < 1) | (v == 0))
+        res[pending[~reject]] = val[~reject].astype(dpnp.int64)
+        pending = pending[reject]
+    else:
+        raise RuntimeError("rejection sampling of logseries variates failed")
+
+    return res.reshape(shape)
+
+
+def dpnp_multinomial(rs, n, pvals, size, usm_type="device"):
+    """
+    Draw samples from a multinomial distribution on the device.
+
+    The counts of the categories are drawn one after another from binomial
+    distributions conditioned on the number of trials left, the same way as
+    NumPy does. Every step is applied to all the samples at once.
+
+    """
+
+    sycl_queue = rs.get_sycl_queue()
+    pvals = dpnp.asarray(
+        pvals,
+        dtype=rs._def_float_type,
+        usm_type=usm_type,
+        sycl_queue=sycl_queue,
+    )
+    if pvals.ndim != 1:
+        raise ValueError("pvals must be a 1-d sequence")
+
+    (n,), shape = _broadcast_params(rs, (n,), size, usm_type=usm_type)
+    n = dpnp.trunc(n)
+    _check_params(
+        (_not_non_negative(n) | dpnp.isinf(n), "n < 0"),
+        (
+            ~((pvals >= 0) & (pvals <= 1)),
+            "pvals < 0, pvals > 1 or pvals contains NaNs",
+        ),
+        (dpnp.sum(pvals[:-1]) > 1.0 + 1e-12, "sum(pvals[:-1]) > 1.0"),
+    )
+
+    # probability of each category given that none of the previous ones
+    # has been drawn
+    remaining_p = 1 - dpnp.cumsum(pvals) + pvals
+    cond_p = dpnp.where(remaining_p > 0, pvals / remaining_p, 1)
+    cond_p = dpnp.clip(cond_p, 0, 1)
+
+    d = pvals.shape[0]
+    res = dpnp.empty(
+        shape + (d,), dtype=n.dtype, usm_type=usm_type, sycl_queue=sycl_queue
+    )
+    for j in range(d - 1):
+        x = _binomial(rs, n, dpnp.broadcast_to(cond_p[j], shape), usm_type)
+        res[..., j] = x
+        n = n - x
+    if d > 0:
+        res[..., -1] = n
+    return res.astype(dpnp.int64)
+
+
+def dpnp_negative_binomial(rs, n, p, size, usm_type="device"):
+    """
+    Draw samples from a negative binomial distribution on the device.
+
+    The distribution is sampled as a Poisson distribution whose rate is drawn
+    from a Gamma distribution.
+
+    """
+
+    (n, p), _ = _broadcast_params(rs, (n, p), size, usm_type=usm_type)
+    _check_params(
+        (_not_positive(n), "n <= 0"),
+        (~((p > 0) & (p <= 1)), "p <= 0, p > 1 or p is NaN"),
+    )
+
+    lam = _standard_gamma(rs, n, usm_type) * ((1 - p) / p)
+    return _poisson(rs, lam, usm_type).astype(dpnp.int64)
+
+
+def dpnp_noncentral_chisquare(rs, df, nonc, size, usm_type="device"):
+    """Draw noncentral chi-square samples with array-like parameters."""
+
+    (df, nonc), _ = _broadcast_params(rs, (df, nonc), size, usm_type=usm_type)
+    _check_params(
+        (_not_positive(df), "df <= 0"),
+        (_not_non_negative(nonc), "nonc < 0"),
+        (dpnp.isinf(nonc), "nonc is not finite"),
+    )
+    return _noncentral_chisquare(rs, df, nonc, usm_type)
+
+
+def dpnp_noncentral_f(rs, dfnum, dfden, nonc, size, usm_type="device"):
+    """
+    Draw samples from the noncentral F distribution on the device.
+
+    The distribution is sampled as a ratio of a noncentral chi-square and
+    a central chi-square variates scaled by their degrees of freedom.
+
+    """
+
+    (dfnum, dfden, nonc), _ = _broadcast_params(
+        rs, (dfnum, dfden, nonc), size, usm_type=usm_type
+    )
+    _check_params(
+        (_not_positive(dfnum), "dfnum <= 0"),
+        (_not_positive(dfden), "dfden <= 0"),
+        (_not_non_negative(nonc), "nonc < 0"),
+        (dpnp.isinf(nonc), "nonc is not finite"),
+    )
+
+    t = _noncentral_chisquare(rs, dfnum, nonc, usm_type) * dfden
+    return t / (_chisquare(rs, dfden, usm_type) * dfnum)
+
+
+def dpnp_normal(rs, loc, scale, size, dtype=None, usm_type="device"):
+    """Draw normal distribution samples with array-like parameters."""
+
+    (loc, scale), shape = _broadcast_params(
+        rs, (loc, scale), size, dtype=dtype, usm_type=usm_type
+    )
+    _check_params((scale < 0, "scale < 0"))
+
+    x = rs.normal(size=shape, dtype=loc.dtype, usm_type=usm_type)
+    return loc + scale * x
+
+
+def dpnp_pareto(rs, a, size, usm_type="device"):
+    """Draw Pareto II distribution samples with array-like `a`."""
+
+    (a,), shape = _broadcast_params(rs, (a,), size, usm_type=usm_type)
+    _check_params((_not_positive(a), "a <= 0"))
+    return dpnp.expm1(_standard_exponential(rs, shape, usm_type) / a)
+
+
+def dpnp_poisson(rs, lam, size, usm_type="device"):
+    """Draw Poisson distribution samples with array-like `lam`."""
+
+    (lam,), _ = _broadcast_params(rs, (lam,), size, usm_type=usm_type)
+    _check_params(
+        (_not_non_negative(lam), "lam < 0"),
+        (lam > _POISSON_LAM_MAX, "lam value too large"),
+    )
+    return _poisson(rs, lam, usm_type).astype(dpnp.int64)
+
+
+def dpnp_power(rs, a, size, usm_type="device"):
+    """Draw power distribution samples with array-like `a`."""
+
+    (a,), shape = _broadcast_params(rs, (a,), size, usm_type=usm_type)
+    _check_params((_not_positive(a), "a <= 0"))
+
+    e = _standard_exponential(rs, shape, usm_type)
+    return dpnp.pow(-dpnp.expm1(-e), 1 / a)
+
+
+def dpnp_random_integers(rs, low, high, size, usm_type="device"):
+    """Draw integers from the closed interval with array-like bounds."""
+
+    (low, high), shape = _broadcast_params(
+        rs, (low, high), size, dtype=dpnp.int64, usm_type=usm_type
+    )
+    _check_params((low > high, "low > high"))
+
+    u = _random_sample(rs, shape, usm_type)
+    res = low + dpnp.floor(u * (high - low + 1)).astype(dpnp.int64)
+    # guard against rounding of the upper bound
+    return dpnp.minimum(res, high)
+
+
+def dpnp_rayleigh(rs, scale, size, usm_type="device"):
+    """Draw Rayleigh distribution samples with array-like `scale`."""
+
+    (scale,), shape = _broadcast_params(rs, (scale,), size, usm_type=usm_type)
+    _check_params((scale < 0, "scale < 0"))
+    return scale * dpnp.sqrt(2 * _standard_exponential(rs, shape, usm_type))
+
+
+def dpnp_standard_gamma(rs, shape, size, usm_type="device"):
+    """Draw standard Gamma distribution samples with array-like `shape`."""
+
+    (shape,), _ = _broadcast_params(rs, (shape,), size, usm_type=usm_type)
+    _check_params((_not_non_negative(shape) | dpnp.isinf(shape), "shape < 0"))
+    return _standard_gamma(rs, shape, usm_type)
+
+
+def dpnp_standard_t(rs, df, size, usm_type="device"):
+    """Draw Student's t distribution samples with array-like `df`."""
+
+    (df,), shape = _broadcast_params(rs, (df,), size, usm_type=usm_type)
+    _check_params((_not_positive(df), "df <= 0"))
+
+    x = rs.standard_normal(size=shape, usm_type=usm_type)
+    return x / dpnp.sqrt(_chisquare(rs, df, usm_type) / df)
+
+
+def dpnp_triangular(rs, left, mode, right, size, usm_type="device"):
+    """Draw triangular distribution samples with array-like parameters."""
+
+    (left, mode, right), shape = _broadcast_params(
+        rs, (left, mode, right), size, usm_type=usm_type
+    )
+    _check_params(
+        (left > mode, "left > mode"),
+        (mode > right, "mode > right"),
+        (left == right, "left == right"),
+    )
+
+    base = right - left
+    left_base = mode - left
+    ratio = left_base / base
+
+    u = _random_sample(rs, shape, usm_type)
+    return dpnp.where(
+        u <= ratio,
+        left + dpnp.sqrt(u * left_base * base),
+        right - dpnp.sqrt((1 - u) * (right - mode) * base),
+    )
+
+
+def dpnp_uniform(rs, low, high, size, dtype=None, usm_type="device"):
+    """Draw uniform distribution samples with array-like bounds."""
+
+    (low, high), shape = _broadcast_params(
+        rs, (low, high), size, dtype=dtype, usm_type=usm_type
+    )
+
+    u = rs.uniform(size=shape, dtype=low.dtype, usm_type=usm_type)
+    return low + (high - low) * u
+
+
+def dpnp_vonmises(rs, mu, kappa, size, usm_type="device"):
+    """
+    Draw samples from a von Mises distribution on the device.
+
+    The rejection method of Best and Fisher is applied to all elements at
+    once, and only the rejected elements are resampled on the next iteration.
+    The distribution is approximated by the uniform one for a tiny `kappa`
+    and by the wrapped normal one for a huge `kappa`, as it is done in NumPy.
+
+    """
+
+    (mu, kappa), shape = _broadcast_params(
+        rs, (mu, kappa), size, usm_type=usm_type
+    )
+    _check_params((kappa < 0, "kappa < 0"))
+
+    mu = mu.ravel()
+    kappa = kappa.ravel()
+    tiny = kappa < 1e-8
+    huge = kappa > 1e6
+    use_rejection = ~(tiny | huge | dpnp.isnan(kappa))
+
+    k = dpnp.where(use_rejection, kappa, 1)
+    r = 1 + dpnp.sqrt(1 + 4 * k * k)
+    rho = (r - dpnp.sqrt(2 * r)) / (2 * k)
+    s = dpnp.where(k < 1e-5, 1 / k + k, (1 + rho * rho) / (2 * rho))
+
+    w = dpnp.ones_like(kappa)
+    pending = dpnp.flatnonzero(use_rejection)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        s_p = s[pending]
+        u = _random_sample(rs, pending.shape, usm_type)
+        v = _random_sample(rs, pending.shape, usm_type)
+        z = dpnp.cos(numpy.pi * u)
+        w_p = (1 + s_p * z) / (s_p + z)
+        y = k[pending] * (s_p - w_p)
+
+        accept = (y * (2 - y) - v >= 0) | (dpnp.log(y / v) + 1 - y >= 0)
+        w[pending[accept]] = w_p[accept]
+        pending = pending[~accept]
+    else:
+        raise RuntimeError("rejection sampling of von Mises variates failed")
+
+    u = _random_sample(rs, kappa.shape, usm_type)
+    res = dpnp.where(u < 0.5, -dpnp.arccos(w), dpnp.arccos(w))
+    res = dpnp.where(tiny, numpy.pi * (2 * u - 1), res)
+
+    x = rs.standard_normal(size=kappa.shape, usm_type=usm_type)
+    res = dpnp.where(huge, x * dpnp.sqrt(1 / kappa), res)
+    res = dpnp.where(dpnp.isnan(kappa), dpnp.nan, res) + mu
+
+    # wrap the angles into [-pi, pi]
+    mod = dpnp.fmod(dpnp.abs(res) + numpy.pi, 2 * numpy.pi) - numpy.pi
+    res = dpnp.where(res < 0, -mod, mod)
+    return res.reshape(shape)
+
+
+def dpnp_wald(rs, mean, scale, size, usm_type="device"):
+    """Draw Wald distribution samples with array-like parameters."""
+
+    (mean, scale), shape = _broadcast_params(
+        rs, (mean, scale), size, usm_type=usm_type
+    )
+    _check_params((mean <= 0, "mean <= 0"), (scale <= 0, "scale <= 0"))
+
+    y = rs.standard_normal(size=shape, usm_type=usm_type)
+    y = mean * y * y
+    x = mean + mean / (2 * scale) * (y - dpnp.sqrt(4 * scale * y + y * y))
+
+    u = _random_sample(rs, shape, usm_type)
+    return dpnp.where(u <= mean / (mean + x), x, mean * mean / x)
+
+
+def dpnp_weibull(rs, a, size, usm_type="device"):
+    """Draw Weibull distribution samples with array-like `a`."""
+
+    (a,), shape = _broadcast_params(rs, (a,), size, usm_type=usm_type)
+    _check_params((a < 0, "a < 0"))
+
+    e = _standard_exponential(rs, shape, usm_type)
+    return dpnp.where(a == 0, 0, dpnp.pow(e, 1 / a))
+
+
+def dpnp_zipf(rs, a, size, usm_type="device"):
+    """
+    Draw samples from a Zipf distribution on the device.
+
+    The rejection method of Devroye is applied to all elements at once, and
+    only the rejected elements are resampled on the next iteration. The
+    samples are set to one if `a` is too large to sample them, as it is done
+    in NumPy.
+
+    """
+
+    (a,), shape = _broadcast_params(rs, (a,), size, usm_type=usm_type)
+    _check_params((~(a > 1), "a <= 1 or a is NaN"))
+
+    a = a.ravel()
+    am1 = dpnp.where(a < _ZIPF_A_MAX, a, 2) - 1
+    b = 2**am1
+    res = dpnp.ones_like(am1)
+    pending = dpnp.flatnonzero(a < _ZIPF_A_MAX)
+    for _ in range(_MAX_REJECTION_ROUNDS):
+        if pending.size == 0:
+            break
+
+        am1_p = am1[pending]
+        b_p = b[pending]
+        u = 1 - _random_sample(rs, pending.shape, usm_type)
+        v = _random_sample(rs, pending.shape, usm_type)
+        x = dpnp.floor(u ** (-1 / am1_p))
+
+        # samples beyond the range of int64 type are rejected
+        in_range = (x >= 1) & (x <= _INT64_MAX)
+        x = dpnp.where(in_range, x, 1)
+        t = (1 + 1 / x) ** am1_p
+        accept = in_range & (v * x * (t - 1) / (b_p - 1) <= t / b_p)
+        res[pending[accept]] = x[accept]
+        pending = pending[~accept]
+    else:
+        raise RuntimeError("rejection sampling of Zipf variates failed")
+
+    return res.astype(dpnp.int64).reshape(shape)
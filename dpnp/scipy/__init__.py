@@ -36,6 +36,6 @@ This namespace provides submodules that mimic parts of ``SciPy`` on top of
 DPNP functionality, reusing DPNP and oneMKL implementations underneath.
 """
 
-from . import linalg, special
+from . import fft, linalg, special
 
-__all__ = ["linalg", "special"]
+__all__ = ["fft", "linalg", "special"]
@@ -0,0 +1,1425 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Interface of the SciPy-compatible Discrete Fourier Transform subset for DPNP.
+
+Notes
+-----
+This module exposes the basic transforms of ``dpnp.scipy.fft``.
+It contains:
+ - SciPy-like interface functions
+ - documentation for the functions
+
+"""
+
+# `workers` is accepted only for compatibility with SciPy
+# pylint: disable=unused-argument
+
+import dpnp
+from dpnp.fft.dpnp_utils_fft import dpnp_fft, dpnp_fftn, swap_direction
+
+__all__ = [
+    "fft",
+    "fft2",
+    "fftn",
+    "hfft",
+    "ifft",
+    "ifft2",
+    "ifftn",
+    "ihfft",
+    "irfft",
+    "irfft2",
+    "irfftn",
+    "rfft",
+    "rfft2",
+    "rfftn",
+]
+
+
+def fft(
+    x,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the one-dimensional discrete Fourier Transform.
+
+    For full documentation refer to :obj:`scipy.fft.fft`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, can be complex.
+    n : {None, int}, optional
+        Length of the transformed axis of the output.
+        If `n` is smaller than the length of the input, the input is cropped.
+        If it is larger, the input is padded with zeros. If `n` is not given,
+        the length of the input along the axis specified by `axis` is used.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis over which to compute the FFT. If not given, the last axis is
+        used.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axis
+        indicated by `axis`, or the last one if `axis` is not specified.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.fft` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.ifft` : The one-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.fft2` : The two-dimensional FFT.
+    :obj:`dpnp.scipy.fft.fftn` : The *N*-dimensional FFT.
+    :obj:`dpnp.scipy.fft.rfft` : The one-dimensional FFT of real input.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.exp(2j * np.pi * np.arange(8) / 8)
+    >>> y = sp.fft.fft(x)
+    >>> np.allclose(y, np.fft.fft(x))
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fft(
+        x,
+        forward=True,
+        real=False,
+        n=n,
+        axis=axis,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def fft2(
+    x,
+    s=None,
+    axes=(-2, -1),
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the 2-dimensional discrete Fourier Transform.
+
+    For full documentation refer to :obj:`scipy.fft.fft2`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, can be complex.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). Along each
+        axis, if the given shape is smaller than that of the input, the input
+        is cropped. If it is larger, the input is padded with zeros. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last two axes are
+        used. A repeated index in `axes` means the transform over that axis is
+        performed multiple times.
+
+        Default: ``(-2, -1)``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axes
+        indicated by `axes`, or the last two axes if `axes` is not given.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.fft2` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.ifft2` : The two-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.fft` : The one-dimensional FFT.
+    :obj:`dpnp.scipy.fft.fftn` : The *N*-dimensional FFT.
+    :obj:`dpnp.scipy.fft.rfft2` : The two-dimensional FFT of real input.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.mgrid[:5, :5][0]
+    >>> y = sp.fft.fft2(x)
+    >>> np.allclose(y, np.fft.fft2(x))
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=True,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def fftn(
+    x,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the *N*-dimensional discrete Fourier Transform.
+
+    For full documentation refer to :obj:`scipy.fft.fftn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, can be complex.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). Along each
+        axis, if the given shape is smaller than that of the input, the input
+        is cropped. If it is larger, the input is padded with zeros. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+        Repeated indices in `axes` means that the transform over that axis is
+        performed multiple times.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axes
+        indicated by `axes`, or by a combination of `s` and `x`, as
+        explained in the parameters section above.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.fftn` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.ifftn` : The *N*-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.fft` : The one-dimensional FFT.
+    :obj:`dpnp.scipy.fft.fft2` : The two-dimensional FFT.
+    :obj:`dpnp.scipy.fft.rfftn` : The *N*-dimensional FFT of real input.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.mgrid[:3, :3, :3][0]
+    >>> y = sp.fft.fftn(x, axes=(1, 2))
+    >>> np.allclose(y, np.fft.fftn(x, axes=(1, 2)))
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=True,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def hfft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None):
+    """
+    Compute the FFT of a signal that has Hermitian symmetry, i.e., a real
+    spectrum.
+
+    For full documentation refer to :obj:`scipy.fft.hfft`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    n : {None, int}, optional
+        Length of the transformed axis of the output. For `n` output points,
+        ``n//2+1`` input points are necessary. If the input is longer than
+        this, it is cropped. If it is shorter than this, it is padded with
+        zeros. If `n` is not given, it is taken to be ``2*(m-1)``, where `m`
+        is the length of the input along the axis specified by `axis`.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis over which to compute the FFT. If not given, the last axis is
+        used.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of real dtype
+        The truncated or zero-padded input, transformed along the axis
+        indicated by `axis`, or the last one if `axis` is not specified.
+        The length of the transformed axis is `n`, or, if `n` is not given,
+        ``2*(m-1)`` where `m` is the length of the transformed axis of the
+        input.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.hfft` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.ihfft` : The inverse of :obj:`dpnp.scipy.fft.hfft`.
+    :obj:`dpnp.scipy.fft.irfft` : The inverse of :obj:`dpnp.scipy.fft.rfft`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> signal = np.array([1, 2, 3, 4, 3, 2])
+    >>> sp.fft.hfft(sp.fft.ihfft(signal), 6)
+    array([1., 2., 3., 4., 3., 2.])
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    # the conjugated input is a temporary array, so it can be overwritten
+    return dpnp_fft(
+        dpnp.conjugate(x),
+        forward=False,
+        real=True,
+        n=n,
+        axis=axis,
+        norm=swap_direction(norm),
+        overwrite_x=True,
+    )
+
+
+def ifft(
+    x,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the one-dimensional inverse discrete Fourier Transform.
+
+    For full documentation refer to :obj:`scipy.fft.ifft`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, can be complex.
+    n : {None, int}, optional
+        Length of the transformed axis of the output.
+        If `n` is smaller than the length of the input, the input is cropped.
+        If it is larger, the input is padded with zeros. If `n` is not given,
+        the length of the input along the axis specified by `axis` is used.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis over which to compute the FFT. If not given, the last axis is
+        used.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axis
+        indicated by `axis`, or the last one if `axis` is not specified.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.ifft` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.fft` : The one-dimensional FFT.
+    :obj:`dpnp.scipy.fft.ifft2` : The two-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.ifftn` : The *N*-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.irfft` : The inverse of :obj:`dpnp.scipy.fft.rfft`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.array([0, 4, 0, 0], dtype=np.complex64)
+    >>> sp.fft.ifft(x, overwrite_x=True)
+    array([ 1.+0.j,  0.+1.j, -1.+0.j,  0.-1.j], dtype=complex64)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fft(
+        x,
+        forward=False,
+        real=False,
+        n=n,
+        axis=axis,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def ifft2(
+    x,
+    s=None,
+    axes=(-2, -1),
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the 2-dimensional inverse discrete Fourier Transform.
+
+    For full documentation refer to :obj:`scipy.fft.ifft2`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, can be complex.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). Along each
+        axis, if the given shape is smaller than that of the input, the input
+        is cropped. If it is larger, the input is padded with zeros. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last two axes are
+        used. A repeated index in `axes` means the transform over that axis is
+        performed multiple times.
+
+        Default: ``(-2, -1)``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axes
+        indicated by `axes`, or the last two axes if `axes` is not given.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.ifft2` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.fft2` : The two-dimensional FFT.
+    :obj:`dpnp.scipy.fft.ifft` : The one-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.ifftn` : The *N*-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.irfft2` : The inverse of :obj:`dpnp.scipy.fft.rfft2`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = 4 * np.eye(4, dtype=np.complex64)
+    >>> y = sp.fft.ifft2(x)
+    >>> np.allclose(y, np.fft.ifft2(x))
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=False,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def ifftn(
+    x,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the *N*-dimensional inverse discrete Fourier Transform.
+
+    For full documentation refer to :obj:`scipy.fft.ifftn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, can be complex.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). Along each
+        axis, if the given shape is smaller than that of the input, the input
+        is cropped. If it is larger, the input is padded with zeros. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+        Repeated indices in `axes` means that the transform over that axis is
+        performed multiple times.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axes
+        indicated by `axes`, or by a combination of `s` and `x`, as
+        explained in the parameters section above.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.ifftn` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.fftn` : The *N*-dimensional FFT.
+    :obj:`dpnp.scipy.fft.ifft` : The one-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.ifft2` : The two-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.irfftn` : The inverse of :obj:`dpnp.scipy.fft.rfftn`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.eye(4, dtype=np.complex64)
+    >>> y = sp.fft.ifftn(sp.fft.fftn(x), overwrite_x=True)
+    >>> np.allclose(x, y)
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=False,
+        real=False,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def ihfft(x, n=None, axis=-1, norm=None, overwrite_x=False, workers=None):
+    """
+    Compute the inverse FFT of a signal that has Hermitian symmetry.
+
+    For full documentation refer to :obj:`scipy.fft.ihfft`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, taken to be real.
+    n : {None, int}, optional
+        Length of the transformed axis of the output.
+        If `n` is smaller than the length of the input, the input is cropped.
+        If it is larger, the input is padded with zeros. If `n` is not given,
+        the length of the input along the axis specified by `axis` is used.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis over which to compute the FFT. If not given, the last axis is
+        used.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axis
+        indicated by `axis`, or the last one if `axis` is not specified.
+        The length of the transformed axis is ``n//2 + 1``.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.ihfft` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.hfft` : Compute the FFT of a Hermitian signal.
+    :obj:`dpnp.scipy.fft.rfft` : The one-dimensional FFT of real input.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> spectrum = np.array([15, -4, 0, -1, 0, -4])
+    >>> sp.fft.ihfft(spectrum)
+    array([ 1.-0.j,  2.-0.j,  3.-0.j,  4.-0.j]) # may vary
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    res = dpnp_fft(
+        x,
+        forward=True,
+        real=True,
+        n=n,
+        axis=axis,
+        norm=swap_direction(norm),
+        overwrite_x=overwrite_x,
+    )
+    return dpnp.conjugate(res, out=res)
+
+
+def irfft(
+    x,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the inverse of :obj:`dpnp.scipy.fft.rfft`.
+
+    For full documentation refer to :obj:`scipy.fft.irfft`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    n : {None, int}, optional
+        Length of the transformed axis of the output. For `n` output points,
+        ``n//2+1`` input points are necessary. If the input is longer than
+        this, it is cropped. If it is shorter than this, it is padded with
+        zeros. If `n` is not given, it is taken to be ``2*(m-1)``, where `m`
+        is the length of the input along the axis specified by `axis`.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis over which to compute the FFT. If not given, the last axis is
+        used.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of real dtype
+        The truncated or zero-padded input, transformed along the axis
+        indicated by `axis`, or the last one if `axis` is not specified.
+        The length of the transformed axis is `n`, or, if `n` is not given,
+        ``2*(m-1)`` where `m` is the length of the transformed axis of the
+        input.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.irfft` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.rfft` : The one-dimensional FFT of real input.
+    :obj:`dpnp.scipy.fft.ifft` : The one-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.irfft2` : The inverse of :obj:`dpnp.scipy.fft.rfft2`.
+    :obj:`dpnp.scipy.fft.irfftn` : The inverse of :obj:`dpnp.scipy.fft.rfftn`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.array([1, -1j, -1])
+    >>> sp.fft.irfft(x, overwrite_x=True)
+    array([0., 1., 0., 0.])
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fft(
+        x,
+        forward=False,
+        real=True,
+        n=n,
+        axis=axis,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def irfft2(
+    x,
+    s=None,
+    axes=(-2, -1),
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the inverse of :obj:`dpnp.scipy.fft.rfft2`.
+
+    For full documentation refer to :obj:`scipy.fft.irfft2`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). `s` is also
+        the number of input points used along this axis, except for the last
+        axis, where ``s[-1]//2+1`` points of the input are used. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used, except for the last axis which is taken to be
+        ``2*(m-1)``, where `m` is the length of the input along that axis.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last two axes are
+        used. A repeated index in `axes` means the transform over that axis is
+        performed multiple times.
+
+        Default: ``(-2, -1)``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of real dtype
+        The result of the inverse real 2-D FFT.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.irfft2` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.rfft2` : The two-dimensional FFT of real input.
+    :obj:`dpnp.scipy.fft.ifft2` : The two-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.irfft` : The inverse of :obj:`dpnp.scipy.fft.rfft`.
+    :obj:`dpnp.scipy.fft.irfftn` : The inverse of :obj:`dpnp.scipy.fft.rfftn`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.mgrid[:5, :5][0]
+    >>> y = sp.fft.irfft2(sp.fft.rfft2(x), s=x.shape, overwrite_x=True)
+    >>> np.allclose(x, y)
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=False,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def irfftn(
+    x,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the inverse of :obj:`dpnp.scipy.fft.rfftn`.
+
+    For full documentation refer to :obj:`scipy.fft.irfftn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). `s` is also
+        the number of input points used along this axis, except for the last
+        axis, where ``s[-1]//2+1`` points of the input are used. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used, except for the last axis which is taken to be
+        ``2*(m-1)``, where `m` is the length of the input along that axis.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+        Repeated indices in `axes` means that the transform over that axis is
+        performed multiple times.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of real dtype
+        The truncated or zero-padded input, transformed along the axes
+        indicated by `axes`, or by a combination of `s` or `x`, as explained
+        in the parameters section above. The length of each transformed axis
+        is as given by the corresponding element of `s`, or the length of
+        the input in every axis except for the last one if `s` is not given.
+        In the final transformed axis the length of the output when `s` is
+        not given is ``2*(m-1)`` where `m` is the length of the final
+        transformed axis of the input.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.irfftn` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.rfftn` : The *N*-dimensional FFT of real input.
+    :obj:`dpnp.scipy.fft.ifftn` : The *N*-dimensional inverse FFT.
+    :obj:`dpnp.scipy.fft.irfft` : The inverse of :obj:`dpnp.scipy.fft.rfft`.
+    :obj:`dpnp.scipy.fft.irfft2` : The inverse of :obj:`dpnp.scipy.fft.rfft2`.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.zeros((3, 2, 2))
+    >>> x[0, 0, 0] = 3 * 2 * 2
+    >>> sp.fft.irfftn(x, overwrite_x=True)
+    array([[[1., 1.],
+            [1., 1.]],
+           [[1., 1.],
+            [1., 1.]],
+           [[1., 1.],
+            [1., 1.]]])
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=False,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def rfft(
+    x,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the one-dimensional discrete Fourier Transform for real input.
+
+    For full documentation refer to :obj:`scipy.fft.rfft`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, taken to be real.
+    n : {None, int}, optional
+        Length of the transformed axis of the output.
+        If `n` is smaller than the length of the input, the input is cropped.
+        If it is larger, the input is padded with zeros. If `n` is not given,
+        the length of the input along the axis specified by `axis` is used.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis over which to compute the FFT. If not given, the last axis is
+        used.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axis
+        indicated by `axis`, or the last one if `axis` is not specified.
+        If `n` is even, the length of the transformed axis is ``(n/2)+1``.
+        If `n` is odd, the length is ``(n+1)/2``.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.rfft` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.irfft` : The inverse of :obj:`dpnp.scipy.fft.rfft`.
+    :obj:`dpnp.scipy.fft.fft` : The one-dimensional FFT.
+    :obj:`dpnp.scipy.fft.rfft2` : The two-dimensional FFT of real input.
+    :obj:`dpnp.scipy.fft.rfftn` : The *N*-dimensional FFT of real input.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.array([0, 1, 0, 0])
+    >>> sp.fft.rfft(x)
+    array([ 1.+0.j,  0.-1.j, -1.+0.j])
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fft(
+        x,
+        forward=True,
+        real=True,
+        n=n,
+        axis=axis,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def rfft2(
+    x,
+    s=None,
+    axes=(-2, -1),
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the 2-dimensional FFT of a real array.
+
+    For full documentation refer to :obj:`scipy.fft.rfft2`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, taken to be real.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). Along each
+        axis, if the given shape is smaller than that of the input, the input
+        is cropped. If it is larger, the input is padded with zeros. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last two axes are
+        used. A repeated index in `axes` means the transform over that axis is
+        performed multiple times.
+
+        Default: ``(-2, -1)``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The result of the real 2-D FFT.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.rfft2` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.irfft2` : The inverse of :obj:`dpnp.scipy.fft.rfft2`.
+    :obj:`dpnp.scipy.fft.fft2` : The two-dimensional FFT.
+    :obj:`dpnp.scipy.fft.rfft` : The one-dimensional FFT of real input.
+    :obj:`dpnp.scipy.fft.rfftn` : The *N*-dimensional FFT of real input.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.mgrid[:5, :5][0]
+    >>> y = sp.fft.rfft2(x)
+    >>> np.allclose(y, np.fft.rfft2(x))
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=True,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
+
+
+def rfftn(
+    x,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    plan=None,
+):
+    """
+    Compute the *N*-dimensional discrete Fourier Transform for real input.
+
+    For full documentation refer to :obj:`scipy.fft.rfftn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        Input array, taken to be real.
+    s : {None, sequence of ints}, optional
+        Shape (length of each transformed axis) of the output
+        (``s[0]`` refers to axis 0, ``s[1]`` to axis 1, etc.). Along each
+        axis, if the given shape is smaller than that of the input, the input
+        is cropped. If it is larger, the input is padded with zeros. If `s` is
+        not given, the shape of the input along the axes specified by `axes`
+        is used.
+
+        Default: ``None``.
+    axes : {None, sequence of ints}, optional
+        Axes over which to compute the FFT. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+        Repeated indices in `axes` means that the transform over that axis is
+        performed multiple times.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.fft`).
+        Indicates which direction of the forward/backward pair of transforms
+        is scaled and with what normalization factor. ``None`` is an alias of
+        the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed: the transform is
+        computed in-place in the memory of `x` where possible, and the result
+        may share memory with `x`.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    plan : {None, dpnp.fft.FFTPlan}, optional
+        A plan created by :obj:`dpnp.fft.get_fft_plan` to compute the
+        transform with, it must match the input array and the transform
+        parameters. If ``None``, the plan of the enclosing ``with plan:``
+        block is used, if any.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray of complex dtype
+        The truncated or zero-padded input, transformed along the axes
+        indicated by `axes`, or by a combination of `s` and `x`, as
+        explained in the parameters section above. The length of the last
+        axis transformed will be ``s[-1]//2+1``, while the remaining
+        transformed axes will have lengths according to `s`, or unchanged
+        from the input.
+
+    See Also
+    --------
+    :obj:`dpnp.fft.rfftn` : Equivalent NumPy-compatible function.
+    :obj:`dpnp.scipy.fft.irfftn` : The inverse of :obj:`dpnp.scipy.fft.rfftn`.
+    :obj:`dpnp.scipy.fft.fftn` : The *N*-dimensional FFT.
+    :obj:`dpnp.scipy.fft.rfft` : The one-dimensional FFT of real input.
+    :obj:`dpnp.scipy.fft.rfft2` : The two-dimensional FFT of real input.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.ones((2, 2, 2))
+    >>> sp.fft.rfftn(x)
+    array([[[8.+0.j, 0.+0.j], # may vary
+            [0.+0.j, 0.+0.j]],
+           [[0.+0.j, 0.+0.j],
+            [0.+0.j, 0.+0.j]]])
+
+    """
+
+    dpnp.check_supported_arrays_type(x)
+    return dpnp_fftn(
+        x,
+        forward=True,
+        real=True,
+        s=s,
+        axes=axes,
+        norm=norm,
+        plan=plan,
+        overwrite_x=overwrite_x,
+    )
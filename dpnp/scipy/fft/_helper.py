@@ -0,0 +1,108 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Helper functions of the SciPy-compatible Discrete Fourier Transform subset
+for DPNP.
+
+"""
+
+import operator
+
+__all__ = ["next_fast_len"]
+
+
+def next_fast_len(target, real=False):
+    """
+    Find the next fast size of input data to FFT, for zero-padding, etc.
+
+    oneMKL has optimized kernels for transforms of lengths that are products
+    of small primes 2, 3, 5 and 7. This returns the next composite of these
+    primes greater than or equal to `target`.
+
+    For full documentation refer to :obj:`scipy.fft.next_fast_len`.
+
+    Parameters
+    ----------
+    target : int
+        Length to start searching from. Must be a non-negative integer.
+    real : bool, optional
+        Whether the FFT involves real input or output (e.g.,
+        :obj:`dpnp.scipy.fft.rfft` or :obj:`dpnp.scipy.fft.hfft`). The fast
+        sizes of oneMKL are the same for complex and real transforms, so the
+        result does not depend on it.
+
+        Default: ``False``.
+
+    Returns
+    -------
+    out : int
+        The smallest fast length greater than or equal to `target`.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.fft` : The one-dimensional FFT.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> min_len = 93
+    >>> fast_len = sp.fft.next_fast_len(min_len)
+    >>> fast_len
+    96
+    >>> a = np.random.rand(min_len)
+    >>> b = sp.fft.fft(a, fast_len)
+
+    """
+
+    target = operator.index(target)
+    if target < 0:
+        raise ValueError("Target cannot be negative")
+    if target <= 10:
+        # all the numbers up to 10 are products of 2, 3, 5 and 7
+        return target
+
+    best = 1 << (target - 1).bit_length()
+    p7 = 1
+    while p7 < best:
+        p57 = p7
+        while p57 < best:
+            p357 = p57
+            while p357 < best:
+                # the smallest power of 2 to get at least target
+                p2 = 1 << (-(-target // p357) - 1).bit_length()
+                n = p2 * p357
+                if n == target:
+                    return n
+                best = min(best, n)
+                p357 *= 3
+            p57 *= 5
+        p7 *= 7
+    return best
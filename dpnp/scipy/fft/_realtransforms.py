@@ -0,0 +1,1147 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Interface of the SciPy-compatible real-to-real transforms for DPNP.
+
+Notes
+-----
+This module exposes the discrete cosine and sine transforms of
+``dpnp.scipy.fft``. The transforms are computed with the real-to-complex and
+complex-to-real FFT of ``dpnp.fft`` applied to a reordered or extended input
+array.
+
+"""
+
+# `type` and `workers` follow the signatures of SciPy functions
+# pylint: disable=redefined-builtin
+# pylint: disable=unused-argument
+
+import math
+from collections.abc import Sequence
+
+from dpctl.tensor._numpy_helper import (
+    normalize_axis_index,
+    normalize_axis_tuple,
+)
+
+import dpnp
+
+from ...dpnp_utils import map_dtype_to_device
+
+__all__ = [
+    "dct",
+    "dctn",
+    "dst",
+    "dstn",
+    "idct",
+    "idctn",
+    "idst",
+    "idstn",
+]
+
+# the type of the transform inverse to the transform of a given type
+_INVERSE_TYPE = {1: 1, 2: 3, 3: 2, 4: 4}
+
+
+def _arange(n, y):
+    """Return ``dpnp.arange(n)`` of the data type and placement of `y`."""
+    return dpnp.arange(
+        n, dtype=y.dtype, usm_type=y.usm_type, sycl_queue=y.sycl_queue
+    )
+
+
+def _dct1(y):
+    """DCT-I as FFT of the even extension of `y` of length ``2*(N-1)``."""
+    z = dpnp.concatenate((y, y[..., -2:0:-1]), axis=-1)
+    return dpnp.fft.rfft(z).real
+
+
+def _dst1(y):
+    """DST-I as FFT of the odd extension of `y` of length ``2*(N+1)``."""
+    n = y.shape[-1]
+    zero = dpnp.zeros_like(y[..., :1])
+    z = dpnp.concatenate((zero, y, zero, -y[..., ::-1]), axis=-1)
+    return -dpnp.fft.rfft(z).imag[..., 1 : n + 1]
+
+
+def _dct2(y):
+    """DCT-II as FFT of the reordered `y` of the same length (Makhoul)."""
+    n = y.shape[-1]
+    v = dpnp.concatenate((y[..., ::2], y[..., 1::2][..., ::-1]), axis=-1)
+    v = dpnp.fft.rfft(v)
+    # restore the second half of the spectrum from Hermitian symmetry
+    v = dpnp.concatenate(
+        (v, dpnp.conjugate(v[..., 1 : (n + 1) // 2][..., ::-1])), axis=-1
+    )
+    v *= dpnp.exp((-0.5j * math.pi / n) * _arange(n, y))
+    res = v.real
+    res *= 2
+    return res
+
+
+def _dct3(y):
+    """DCT-III as inverse FFT of length N, inverse to :func:`_dct2`."""
+    n = y.shape[-1]
+    m = n // 2 + 1
+    # y[N - k] for k = 0, ..., N // 2 with y[N] = 0
+    zero = dpnp.zeros_like(y[..., :1])
+    y_rev = dpnp.concatenate((zero, y[..., ::-1]), axis=-1)
+    v = y[..., :m] - 1j * y_rev[..., :m]
+    v *= dpnp.exp((0.5j * math.pi / n) * _arange(m, y))
+    v = dpnp.fft.irfft(v, n=n)
+
+    # undo the reordering of the input of :func:`_dct2`
+    h = (n + 1) // 2
+    res = dpnp.empty_like(y)
+    res[..., ::2] = v[..., :h]
+    res[..., 1::2] = v[..., h:][..., ::-1]
+    res *= n
+    return res
+
+
+def _dx4(y, dst):
+    """DCT-IV or DST-IV as FFT of the modulated `y` of length ``2*N``."""
+    n = y.shape[-1]
+    k = _arange(n, y)
+    v = y * dpnp.exp((-0.5j * math.pi / n) * k)
+    v = dpnp.fft.fft(v, n=2 * n)[..., :n]
+    v *= dpnp.exp((-0.25j * math.pi / n) * (2 * k + 1))
+    res = v.imag if dst else v.real
+    res *= -2 if dst else 2
+    return res
+
+
+def _resize(x, n, axis):
+    """Truncate or zero-pad `x` along `axis` to length `n`."""
+
+    m = x.shape[axis]
+    index = [slice(None)] * x.ndim
+    if n <= m:
+        index[axis] = slice(0, n)
+        return x[tuple(index)], False
+
+    shape = list(x.shape)
+    shape[axis] = n
+    res = dpnp.zeros_like(x, shape=shape)
+    index[axis] = slice(0, m)
+    res[tuple(index)] = x
+    return res, True
+
+
+def _r2r(x, type, n, axis, norm, overwrite_x, orthogonalize, dst, inverse):
+    """Compute DCT or DST of `x` along `axis`."""
+
+    dpnp.check_supported_arrays_type(x)
+    if type not in _INVERSE_TYPE:
+        raise ValueError(f"invalid {'DST' if dst else 'DCT'} type")
+    if norm not in (None, "backward", "ortho", "forward"):
+        raise ValueError(
+            f"Invalid norm value {norm}; should be None, "
+            '"ortho", "forward", or "backward".'
+        )
+    if x.ndim == 0:
+        raise ValueError("Input array must be at least 1D")
+
+    if dpnp.issubdtype(x.dtype, dpnp.complexfloating):
+        # the real and imaginary parts are transformed separately
+        args = (type, n, axis, norm, overwrite_x, orthogonalize, dst, inverse)
+        res_real = _r2r(x.real, *args)
+        res = dpnp.empty_like(res_real, dtype=x.dtype)
+        res.real = res_real
+        res.imag = _r2r(x.imag, *args)
+        return res
+
+    axis = normalize_axis_index(axis, x.ndim)
+    # whether `x` is a temporary array which can be modified in-place
+    owned = overwrite_x
+    if x.dtype not in (dpnp.float32, dpnp.float64):
+        if x.dtype == dpnp.float16:
+            dtype = dpnp.float32
+        else:
+            dtype = map_dtype_to_device(dpnp.float64, x.sycl_device)
+        x = x.astype(dtype)
+        owned = True
+
+    if n is not None:
+        if not isinstance(n, int):
+            raise TypeError("`n` should be None or an integer")
+        if n < 1:
+            raise ValueError(f"invalid number of data points ({n}) specified")
+        x, padded = _resize(x, n, axis)
+        owned |= padded
+
+    n = x.shape[axis]
+    if inverse:
+        type = _INVERSE_TYPE[type]
+    if type == 1 and not dst and n < 2:
+        raise ValueError("DCT-I is not defined for size < 2")
+    if orthogonalize is None:
+        orthogonalize = norm == "ortho"
+
+    y = dpnp.moveaxis(x, axis, -1)
+    sqrt2 = math.sqrt(2)
+    if orthogonalize and type in (1, 3) and not (dst and type == 1):
+        if not owned:
+            y = y.copy()
+            owned = True
+        if dst:
+            y[..., -1] *= sqrt2
+        else:
+            y[..., 0] *= sqrt2
+            if type == 1:
+                y[..., -1] *= sqrt2
+
+    if type == 1:
+        res = _dst1(y) if dst else _dct1(y)
+    elif type == 2:
+        if dst:
+            # DST-II(y)[k] = DCT-II(y * (-1)**n)[N - 1 - k]
+            if not owned:
+                y = y.copy()
+            y[..., 1::2] *= -1
+            res = _dct2(y)[..., ::-1]
+        else:
+            res = _dct2(y)
+    elif type == 3:
+        if dst:
+            # DST-III(y)[k] = (-1)**k * DCT-III(y[::-1])[k]
+            res = _dct3(y[..., ::-1])
+            res[..., 1::2] *= -1
+        else:
+            res = _dct3(y)
+    else:
+        res = _dx4(y, dst)
+
+    if orthogonalize and type in (1, 2) and not (dst and type == 1):
+        if dst:
+            res[..., -1] /= sqrt2
+        else:
+            res[..., 0] /= sqrt2
+            if type == 1:
+                res[..., -1] /= sqrt2
+
+    if type == 1:
+        scale = 2 * (n + 1) if dst else 2 * (n - 1)
+    else:
+        scale = 2 * n
+    if norm == "ortho":
+        res /= math.sqrt(scale)
+    elif (norm == "forward") != inverse:
+        res /= scale
+
+    return dpnp.moveaxis(res, -1, axis)
+
+
+def _r2rn(x, type, s, axes, norm, overwrite_x, orthogonalize, dst, inverse):
+    """Compute N-D DCT or DST of `x` over `axes`."""
+
+    dpnp.check_supported_arrays_type(x)
+    if s is not None and not isinstance(s, Sequence):
+        s = (s,)
+    if axes is None:
+        axes = range(x.ndim) if s is None else range(-len(s), 0)
+    axes = normalize_axis_tuple(axes, x.ndim, "axes")
+    if s is None:
+        s = [None] * len(axes)
+    elif len(s) != len(axes):
+        raise ValueError(
+            "When given, axes and shape arguments have to be of the same "
+            "length"
+        )
+
+    for n, axis in zip(s, axes):
+        x = _r2r(
+            x, type, n, axis, norm, overwrite_x, orthogonalize, dst, inverse
+        )
+        # the result of the previous pass is a temporary array
+        overwrite_x = True
+    return x
+
+
+def dct(
+    x,
+    type=2,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    orthogonalize=None,
+):
+    """
+    Return the Discrete Cosine Transform of an arbitrary type sequence.
+
+    For full documentation refer to :obj:`scipy.fft.dct`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the DCT (see Notes).
+
+        Default: ``2``.
+    n : {None, int}, optional
+        Length of the transform. If ``n < x.shape[axis]``, `x` is truncated.
+        If ``n > x.shape[axis]``, `x` is zero-padded.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis along which the DCT is computed.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see Notes). ``None`` is an alias of the default
+        option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DCT variant (see Notes). If
+        ``None``, it is ``True`` when ``norm="ortho"`` and ``False``
+        otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.idct` : The inverse DCT.
+    :obj:`dpnp.scipy.fft.dctn` : The *N*-D DCT.
+
+    Notes
+    -----
+    For a single dimension array `x` of length `N` and
+    ``norm="backward"``, the transforms are defined as
+
+    * type 1: ``y[k] = x[0] + (-1)**k x[N-1] +
+      2 * sum(x[n] * cos(pi * k * n / (N-1)), n=1..N-2)``
+    * type 2: ``y[k] = 2 * sum(x[n] * cos(pi * k * (2n+1) / (2N)), n=0..N-1)``
+    * type 3: ``y[k] = x[0] + 2 * sum(x[n] * cos(pi * (2k+1) * n / (2N)),
+      n=1..N-1)``
+    * type 4: ``y[k] = 2 * sum(x[n] * cos(pi * (2k+1) * (2n+1) / (4N)),
+      n=0..N-1)``
+
+    The inverse of the transform of type 1, 2, 3 and 4 is the transform of
+    type 1, 3, 2 and 4, respectively, up to the factor ``2*(N-1)`` for type 1
+    and ``2*N`` for the other types, which is applied by the forward
+    transform with ``norm="forward"``, by the inverse transform with
+    ``norm="backward"`` and split symmetrically with ``norm="ortho"``. With
+    ``norm="ortho"`` and orthogonalization, ``x[0]`` (and ``x[N-1]`` for
+    type 1) is multiplied by ``sqrt(2)`` for types 1 and 3, and ``y[0]``
+    (and ``y[N-1]`` for type 1) is divided by ``sqrt(2)`` for types 1 and 2,
+    which makes the transform orthogonal.
+
+    Types 1 and 2 are computed by a real-to-complex FFT of the even extension
+    and of the reordered input, respectively, type 3 by a complex-to-real FFT
+    of the same length and type 4 by a complex-to-complex FFT of twice the
+    length.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.array([4.0, 3.0, 5.0, 10.0])
+    >>> sp.fft.dct(x, norm="ortho")
+    array([11.        , -4.46088499,  3.        , -0.31702534])
+    >>> sp.fft.idct(sp.fft.dct(x))
+    array([ 4.,  3.,  5., 10.])
+
+    """
+
+    return _r2r(
+        x,
+        type,
+        n,
+        axis,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=False,
+        inverse=False,
+    )
+
+
+def dctn(
+    x,
+    type=2,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    orthogonalize=None,
+):
+    """
+    Return the multidimensional Discrete Cosine Transform
+    along the specified axes.
+
+    For full documentation refer to :obj:`scipy.fft.dctn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the DCT (see :obj:`dpnp.scipy.fft.dct`).
+
+        Default: ``2``.
+    s : {None, int, sequence of ints}, optional
+        The shape of the result. If both `s` and `axes` are ``None``, `s` is
+        ``x.shape``; if `s` is ``None`` but `axes` is not ``None``, then `s`
+        is ``numpy.take(x.shape, axes, axis=0)``. If ``s[i] > x.shape[i]``,
+        the i-th dimension of the input is padded with zeros. If
+        ``s[i] < x.shape[i]``, the i-th dimension of the input is truncated.
+
+        Default: ``None``.
+    axes : {None, int, sequence of ints}, optional
+        Axes over which the DCT is computed. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.scipy.fft.dct`). ``None`` is an
+        alias of the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DCT variant (see
+        :obj:`dpnp.scipy.fft.dct`). If ``None``, it is ``True`` when
+        ``norm="ortho"`` and ``False`` otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.idctn` : The inverse *N*-D DCT.
+    :obj:`dpnp.scipy.fft.dct` : The one-dimensional DCT.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.random.randn(16, 16)
+    >>> y = sp.fft.dctn(x)
+    >>> np.allclose(x, sp.fft.idctn(y))
+    array(True)
+
+    """
+
+    return _r2rn(
+        x,
+        type,
+        s,
+        axes,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=False,
+        inverse=False,
+    )
+
+
+def dst(
+    x,
+    type=2,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    orthogonalize=None,
+):
+    """
+    Return the Discrete Sine Transform of an arbitrary type sequence.
+
+    For full documentation refer to :obj:`scipy.fft.dst`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the DST (see Notes).
+
+        Default: ``2``.
+    n : {None, int}, optional
+        Length of the transform. If ``n < x.shape[axis]``, `x` is truncated.
+        If ``n > x.shape[axis]``, `x` is zero-padded.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis along which the DST is computed.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see Notes). ``None`` is an alias of the default
+        option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DST variant (see Notes). If
+        ``None``, it is ``True`` when ``norm="ortho"`` and ``False``
+        otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.idst` : The inverse DST.
+    :obj:`dpnp.scipy.fft.dstn` : The *N*-D DST.
+
+    Notes
+    -----
+    For a single dimension array `x` of length `N` and
+    ``norm="backward"``, the transforms are defined as
+
+    * type 1: ``y[k] = 2 * sum(x[n] * sin(pi * (k+1) * (n+1) / (N+1)),
+      n=0..N-1)``
+    * type 2: ``y[k] = 2 * sum(x[n] * sin(pi * (k+1) * (2n+1) / (2N)),
+      n=0..N-1)``
+    * type 3: ``y[k] = (-1)**k x[N-1] + 2 * sum(x[n] * sin(pi * (2k+1) *
+      (n+1) / (2N)), n=0..N-2)``
+    * type 4: ``y[k] = 2 * sum(x[n] * sin(pi * (2k+1) * (2n+1) / (4N)),
+      n=0..N-1)``
+
+    The inverse of the transform of type 1, 2, 3 and 4 is the transform of
+    type 1, 3, 2 and 4, respectively, up to the factor ``2*(N+1)`` for type 1
+    and ``2*N`` for the other types, which is applied by the forward
+    transform with ``norm="forward"``, by the inverse transform with
+    ``norm="backward"`` and split symmetrically with ``norm="ortho"``. With
+    ``norm="ortho"`` and orthogonalization, ``x[N-1]`` is multiplied by
+    ``sqrt(2)`` for type 3 and ``y[N-1]`` is divided by ``sqrt(2)`` for
+    type 2, which makes the transform orthogonal.
+
+    The transforms are computed through the discrete cosine transforms of
+    the same type applied to the input with alternating signs or in reversed
+    order.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.array([4.0, 3.0, 5.0, 10.0])
+    >>> y = sp.fft.dst(x, type=4)
+    >>> np.allclose(sp.fft.idst(y, type=4), x)
+    array(True)
+
+    """
+
+    return _r2r(
+        x,
+        type,
+        n,
+        axis,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=True,
+        inverse=False,
+    )
+
+
+def dstn(
+    x,
+    type=2,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    orthogonalize=None,
+):
+    """
+    Return the multidimensional Discrete Sine Transform
+    along the specified axes.
+
+    For full documentation refer to :obj:`scipy.fft.dstn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the DST (see :obj:`dpnp.scipy.fft.dst`).
+
+        Default: ``2``.
+    s : {None, int, sequence of ints}, optional
+        The shape of the result. If both `s` and `axes` are ``None``, `s` is
+        ``x.shape``; if `s` is ``None`` but `axes` is not ``None``, then `s`
+        is ``numpy.take(x.shape, axes, axis=0)``. If ``s[i] > x.shape[i]``,
+        the i-th dimension of the input is padded with zeros. If
+        ``s[i] < x.shape[i]``, the i-th dimension of the input is truncated.
+
+        Default: ``None``.
+    axes : {None, int, sequence of ints}, optional
+        Axes over which the DST is computed. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.scipy.fft.dst`). ``None`` is an
+        alias of the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DST variant (see
+        :obj:`dpnp.scipy.fft.dst`). If ``None``, it is ``True`` when
+        ``norm="ortho"`` and ``False`` otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.idstn` : The inverse *N*-D DST.
+    :obj:`dpnp.scipy.fft.dst` : The one-dimensional DST.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.random.randn(16, 16)
+    >>> y = sp.fft.dstn(x, type=1)
+    >>> np.allclose(x, sp.fft.idstn(y, type=1))
+    array(True)
+
+    """
+
+    return _r2rn(
+        x,
+        type,
+        s,
+        axes,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=True,
+        inverse=False,
+    )
+
+
+def idct(
+    x,
+    type=2,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    orthogonalize=None,
+):
+    """
+    Return the Inverse Discrete Cosine Transform of an arbitrary type sequence.
+
+    For full documentation refer to :obj:`scipy.fft.idct`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the inverse DCT (see Notes).
+
+        Default: ``2``.
+    n : {None, int}, optional
+        Length of the transform. If ``n < x.shape[axis]``, `x` is truncated.
+        If ``n > x.shape[axis]``, `x` is zero-padded.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis along which the inverse DCT is computed.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see Notes). ``None`` is an alias of the default
+        option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DCT variant (see Notes). If
+        ``None``, it is ``True`` when ``norm="ortho"`` and ``False``
+        otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.dct` : The forward DCT.
+    :obj:`dpnp.scipy.fft.idctn` : The *N*-D inverse DCT.
+
+    Notes
+    -----
+    For a single dimension array `x` of length `N` and
+    ``norm="backward"``, the transforms are defined as
+
+    * type 1: ``y[k] = x[0] + (-1)**k x[N-1] +
+      2 * sum(x[n] * cos(pi * k * n / (N-1)), n=1..N-2)``
+    * type 2: ``y[k] = 2 * sum(x[n] * cos(pi * k * (2n+1) / (2N)), n=0..N-1)``
+    * type 3: ``y[k] = x[0] + 2 * sum(x[n] * cos(pi * (2k+1) * n / (2N)),
+      n=1..N-1)``
+    * type 4: ``y[k] = 2 * sum(x[n] * cos(pi * (2k+1) * (2n+1) / (4N)),
+      n=0..N-1)``
+
+    The inverse of the transform of type 1, 2, 3 and 4 is the transform of
+    type 1, 3, 2 and 4, respectively, up to the factor ``2*(N-1)`` for type 1
+    and ``2*N`` for the other types, which is applied by the forward
+    transform with ``norm="forward"``, by the inverse transform with
+    ``norm="backward"`` and split symmetrically with ``norm="ortho"``. With
+    ``norm="ortho"`` and orthogonalization, ``x[0]`` (and ``x[N-1]`` for
+    type 1) is multiplied by ``sqrt(2)`` for types 1 and 3, and ``y[0]``
+    (and ``y[N-1]`` for type 1) is divided by ``sqrt(2)`` for types 1 and 2,
+    which makes the transform orthogonal.
+
+    Types 1 and 2 are computed by a real-to-complex FFT of the even extension
+    and of the reordered input, respectively, type 3 by a complex-to-real FFT
+    of the same length and type 4 by a complex-to-complex FFT of twice the
+    length.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.array([4.0, 3.0, 5.0, 10.0])
+    >>> sp.fft.idct(sp.fft.dct(x, type=3), type=3)
+    array([ 4.,  3.,  5., 10.])
+
+    """
+
+    return _r2r(
+        x,
+        type,
+        n,
+        axis,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=False,
+        inverse=True,
+    )
+
+
+def idctn(
+    x,
+    type=2,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    orthogonalize=None,
+):
+    """
+    Return the multidimensional inverse Discrete Cosine Transform
+    along the specified axes.
+
+    For full documentation refer to :obj:`scipy.fft.idctn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the inverse DCT (see :obj:`dpnp.scipy.fft.dct`).
+
+        Default: ``2``.
+    s : {None, int, sequence of ints}, optional
+        The shape of the result. If both `s` and `axes` are ``None``, `s` is
+        ``x.shape``; if `s` is ``None`` but `axes` is not ``None``, then `s`
+        is ``numpy.take(x.shape, axes, axis=0)``. If ``s[i] > x.shape[i]``,
+        the i-th dimension of the input is padded with zeros. If
+        ``s[i] < x.shape[i]``, the i-th dimension of the input is truncated.
+
+        Default: ``None``.
+    axes : {None, int, sequence of ints}, optional
+        Axes over which the inverse DCT is computed. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.scipy.fft.dct`). ``None`` is an
+        alias of the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DCT variant (see
+        :obj:`dpnp.scipy.fft.dct`). If ``None``, it is ``True`` when
+        ``norm="ortho"`` and ``False`` otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.dctn` : The forward *N*-D DCT.
+    :obj:`dpnp.scipy.fft.idct` : The one-dimensional inverse DCT.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.random.randn(16, 16)
+    >>> y = sp.fft.idctn(x, norm="ortho")
+    >>> np.allclose(x, sp.fft.dctn(y, norm="ortho"))
+    array(True)
+
+    """
+
+    return _r2rn(
+        x,
+        type,
+        s,
+        axes,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=False,
+        inverse=True,
+    )
+
+
+def idst(
+    x,
+    type=2,
+    n=None,
+    axis=-1,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    orthogonalize=None,
+):
+    """
+    Return the Inverse Discrete Sine Transform of an arbitrary type sequence.
+
+    For full documentation refer to :obj:`scipy.fft.idst`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the inverse DST (see Notes).
+
+        Default: ``2``.
+    n : {None, int}, optional
+        Length of the transform. If ``n < x.shape[axis]``, `x` is truncated.
+        If ``n > x.shape[axis]``, `x` is zero-padded.
+
+        Default: ``None``.
+    axis : int, optional
+        Axis along which the inverse DST is computed.
+
+        Default: ``-1``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see Notes). ``None`` is an alias of the default
+        option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DST variant (see Notes). If
+        ``None``, it is ``True`` when ``norm="ortho"`` and ``False``
+        otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.dst` : The forward DST.
+    :obj:`dpnp.scipy.fft.idstn` : The *N*-D inverse DST.
+
+    Notes
+    -----
+    For a single dimension array `x` of length `N` and
+    ``norm="backward"``, the transforms are defined as
+
+    * type 1: ``y[k] = 2 * sum(x[n] * sin(pi * (k+1) * (n+1) / (N+1)),
+      n=0..N-1)``
+    * type 2: ``y[k] = 2 * sum(x[n] * sin(pi * (k+1) * (2n+1) / (2N)),
+      n=0..N-1)``
+    * type 3: ``y[k] = (-1)**k x[N-1] + 2 * sum(x[n] * sin(pi * (2k+1) *
+      (n+1) / (2N)), n=0..N-2)``
+    * type 4: ``y[k] = 2 * sum(x[n] * sin(pi * (2k+1) * (2n+1) / (4N)),
+      n=0..N-1)``
+
+    The inverse of the transform of type 1, 2, 3 and 4 is the transform of
+    type 1, 3, 2 and 4, respectively, up to the factor ``2*(N+1)`` for type 1
+    and ``2*N`` for the other types, which is applied by the forward
+    transform with ``norm="forward"``, by the inverse transform with
+    ``norm="backward"`` and split symmetrically with ``norm="ortho"``. With
+    ``norm="ortho"`` and orthogonalization, ``x[N-1]`` is multiplied by
+    ``sqrt(2)`` for type 3 and ``y[N-1]`` is divided by ``sqrt(2)`` for
+    type 2, which makes the transform orthogonal.
+
+    The transforms are computed through the discrete cosine transforms of
+    the same type applied to the input with alternating signs or in reversed
+    order.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.array([4.0, 3.0, 5.0, 10.0])
+    >>> y = sp.fft.dst(x, norm="ortho")
+    >>> np.allclose(sp.fft.idst(y, norm="ortho"), x)
+    array(True)
+
+    """
+
+    return _r2r(
+        x,
+        type,
+        n,
+        axis,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=True,
+        inverse=True,
+    )
+
+
+def idstn(
+    x,
+    type=2,
+    s=None,
+    axes=None,
+    norm=None,
+    overwrite_x=False,
+    workers=None,
+    *,
+    orthogonalize=None,
+):
+    """
+    Return the multidimensional inverse Discrete Sine Transform
+    along the specified axes.
+
+    For full documentation refer to :obj:`scipy.fft.idstn`.
+
+    Parameters
+    ----------
+    x : {dpnp.ndarray, usm_ndarray}
+        The input array.
+    type : {1, 2, 3, 4}, optional
+        Type of the inverse DST (see :obj:`dpnp.scipy.fft.dst`).
+
+        Default: ``2``.
+    s : {None, int, sequence of ints}, optional
+        The shape of the result. If both `s` and `axes` are ``None``, `s` is
+        ``x.shape``; if `s` is ``None`` but `axes` is not ``None``, then `s`
+        is ``numpy.take(x.shape, axes, axis=0)``. If ``s[i] > x.shape[i]``,
+        the i-th dimension of the input is padded with zeros. If
+        ``s[i] < x.shape[i]``, the i-th dimension of the input is truncated.
+
+        Default: ``None``.
+    axes : {None, int, sequence of ints}, optional
+        Axes over which the inverse DST is computed. If not given, the last
+        ``len(s)`` axes are used, or all axes if `s` is also not specified.
+
+        Default: ``None``.
+    norm : {None, "backward", "ortho", "forward"}, optional
+        Normalization mode (see :obj:`dpnp.scipy.fft.dst`). ``None`` is an
+        alias of the default option ``"backward"``.
+
+        Default: ``"backward"``.
+    overwrite_x : bool, optional
+        If ``True``, the contents of `x` can be destroyed.
+
+        Default: ``False``.
+    workers : {None, int}, optional
+        Maximum number of workers to use for parallel computation. It is
+        accepted for compatibility with SciPy and ignored, the computation is
+        parallelized by the SYCL device the input array is allocated on.
+
+        Default: ``None``.
+    orthogonalize : {None, bool}, optional
+        Whether to use the orthogonalized DST variant (see
+        :obj:`dpnp.scipy.fft.dst`). If ``None``, it is ``True`` when
+        ``norm="ortho"`` and ``False`` otherwise.
+
+        Default: ``None``.
+
+    Returns
+    -------
+    out : dpnp.ndarray
+        The transformed input array of the real floating data type of the
+        input, or of the default real floating data type if the input is
+        integer. Complex input is transformed by its real and imaginary
+        parts and gives a complex result.
+
+    See Also
+    --------
+    :obj:`dpnp.scipy.fft.dstn` : The forward *N*-D DST.
+    :obj:`dpnp.scipy.fft.idst` : The one-dimensional inverse DST.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> import dpnp.scipy as sp
+    >>> x = np.random.randn(16, 16)
+    >>> y = sp.fft.idstn(x, axes=1)
+    >>> np.allclose(x, sp.fft.dstn(y, axes=1))
+    array(True)
+
+    """
+
+    return _r2rn(
+        x,
+        type,
+        s,
+        axes,
+        norm,
+        overwrite_x,
+        orthogonalize,
+        dst=True,
+        inverse=True,
+    )
@@ -0,0 +1,154 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Interface of the SciPy-compatible basic linear algebra routines for DPNP.
+
+Notes
+-----
+This module exposes the public API for ``dpnp.scipy.linalg``.
+It contains:
+ - SciPy-like interface functions
+ - documentation for the functions
+
+"""
+
+import dpnp
+from dpnp.linalg.dpnp_utils_linalg import (
+    assert_stacked_2d,
+    assert_stacked_square,
+)
+
+from ._utils import dpnp_solve_triangular
+
+_trans_codes = {"N": 0, "T": 1, "C": 2}
+
+
+def solve_triangular(
+    a,
+    b,
+    trans=0,
+    lower=False,
+    unit_diagonal=False,
+    overwrite_b=False,
+    check_finite=True,
+):
+    """
+    Solve the equation :math:`a x = b` for `x`, assuming `a` is a triangular
+    matrix.
+
+    For full documentation refer to :obj:`scipy.linalg.solve_triangular`.
+
+    Parameters
+    ----------
+    a : (..., M, M) {dpnp.ndarray, usm_ndarray}
+        A triangular matrix.
+    b : {(M,), (..., M, K)} {dpnp.ndarray, usm_ndarray}
+        Right-hand side matrix in :math:`a x = b`.
+    trans : {0, 1, 2, "N", "T", "C"}, optional
+        Type of system to solve:
+
+        ========  =================
+        trans     system
+        ========  =================
+        0 or "N"  :math:`a x = b`
+        1 or "T"  :math:`a^T x = b`
+        2 or "C"  :math:`a^H x = b`
+        ========  =================
+
+        Default: ``0``.
+    lower : bool, optional
+        Use only data contained in the lower triangle of `a`.
+
+        Default: ``False``.
+    unit_diagonal : bool, optional
+        If ``True``, diagonal elements of `a` are assumed to be 1 and will
+        not be referenced.
+
+        Default: ``False``.
+    overwrite_b : bool, optional
+        Whether to overwrite data in `b` (may increase performance).
+
+        Default: ``False``.
+    check_finite : bool, optional
+        Whether to check that the input matrices contain only finite numbers.
+        Disabling may give a performance gain, but may result in problems
+        (crashes, non-termination) if the inputs do contain infinities or NaNs.
+
+        Default: ``True``.
+
+    Returns
+    -------
+    x : {(M,), (..., M, K)} dpnp.ndarray
+        Solution to the system :math:`a x = b`. Shape of the return matches
+        the broadcasted shape of `b`.
+
+    Raises
+    ------
+    dpnp.linalg.LinAlgError
+        If `a` is singular.
+
+    Warnings
+    --------
+    This function synchronizes in order to validate array elements
+    when ``check_finite=True`` and to check the diagonal of `a` for zeros
+    when ``unit_diagonal=False``.
+
+    See Also
+    --------
+    :func:`dpnp.scipy.linalg.lu_solve` : Solve an equation system using
+                                         the LU factorization of a matrix.
+    :obj:`dpnp.linalg.solve` : Solve a linear matrix equation.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> a = np.array([[3, 0, 0, 0], [2, 1, 0, 0], [1, 0, 1, 0], [1, 1, 1, 1]])
+    >>> b = np.array([4, 2, 4, 2])
+    >>> x = np.scipy.linalg.solve_triangular(a, b, lower=True)
+    >>> x
+    array([ 1.33333333, -0.66666667,  2.66666667, -1.33333333])
+    >>> a @ x  # Check the result
+    array([4., 2., 4., 2.])
+
+    """
+
+    dpnp.check_supported_arrays_type(a, b)
+    assert_stacked_2d(a)
+    assert_stacked_square(a)
+
+    return dpnp_solve_triangular(
+        a,
+        b,
+        trans=_trans_codes.get(trans, trans),
+        lower=lower,
+        unit_diagonal=unit_diagonal,
+        overwrite_b=overwrite_b,
+        check_finite=check_finite,
+    )
@@ -0,0 +1,185 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Interface of the SciPy-compatible Cholesky decomposition for DPNP.
+
+Notes
+-----
+This module exposes the public API for ``dpnp.scipy.linalg``.
+It contains:
+ - SciPy-like interface functions
+ - documentation for the functions
+
+"""
+
+import dpnp
+from dpnp.linalg.dpnp_utils_linalg import (
+    assert_stacked_2d,
+    assert_stacked_square,
+)
+
+from ._utils import (
+    dpnp_cho_factor,
+    dpnp_cho_solve,
+)
+
+
+def cho_factor(a, lower=False, overwrite_a=False, check_finite=True):
+    """
+    Compute the Cholesky decomposition of a matrix, to use in
+    :obj:`dpnp.scipy.linalg.cho_solve`.
+
+    For full documentation refer to :obj:`scipy.linalg.cho_factor`.
+
+    Parameters
+    ----------
+    a : (..., M, M) {dpnp.ndarray, usm_ndarray}
+        Hermitian positive-definite matrix to be decomposed.
+    lower : bool, optional
+        Whether to compute the upper or lower triangular Cholesky
+        factorization.
+
+        Default: ``False``.
+    overwrite_a : bool, optional
+        Whether to overwrite data in `a` (may increase performance).
+        Currently ignored.
+
+        Default: ``False``.
+    check_finite : bool, optional
+        Whether to check that the input matrix contains only finite numbers.
+        Disabling may give a performance gain, but may result in problems
+        (crashes, non-termination) if the inputs do contain infinities or NaNs.
+
+        Default: ``True``.
+
+    Returns
+    -------
+    c : (..., M, M) dpnp.ndarray
+        Matrix whose upper or lower triangle contains the Cholesky factor
+        of `a`. The other triangle is zeroed.
+    lower : bool
+        Flag indicating whether the factor is in the lower or upper triangle.
+
+    Warnings
+    --------
+    This function synchronizes in order to validate array elements
+    when ``check_finite=True``.
+
+    See Also
+    --------
+    :func:`dpnp.scipy.linalg.cho_solve` : Solve a linear set equations using
+                                          the Cholesky factorization of
+                                          a matrix.
+    :obj:`dpnp.linalg.cholesky` : Cholesky decomposition.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> A = np.array([[9, 3, 1, 5], [3, 7, 5, 1], [1, 5, 9, 2], [5, 1, 2, 6]])
+    >>> c, low = np.scipy.linalg.cho_factor(A)
+    >>> np.allclose(c.T @ c, A)
+    array(True)
+
+    """
+
+    dpnp.check_supported_arrays_type(a)
+    assert_stacked_2d(a)
+    assert_stacked_square(a)
+
+    return dpnp_cho_factor(
+        a,
+        lower=lower,
+        overwrite_a=overwrite_a,
+        check_finite=check_finite,
+    )
+
+
+def cho_solve(c_and_lower, b, overwrite_b=False, check_finite=True):
+    """
+    Solve the linear equations :math:`a x = b`, given the Cholesky
+    factorization of `a`.
+
+    For full documentation refer to :obj:`scipy.linalg.cho_solve`.
+
+    Parameters
+    ----------
+    c, lower : {tuple of dpnp.ndarray or usm_ndarray and bool}
+        Cholesky factorization of matrix `a` (..., M, M), as given by
+        :obj:`dpnp.scipy.linalg.cho_factor`.
+    b : {(M,), (..., M, K)} {dpnp.ndarray, usm_ndarray}
+        Right-hand side.
+    overwrite_b : bool, optional
+        Whether to overwrite data in `b` (may increase performance).
+
+        Default: ``False``.
+    check_finite : bool, optional
+        Whether to check that the input matrices contain only finite numbers.
+        Disabling may give a performance gain, but may result in problems
+        (crashes, non-termination) if the inputs do contain infinities or NaNs.
+
+        Default: ``True``.
+
+    Returns
+    -------
+    x : {(M,), (..., M, K)} dpnp.ndarray
+        The solution to the system :math:`a x = b`.
+
+    Warnings
+    --------
+    This function synchronizes in order to validate array elements
+    when ``check_finite=True``.
+
+    See Also
+    --------
+    :func:`dpnp.scipy.linalg.cho_factor` : Cholesky factorization of a matrix.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> A = np.array([[9, 3, 1, 5], [3, 7, 5, 1], [1, 5, 9, 2], [5, 1, 2, 6]])
+    >>> c, low = np.scipy.linalg.cho_factor(A)
+    >>> x = np.scipy.linalg.cho_solve((c, low), np.array([1, 1, 1, 1]))
+    >>> np.allclose(A @ x - np.array([1, 1, 1, 1]), np.zeros(4))
+    array(True)
+
+    """
+
+    c, lower = c_and_lower
+    dpnp.check_supported_arrays_type(c, b)
+    assert_stacked_2d(c)
+    assert_stacked_square(c)
+
+    return dpnp_cho_solve(
+        c,
+        lower,
+        b,
+        overwrite_b=overwrite_b,
+        check_finite=check_finite,
+    )
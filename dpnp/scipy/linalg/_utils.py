@@ -49,7 +49,12 @@ import dpctl.utils as dpu
 import dpnp
 import dpnp.backend.extensions.lapack._lapack_impl as li
 from dpnp.dpnp_utils import get_usm_allocations
-from dpnp.linalg.dpnp_utils_linalg import _common_type, _real_type
+from dpnp.linalg.dpnp_utils_linalg import (
+    _common_type,
+    _real_type,
+    _use_getrf_batch,
+    dpnp_cholesky,
+)
 
 
 def _align_lu_solve_broadcast(lu, b):
@@ -128,17 +133,13 @@ def _apply_permutation_to_rows(mat, perm_indices):
 def _batched_lu_factor_scipy(a, res_type):  # pylint: disable=too-many-locals
     """SciPy-compatible LU factorization for batched inputs."""
 
-    # TODO: Find out at which array sizes the best performance is obtained
-    # getrf_batch can be slow on large GPU arrays.
-    # Use getrf_batch only on CPU.
-    # On GPU fall back to calling getrf per 2D slice.
-    use_batch = a.sycl_device.has_aspect_cpu
+    m, n = a.shape[-2:]
+    use_batch = _use_getrf_batch(a.sycl_device, max(m, n))
 
     a_sycl_queue = a.sycl_queue
     a_usm_type = a.usm_type
     _manager = dpu.SequentialOrderManager[a_sycl_queue]
 
-    m, n = a.shape[-2:]
     k = min(m, n)
     orig_shape = a.shape
     batch_shape = orig_shape[:-2]
@@ -349,6 +350,31 @@ def _batched_lu_solve(lu, piv, b, res_type, trans=0):
     return b_h
 
 
+def _check_triangular_solve_shapes(a, b):
+    """Check that `a` and `b` are compatible for a triangular solve."""
+    n = b.shape[0] if b.ndim == 1 else b.shape[-2]
+    if a.shape[-1] != n:
+        raise ValueError(
+            f"shapes of a {a.shape} and b {b.shape} are incompatible"
+        )
+
+
+def _identity_pivots(lu):
+    """
+    Return 0-based pivot indices of the identity permutation broadcasted to
+    the batch shape of `lu`.
+
+    """
+
+    piv = dpnp.arange(
+        lu.shape[-1],
+        dtype=dpnp.int64,
+        usm_type=lu.usm_type,
+        sycl_queue=lu.sycl_queue,
+    )
+    return dpnp.broadcast_to(piv, lu.shape[:-1])
+
+
 def _is_copy_required(a, res_type):
     """
     Determine if `a` needs to be copied before LU decomposition.
@@ -788,3 +814,143 @@ def dpnp_lu_solve(lu, piv, b, trans=0, overwrite_b=False, check_finite=True):
     _manager.add_event_pair(ht_ev, getrs_ev)
 
     return b_h
+
+
+def dpnp_cho_factor(a, lower=False, overwrite_a=False, check_finite=True):
+    """
+    dpnp_cho_factor(a, lower=False, overwrite_a=False, check_finite=True)
+
+    Compute the Cholesky decomposition of a matrix (SciPy-compatible
+    behavior).
+
+    This function mimics the behavior of `scipy.linalg.cho_factor` except
+    that `overwrite_a` is ignored and the unused triangle of the returned
+    factor is zeroed.
+
+    """
+
+    if check_finite:
+        if not dpnp.isfinite(a).all():
+            raise ValueError("array must not contain infs or NaNs")
+
+    return dpnp_cholesky(a, upper=not lower), lower
+
+
+def dpnp_cho_solve(c, lower, b, overwrite_b=False, check_finite=True):
+    """
+    dpnp_cho_solve(c, lower, b, overwrite_b=False, check_finite=True)
+
+    Solve an equation system given the Cholesky factorization of its
+    coefficient matrix (SciPy-compatible behavior).
+
+    """
+
+    res_usm_type, _ = get_usm_allocations([c, b])
+
+    if check_finite:
+        if not dpnp.isfinite(c).all():
+            raise ValueError("array must not contain infs or NaNs")
+        if not dpnp.isfinite(b).all():
+            raise ValueError("array must not contain infs or NaNs")
+
+    _check_triangular_solve_shapes(c, b)
+    c, b = _align_lu_solve_broadcast(c, b)
+
+    if b.size == 0:
+        return dpnp.empty_like(
+            b, dtype=_common_type(c, b), usm_type=res_usm_type
+        )
+
+    if lower:
+        low = dpnp.tril(c)
+    else:
+        low = dpnp.conj(dpnp.swapaxes(dpnp.triu(c), -1, -2))
+
+    # oneMKL LAPACK getrs solves with a unit lower and an upper triangular
+    # factor, so ``a = low @ low^H`` is passed as ``(low / d) @ (d * low^H)``
+    # with `d` the diagonal of `low`, keeping one triangular solve per factor
+    d = dpnp.diagonal(low, axis1=-2, axis2=-1)
+    lu = dpnp.tril(low / d[..., None, :], k=-1)
+    lu += dpnp.triu(d[..., :, None] * dpnp.conj(dpnp.swapaxes(low, -1, -2)))
+
+    return dpnp_lu_solve(
+        lu,
+        _identity_pivots(lu),
+        b,
+        overwrite_b=overwrite_b,
+        check_finite=False,
+    )
+
+
+def dpnp_solve_triangular(
+    a,
+    b,
+    trans=0,
+    lower=False,
+    unit_diagonal=False,
+    overwrite_b=False,
+    check_finite=True,
+):
+    """
+    dpnp_solve_triangular(a, b, trans=0, lower=False, unit_diagonal=False,
+                          overwrite_b=False, check_finite=True)
+
+    Solve an equation system with a triangular coefficient matrix
+    (SciPy-compatible behavior).
+
+    """
+
+    res_usm_type, _ = get_usm_allocations([a, b])
+
+    if check_finite:
+        if not dpnp.isfinite(a).all():
+            raise ValueError("array must not contain infs or NaNs")
+        if not dpnp.isfinite(b).all():
+            raise ValueError("array must not contain infs or NaNs")
+
+    _check_triangular_solve_shapes(a, b)
+    a, b = _align_lu_solve_broadcast(a, b)
+
+    if b.size == 0:
+        return dpnp.empty_like(
+            b, dtype=_common_type(a, b), usm_type=res_usm_type
+        )
+
+    # validate `trans` before it is remapped below
+    _map_trans_to_mkl(trans)
+
+    # oneMKL LAPACK getrs solves with a unit lower and an upper triangular
+    # factor, so the triangular matrix is passed as the upper one together
+    # with identity pivots; a lower triangular matrix is transposed first
+    if lower:
+        a = dpnp.swapaxes(a, -1, -2)
+        if trans == 2:
+            a = dpnp.conj(a)
+            trans = 0
+        else:
+            trans = 1 - trans
+
+    n = a.shape[-1]
+    if unit_diagonal:
+        u = dpnp.triu(a, k=1)
+        u += dpnp.eye(
+            n, dtype=u.dtype, usm_type=u.usm_type, sycl_queue=u.sycl_queue
+        )
+    else:
+        u = dpnp.triu(a)
+        diag = dpnp.diagonal(u, axis1=-2, axis2=-1)
+        singular = (diag == 0).reshape(-1, n).any(axis=0)
+        if singular.any():
+            raise dpnp.linalg.LinAlgError(
+                "singular matrix: resolution failed at diagonal "
+                f"{int(singular.argmax())}"
+            )
+
+    return dpnp_lu_solve(
+        u,
+        _identity_pivots(u),
+        b,
+        trans=trans,
+        overwrite_b=overwrite_b,
+        check_finite=False,
+    )
@@ -0,0 +1,753 @@
+# *****************************************************************************
+# Copyright (c) 2025, Intel Corporation
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# - Redistributions of source code must retain the above copyright notice,
+#   this list of conditions and the following disclaimer.
+# - Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+# - Neither the name of the copyright holder nor the names of its contributors
+#   may be used to endorse or promote products derived from this software
+#   without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF
+# THE POSSIBILITY OF SUCH DAMAGE.
+# *****************************************************************************
+
+
+"""
+Accumulators of statistics over chunked data for DPNP.
+
+Notes
+-----
+This module contains the accumulators exposed in ``dpnp.stats``. Partial
+results of the chunks are combined with the pairwise update formulas of
+Chan, Golub and LeVeque, so the accumulated statistics do not depend on how
+the data set was split, and every update is enqueued on the device without
+a synchronization with the host.
+
+"""
+
+import operator
+
+import dpctl.utils as dpu
+import numpy
+from dpctl.tensor._numpy_helper import normalize_axis_index
+
+import dpnp
+from dpnp.dpnp_iface_histograms import (
+    _get_outer_edges,
+    _histogram_run_native,
+    _ravel_check_a_and_weights,
+)
+
+
+class _OnlineAccumulator:
+    """Base class keeping the allocation placement of an accumulator."""
+
+    def __init__(self, device=None, usm_type=None, sycl_queue=None):
+        dpu.validate_usm_type(usm_type, allow_none=True)
+        self._device = device
+        self._usm_type = usm_type
+        self._sycl_queue = sycl_queue
+        self._count = 0
+
+    @property
+    def count(self):
+        """Number of samples accumulated so far."""
+        return self._count
+
+    def _asarray(self, x):
+        """
+        Return `x` as an array allocated on the queue of the accumulator.
+
+        The queue of the first chunk is used by all the following chunks
+        unless it was specified explicitly at construction.
+
+        """
+
+        x = dpnp.asarray(
+            x,
+            device=self._device,
+            usm_type=self._usm_type,
+            sycl_queue=self._sycl_queue,
+        )
+        self._device = None
+        self._sycl_queue = x.sycl_queue
+        return x
+
+    def _check_merge(self, other):
+        if not isinstance(other, type(self)):
+            raise TypeError(
+                f"An instance of {type(self).__name__} is expected, "
+                f"but got {type(other)}"
+            )
+
+    def _check_not_empty(self):
+        if self._count == 0:
+            raise ValueError("No data has been accumulated")
+
+
+class OnlineMoments(_OnlineAccumulator):
+    """
+    Accumulator of the mean and the variance of chunked data.
+
+    Every call of :meth:`update` reduces a chunk with :obj:`dpnp.mean_var`
+    and combines the result with the previously accumulated moments, so the
+    whole data set never has to be allocated on the device at once.
+
+    Parameters
+    ----------
+    axis : {None, int}, optional
+        Axis along which the chunks are concatenated. The statistics are
+        computed along this axis, while the other dimensions of all chunks
+        must be the same. If ``None``, the chunks are flattened and the
+        statistics are computed over all their elements.
+
+        Default: ``None``.
+    dtype : {None, str, dtype object}, optional
+        Type to use in computing the statistics. By default the type is
+        chosen as by :obj:`dpnp.mean`.
+
+        Default: ``None``.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the chunks which are not
+        allocated on a device yet are copied to.
+
+        Default: ``None``.
+    usm_type : {None, "device", "shared", "host"}, optional
+        The type of SYCL USM allocation for such chunks.
+
+        Default: ``None``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for such chunks.
+
+        Default: ``None``.
+
+    See Also
+    --------
+    :obj:`dpnp.mean_var` : Compute the mean and the variance together.
+    :obj:`dpnp.stats.OnlineCovariance` : Accumulator of a covariance matrix.
+
+    Notes
+    -----
+    If none of `device` and `sycl_queue` is given, the queue of the first
+    chunk is used for all following ones.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> m = np.stats.OnlineMoments(axis=0)
+    >>> for chunk in np.arange(12.0).reshape(3, 2, 2):
+    ...     m = m.update(chunk)
+    >>> m.count
+    6
+    >>> m.mean()
+    array([5., 6.])
+    >>> m.var()
+    array([11.66666667, 11.66666667])
+
+    """
+
+    def __init__(
+        self,
+        axis=None,
+        dtype=None,
+        *,
+        device=None,
+        usm_type=None,
+        sycl_queue=None,
+    ):
+        super().__init__(
+            device=device, usm_type=usm_type, sycl_queue=sycl_queue
+        )
+        self._axis = None if axis is None else operator.index(axis)
+        self._dtype = dtype
+        self._mean = None
+        self._m2 = None
+
+    def update(self, x):
+        """
+        Accumulate the moments of a chunk of data.
+
+        Parameters
+        ----------
+        x : array_like
+            The chunk of data. Arrays allocated on the host are copied to
+            the device.
+
+        Returns
+        -------
+        out : dpnp.stats.OnlineMoments
+            The updated accumulator.
+
+        """
+
+        x = self._asarray(x)
+        if self._axis is None:
+            n = x.size
+        else:
+            n = x.shape[normalize_axis_index(self._axis, x.ndim)]
+
+        if n > 0:
+            mean, var = dpnp.mean_var(x, axis=self._axis, dtype=self._dtype)
+            self._combine(n, mean, var * n)
+        return self
+
+    def merge(self, other):
+        """
+        Merge the moments accumulated by another accumulator.
+
+        Parameters
+        ----------
+        other : dpnp.stats.OnlineMoments
+            The accumulator to merge. It must reduce along the same axis.
+
+        Returns
+        -------
+        out : dpnp.stats.OnlineMoments
+            The updated accumulator.
+
+        """
+
+        self._check_merge(other)
+        if other._axis != self._axis:
+            raise ValueError(
+                "Accumulators reducing along different axes can't be merged"
+            )
+
+        if other._count > 0:
+            self._combine(other._count, other._mean, other._m2)
+        return self
+
+    def _combine(self, n_b, mean_b, m2_b):
+        """Combine the accumulated moments with the ones of another part."""
+
+        if self._count == 0:
+            self._count, self._mean, self._m2 = n_b, mean_b, m2_b
+            return
+
+        if mean_b.shape != self._mean.shape:
+            raise ValueError(
+                f"Chunk of shape {mean_b.shape} after the reduction can't be "
+                f"combined with the accumulated shape {self._mean.shape}"
+            )
+
+        n_a = self._count
+        n = n_a + n_b
+        delta = mean_b - self._mean
+        self._mean = self._mean + delta * (n_b / n)
+        self._m2 = self._m2 + m2_b + dpnp.abs(delta) ** 2 * (n_a * n_b / n)
+        self._count = n
+
+    def mean(self):
+        """
+        Return the arithmetic mean of the accumulated data.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The mean along the accumulation axis.
+
+        """
+
+        self._check_not_empty()
+        return self._mean.copy()
+
+    def var(self, ddof=0):
+        """
+        Return the variance of the accumulated data.
+
+        Parameters
+        ----------
+        ddof : {int, float}, optional
+            Means Delta Degrees of Freedom. The divisor used in calculations
+            is ``N - ddof``, where ``N`` is :attr:`count`.
+
+            Default: ``0``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The variance along the accumulation axis. The variance of complex
+            data is real.
+
+        """
+
+        self._check_not_empty()
+        return self._m2 / max(self._count - ddof, 0)
+
+    def std(self, ddof=0):
+        """
+        Return the standard deviation of the accumulated data.
+
+        Parameters
+        ----------
+        ddof : {int, float}, optional
+            Means Delta Degrees of Freedom. The divisor used in calculations
+            is ``N - ddof``, where ``N`` is :attr:`count`.
+
+            Default: ``0``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The standard deviation along the accumulation axis.
+
+        """
+
+        return dpnp.sqrt(self.var(ddof=ddof))
+
+
+class OnlineCovariance(_OnlineAccumulator):
+    """
+    Accumulator of the covariance matrix of chunked observations.
+
+    Every call of :meth:`update` computes the means of a chunk and the
+    product of the centered chunk with its conjugate transpose, which is
+    then combined with the previously accumulated co-moments.
+
+    Parameters
+    ----------
+    rowvar : bool, optional
+        If ``True``, each row of a chunk represents a variable, with
+        observations in the columns, and the chunks are concatenated along
+        the columns. Otherwise, the relationship is transposed: each column
+        represents a variable and the chunks are concatenated along the rows.
+
+        Default: ``True``.
+    dtype : {None, str, dtype object}, optional
+        Type to use in computing the covariance. By default chunks with an
+        integer or a boolean data type are computed in the default floating
+        point data type for the device.
+
+        Default: ``None``.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the chunks which are not
+        allocated on a device yet are copied to.
+
+        Default: ``None``.
+    usm_type : {None, "device", "shared", "host"}, optional
+        The type of SYCL USM allocation for such chunks.
+
+        Default: ``None``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for such chunks.
+
+        Default: ``None``.
+
+    See Also
+    --------
+    :obj:`dpnp.cov` : Estimate a covariance matrix.
+    :obj:`dpnp.stats.OnlineMoments` : Accumulator of the mean and the
+                                      variance.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> x = np.array([[0.0, 2.0], [1.0, 1.0], [2.0, 0.0]])
+    >>> c = np.stats.OnlineCovariance(rowvar=False)
+    >>> c = c.update(x[:2]).update(x[2:])
+    >>> c.cov()
+    array([[ 1., -1.],
+           [-1.,  1.]])
+
+    """
+
+    def __init__(
+        self,
+        rowvar=True,
+        dtype=None,
+        *,
+        device=None,
+        usm_type=None,
+        sycl_queue=None,
+    ):
+        super().__init__(
+            device=device, usm_type=usm_type, sycl_queue=sycl_queue
+        )
+        self._rowvar = rowvar
+        self._dtype = dtype
+        self._mean = None
+        self._comoment = None
+
+    def update(self, x):
+        """
+        Accumulate the co-moments of a chunk of observations.
+
+        Parameters
+        ----------
+        x : array_like
+            A 1-D or 2-D chunk of observations. Arrays allocated on the host
+            are copied to the device.
+
+        Returns
+        -------
+        out : dpnp.stats.OnlineCovariance
+            The updated accumulator.
+
+        """
+
+        x = self._asarray(x)
+        if x.ndim > 2:
+            raise ValueError("x has more than 2 dimensions")
+
+        if x.ndim < 2:
+            x = x.reshape(1, -1)
+        elif not self._rowvar:
+            x = x.T
+
+        n = x.shape[1]
+        if n == 0:
+            return self
+
+        dtype = self._dtype
+        if dtype is None and not dpnp.issubdtype(x.dtype, dpnp.inexact):
+            dtype = dpnp.default_float_type(sycl_queue=x.sycl_queue)
+        if dtype is not None:
+            x = dpnp.astype(x, dtype, copy=False)
+
+        mean = dpnp.mean(x, axis=1)
+
+        # the centered chunk is C-contiguous, so the product with its
+        # transposed view is computed by syrk for real data
+        centered = x - mean[:, None]
+        centered_t = centered.T
+        if dpnp.issubdtype(centered.dtype, dpnp.complexfloating):
+            centered_t = centered_t.conj()
+
+        self._combine(n, mean, dpnp.matmul(centered, centered_t))
+        return self
+
+    def merge(self, other):
+        """
+        Merge the co-moments accumulated by another accumulator.
+
+        Parameters
+        ----------
+        other : dpnp.stats.OnlineCovariance
+            The accumulator to merge.
+
+        Returns
+        -------
+        out : dpnp.stats.OnlineCovariance
+            The updated accumulator.
+
+        """
+
+        self._check_merge(other)
+        if other._count > 0:
+            self._combine(other._count, other._mean, other._comoment)
+        return self
+
+    def _combine(self, n_b, mean_b, comoment_b):
+        """Combine the accumulated co-moments with the ones of another part."""
+
+        if self._count == 0:
+            self._count, self._mean, self._comoment = n_b, mean_b, comoment_b
+            return
+
+        if mean_b.shape != self._mean.shape:
+            raise ValueError(
+                f"Chunk with {mean_b.shape[0]} variables can't be combined "
+                f"with the accumulated {self._mean.shape[0]} variables"
+            )
+
+        n_a = self._count
+        n = n_a + n_b
+        delta = mean_b - self._mean
+        self._mean = self._mean + delta * (n_b / n)
+        self._comoment = self._comoment + comoment_b
+        self._comoment += dpnp.outer(delta * (n_a * n_b / n), delta.conj())
+        self._count = n
+
+    def mean(self):
+        """
+        Return the means of the variables.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            1-D array with the mean of each variable.
+
+        """
+
+        self._check_not_empty()
+        return self._mean.copy()
+
+    def cov(self, ddof=1):
+        """
+        Return the covariance matrix of the accumulated observations.
+
+        Parameters
+        ----------
+        ddof : {int, float}, optional
+            Means Delta Degrees of Freedom. The divisor used in calculations
+            is ``N - ddof``, where ``N`` is :attr:`count`.
+
+            Default: ``1``.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The covariance matrix of the variables, squeezed as by
+            :obj:`dpnp.cov`.
+
+        """
+
+        self._check_not_empty()
+        out = self._comoment / max(self._count - ddof, 0)
+        return out.squeeze()
+
+    def corrcoef(self):
+        """
+        Return the Pearson correlation coefficients of the variables.
+
+        Returns
+        -------
+        out : dpnp.ndarray
+            The correlation coefficient matrix of the variables, squeezed as
+            by :obj:`dpnp.corrcoef`.
+
+        """
+
+        out = self.cov()
+        if out.ndim == 0:
+            # nan if incorrect value (nan, inf, 0), 1 otherwise
+            return out / out
+
+        stddev = dpnp.sqrt(dpnp.diag(out).real)
+        out /= stddev[:, None]
+        out /= stddev[None, :]
+
+        # clip real and imaginary parts to [-1, 1] as dpnp.corrcoef does
+        dpnp.clip(out.real, -1, 1, out=out.real)
+        if dpnp.iscomplexobj(out):
+            dpnp.clip(out.imag, -1, 1, out=out.imag)
+        return out
+
+
+class OnlineHistogram(_OnlineAccumulator):
+    """
+    Accumulator of the histogram of chunked data.
+
+    The bin edges are fixed at construction, so every call of :meth:`update`
+    counts a chunk into the same bins without any synchronization with the
+    host and adds the counts to the accumulated histogram.
+
+    Parameters
+    ----------
+    bins : {int, dpnp.ndarray, usm_ndarray, sequence of scalars}, optional
+        If `bins` is an integer, it defines the number of equal-width bins in
+        the given `range`. If `bins` is a sequence, it defines the bin edges,
+        including the rightmost edge, allowing for non-uniform bin widths.
+
+        Default: ``10``.
+    range : {None, 2-tuple of float}, optional
+        The lower and upper range of the bins. It is required if `bins` is an
+        integer, since the range can't be inferred from the data which have
+        not been seen yet. Values outside the range are ignored.
+
+        Default: ``None``.
+    device : {None, string, SyclDevice, SyclQueue, Device}, optional
+        An array API concept of device where the bin edges and the
+        histogram are allocated on.
+
+        Default: ``None``.
+    usm_type : {None, "device", "shared", "host"}, optional
+        The type of SYCL USM allocation for the bin edges.
+
+        Default: ``None``.
+    sycl_queue : {None, SyclQueue}, optional
+        A SYCL queue to use for the bin edges.
+
+        Default: ``None``.
+
+    See Also
+    --------
+    :obj:`dpnp.histogram` : Compute the histogram of a data set.
+
+    Notes
+    -----
+    All chunks are copied to the queue of the bin edges if needed.
+
+    Examples
+    --------
+    >>> import dpnp as np
+    >>> h = np.stats.OnlineHistogram(bins=4, range=(0, 4))
+    >>> h = h.update(np.array([0, 1, 1])).update(np.array([3, 5]))
+    >>> hist, bin_edges = h.histogram()
+    >>> hist
+    array([1, 2, 0, 1])
+    >>> bin_edges
+    array([0., 1., 2., 3., 4.])
+
+    """
+
+    def __init__(
+        self,
+        bins=10,
+        range=None,
+        *,
+        device=None,
+        usm_type=None,
+        sycl_queue=None,
+    ):
+        super().__init__(
+            device=device, usm_type=usm_type, sycl_queue=sycl_queue
+        )
+
+        if numpy.ndim(bins) == 0:
+            try:
+                n_equal_bins = operator.index(bins)
+            except TypeError as e:
+                raise TypeError("`bins` must be an integer or an array") from e
+            if n_equal_bins < 1:
+                raise ValueError("`bins` must be positive, when an integer")
+            if range is None:
+                raise ValueError(
+                    "`range` must be given, when `bins` is an integer"
+                )
+
+            first_edge, last_edge = _get_outer_edges(None, range)
+            bin_edges = dpnp.linspace(
+                first_edge,
+                last_edge,
+                n_equal_bins + 1,
+                endpoint=True,
+                device=device,
+                usm_type=usm_type,
+                sycl_queue=sycl_queue,
+            )
+        elif numpy.ndim(bins) == 1:
+            bin_edges = self._asarray(bins)
+            if bin_edges.size < 2:
+                raise ValueError("`bins` must have at least 2 edges")
+            if dpnp.any(bin_edges[:-1] > bin_edges[1:]):
+                raise ValueError(
+                    "`bins` must increase monotonically, when an array"
+                )
+        else:
+            raise ValueError("`bins` must be 1d, when an array")
+
+        self._device = None
+        self._sycl_queue = bin_edges.sycl_queue
+        self._bin_edges = bin_edges
+        self._hist = None
+
+    def update(self, x, weights=None):
+        """
+        Accumulate the histogram of a chunk of data.
+
+        Parameters
+        ----------
+        x : array_like
+            The chunk of data. The histogram is computed over the flattened
+            chunk. Arrays allocated on the host are copied to the device.
+        weights : {None, array_like}, optional
+            An array of weights, of the same shape as `x`.
+
+            Default: ``None``.
+
+        Returns
+        -------
+        out : dpnp.stats.OnlineHistogram
+            The updated accumulator.
+
+        """
+
+        x = self._asarray(x)
+        if weights is not None:
+            weights = self._asarray(weights)
+        a, weights, usm_type = _ravel_check_a_and_weights(x, weights)
+
+        hist = _histogram_run_native(a, self._bin_edges, weights, usm_type)
+        self._hist = hist if self._hist is None else self._hist + hist
+        self._count += a.size
+        return self
+
+    def merge(self, other):
+        """
+        Merge the histogram accumulated by another accumulator.
+
+        Parameters
+        ----------
+        other : dpnp.stats.OnlineHistogram
+            The accumulator to merge. It must use the same bin edges.
+
+        Returns
+        -------
+        out : dpnp.stats.OnlineHistogram
+            The updated accumulator.
+
+        Warnings
+        --------
+        This method synchronizes in order to check that the bin edges of
+        both accumulators are the same.
+
+        """
+
+        self._check_merge(other)
+        if other._bin_edges is not self._bin_edges:
+            other_edges = self._asarray(other._bin_edges)
+            if other_edges.shape != self._bin_edges.shape or not (
+                dpnp.array_equal(other_edges, self._bin_edges)
+            ):
+                raise ValueError(
+                    "Histograms with different bins can't be merged"
+                )
+
+        if other._hist is not None:
+            hist = self._asarray(other._hist)
+            self._hist = hist if self._hist is None else self._hist + hist
+        self._count += other._count
+        return self
+
+    def histogram(self, density=False):
+        """
+        Return the accumulated histogram.
+
+        Parameters
+        ----------
+        density : bool, optional
+            If ``False``, the result will contain the number of samples in
+            each bin. If ``True``, the result is the value of the probability
+            *density* function at the bin, normalized such that the *integral*
+            over the range is ``1``.
+
+            Default: ``False``.
+
+        Returns
+        -------
+        hist : dpnp.ndarray
+            The values of the histogram.
+        bin_edges : dpnp.ndarray
+            The bin edges ``(length(hist)+1)``.
+
+        """
+
+        bin_edges = self._bin_edges
+        hist = self._hist
+        if hist is None:
+            hist = dpnp.zeros_like(bin_edges[1:], dtype=dpnp.intp)
+
+        if density:
+            db = dpnp.astype(
+                dpnp.diff(bin_edges),
+                dpnp.default_float_type(sycl_queue=bin_edges.sycl_queue),
+            )
+            return hist / db / dpnp.sum(hist), bin_edges.copy()
+
+        return hist.copy(), bin_edges.copy()
@@ -453,6 +453,43 @@ class TestFftn:
             expected = numpy.fft.ifft(expected, n=jj, axis=ii)
         assert_dtype_allclose(result, expected)
 
+    @pytest.mark.parametrize("norm", [None, "forward", "ortho"])
+    @pytest.mark.parametrize("order", ["C", "F"])
+    @pytest.mark.parametrize(
+        "s", [None, (3, 2, 4, 2, 3), (2, 4, 3, 5, 1), (1, 2, 3, 4, 5)]
+    )
+    def test_5d(self, norm, order, s):
+        a = generate_random_numpy_array((2, 3, 4, 3, 2), numpy.complex64, order)
+        ia = dpnp.array(a)
+        ia_orig = ia.copy()
+
+        result = dpnp.fft.fftn(ia, s=s, norm=norm)
+        expected = numpy.fft.fftn(a, s=s, norm=norm)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+        # input array is not overwritten by the intermediate passes
+        assert_dtype_allclose(ia, ia_orig)
+
+        result = dpnp.fft.ifftn(result, s=s, norm=norm)
+        expected = numpy.fft.ifftn(expected, s=s, norm=norm)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    @pytest.mark.parametrize("axes", [None, (0, 2, 3, 4), (4, 1, 0, 2)])
+    def test_strided(self, axes):
+        a = generate_random_numpy_array((4, 3, 6, 4, 5), numpy.complex64)
+        ia = dpnp.array(a)
+
+        # non-contiguous views with the permuted layout
+        a = a.transpose(2, 0, 4, 1, 3)[::2]
+        ia = ia.transpose(2, 0, 4, 1, 3)[::2]
+
+        result = dpnp.fft.fftn(ia, axes=axes)
+        expected = numpy.fft.fftn(a, axes=axes)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+        result = dpnp.fft.rfftn(ia.real, axes=axes)
+        expected = numpy.fft.rfftn(a.real, axes=axes)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
     def test_negative_s(self):
         a = generate_random_numpy_array((3, 4, 5), dtype=numpy.complex64)
         ia = dpnp.array(a)
@@ -954,3 +991,387 @@ class TestRfftn:
         expected = numpy.fft.irfftn(a)
         flag = True if numpy_version() < "2.0.0" else False
         assert_dtype_allclose(result, expected, check_only_type_kind=flag)
+
+
+class TestPlanCache:
+    @pytest.fixture(autouse=True)
+    def restore_size(self):
+        size = dpnp.fft.config.get_plan_cache_size()
+        yield
+        dpnp.fft.config.set_plan_cache_size(size)
+
+    def test_hits(self):
+        q = dpctl.SyclQueue()
+        cache = dpnp.fft.config.get_plan_cache(q)
+        assert cache.get_curr_size() == 0
+
+        a = generate_random_numpy_array(64, dtype=numpy.float32)
+        ia = dpnp.array(a, sycl_queue=q)
+        for _ in range(3):
+            result = dpnp.fft.rfft(ia)
+            assert_dtype_allclose(result, numpy.fft.rfft(a))
+        assert cache.get_curr_size() == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        # another shape needs another plan
+        dpnp.fft.rfft(ia[:32])
+        assert cache.get_curr_size() == 2
+        assert (cache.hits, cache.misses) == (2, 2)
+
+        # the inverse transform of the same shape is a separate plan
+        dpnp.fft.irfft(dpnp.fft.rfft(ia))
+        assert cache.misses == 3
+
+    def test_lru(self):
+        q = dpctl.SyclQueue()
+        cache = dpnp.fft.config.get_plan_cache(q)
+        cache.set_size(2)
+
+        a = dpnp.ones(16, dtype=dpnp.complex64, sycl_queue=q)
+        for n in [4, 8, 4, 16]:
+            dpnp.fft.fft(a, n=n)
+        assert cache.get_curr_size() == 2
+
+        # the plan of size 8 is evicted as the least recently used
+        misses = cache.misses
+        dpnp.fft.fft(a, n=4)
+        dpnp.fft.fft(a, n=16)
+        assert cache.misses == misses
+        dpnp.fft.fft(a, n=8)
+        assert cache.misses == misses + 1
+
+    def test_clear_and_disable(self):
+        q = dpctl.SyclQueue()
+        cache = dpnp.fft.config.get_plan_cache(q)
+        a = dpnp.ones((4, 8), dtype=dpnp.complex64, sycl_queue=q)
+
+        dpnp.fft.fftn(a)
+        assert cache.get_curr_size() > 0
+        dpnp.fft.config.clear_plan_cache()
+        assert cache.get_curr_size() == 0
+        assert (cache.hits, cache.misses) == (0, 0)
+
+        dpnp.fft.config.set_plan_cache_size(0)
+        assert cache.get_size() == 0
+        assert dpnp.fft.config.get_plan_cache_size() == 0
+        result = dpnp.fft.fftn(a)
+        assert_dtype_allclose(result, numpy.fft.fftn(dpnp.asnumpy(a)))
+        assert cache.get_curr_size() == 0
+
+    def test_show_info(self, capsys):
+        q = dpctl.SyclQueue()
+        dpnp.fft.config.get_plan_cache(q).show_info()
+        assert "current / max size" in capsys.readouterr().out
+
+        dpnp.fft.config.show_plan_cache_info()
+        assert "plan cache" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("size", [-1, 2.5, "1"])
+    def test_error(self, size):
+        cache = dpnp.fft.config.get_plan_cache()
+        assert_raises((TypeError, ValueError), cache.set_size, size)
+        assert_raises(
+            (TypeError, ValueError), dpnp.fft.config.set_plan_cache_size, size
+        )
+
+
+class TestFftPlan:
+    @pytest.mark.parametrize("dtype", get_complex_dtypes())
+    @pytest.mark.parametrize("axes", [None, -1, (0, 1), (2, 0)])
+    def test_c2c(self, dtype, axes):
+        a = generate_random_numpy_array((4, 5, 6), dtype)
+        ia = dpnp.array(a)
+
+        plan = dpnp.fft.get_fft_plan(ia, axes=axes)
+        result = plan.execute(ia)
+        expected = numpy.fft.fftn(a, axes=axes)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+        # inverse FFT with the same plan
+        result = plan.execute(result, forward=False)
+        assert_dtype_allclose(result, a, check_only_type_kind=True)
+
+    @pytest.mark.parametrize("dtype", get_float_dtypes())
+    @pytest.mark.parametrize("norm", [None, "forward", "ortho"])
+    def test_r2c_c2r(self, dtype, norm):
+        a = generate_random_numpy_array((6, 8), dtype)
+        ia = dpnp.array(a)
+
+        plan = dpnp.fft.get_fft_plan(ia, axes=-1, value_type="R2C")
+        result = plan.execute(ia, norm=norm)
+        expected = numpy.fft.rfft(a, norm=norm)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+        iplan = dpnp.fft.get_fft_plan(result, s=8, axes=-1, value_type="C2R")
+        result = iplan.execute(result, norm=norm)
+        assert_dtype_allclose(result, a, check_only_type_kind=True)
+
+    def test_plan_keyword(self):
+        a = generate_random_numpy_array((3, 16), dpnp.complex64)
+        ia = dpnp.array(a)
+
+        plan = dpnp.fft.get_fft_plan(ia, axes=1)
+        result = dpnp.fft.fft(ia, plan=plan)
+        expected = numpy.fft.fft(a)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+        result = dpnp.fft.ifft(ia, plan=plan)
+        expected = numpy.fft.ifft(a)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+        plan = dpnp.fft.get_fft_plan(ia)
+        result = dpnp.fft.fft2(ia, plan=plan)
+        expected = numpy.fft.fft2(a)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    def test_context_manager(self):
+        a = generate_random_numpy_array((4, 10), dpnp.float32)
+        ia = dpnp.array(a)
+
+        plan = dpnp.fft.get_fft_plan(ia, axes=-1, value_type="R2C")
+        with plan:
+            result = dpnp.fft.rfft(ia)
+        expected = numpy.fft.rfft(a)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+        # the plan is not used outside of the block
+        result = dpnp.fft.rfft(ia[:2])
+        expected = numpy.fft.rfft(a[:2])
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    def test_out(self):
+        a = generate_random_numpy_array((5, 8), dpnp.complex64)
+        ia = dpnp.array(a)
+
+        plan = dpnp.fft.get_fft_plan(ia, axes=0)
+        out = dpnp.empty_like(ia)
+        result = plan.execute(ia, out=out)
+        assert result is out
+        expected = numpy.fft.fft(a, axis=0)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+        out = dpnp.empty((5, 8), dtype=dpnp.complex64)
+        result = dpnp.fft.fft(ia, axis=0, out=out, plan=plan)
+        assert result is out
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    def test_plan_cache_not_used(self):
+        q = dpctl.SyclQueue()
+        cache = dpnp.fft.config.get_plan_cache(q)
+        a = dpnp.ones((4, 8), dtype=dpnp.complex64, sycl_queue=q)
+
+        plan = dpnp.fft.get_fft_plan(a)
+        for _ in range(3):
+            plan.execute(a)
+            dpnp.fft.fftn(a, plan=plan)
+        assert (cache.hits, cache.misses) == (0, 0)
+        assert cache.get_curr_size() == 0
+
+    def test_attributes(self):
+        a = dpnp.ones((4, 6), dtype=dpnp.complex64)
+        plan = dpnp.fft.get_fft_plan(a, s=(8,), axes=(-2,))
+        assert isinstance(plan, dpnp.fft.FFTPlan)
+        assert plan.shape == (4, 6)
+        assert plan.dtype == dpnp.complex64
+        assert plan.s == (8,)
+        assert plan.axes == (0,)
+        assert plan.value_type == "C2C"
+        assert plan.sycl_queue == a.sycl_queue
+
+    def test_error(self):
+        a = dpnp.ones((4, 8), dtype=dpnp.complex64)
+
+        # invalid value type
+        assert_raises(ValueError, dpnp.fft.get_fft_plan, a, value_type="R2R")
+        # complex input of R2C transform
+        assert_raises(TypeError, dpnp.fft.get_fft_plan, a, value_type="R2C")
+        # 0-D array
+        assert_raises(ValueError, dpnp.fft.get_fft_plan, dpnp.array(1.0))
+
+        plan = dpnp.fft.get_fft_plan(a, axes=-1)
+        # another shape or dtype
+        assert_raises(ValueError, plan.execute, a[:2])
+        assert_raises(ValueError, plan.execute, a.astype(dpnp.complex128))
+        # another transform
+        assert_raises(ValueError, dpnp.fft.fft, a, n=4, plan=plan)
+        assert_raises(ValueError, dpnp.fft.fft, a, axis=0, plan=plan)
+        assert_raises(ValueError, dpnp.fft.rfft, a.real, plan=plan)
+        # not a plan
+        assert_raises(TypeError, dpnp.fft.fft, a, plan="plan")
+
+        # another queue
+        q = dpctl.SyclQueue()
+        b = dpnp.ones((4, 8), dtype=dpnp.complex64, sycl_queue=q)
+        assert_raises(ExecutionPlacementError, plan.execute, b)
+
+        # direction of R2C transform can't be changed
+        plan = dpnp.fft.get_fft_plan(a.real, value_type="R2C")
+        assert_raises(ValueError, plan.execute, a.real, forward=False)
+
+
+@testing.with_requires("scipy")
+class TestScipyFft:
+    @pytest.mark.parametrize(
+        "func", ["fft", "ifft", "rfft", "irfft", "hfft", "ihfft"]
+    )
+    @pytest.mark.parametrize("n", [None, 6, 11])
+    @pytest.mark.parametrize("norm", [None, "forward", "ortho"])
+    @pytest.mark.parametrize("overwrite_x", [True, False])
+    def test_1d(self, func, n, norm, overwrite_x):
+        import scipy.fft
+
+        dtype = numpy.float32 if func in ["rfft", "ihfft"] else numpy.complex64
+        a = generate_random_numpy_array((3, 8), dtype)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp.scipy.fft, func)(
+            ia, n=n, axis=0, norm=norm, overwrite_x=overwrite_x
+        )
+        expected = getattr(scipy.fft, func)(a, n=n, axis=0, norm=norm)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+        if not overwrite_x:
+            assert_dtype_allclose(ia, a)
+
+    @pytest.mark.parametrize(
+        "func", ["fft2", "ifft2", "fftn", "ifftn", "rfftn", "irfftn"]
+    )
+    @pytest.mark.parametrize("axes", [None, (0, 2), (2, 3, 1, 0)])
+    @pytest.mark.parametrize("overwrite_x", [True, False])
+    def test_nd(self, func, axes, overwrite_x):
+        import scipy.fft
+
+        if func in ["fft2", "ifft2"] and axes is None:
+            axes = (-2, -1)
+        dtype = numpy.float64 if func == "rfftn" else numpy.complex128
+        a = generate_random_numpy_array((4, 3, 6, 5), dtype)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp.scipy.fft, func)(
+            ia, axes=axes, overwrite_x=overwrite_x, workers=-1
+        )
+        expected = getattr(scipy.fft, func)(a, axes=axes)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+        if not overwrite_x:
+            assert_dtype_allclose(ia, a)
+
+    @pytest.mark.parametrize("func", ["fft", "fftn"])
+    def test_overwrite_x_in_place(self, func):
+        a = generate_random_numpy_array((4, 16), numpy.complex64)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp.scipy.fft, func)(ia, overwrite_x=True)
+        expected = getattr(numpy.fft, func)(a)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+        # the transform is computed in the memory of the input array
+        assert dpnp.array_equal(ia, result)
+
+    def test_plan(self):
+        a = generate_random_numpy_array((5, 8), numpy.complex64)
+        ia = dpnp.array(a)
+
+        plan = dpnp.fft.get_fft_plan(ia, axes=-1)
+        result = dpnp.scipy.fft.fft(ia, plan=plan)
+        expected = numpy.fft.fft(a)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    def test_helpers(self):
+        for func in ["fftfreq", "rfftfreq", "fftshift", "ifftshift"]:
+            assert getattr(dpnp.scipy.fft, func) is getattr(dpnp.fft, func)
+
+
+@testing.with_requires("scipy")
+class TestScipyRealTransforms:
+    @pytest.mark.parametrize("func", ["dct", "idct", "dst", "idst"])
+    @pytest.mark.parametrize("type", [1, 2, 3, 4])
+    @pytest.mark.parametrize("n", [None, 5, 12])
+    @pytest.mark.parametrize("norm", [None, "backward", "forward", "ortho"])
+    def test_basic(self, func, type, n, norm):
+        import scipy.fft
+
+        a = generate_random_numpy_array((7, 4), numpy.float64)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp.scipy.fft, func)(ia, type, n=n, axis=0, norm=norm)
+        expected = getattr(scipy.fft, func)(a, type, n=n, axis=0, norm=norm)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("func", ["dct", "idct", "dst", "idst"])
+    @pytest.mark.parametrize("type", [1, 2, 3, 4])
+    @pytest.mark.parametrize("orthogonalize", [True, False])
+    def test_orthogonalize(self, func, type, orthogonalize):
+        import scipy.fft
+
+        a = generate_random_numpy_array(9, numpy.float64)
+        ia = dpnp.array(a)
+
+        for norm in ["backward", "ortho"]:
+            result = getattr(dpnp.scipy.fft, func)(
+                ia, type, norm=norm, orthogonalize=orthogonalize
+            )
+            expected = getattr(scipy.fft, func)(
+                a, type, norm=norm, orthogonalize=orthogonalize
+            )
+            assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("overwrite_x", [True, False])
+    def test_dtype(self, dtype, overwrite_x):
+        import scipy.fft
+
+        a = generate_random_numpy_array((4, 6), dtype)
+        ia = dpnp.array(a)
+
+        result = dpnp.scipy.fft.dct(ia, norm="ortho", overwrite_x=overwrite_x)
+        expected = scipy.fft.dct(a, norm="ortho")
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+        if not overwrite_x:
+            assert_dtype_allclose(ia, a)
+
+    @pytest.mark.parametrize("func", ["dctn", "idctn", "dstn", "idstn"])
+    @pytest.mark.parametrize("type", [1, 2, 3, 4])
+    @pytest.mark.parametrize(
+        "s, axes", [(None, None), (None, (0, 2)), ((4, 6), (2, 1)), (5, 1)]
+    )
+    def test_nd(self, func, type, s, axes):
+        import scipy.fft
+
+        a = generate_random_numpy_array((3, 4, 5), numpy.float64)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp.scipy.fft, func)(ia, type, s=s, axes=axes)
+        expected = getattr(scipy.fft, func)(a, type, s=s, axes=axes)
+        assert_dtype_allclose(result, expected)
+
+    def test_error(self):
+        ia = dpnp.ones(4)
+        assert_raises(ValueError, dpnp.scipy.fft.dct, ia, type=5)
+        assert_raises(ValueError, dpnp.scipy.fft.dst, ia, norm="sym")
+        assert_raises(ValueError, dpnp.scipy.fft.dct, ia, n=0)
+        assert_raises(TypeError, dpnp.scipy.fft.dct, ia, n=2.5)
+        assert_raises(ValueError, dpnp.scipy.fft.dct, ia[:1], type=1)
+        assert_raises(ValueError, dpnp.scipy.fft.dctn, ia, s=(4, 4), axes=0)
+
+
+class TestNextFastLen:
+    @pytest.mark.parametrize(
+        "target, expected",
+        [(0, 0), (1, 1), (7, 7), (11, 12), (13, 14), (93, 96), (1025, 1029)],
+    )
+    def test_basic(self, target, expected):
+        assert dpnp.scipy.fft.next_fast_len(target) == expected
+        assert dpnp.scipy.fft.next_fast_len(target, real=True) == expected
+
+    def test_smooth(self):
+        for target in range(1, 500):
+            n = dpnp.scipy.fft.next_fast_len(target)
+            assert n >= target
+            for p in [2, 3, 5, 7]:
+                while n % p == 0:
+                    n //= p
+            assert n == 1
+
+    @pytest.mark.parametrize("target", [-1, 2.5, "8"])
+    def test_error(self, target):
+        assert_raises(
+            (TypeError, ValueError), dpnp.scipy.fft.next_fast_len, target
+        )
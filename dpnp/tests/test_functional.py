@@ -57,9 +57,47 @@ class TestApplyAlongAxis:
         result = dpnp.apply_along_axis(dpnp.mean, 0, ia, 0, dtype, None, True)
         assert_array_equal(result, expected)
 
+    @pytest.mark.parametrize("func", ["sum", "argmax", "cumsum", "sort"])
+    @pytest.mark.parametrize("axis", [0, 1, -1])
+    @pytest.mark.parametrize("vectorized", [None, True, False])
+    def test_vectorized(self, func, axis, vectorized):
+        a = generate_random_numpy_array((4, 5, 6))
+        ia = dpnp.array(a)
+
+        expected = numpy.apply_along_axis(getattr(numpy, func), axis, a)
+        result = dpnp.apply_along_axis(
+            getattr(dpnp, func), axis, ia, vectorized=vectorized
+        )
+        assert_dtype_allclose(result, expected)
+
+    def test_vectorized_custom_func(self):
+        def normalize(x, axis=-1):
+            return x / x.sum(axis=axis, keepdims=True)
+
+        a = generate_random_numpy_array((3, 4), low=1)
+        ia = dpnp.array(a)
+
+        expected = numpy.apply_along_axis(normalize, 0, a)
+        result = dpnp.apply_along_axis(normalize, 0, ia, vectorized=True)
+        assert_dtype_allclose(result, expected)
+
+    def test_vectorized_error(self):
+        ia = dpnp.ones((3, 4))
+        assert_raises(
+            ValueError,
+            dpnp.apply_along_axis,
+            lambda x, axis: x.sum(),
+            0,
+            ia,
+            vectorized=True,
+        )
+
+        ia = dpnp.ones((0, 4))
+        assert_raises(ValueError, dpnp.apply_along_axis, dpnp.sum, 1, ia)
+
 
 class TestApplyOverAxes:
-    @pytest.mark.parametrize("func", ["sum", "cumsum"])
+    @pytest.mark.parametrize("func", ["sum", "cumsum", "max", "mean"])
     @pytest.mark.parametrize("axes", [1, [0, 2], (-1, -2)])
     def test_basic(self, func, axes):
         a = numpy.arange(24).reshape(2, 3, 4)
@@ -77,6 +115,128 @@ class TestApplyOverAxes:
         assert_raises(ValueError, dpnp.apply_over_axes, custom_func, ia, 1)
 
 
+class TestFuse:
+    @staticmethod
+    def _func(a, b, c, d):
+        return a * b + c * dpnp.exp(d)
+
+    @pytest.mark.parametrize(
+        "dtype", get_all_dtypes(no_none=True, no_bool=True, no_complex=True)
+    )
+    def test_basic(self, dtype):
+        args = [generate_random_numpy_array((4, 5), dtype) for _ in range(4)]
+        iargs = [dpnp.array(x) for x in args]
+
+        fused = dpnp.fuse(self._func)
+        expected = self._func(*iargs)
+        for _ in range(3):
+            result = fused(*iargs)
+            assert_array_equal(result, expected)
+            assert result.dtype == expected.dtype
+        assert len(fused._cache) == 1
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    def test_layout(self, order):
+        a = dpnp.asarray(generate_random_numpy_array((3, 4)), order=order)
+        b = dpnp.arange(4, dtype=a.dtype)
+
+        fused = dpnp.fuse(self._func)
+        expected = self._func(a, b, 2.0, a)
+        fused(a, b, 2.0, a)
+        result = fused(a, b, 2.0, a)
+        assert_array_equal(result, expected)
+        assert result.flags.c_contiguous == expected.flags.c_contiguous
+        assert result.flags.f_contiguous == expected.flags.f_contiguous
+
+    def test_scalar_args(self):
+        @dpnp.fuse
+        def func(x, s):
+            return -((x - s) ** 2) <= s
+
+        a = dpnp.arange(10)
+        for s in [1, 3, 4.5, True]:
+            assert_array_equal(func(a, s), -((a - s) ** 2) <= s)
+        assert len(func._cache) == 3
+
+    def test_multiple_outputs(self):
+        @dpnp.fuse(kernel_name="sincos")
+        def func(x, y):
+            t = x * y
+            return dpnp.sin(t), dpnp.cos(t), x
+
+        a = dpnp.linspace(0, 1, num=7)
+        for _ in range(2):
+            res = func(a, 3)
+            assert isinstance(res, tuple)
+            assert_array_equal(res[0], dpnp.sin(a * 3))
+            assert_array_equal(res[1], dpnp.cos(a * 3))
+            assert res[2] is a
+        assert func.name == "sincos"
+        assert func.__name__ == "func"
+
+    def test_results_not_shared(self):
+        fused = dpnp.fuse(lambda x: dpnp.sqrt(x + 1))
+        a = dpnp.arange(5.0)
+
+        res1 = fused(a)
+        res2 = fused(a)
+        assert res1 is not res2
+        res1 += 1
+        assert_array_equal(res2, dpnp.sqrt(a + 1))
+
+    @pytest.mark.parametrize("func", ["sqrt", "log"])
+    def test_where(self, func):
+        def masked(x, m):
+            return dpnp.where(m, getattr(dpnp, func)(x + 1, where=m), -1.0)
+
+        def masked_inner(x):
+            m = x > 0
+            return dpnp.where(m, getattr(dpnp, func)(x, where=m) * 2, -1.0)
+
+        fused = dpnp.fuse(masked)
+        fused_inner = dpnp.fuse(masked_inner)
+        for seed in range(3):
+            a = generate_random_numpy_array(10, seed_value=seed)
+            ia = dpnp.array(a)
+            im = dpnp.array(a > 0)
+
+            assert_array_equal(fused(ia, im), masked(ia, im))
+            assert_array_equal(fused_inner(ia), masked_inner(ia))
+
+    def test_operators(self):
+        @dpnp.fuse
+        def func(x, y):
+            return (
+                (abs(-x) + y) * 2 // 3 % 5,
+                (x & y) | (x ^ 1),
+                ~(x << 1) >> 1,
+                (x < y) == (x >= y),
+                1 - x / (y + 1) ** 2,
+            )
+
+        a = dpnp.arange(12).reshape(3, 4)
+        b = dpnp.arange(4)
+        expected = func.__wrapped__(a, b)
+        func(a, b)
+        for r, e in zip(func(a, b), expected):
+            assert_array_equal(r, e)
+
+    def test_errors(self):
+        a = dpnp.arange(4)
+
+        # data dependent control flow
+        fused = dpnp.fuse(lambda x: x if x > 0 else -x)
+        assert_raises(TypeError, fused, a)
+
+        # out keyword
+        fused = dpnp.fuse(lambda x: dpnp.add(x, 1, out=x))
+        assert_raises(NotImplementedError, fused, a)
+
+        # unsupported argument
+        fused = dpnp.fuse(lambda x: x + 1)
+        assert_raises(TypeError, fused, [1, 2])
+
+
 class TestPiecewise:
     @pytest.mark.parametrize(
         "dtype", get_all_dtypes(no_none=True, no_unsigned=True)
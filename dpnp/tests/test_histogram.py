@@ -623,6 +623,30 @@ class TestBincount:
             minlength=None,
         )
 
+    @pytest.mark.parametrize("dt", get_integer_dtypes())
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_assume_bounded(self, dt, weighted):
+        a = numpy.array([1, 2, 2, 1, 2, 4], dtype=dt)
+        ia = dpnp.array(a)
+        w = iw = None
+        if weighted:
+            w = numpy.array([0.3, 0.5, 0, 0.7, 1.0, -0.6])
+            iw = dpnp.array(w)
+
+        expected = numpy.bincount(a, weights=w, minlength=7)
+        result = dpnp.bincount(ia, weights=iw, minlength=7, assume_bounded=True)
+        assert_dtype_allclose(result, expected)
+
+    def test_assume_bounded_out_of_range(self):
+        ia = dpnp.array([-1, 0, 3, 1, 5, 3])
+
+        # values outside of [0, minlength) are ignored
+        result = dpnp.bincount(ia, minlength=4, assume_bounded=True)
+        assert_array_equal(result, [1, 1, 0, 2])
+
+        result = dpnp.bincount(ia, assume_bounded=True)
+        assert_array_equal(result, [])
+
     @pytest.mark.parametrize(
         "weights",
         [None, [0.3, 0.5, 0, 0.7, 1.0, -0.6], [2, 2, 2, 2, 2, 2]],
@@ -139,6 +139,64 @@ def test_usm_ndarray_linearalgebra_batch(func):
     assert isinstance(result, dpnp.ndarray)
 
 
+class TestChoSolve:
+    @staticmethod
+    def _make_spd_np(shape, dtype):
+        a = generate_random_numpy_array(shape, dtype, seed_value=81)
+        n = shape[-1]
+        a = a @ numpy.swapaxes(a, -1, -2).conj()
+        return a + n * numpy.eye(n, dtype=dtype)
+
+    @pytest.mark.parametrize("lower", [True, False])
+    @pytest.mark.parametrize("b_shape", [(4,), (4, 3)])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_cho_solve(self, b_shape, lower, dtype):
+        a_np = self._make_spd_np((4, 4), dtype)
+        b_np = generate_random_numpy_array(b_shape, dtype, seed_value=76)
+        a_dp, b_dp = dpnp.array(a_np), dpnp.array(b_np)
+
+        c, low = dpnp.scipy.linalg.cho_factor(a_dp, lower=lower)
+        assert low is lower
+        x = dpnp.scipy.linalg.cho_solve((c, low), b_dp)
+
+        expected = numpy.linalg.solve(a_np, b_np)
+        assert_dtype_allclose(x, expected, factor=24)
+
+    @pytest.mark.parametrize("lower", [True, False])
+    @pytest.mark.parametrize(
+        "a_shape, b_shape",
+        [
+            ((3, 5, 5), (3, 5, 2)),
+            ((2, 1, 6, 6), (2, 3, 6, 1)),
+            ((5, 5), (2, 5, 4)),
+        ],
+    )
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_cho_solve_batched(self, a_shape, b_shape, lower, dtype):
+        a_np = self._make_spd_np(a_shape, dtype)
+        b_np = generate_random_numpy_array(b_shape, dtype, seed_value=76)
+        a_dp, b_dp = dpnp.array(a_np), dpnp.array(b_np)
+
+        c_and_lower = dpnp.scipy.linalg.cho_factor(a_dp, lower=lower)
+        x = dpnp.scipy.linalg.cho_solve(c_and_lower, b_dp)
+
+        expected = numpy.linalg.solve(a_np, b_np)
+        assert_dtype_allclose(x, expected, factor=24)
+
+    def test_check_finite(self):
+        a_dp = dpnp.array([[4, 2], [2, dpnp.nan]])
+        assert_raises(ValueError, dpnp.scipy.linalg.cho_factor, a_dp)
+
+        c = dpnp.scipy.linalg.cho_factor(dpnp.eye(2))
+        b_dp = dpnp.array([1, dpnp.inf])
+        assert_raises(ValueError, dpnp.scipy.linalg.cho_solve, c, b_dp)
+
+    def test_shape_mismatch(self):
+        c = dpnp.scipy.linalg.cho_factor(dpnp.eye(3))
+        b_dp = dpnp.ones(4)
+        assert_raises(ValueError, dpnp.scipy.linalg.cho_solve, c, b_dp)
+
+
 class TestCholesky:
     @pytest.mark.parametrize(
         "array",
@@ -256,6 +314,25 @@ class TestCholesky:
         expected = numpy.linalg.cholesky(a)
         assert_array_equal(result, expected)
 
+    @pytest.mark.parametrize("upper", [True, False])
+    @pytest.mark.parametrize("n", [1, 2, 3, 6, 32, 33])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_cholesky_small_batch(self, n, dtype, upper):
+        a = generate_random_numpy_array((20, 3, n, n), dtype, seed_value=81)
+        a = a @ a.swapaxes(-1, -2).conj() + n * numpy.eye(n, dtype=dtype)
+        expected = numpy.linalg.cholesky(a)
+        if upper:
+            expected = expected.swapaxes(-1, -2).conj()
+
+        # only a triangle of the matrices is used
+        ia = dpnp.array(numpy.triu(a) if upper else numpy.tril(a))
+        result = dpnp.linalg.cholesky(ia, upper=upper)
+        assert_dtype_allclose(result, expected, factor=24)
+
+    def test_cholesky_small_batch_not_positive_definite(self):
+        a = dpnp.array([[[2, 1], [1, 2]], [[1, 2], [2, 1]]], dtype="f4")
+        assert_raises(dpnp.linalg.LinAlgError, dpnp.linalg.cholesky, a)
+
     def test_cholesky_errors(self):
         a_dp = dpnp.array([[1, 2], [2, 5]], dtype="float32")
 
@@ -458,6 +535,27 @@ class TestDet:
 
         assert_allclose(result, expected)
 
+    @pytest.mark.parametrize("n", [4, 16])
+    def test_det_large_batch(self, n):
+        a = generate_random_numpy_array(
+            (500, n, n), dpnp.default_float_type(), seed_value=81
+        )
+        ia = dpnp.array(a)
+
+        result = dpnp.linalg.det(ia)
+        expected = numpy.linalg.det(a)
+        assert_allclose(result, expected, rtol=1e-3)
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 6, 32])
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_bool=True))
+    def test_det_small_batch(self, n, dtype):
+        a = generate_random_numpy_array((20, 3, n, n), dtype, seed_value=81)
+        ia = dpnp.array(a)
+
+        result = dpnp.linalg.det(ia)
+        expected = numpy.linalg.det(a)
+        assert_dtype_allclose(result, expected, factor=24)
+
     def test_det_errors(self):
         a_dp = dpnp.array([[1, 2], [3, 5]], dtype="float32")
 
@@ -520,6 +618,30 @@ class TestEigenvalue:
 
         assert_dtype_allclose(w_dp, w, factor=24)
 
+    @pytest.mark.parametrize("func", ["eigh", "eigvalsh"])
+    @pytest.mark.parametrize("n", [1, 2, 3, 6, 7])
+    @pytest.mark.parametrize("UPLO", ["L", "U"])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_eigh_small_batch(self, func, n, UPLO, dtype):
+        a = generate_random_numpy_array(
+            (4, 5, n, n), dtype, hermitian=True, low=-4, high=4
+        )
+        # only a triangle of the matrices is used
+        if UPLO == "L":
+            a_dp = dpnp.array(numpy.tril(a))
+        else:
+            a_dp = dpnp.array(numpy.triu(a))
+
+        result = getattr(dpnp.linalg, func)(a_dp, UPLO=UPLO)
+        if func == "eigh":
+            w_dp, v_dp = result.eigenvalues, result.eigenvectors
+            self.assert_eigen_decomposition(dpnp.array(a), w_dp, v_dp)
+        else:
+            w_dp = result
+
+        w = numpy.linalg.eigvalsh(a)
+        assert_dtype_allclose(w_dp, w, factor=24)
+
     # eigh() and eigvalsh() are tested in cupy tests
     @pytest.mark.parametrize("func", ["eig", "eigvals"])
     @pytest.mark.parametrize(
@@ -1669,6 +1791,102 @@ class TestEinsum:
         assert expected[0] == result[0]
         assert expected[1] == result[1]
 
+    @pytest.mark.parametrize("optimize", [False, "greedy", "optimal"])
+    @pytest.mark.parametrize(
+        "subscripts, shapes",
+        [
+            ("ij,jk,kl->il", [(2, 2), (2, 5), (5, 2)]),
+            (
+                "ea,fb,abcd,gc,hd->efgh",
+                [(3, 3), (3, 3), (3, 3, 3, 3), (3, 3), (3, 3)],
+            ),
+            ("...a,...a->...", [(2, 3, 4), (3, 4)]),
+            ("iij,jk", [(2, 2, 3), (3, 1)]),
+            ("ii->i", [(3, 3)]),
+        ],
+    )
+    def test_einsum_expression(self, subscripts, shapes, optimize):
+        expr = dpnp.einsum_expression(subscripts, *shapes, optimize=optimize)
+        assert expr.shapes == tuple(shapes)
+
+        # the same expression evaluated on different data
+        for _ in range(2):
+            a = [generate_random_numpy_array(shape) for shape in shapes]
+            ia = [dpnp.array(x) for x in a]
+            result = expr(*ia)
+            expected = numpy.einsum(subscripts, *a)
+            assert_dtype_allclose(result, expected)
+
+    def test_einsum_expression_path(self):
+        expr = dpnp.einsum_expression("ij,jk,kl->il", (2, 2), (2, 5), (5, 2))
+        expected = numpy.einsum_path(
+            "ij,jk,kl->il",
+            numpy.ones((2, 2)),
+            numpy.ones((2, 5)),
+            numpy.ones((5, 2)),
+            optimize="greedy",
+        )
+        assert expr.path == expected[0]
+
+        a = dpnp.ones((2, 2))
+        b = dpnp.ones((2, 5))
+        c = dpnp.ones((5, 2))
+        result = dpnp.einsum("ij,jk,kl->il", a, b, c, optimize=expr.path)
+        assert_dtype_allclose(result, expr(a, b, c))
+
+    def test_einsum_expression_out(self):
+        expr = dpnp.einsum_expression("ij,j->i", (3, 4), (4,))
+        a = dpnp.arange(12, dtype=dpnp.float32).reshape(3, 4)
+        b = dpnp.ones(4, dtype=dpnp.float32)
+        out = dpnp.empty(3, dtype=dpnp.float32)
+        result = expr(a, b, out=out)
+        assert result is out
+        expected = numpy.einsum("ij,j->i", a.asnumpy(), b.asnumpy())
+        assert_dtype_allclose(result, expected)
+
+    def test_einsum_expression_error(self):
+        expr = dpnp.einsum_expression("ij,jk", (2, 3), (3, 4))
+        a = dpnp.ones((2, 3))
+        b = dpnp.ones((3, 4))
+
+        # wrong number of operands
+        assert_raises(ValueError, expr, a)
+        # wrong shape of an operand
+        assert_raises(ValueError, expr, a, a)
+        # operands must be arrays
+        assert_raises(TypeError, expr, a, b.asnumpy())
+        # inconsistent sycl_queue
+        out = dpnp.empty((2, 4), sycl_queue=dpctl.SyclQueue())
+        assert_raises(ExecutionPlacementError, expr, a, b, out=out)
+
+        # subscripts must be a string
+        assert_raises(TypeError, dpnp.einsum_expression, [0, 1], (2, 3))
+        # mismatched dimensions are reported on creation
+        assert_raises(ValueError, dpnp.einsum_expression, "ij,jk", (2, 3), (4,))
+        assert_raises(
+            ValueError, dpnp.einsum_expression, "ij,jk", (2, 3), (2, 4)
+        )
+
+    def test_einsum_plan_cache(self):
+        from dpnp.dpnp_utils.dpnp_utils_einsum import _make_einsum_plan
+
+        a = dpnp.ones((3, 4))
+        b = dpnp.ones((4, 5))
+        dpnp.einsum("ij,jk->ik", a, b, optimize="greedy")
+        hits = _make_einsum_plan.cache_info().hits
+
+        result = dpnp.einsum("ij,jk->ik", a + 1, b, optimize="greedy")
+        assert _make_einsum_plan.cache_info().hits == hits + 1
+        expected = numpy.einsum("ij,jk->ik", a.asnumpy() + 1, b.asnumpy())
+        assert_dtype_allclose(result, expected)
+
+        # a path passed as a list is cached as well
+        path = ["einsum_path", [0, 1]]
+        dpnp.einsum("ij,jk->ik", a, b, optimize=path)
+        hits = _make_einsum_plan.cache_info().hits
+        dpnp.einsum("ij,jk->ik", a, b, optimize=path)
+        assert _make_einsum_plan.cache_info().hits == hits + 1
+
 
 class TestInv:
     @pytest.mark.parametrize(
@@ -1761,6 +1979,39 @@ class TestInv:
         assert_raises(numpy.linalg.LinAlgError, numpy.linalg.inv, a_np)
         assert_raises(dpnp.linalg.LinAlgError, dpnp.linalg.inv, a_dp)
 
+    @pytest.mark.parametrize("n", [1, 2, 3, 6, 32])
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_bool=True))
+    def test_inv_small_batch(self, n, dtype):
+        a = generate_random_numpy_array((20, 3, n, n), dtype, seed_value=81)
+        a += n * 10 * numpy.eye(n, dtype=dtype)
+        ia = dpnp.array(a)
+
+        result = dpnp.linalg.inv(ia)
+        expected = numpy.linalg.inv(a)
+        assert_dtype_allclose(result, expected, factor=24)
+
+    @pytest.mark.parametrize("n", [3, 6])
+    def test_inv_small_batch_pivoting(self, n):
+        # zero and tiny leading elements require the rows to be swapped
+        a = generate_random_numpy_array((4, n, n), "f8", seed_value=81)
+        a[0, 0, 0] = 0
+        a[1, 0, 0] = 1e-12
+        a[2, :, 0] = 0
+        a[2, -1, 0] = 1
+        ia = dpnp.array(a)
+
+        result = dpnp.linalg.inv(ia)
+        expected = numpy.linalg.inv(a)
+        assert_allclose(result, expected, rtol=1e-6, atol=1e-8)
+
+    def test_inv_small_batch_singular(self):
+        a = numpy.ones((4, 3, 3))
+        a[:-1] += numpy.eye(3)
+        ia = dpnp.array(a)
+
+        assert_raises(numpy.linalg.LinAlgError, numpy.linalg.inv, a)
+        assert_raises(dpnp.linalg.LinAlgError, dpnp.linalg.inv, ia)
+
     def test_inv_errors(self):
         a_dp = dpnp.array([[1, 2], [2, 5]], dtype="float32")
 
@@ -2150,6 +2401,30 @@ class TestLuFactorBatched:
             )
             assert dpnp.allclose(L @ U, PA, rtol=1e-6, atol=1e-6)
 
+    @pytest.mark.parametrize("shape", [(500, 5, 5), (200, 8, 6)])
+    def test_large_batch(self, shape):
+        a_np = self._make_nonsingular_nd_np(
+            shape, dpnp.default_float_type(), "C"
+        )
+        a_dp = dpnp.array(a_np)
+        lu, piv = dpnp.scipy.linalg.lu_factor(a_dp, check_finite=False)
+
+        m, n = shape[-2:]
+        k = min(m, n)
+        lu_np = dpnp.asnumpy(lu)
+        piv_np = dpnp.asnumpy(piv)
+        L = numpy.tril(lu_np, k=-1)[..., :k] + numpy.eye(m, k)
+        U = numpy.triu(lu_np)[..., :k, :]
+
+        # apply the row interchanges to the input
+        pa = a_np.copy()
+        rows = numpy.arange(shape[0])
+        for i in range(k):
+            tmp = pa[rows, i].copy()
+            pa[rows, i] = pa[rows, piv_np[:, i]]
+            pa[rows, piv_np[:, i]] = tmp
+        assert_allclose(L @ U, pa, rtol=1e-5, atol=1e-5)
+
     def test_singular_matrix(self):
         a = dpnp.zeros((3, 2, 2), dtype=dpnp.default_float_type())
         a[0] = dpnp.array([[1.0, 2.0], [2.0, 4.0]])
@@ -3869,6 +4144,51 @@ class TestSolve:
         assert_raises(numpy.linalg.LinAlgError, numpy.linalg.solve, a_np, b_np)
         assert_raises(dpnp.linalg.LinAlgError, dpnp.linalg.solve, a_dp, b_dp)
 
+    @pytest.mark.parametrize("b_kind", ["vector", "matrix", "batch"])
+    @pytest.mark.parametrize("n", [1, 2, 3, 6, 32])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_solve_small_batch(self, n, b_kind, dtype):
+        a = generate_random_numpy_array((20, 5, n, n), dtype, seed_value=81)
+        a += n * 10 * numpy.eye(n, dtype=dtype)
+        b_shape = {"vector": (n,), "matrix": (n, 4), "batch": (20, 1, n, 4)}
+        b = generate_random_numpy_array(b_shape[b_kind], dtype, seed_value=76)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = dpnp.linalg.solve(ia, ib)
+        expected = numpy.linalg.solve(a, b)
+        assert_dtype_allclose(result, expected, factor=24)
+
+    @pytest.mark.parametrize("b_shape", [(50,), (50, 3)])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_solve_mixed_precision(self, b_shape, dtype):
+        a = generate_random_numpy_array((50, 50), dtype, seed_value=81)
+        a += 50 * numpy.eye(50, dtype=dtype)
+        b = generate_random_numpy_array(b_shape, dtype, seed_value=76)
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        result = dpnp.linalg.solve(ia, ib, mixed_precision=True)
+        expected = numpy.linalg.solve(a, b)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.skipif(
+        not has_support_aspect64(), reason="double precision is required"
+    )
+    @pytest.mark.parametrize(
+        "matrix, vector",
+        [
+            ([[1, 1], [1, 1 + 1e-10]], [2, 2 + 1e-10]),
+            ([[1e300, 1], [1, 1]], [1e300, 2]),
+        ],
+        ids=["Singular in single precision", "Overflow in single precision"],
+    )
+    def test_solve_mixed_precision_fallback(self, matrix, vector):
+        a_dp = dpnp.array(matrix, dtype="float64")
+        b_dp = dpnp.array(vector, dtype="float64")
+
+        result = dpnp.linalg.solve(a_dp, b_dp, mixed_precision=True)
+        expected = dpnp.linalg.solve(a_dp, b_dp)
+        assert_allclose(result, expected)
+
     def test_solve_errors(self):
         a_dp = dpnp.array([[1, 0.5], [0.5, 1]], dtype="float32")
         b_dp = dpnp.array(a_dp, dtype="float32")
@@ -3897,6 +4217,88 @@ class TestSolve:
         assert_raises(ValueError, dpnp.linalg.solve, a_dp, b_dp_ndim_0)
 
 
+class TestSolveTriangular:
+    @pytest.mark.parametrize("unit_diagonal", [True, False])
+    @pytest.mark.parametrize("lower", [True, False])
+    @pytest.mark.parametrize("trans", [0, 1, 2, "N", "T", "C"])
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_solve_triangular(self, trans, lower, unit_diagonal, dtype):
+        n = 5
+        a_np = generate_random_numpy_array((n, n), dtype, seed_value=81)
+        a_np += n * numpy.eye(n, dtype=dtype)
+        b_np = generate_random_numpy_array((n, 3), dtype, seed_value=76)
+        a_dp, b_dp = dpnp.array(a_np), dpnp.array(b_np)
+
+        x = dpnp.scipy.linalg.solve_triangular(
+            a_dp, b_dp, trans, lower=lower, unit_diagonal=unit_diagonal
+        )
+
+        t_np = numpy.tril(a_np) if lower else numpy.triu(a_np)
+        if unit_diagonal:
+            numpy.fill_diagonal(t_np, 1)
+        if trans in (1, "T"):
+            t_np = t_np.T
+        elif trans in (2, "C"):
+            t_np = t_np.conj().T
+        expected = numpy.linalg.solve(t_np, b_np)
+        assert_dtype_allclose(x, expected, factor=24)
+
+    @pytest.mark.parametrize("lower", [True, False])
+    @pytest.mark.parametrize(
+        "a_shape, b_shape",
+        [
+            ((3, 4, 4), (3, 4, 2)),
+            ((2, 1, 4, 4), (2, 3, 4, 2)),
+            ((4, 4), (2, 4, 1)),
+        ],
+    )
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_solve_triangular_batched(self, a_shape, b_shape, lower, dtype):
+        a_np = generate_random_numpy_array(a_shape, dtype, seed_value=81)
+        a_np += 4 * numpy.eye(4, dtype=dtype)
+        b_np = generate_random_numpy_array(b_shape, dtype, seed_value=76)
+        a_dp, b_dp = dpnp.array(a_np), dpnp.array(b_np)
+
+        x = dpnp.scipy.linalg.solve_triangular(a_dp, b_dp, lower=lower)
+
+        t_np = numpy.tril(a_np) if lower else numpy.triu(a_np)
+        expected = numpy.linalg.solve(t_np, b_np)
+        assert_dtype_allclose(x, expected, factor=24)
+
+    def test_singular(self):
+        a_dp = dpnp.array([[1, 2, 3], [0, 0, 1], [0, 0, 2]])
+        b_dp = dpnp.ones(3)
+        assert_raises(
+            dpnp.linalg.LinAlgError,
+            dpnp.scipy.linalg.solve_triangular,
+            a_dp,
+            b_dp,
+        )
+
+        # the diagonal is not referenced for unit diagonal matrix
+        x = dpnp.scipy.linalg.solve_triangular(a_dp, b_dp, unit_diagonal=True)
+        assert_allclose(x, [-2.0, 0.0, 1.0])
+
+    def test_errors(self):
+        a_dp = dpnp.eye(3)
+        assert_raises(
+            ValueError, dpnp.scipy.linalg.solve_triangular, a_dp, dpnp.ones(4)
+        )
+        assert_raises(
+            ValueError,
+            dpnp.scipy.linalg.solve_triangular,
+            a_dp,
+            dpnp.ones(3),
+            trans=3,
+        )
+        assert_raises(
+            ValueError,
+            dpnp.scipy.linalg.solve_triangular,
+            a_dp,
+            dpnp.array([1, dpnp.nan, 1]),
+        )
+
+
 class TestSlogdet:
     @pytest.mark.parametrize("dtype", get_all_dtypes(no_bool=True))
     def test_slogdet_2d(self, dtype):
@@ -3999,6 +4401,19 @@ class TestSlogdet:
         assert_allclose(sign_result, sign_expected)
         assert_allclose(logdet_result, logdet_expected)
 
+    @pytest.mark.parametrize("n", [6, 70])
+    def test_slogdet_large_batch(self, n):
+        a = generate_random_numpy_array(
+            (300, n, n), dpnp.default_float_type(), seed_value=81
+        )
+        a_dp = dpnp.array(a)
+
+        sign_expected, logdet_expected = numpy.linalg.slogdet(a)
+        result = dpnp.linalg.slogdet(a_dp)
+
+        assert_allclose(result.sign, sign_expected)
+        assert_allclose(result.logabsdet, logdet_expected, rtol=1e-4)
+
     def test_slogdet_errors(self):
         a_dp = dpnp.array([[1, 2], [3, 5]], dtype="float32")
 
@@ -14,6 +14,7 @@ from dpnp.exceptions import AxisError
 
 from .helper import (
     assert_dtype_allclose,
+    generate_random_numpy_array,
     get_all_dtypes,
     get_array,
     get_complex_dtypes,
@@ -1960,6 +1961,34 @@ class TestUnique:
             for iv, v in zip(result, expected):
                 assert_array_equal(iv, v)
 
+    @testing.with_requires("numpy>=2.0.1")
+    @pytest.mark.parametrize("dt", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("axis", [0, 1])
+    def test_2d_axis_many_rows(self, dt, axis):
+        a = generate_random_numpy_array((500, 3), dt, low=0, high=3)
+        a = numpy.concatenate((a, a[::-3]))
+        if axis == 1:
+            a = a.T
+        ia = dpnp.array(a)
+
+        result = dpnp.unique(ia, True, True, True, axis=axis)
+        expected = numpy.unique(a, True, True, True, axis=axis)
+        for iv, v in zip(result, expected):
+            assert_array_equal(iv, v)
+
+    @testing.with_requires("numpy>=2.0.1")
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    def test_2d_axis_many_rows_nans(self, dt):
+        a = generate_random_numpy_array((300, 2), dt, low=0, high=2)
+        a[::7, 0] = numpy.nan
+        a[::11, 1] = numpy.nan
+        ia = dpnp.array(a)
+
+        result = dpnp.unique(ia, return_index=True, axis=0)
+        expected = numpy.unique(a, return_index=True, axis=0)
+        for iv, v in zip(result, expected):
+            assert_array_equal(iv, v)
+
     @testing.with_requires("numpy>=2.0")
     @pytest.mark.parametrize(
         "func",
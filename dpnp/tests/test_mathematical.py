@@ -1947,7 +1947,7 @@ class TestUfunc:
         [
             pytest.param(
                 "abs",
-                {"unknown_kwarg": 1, "where": False, "subok": False},
+                {"unknown_kwarg": 1, "subok": False},
                 id="DPNPUnaryFunc",
             ),
             pytest.param(
@@ -1962,7 +1962,7 @@ class TestUfunc:
             ),
             pytest.param(
                 "add",
-                {"unknown_kwarg": 1, "where": False, "subok": False},
+                {"unknown_kwarg": 1, "subok": False},
                 id="DPNPBinaryFunc",
             ),
             pytest.param(
@@ -2175,6 +2175,184 @@ class TestUfunc:
         assert len(types) > 0
 
 
+class TestUfuncMethods:
+    @pytest.mark.parametrize(
+        "func",
+        [
+            "add",
+            "multiply",
+            "maximum",
+            "fmin",
+            "logaddexp",
+            "subtract",
+            "bitwise_or",
+            "gcd",
+        ],
+    )
+    @pytest.mark.parametrize("axis", [0, 1, -1])
+    @pytest.mark.parametrize("keepdims", [True, False])
+    def test_reduce(self, func, axis, keepdims):
+        if func in ["bitwise_or", "gcd"]:
+            a = generate_random_numpy_array((3, 5), "i4", low=0, high=20)
+        else:
+            a = generate_random_numpy_array((3, 5), "f4", low=0.5, high=1.5)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp, func).reduce(ia, axis=axis, keepdims=keepdims)
+        expected = getattr(numpy, func).reduce(a, axis=axis, keepdims=keepdims)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    @pytest.mark.parametrize("func", ["add", "maximum", "bitwise_xor"])
+    @pytest.mark.parametrize("axis", [None, (0, 2), (1,)])
+    @pytest.mark.parametrize("initial", [None, 5])
+    def test_reduce_axes(self, func, axis, initial):
+        a = generate_random_numpy_array((4, 3, 5), "i4", low=0, high=50)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp, func).reduce(ia, axis=axis, initial=initial)
+        expected = getattr(numpy, func).reduce(a, axis=axis, initial=initial)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    @pytest.mark.parametrize("func", ["add", "bitwise_and", "logical_or"])
+    def test_reduce_empty(self, func):
+        a = numpy.ones((3, 0), dtype="i4")
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp, func).reduce(ia, axis=1)
+        expected = getattr(numpy, func).reduce(a, axis=1)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    @pytest.mark.parametrize(
+        "dtype", get_integer_dtypes(all_int_types=True) + [dpnp.bool]
+    )
+    def test_reduce_empty_bitwise_and(self, dtype):
+        a = numpy.ones((3, 0), dtype=dtype)
+        ia = dpnp.array(a)
+
+        result = dpnp.bitwise_and.reduce(ia, axis=1)
+        expected = numpy.bitwise_and.reduce(a, axis=1)
+        assert_array_equal(result, expected)
+
+    def test_reduce_out(self):
+        a = numpy.arange(12, dtype="f4").reshape(3, 4)
+        ia = dpnp.array(a)
+
+        iout = dpnp.empty(4, dtype="f4")
+        result = dpnp.fmax.reduce(ia, out=iout)
+        assert result is iout
+        assert_array_equal(result, numpy.fmax.reduce(a))
+
+    def test_reduce_error(self):
+        a = dpnp.ones((2, 3))
+        assert_raises(ValueError, dpnp.subtract.reduce, a, axis=(0, 1))
+        assert_raises(ValueError, dpnp.subtract.reduce, a, axis=None)
+        assert_raises(ValueError, dpnp.fmax.reduce, dpnp.ones((2, 0)), axis=1)
+        assert_raises(NotImplementedError, dpnp.add.reduce, a, where=False)
+
+    @pytest.mark.parametrize(
+        "func", ["add", "multiply", "maximum", "fmax", "subtract", "logaddexp"]
+    )
+    @pytest.mark.parametrize("axis", [0, 1])
+    def test_accumulate(self, func, axis):
+        a = generate_random_numpy_array((4, 7), "f4", low=0.5, high=1.5)
+        ia = dpnp.array(a)
+
+        result = getattr(dpnp, func).accumulate(ia, axis=axis)
+        expected = getattr(numpy, func).accumulate(a, axis=axis)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    def test_accumulate_dtype(self, dtype):
+        a = generate_random_numpy_array(10, dtype)
+        ia = dpnp.array(a)
+
+        result = dpnp.add.accumulate(ia)
+        expected = numpy.add.accumulate(a)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("func", ["add", "minimum", "subtract"])
+    @pytest.mark.parametrize(
+        "indices",
+        [[0, 4, 5, 9], [2, 2, 7], [0, 4, 1, 5, 2, 6, 3, 7], [9]],
+    )
+    @pytest.mark.parametrize("axis", [0, -1])
+    def test_reduceat(self, func, indices, axis):
+        a = generate_random_numpy_array((10, 10), "i4", low=-20, high=20)
+        ia = dpnp.array(a)
+        iindices = dpnp.array(indices)
+
+        result = getattr(dpnp, func).reduceat(ia, iindices, axis=axis)
+        expected = getattr(numpy, func).reduceat(a, indices, axis=axis)
+        assert_dtype_allclose(result, expected, check_only_type_kind=True)
+
+    @pytest.mark.parametrize("func", ["add", "maximum", "subtract"])
+    def test_reduceat_overlapping(self, func):
+        a = generate_random_numpy_array((4, 12), "f4", low=-5, high=5)
+        indices = [3, 11, 0, 8, 5, 5, 2, 10]
+        ia, iindices = dpnp.array(a), dpnp.array(indices)
+
+        result = getattr(dpnp, func).reduceat(ia, iindices, axis=1)
+        expected = getattr(numpy, func).reduceat(a, indices, axis=1)
+        assert_dtype_allclose(result, expected)
+
+    def test_reduceat_error(self):
+        a = dpnp.arange(5)
+        assert_raises(IndexError, dpnp.add.reduceat, a, [0, 5])
+        assert_raises(IndexError, dpnp.add.reduceat, a, [-1])
+        assert_raises(TypeError, dpnp.add.reduceat, a, [0.5])
+        assert_raises(ValueError, dpnp.add.reduceat, a, [[0, 1]])
+
+    @pytest.mark.parametrize(
+        "func", ["add", "multiply", "maximum", "subtract", "divide", "fmod"]
+    )
+    @pytest.mark.parametrize("dtype", get_float_dtypes())
+    def test_at(self, func, dtype):
+        a = generate_random_numpy_array(10, dtype, low=1, high=5)
+        b = generate_random_numpy_array(8, dtype, low=1, high=5)
+        indices = numpy.array([0, 3, 3, 9, 1, 3, 9, 5])
+        ia, ib, iindices = dpnp.array(a), dpnp.array(b), dpnp.array(indices)
+
+        getattr(dpnp, func).at(ia, iindices, ib)
+        getattr(numpy, func).at(a, indices, b)
+        assert_dtype_allclose(ia, a)
+
+    def test_at_scalar(self):
+        a = numpy.zeros(5, dtype="i4")
+        ia = dpnp.array(a)
+
+        dpnp.add.at(ia, [0, 0, 4, 0], 1)
+        numpy.add.at(a, [0, 0, 4, 0], 1)
+        assert_array_equal(ia, a)
+
+    def test_at_unary(self):
+        a = numpy.arange(6, dtype="f4")
+        ia = dpnp.array(a)
+
+        dpnp.negative.at(ia, [1, 1, 2])
+        numpy.negative.at(a, [1, 1, 2])
+        assert_array_equal(ia, a)
+
+    def test_at_multi_dim(self):
+        a = numpy.arange(24, dtype="f4").reshape(4, 6)
+        b = numpy.ones((3, 6), dtype="f4")
+        ia, ib = dpnp.array(a), dpnp.array(b)
+
+        dpnp.add.at(ia, (dpnp.array([0, 2, 0]), slice(None)), ib)
+        numpy.add.at(a, (numpy.array([0, 2, 0]), slice(None)), b)
+        assert_array_equal(ia, a)
+
+        # non-contiguous array
+        ia = dpnp.array(a)
+        dpnp.maximum.at(ia.T, dpnp.array([1, 1, 5]), 20)
+        numpy.maximum.at(a.T, numpy.array([1, 1, 5]), 20)
+        assert_array_equal(ia, a)
+
+    def test_at_error(self):
+        a = dpnp.arange(5)
+        assert_raises(ValueError, dpnp.add.at, a, [0], None)
+        assert_raises(ValueError, dpnp.negative.at, a, [0], 1)
+
+
 class TestUnwrap:
     @pytest.mark.parametrize("dt", get_float_dtypes())
     def test_basic(self, dt):
@@ -337,6 +337,16 @@ class TestNanMean:
         result = dpnp.nanmean(ia)
         assert_dtype_allclose(result, expected)
 
+    @pytest.mark.parametrize("dtype", get_complex_dtypes())
+    def test_complex_nan_imag(self, dtype):
+        a = generate_random_numpy_array((4, 5), dtype=dtype)
+        a.imag[::2, 1] = numpy.nan
+        ia = dpnp.array(a)
+
+        expected = numpy.nanmean(a, axis=0)
+        result = dpnp.nanmean(ia, axis=0)
+        assert_dtype_allclose(result, expected)
+
     @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
     def test_dtype(self, dtype):
         ia = dpnp.array([[dpnp.nan, 1, 2], [3, dpnp.nan, 0]])
@@ -588,6 +598,76 @@ class TestNanProdSum:
 
 
 @pytest.mark.parametrize("func", ["nanstd", "nanvar"])
+@pytest.mark.parametrize("func", ["nanpercentile", "nanquantile"])
+class TestNanQuantile:
+    @staticmethod
+    def _get_q(func, q):
+        return numpy.asarray(q) * 100 if func == "nanpercentile" else q
+
+    @pytest.mark.parametrize("dtype", get_float_dtypes())
+    @pytest.mark.parametrize(
+        "method", ["inverted_cdf", "hazen", "linear", "lower", "nearest"]
+    )
+    @pytest.mark.parametrize("axis", [None, 0, -1, (0, 1)])
+    @pytest.mark.parametrize("keepdims", [True, False])
+    def test_basic(self, func, dtype, method, axis, keepdims):
+        a = generate_random_numpy_array((3, 4, 5), dtype)
+        a[0, 1, 2] = a[1, :, 0] = a[2, 3, :2] = numpy.nan
+        ia = dpnp.array(a)
+        q = self._get_q(func, [0.0, 0.3, 0.5, 1.0])
+
+        kw = {"method": method, "axis": axis, "keepdims": keepdims}
+        expected = getattr(numpy, func)(a, q, **kw)
+        result = getattr(dpnp, func)(ia, q, **kw)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize(
+        "dtype", get_all_dtypes(no_none=True, no_bool=True, no_complex=True)
+    )
+    def test_no_nan(self, func, dtype):
+        a = generate_random_numpy_array((4, 5), dtype)
+        ia = dpnp.array(a)
+        q = self._get_q(func, 0.25)
+
+        expected = getattr(numpy, func)(a, q, axis=1)
+        result = getattr(dpnp, func)(ia, q, axis=1)
+        assert_dtype_allclose(result, expected)
+
+    def test_all_nan(self, func):
+        a = numpy.array([[numpy.nan, numpy.nan], [1.0, 2.0]])
+        ia = dpnp.array(a)
+        q = self._get_q(func, [0.1, 0.9])
+
+        with pytest.warns(RuntimeWarning, match="All-NaN slice encountered"):
+            result = getattr(dpnp, func)(ia, q, axis=1)
+        with pytest.warns(RuntimeWarning, match="All-NaN slice encountered"):
+            expected = getattr(numpy, func)(a, q, axis=1)
+        assert_dtype_allclose(result, expected)
+
+    def test_out(self, func):
+        a = generate_random_numpy_array((4, 5))
+        a[1, 2] = numpy.nan
+        ia = dpnp.array(a)
+        q = self._get_q(func, [0.3, 0.7])
+
+        out_np = numpy.empty((2, 4), dtype=a.dtype)
+        out_dp = dpnp.empty((2, 4), dtype=ia.dtype)
+        expected = getattr(numpy, func)(a, q, axis=1, out=out_np)
+        result = getattr(dpnp, func)(ia, q, axis=1, out=out_dp)
+        assert result is out_dp
+        assert_dtype_allclose(result, expected)
+
+    def test_error(self, func):
+        ia = dpnp.array([1.0, dpnp.nan, 3.0])
+        dpnp_func = getattr(dpnp, func)
+
+        assert_raises(ValueError, dpnp_func, ia, self._get_q(func, 2.0))
+        assert_raises(ValueError, dpnp_func, ia, 0, method="deadbeef")
+        assert_raises(
+            NotImplementedError, dpnp_func, ia, 0, weights=dpnp.ones(3)
+        )
+
+
 class TestNanStdVar:
     @pytest.mark.parametrize(
         "array",
@@ -652,6 +732,16 @@ class TestNanStdVar:
         result = getattr(dpnp, func)(ia)
         assert_dtype_allclose(result, expected)
 
+    @pytest.mark.parametrize("dtype", get_complex_dtypes())
+    def test_complex_nan_imag(self, func, dtype):
+        a = generate_random_numpy_array((4, 5), dtype=dtype)
+        a.imag[::2, 1] = numpy.nan
+        ia = dpnp.array(a)
+
+        expected = getattr(numpy, func)(a, axis=0)
+        result = getattr(dpnp, func)(ia, axis=0)
+        assert_dtype_allclose(result, expected)
+
     @pytest.mark.usefixtures("suppress_dof_numpy_warnings")
     @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
     @pytest.mark.parametrize("axis", [None, 0, 1, 2, (0, 1), (1, 2)])
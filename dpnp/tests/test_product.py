@@ -1106,6 +1106,38 @@ class TestMatmul:
         assert result.flags.f_contiguous == expected.flags.f_contiguous
         assert_dtype_allclose(result, expected)
 
+    @pytest.mark.parametrize("trans_a", [True, False])
+    @pytest.mark.parametrize("trans_b", [True, False])
+    @pytest.mark.parametrize("trans_out", [True, False])
+    def test_out_order_mixed(self, trans_a, trans_b, trans_out):
+        # test gemm_batch with inputs whose 2D bases have different layouts
+        def _stack(shape, trans):
+            if trans:
+                shape = (shape[0], shape[2], shape[1])
+            x = generate_random_numpy_array(shape, low=-5, high=5)
+            ix = dpnp.array(x)
+            if trans:
+                return x.transpose(0, 2, 1), ix.transpose(0, 2, 1)
+            return x, ix
+
+        a, ia = _stack((3, 4, 6), trans_a)
+        b, ib = _stack((3, 6, 5), trans_b)
+
+        if trans_out:
+            iout = dpnp.empty((3, 5, 4)).transpose(0, 2, 1)
+            out = numpy.empty((3, 5, 4)).transpose(0, 2, 1)
+        else:
+            iout = dpnp.empty((3, 4, 5))
+            out = numpy.empty((3, 4, 5))
+
+        result = dpnp.matmul(ia, ib, out=iout)
+        assert result is iout
+
+        expected = numpy.matmul(a, b, out=out)
+        assert result.flags.c_contiguous == expected.flags.c_contiguous
+        assert result.flags.f_contiguous == expected.flags.f_contiguous
+        assert_dtype_allclose(result, expected)
+
     @pytest.mark.parametrize(
         "out_shape",
         [((4, 5)), ((6,)), ((4, 7, 2))],
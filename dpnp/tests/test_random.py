@@ -2,7 +2,12 @@ import unittest
 
 import numpy
 import pytest
-from numpy.testing import assert_allclose, assert_array_equal, assert_equal
+from numpy.testing import (
+    assert_allclose,
+    assert_array_equal,
+    assert_equal,
+    assert_raises,
+)
 
 import dpnp.random
 
@@ -1178,3 +1183,276 @@ class TestPermutationsTestShuffle:
         actual = alist
         desired = conv([0, 1, 9, 6, 2, 4, 5, 8, 7, 3])
         assert_array_equal(actual, desired)
+
+
+class TestChoice:
+    @pytest.mark.parametrize("replace", [True, False])
+    def test_int_population(self, replace):
+        dpnp.random.seed(28041990)
+        res = dpnp.random.choice(10, size=(2, 3), replace=replace)
+        assert res.shape == (2, 3)
+        assert res.dtype == dpnp.int64
+        assert dpnp.all((res >= 0) & (res < 10))
+        if not replace:
+            assert dpnp.unique(res).size == res.size
+
+    @pytest.mark.parametrize("replace", [True, False])
+    def test_array_population(self, replace):
+        a = dpnp.array([1.5, 2.5, 3.5, 4.5])
+        res = dpnp.random.choice(a, size=4, replace=replace)
+        assert res.dtype == a.dtype
+        assert res.sycl_queue == a.sycl_queue
+        assert dpnp.all(dpnp.isin(res, a))
+        if not replace:
+            assert_array_equal(dpnp.sort(res), a)
+
+    @pytest.mark.parametrize("replace", [True, False])
+    def test_probabilities(self, replace):
+        p = [0.1, 0.0, 0.3, 0.6, 0.0]
+        res = dpnp.random.choice(5, size=3, replace=replace, p=p)
+        assert not dpnp.any((res == 1) | (res == 4))
+
+    def test_frequencies(self):
+        p = numpy.array([0.2, 0.5, 0.3])
+        res = dpnp.random.choice(3, size=10**5, p=p)
+        freq = dpnp.asnumpy(dpnp.bincount(res, minlength=3)) / res.size
+        assert_allclose(freq, p, atol=0.02)
+
+    def test_invalid_args(self):
+        assert_raises(ValueError, dpnp.random.choice, [[1, 2], [3, 4]])
+        assert_raises(ValueError, dpnp.random.choice, 3, p=[0.5, 0.5])
+        assert_raises(ValueError, dpnp.random.choice, 3, p=[0.5, 0.6, -0.1])
+        assert_raises(ValueError, dpnp.random.choice, 3, p=[0.5, 0.6, 0.1])
+        assert_raises(ValueError, dpnp.random.choice, 3, 4, replace=False)
+        assert_raises(
+            ValueError,
+            dpnp.random.choice,
+            3,
+            2,
+            replace=False,
+            p=[1.0, 0.0, 0.0],
+        )
+
+
+class TestDirichlet:
+    def test_moments(self):
+        alpha = numpy.array([10.0, 5.0, 3.0])
+        res = dpnp.random.dirichlet(alpha, size=10**5)
+        assert res.shape == (10**5, 3)
+        assert_allclose(dpnp.sum(res, axis=1), 1.0, rtol=1e-5)
+        assert_allclose(dpnp.mean(res, axis=0), alpha / alpha.sum(), atol=0.01)
+
+    def test_invalid_args(self):
+        assert_raises(ValueError, dpnp.random.dirichlet, [1.0, -1.0])
+        assert_raises(ValueError, dpnp.random.dirichlet, [1.0, numpy.nan])
+        assert_raises(ValueError, dpnp.random.dirichlet, [1.0, numpy.inf])
+
+
+class TestLogseries(TestDistribution):
+    def test_moments(self):
+        p = 0.6
+        log_q = numpy.log1p(-p)
+        expected_mean = -p / ((1 - p) * log_q)
+        expected_var = -p * (p + log_q) / ((1 - p) ** 2 * log_q**2)
+        self.check_moments("logseries", expected_mean, expected_var, {"p": p})
+
+    def test_invalid_args(self):
+        self.check_invalid_args("logseries", {"p": 1.5})
+
+
+@pytest.mark.skipif(not has_support_aspect64(), reason="Failed on Iris Xe")
+class TestNoncentralF(TestDistribution):
+    def test_moments(self):
+        dfnum, dfden, nonc = 3.0, 20.0, 3.0
+        expected_mean = dfden * (dfnum + nonc) / (dfnum * (dfden - 2))
+        expected_var = (
+            2
+            * (dfden / dfnum) ** 2
+            * ((dfnum + nonc) ** 2 + (dfnum + 2 * nonc) * (dfden - 2))
+            / ((dfden - 2) ** 2 * (dfden - 4))
+        )
+        self.check_moments(
+            "noncentral_f",
+            expected_mean,
+            expected_var,
+            {"dfnum": dfnum, "dfden": dfden, "nonc": nonc},
+            size=10**6,
+        )
+
+    def test_invalid_args(self):
+        params = {"dfnum": 3.0, "dfden": -1.0, "nonc": 3.0}
+        self.check_invalid_args("noncentral_f", params)
+
+
+def test_bytes():
+    res = dpnp.random.bytes(10)
+    assert isinstance(res, bytes)
+    assert len(res) == 10
+
+
+@pytest.mark.skipif(not has_support_aspect64(), reason="Failed on Iris Xe")
+@pytest.mark.parametrize(
+    "dist, params, mean",
+    [
+        ("beta", {"a": [1.0, 4.0], "b": 2.0}, lambda a, b: a / (a + b)),
+        (
+            "binomial",
+            {"n": [10.0, 100.0], "p": [0.3, 0.8]},
+            lambda n, p: n * p,
+        ),
+        ("chisquare", {"df": [0.5, 3.0]}, lambda df: df),
+        ("exponential", {"scale": [0.5, 3.0]}, lambda scale: scale),
+        (
+            "gamma",
+            {"shape": [0.3, 2.5], "scale": 2.0},
+            lambda shape, scale: shape * scale,
+        ),
+        ("geometric", {"p": [0.3, 1.0]}, lambda p: 1 / p),
+        (
+            "gumbel",
+            {"loc": [0.0, 2.0], "scale": 1.5},
+            lambda loc, scale: loc + 0.5772156649 * scale,
+        ),
+        (
+            "hypergeometric",
+            {"ngood": [5.0, 100.0], "nbad": 50.0, "nsample": [3.0, 40.0]},
+            lambda ngood, nbad, nsample: nsample * ngood / (ngood + nbad),
+        ),
+        ("laplace", {"loc": [-1.0, 2.0], "scale": 0.5}, lambda loc, scale: loc),
+        (
+            "logistic",
+            {"loc": [-1.0, 2.0], "scale": 0.5},
+            lambda loc, scale: loc,
+        ),
+        (
+            "lognormal",
+            {"mean": [0.0, 0.5], "sigma": 0.5},
+            lambda mean, sigma: numpy.exp(mean + sigma**2 / 2),
+        ),
+        (
+            "normal",
+            {"loc": [-3.0, 5.0], "scale": [1.0, 0.5]},
+            lambda loc, scale: loc,
+        ),
+        (
+            "negative_binomial",
+            {"n": [1.0, 5.0], "p": 0.4},
+            lambda n, p: n * (1 - p) / p,
+        ),
+        (
+            "noncentral_chisquare",
+            {"df": [0.5, 3.0], "nonc": 2.0},
+            lambda df, nonc: df + nonc,
+        ),
+        (
+            "noncentral_f",
+            {"dfnum": [0.5, 3.0], "dfden": 20.0, "nonc": 3.0},
+            lambda dfnum, dfden, nonc: dfden
+            * (dfnum + nonc)
+            / (dfnum * (dfden - 2)),
+        ),
+        ("pareto", {"a": [5.0, 10.0]}, lambda a: 1 / (a - 1)),
+        ("poisson", {"lam": [2.0, 50.0]}, lambda lam: lam),
+        ("power", {"a": [0.5, 3.0]}, lambda a: a / (a + 1)),
+        (
+            "rayleigh",
+            {"scale": [1.0, 2.0]},
+            lambda scale: scale * numpy.sqrt(numpy.pi / 2),
+        ),
+        ("standard_gamma", {"shape": [0.5, 4.0]}, lambda shape: shape),
+        ("standard_t", {"df": [5.0, 10.0]}, lambda df: 0.0),
+        (
+            "triangular",
+            {"left": [0.0, 1.0], "mode": 2.0, "right": 3.0},
+            lambda left, mode, right: (left + mode + right) / 3,
+        ),
+        (
+            "uniform",
+            {"low": [0.0, 1.0], "high": [1.0, 5.0]},
+            lambda low, high: (low + high) / 2,
+        ),
+        (
+            "vonmises",
+            {"mu": [-1.0, 1.0], "kappa": [4.0, 8.0]},
+            lambda mu, kappa: mu,
+        ),
+        ("wald", {"mean": [1.0, 3.0], "scale": 2.0}, lambda mean, scale: mean),
+        ("weibull", {"a": [0.0, 1.0]}, lambda a: numpy.where(a == 0, 0, 1)),
+        (
+            "zipf",
+            {"a": [3.5, 5.0]},
+            lambda a: sum(k ** (1 - a) for k in range(1, 10**4))
+            / sum(k**-a for k in range(1, 10**4)),
+        ),
+    ],
+)
+def test_array_params(dist, params, mean):
+    dpnp.random.seed(28041995)
+    size = (10**5, 2)
+    dp_params = {
+        k: dpnp.array(v) if isinstance(v, list) else v
+        for k, v in params.items()
+    }
+    res = getattr(dpnp.random, dist)(size=size, **dp_params)
+    assert res.shape == size
+
+    np_params = {k: numpy.array(v) for k, v in params.items()}
+    expected_mean = numpy.broadcast_to(mean(**np_params), (2,))
+    assert_allclose(dpnp.mean(res, axis=0), expected_mean, atol=0.1, rtol=0.05)
+
+
+@pytest.mark.parametrize(
+    "dist, params",
+    [
+        ("beta", {"a": [1.0, -4.0], "b": 2.0}),
+        ("gamma", {"shape": [1.0, -1.0]}),
+        ("beta", {"a": [1.0, numpy.nan], "b": 2.0}),
+        ("binomial", {"n": [10.0, -1.0], "p": 0.5}),
+        ("binomial", {"n": 10.0, "p": [0.5, numpy.nan]}),
+        ("chisquare", {"df": [1.0, numpy.nan]}),
+        ("f", {"dfnum": [1.0, numpy.inf], "dfden": 2.0}),
+        ("gamma", {"shape": [1.0, numpy.nan]}),
+        ("gamma", {"shape": 1.0, "scale": [1.0, numpy.nan]}),
+        ("hypergeometric", {"ngood": [5.0, 1.0], "nbad": 1.0, "nsample": 3.0}),
+        ("multinomial", {"n": [10.0, -1.0], "pvals": [0.5, 0.5]}),
+        ("multinomial", {"n": 10.0, "pvals": [0.5, 0.7, -0.2]}),
+        ("negative_binomial", {"n": [1.0, 0.0], "p": 0.5}),
+        ("noncentral_chisquare", {"df": 1.0, "nonc": [1.0, -1.0]}),
+        ("noncentral_f", {"dfnum": [0.5, 0.0], "dfden": 2.0, "nonc": 1.0}),
+        ("poisson", {"lam": [1.0, -1.0]}),
+        ("standard_gamma", {"shape": [1.0, numpy.inf]}),
+        ("standard_t", {"df": [numpy.nan, 1.0]}),
+        ("normal", {"loc": 0.0, "scale": [1.0, -1.0]}),
+        ("triangular", {"left": [0.0, 3.0], "mode": 2.0, "right": 3.0}),
+        ("vonmises", {"mu": 0.0, "kappa": [1.0, -1.0]}),
+        ("wald", {"mean": [1.0, 0.0], "scale": 2.0}),
+        ("zipf", {"a": [2.0, 1.0]}),
+    ],
+)
+def test_array_params_invalid(dist, params):
+    params = {
+        k: dpnp.array(v) if isinstance(v, list) else v
+        for k, v in params.items()
+    }
+    with pytest.raises(ValueError):
+        getattr(dpnp.random, dist)(size=(10, 2), **params)
+
+
+@pytest.mark.skipif(not has_support_aspect64(), reason="Failed on Iris Xe")
+def test_multinomial_array_params():
+    dpnp.random.seed(28041995)
+    n = dpnp.array([10, 100])
+    pvals = dpnp.array([0.2, 0.3, 0.5])
+    res = dpnp.random.multinomial(n, pvals, size=(10**5, 2))
+    assert res.shape == (10**5, 2, 3)
+    assert_array_equal(dpnp.sum(res, axis=-1), dpnp.broadcast_to(n, (10**5, 2)))
+
+    expected_mean = numpy.outer([10, 100], [0.2, 0.3, 0.5])
+    assert_allclose(dpnp.mean(res, axis=0), expected_mean, atol=0.1, rtol=0.05)
+
+
+def test_array_params_shape_mismatch():
+    loc = dpnp.zeros(3)
+    assert dpnp.random.normal(loc).shape == (3,)
+    assert dpnp.random.normal(loc, size=(4, 3)).shape == (4, 3)
+    assert_raises(ValueError, dpnp.random.normal, loc, size=(3, 2))
@@ -0,0 +1,246 @@
+import dpctl
+import numpy
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal, assert_raises
+
+import dpnp
+from dpnp.random import BitGenerator, Generator, Philox, default_rng
+
+from .helper import has_support_aspect64
+
+list_of_usm_types = ["host", "device", "shared"]
+
+
+def _words(raw):
+    """Split 64-bit words into 32-bit ones, least significant word first."""
+    raw = dpnp.asnumpy(raw).astype(numpy.uint64)
+    return numpy.stack((raw & 0xFFFFFFFF, raw >> 32), axis=-1).ravel()
+
+
+class TestPhilox:
+    # known answer tests of Philox4x32-10 from Random123 library
+    @pytest.mark.parametrize(
+        "counter, key, expected",
+        [
+            (
+                [0, 0, 0, 0],
+                [0, 0],
+                [0x6627E8D5, 0xE169C58D, 0xBC57AC4C, 0x9B00DBD8],
+            ),
+            (
+                [0xFFFFFFFF] * 4,
+                [0xFFFFFFFF] * 2,
+                [0x408F276D, 0x41C83B0E, 0xA20BC7C6, 0x6D5451FD],
+            ),
+            (
+                [0x243F6A88, 0x85A308D3, 0x13198A2E, 0x03707344],
+                [0xA4093822, 0x299F31D0],
+                [0xD16CFE09, 0x94FDCCEB, 0x5001E420, 0x24126EA1],
+            ),
+        ],
+    )
+    def test_known_answer(self, counter, key, expected):
+        bg = Philox(counter=counter, key=key)
+        assert_array_equal(_words(bg.random_raw(2)), expected)
+
+    def test_counter_carry(self):
+        key = [1, 2]
+        raw = Philox(counter=2**64 - 1, key=key).random_raw(4)
+        expected = Philox(counter=2**64, key=key).random_raw(2)
+        assert_array_equal(raw[2:], expected)
+
+    def test_advance(self):
+        bg = Philox(1234)
+        expected = dpnp.asnumpy(bg.random_raw(8))[4:]
+
+        bg = Philox(1234).advance(2)
+        assert_array_equal(bg.random_raw(4), expected)
+
+    def test_jumped(self):
+        bg = Philox(1234)
+        jumped = bg.jumped(3)
+        assert jumped is not bg
+        assert jumped.seed_seq is bg.seed_seq
+
+        state = jumped.state["state"]
+        assert_array_equal(state["counter"], [0, 0, 3, 0])
+        assert_array_equal(state["key"], bg.state["state"]["key"])
+
+    def test_state(self):
+        bg = Philox(1234)
+        state = bg.state
+        expected = bg.random_raw(5)
+
+        bg.state = state
+        assert_array_equal(bg.random_raw(5), expected)
+
+    def test_state_error(self):
+        bg = Philox(1234)
+        with pytest.raises(ValueError):
+            bg.state = {"bit_generator": "MT19937", "state": {}}
+
+    def test_seed_and_key(self):
+        assert_raises(ValueError, Philox, 1, key=2)
+        assert_raises(ValueError, Philox, key=[1, 2, 3])
+        assert_raises(ValueError, Philox, counter=2**128)
+
+    def test_reproducible(self):
+        a = Philox(1234).random_raw(10)
+        b = Philox(1234).random_raw(10)
+        c = Philox(4321).random_raw(10)
+        assert_array_equal(a, b)
+        assert not dpnp.array_equal(a, c)
+
+    def test_spawn(self):
+        children = Philox(1234).spawn(3)
+        assert len(children) == 3
+        assert all(isinstance(child, Philox) for child in children)
+
+        raws = [dpnp.asnumpy(child.random_raw(4)) for child in children]
+        assert not numpy.array_equal(raws[0], raws[1])
+        assert not numpy.array_equal(raws[1], raws[2])
+
+    def test_base_class(self):
+        assert_raises(NotImplementedError, BitGenerator(1).random_raw, 2)
+
+
+class TestGenerator:
+    def test_default_rng(self):
+        rng = default_rng(1234)
+        assert isinstance(rng, Generator)
+        assert isinstance(rng.bit_generator, Philox)
+        assert default_rng(rng) is rng
+
+        bg = Philox(1234)
+        assert default_rng(bg).bit_generator is bg
+        assert_raises(TypeError, Generator, numpy.random.PCG64(1234))
+
+    @pytest.mark.parametrize("dtype", [None, dpnp.float32, dpnp.float64])
+    def test_random(self, dtype):
+        if dtype is dpnp.float64 and not has_support_aspect64():
+            pytest.skip("float64 is not supported by the device")
+
+        res = default_rng(1234).random(size=10**5, dtype=dtype)
+        if dtype is not None:
+            assert res.dtype == dtype
+        assert dpnp.all((res >= 0) & (res < 1))
+        assert_allclose(dpnp.mean(res), 0.5, atol=0.01)
+        assert_allclose(dpnp.var(res), 1 / 12, atol=0.01)
+
+    def test_random_out(self):
+        out = dpnp.empty((3, 4), dtype=dpnp.float32)
+        res = default_rng(1234).random(dtype=dpnp.float32, out=out)
+        assert res is out
+
+        expected = default_rng(1234).random(size=(3, 4), dtype=dpnp.float32)
+        assert_array_equal(out, expected)
+
+    @pytest.mark.skipif(not has_support_aspect64(), reason="Failed on Iris Xe")
+    @pytest.mark.parametrize(
+        "func", ["random", "standard_normal", "standard_exponential"]
+    )
+    def test_out_errors(self, func):
+        rng = default_rng(1234)
+        out = dpnp.empty((3, 4), dtype=dpnp.float32)
+        with pytest.raises(TypeError):
+            getattr(rng, func)(dtype=dpnp.float64, out=out)
+        with pytest.raises(ValueError):
+            getattr(rng, func)(size=(4, 3), out=out)
+        with pytest.raises(TypeError):
+            getattr(rng, func)(out=dpnp.empty(3, dtype=dpnp.int32))
+
+    @pytest.mark.parametrize("usm_type", list_of_usm_types)
+    def test_sycl_queue(self, usm_type):
+        sycl_queue = dpctl.SyclQueue()
+        rng = default_rng(1234, sycl_queue=sycl_queue)
+        res = rng.standard_normal(size=(2, 3), usm_type=usm_type)
+        assert res.sycl_queue == sycl_queue
+        assert res.usm_type == usm_type
+
+    def test_standard_normal(self):
+        res = default_rng(1234).standard_normal(size=10**5 + 1)
+        assert res.shape == (10**5 + 1,)
+        assert_allclose(dpnp.mean(res), 0.0, atol=0.01)
+        assert_allclose(dpnp.var(res), 1.0, atol=0.02)
+
+    def test_standard_exponential(self):
+        out = dpnp.empty(10**5, dtype=dpnp.float32)
+        res = default_rng(1234).standard_exponential(out=out)
+        assert res is out
+        assert dpnp.all(res >= 0)
+        assert_allclose(dpnp.mean(res), 1.0, atol=0.02)
+
+        expected = default_rng(1234).standard_exponential(
+            size=10**5, dtype=dpnp.float32
+        )
+        assert_array_equal(out, expected)
+
+    def test_normal(self):
+        rng = default_rng(1234)
+        res = rng.normal(loc=2.0, scale=3.0, size=10**5)
+        assert_allclose(dpnp.mean(res), 2.0, atol=0.05)
+        assert_allclose(dpnp.std(res), 3.0, atol=0.05)
+
+        loc = dpnp.array([-5.0, 5.0])
+        res = rng.normal(loc=loc, size=(10**4, 2))
+        assert_allclose(dpnp.mean(res, axis=0), loc, atol=0.1)
+        assert_raises(ValueError, rng.normal, scale=-1.0)
+
+    def test_uniform(self):
+        rng = default_rng(1234)
+        res = rng.uniform(low=-2.0, high=3.0, size=10**4)
+        assert dpnp.all((res >= -2.0) & (res < 3.0))
+
+        high = dpnp.array([1.0, 10.0])
+        res = rng.uniform(high=high, size=(10**4, 2))
+        assert dpnp.all(res < high)
+
+    @pytest.mark.parametrize("endpoint", [True, False])
+    @pytest.mark.parametrize(
+        "dtype", [dpnp.int8, dpnp.uint8, dpnp.int32, dpnp.int64]
+    )
+    def test_integers(self, dtype, endpoint):
+        res = default_rng(1234).integers(
+            2, 10, size=10**4, dtype=dtype, endpoint=endpoint
+        )
+        assert res.dtype == dtype
+
+        high = 10 if endpoint else 9
+        expected = numpy.arange(2, high + 1)
+        assert_array_equal(dpnp.unique(res), expected)
+
+    def test_integers_array_bounds(self):
+        high = dpnp.array([1, 5, 100])
+        res = default_rng(1234).integers(high, size=(1000, 3))
+        assert dpnp.all((res >= 0) & (res < high))
+
+    def test_integers_errors(self):
+        rng = default_rng(1234)
+        assert_raises(ValueError, rng.integers, 5, 5)
+        assert_raises(ValueError, rng.integers, 5, 4, endpoint=True)
+        assert_raises(ValueError, rng.integers, 0, 300, dtype=dpnp.uint8)
+        assert_raises(ValueError, rng.integers, -1, 3, dtype=dpnp.uint8)
+        assert_raises(TypeError, rng.integers, 5, dtype=dpnp.float32)
+
+    @pytest.mark.skipif(not has_support_aspect64(), reason="Failed on Iris Xe")
+    def test_gamma(self):
+        res = default_rng(1234).gamma(2.0, 3.0, size=10**5)
+        assert_allclose(dpnp.mean(res), 6.0, atol=0.1)
+        assert_allclose(dpnp.var(res), 18.0, atol=0.5)
+
+    def test_choice(self):
+        res = default_rng(1234).choice(5, size=5, replace=False)
+        assert_array_equal(dpnp.sort(res), numpy.arange(5))
+
+    def test_bytes(self):
+        res = default_rng(1234).bytes(10)
+        assert isinstance(res, bytes)
+        assert len(res) == 10
+
+    def test_spawn(self):
+        rng = default_rng(1234)
+        children = rng.spawn(2)
+        assert all(isinstance(child, Generator) for child in children)
+
+        a, b = (child.random(10) for child in children)
+        assert not dpnp.array_equal(a, b)
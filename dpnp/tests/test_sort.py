@@ -16,6 +16,76 @@ from .helper import (
 from .third_party.cupy import testing
 
 
+class TestArgpartition:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("kth", [0, 3, -1, (2, 7)])
+    def test_basic(self, dtype, kth):
+        a = generate_random_numpy_array(10, dtype)
+        ia = dpnp.array(a)
+
+        ind = dpnp.argpartition(ia, kth)
+        p = dpnp.take_along_axis(ia, ind, axis=-1)
+        expected = numpy.sort(a)
+        for k in numpy.atleast_1d(kth) % a.size:
+            assert_equal(p[k], expected[k])
+            assert (p[:k] <= p[k]).all()
+            assert (p[k] <= p[k + 1 :]).all()
+
+    @pytest.mark.parametrize(
+        "shape, axis", [((4001,), 0), ((3, 2500), -1), ((2600, 2), 0)]
+    )
+    @pytest.mark.parametrize(
+        "dtype", get_all_dtypes(no_none=True, no_bool=True, no_complex=True)
+    )
+    @pytest.mark.parametrize("kth", [[1], [-3, 17], [200, 1000, 2000]])
+    def test_selection(self, shape, axis, dtype, kth):
+        a = generate_random_numpy_array(shape, dtype)
+        ia = dpnp.array(a)
+
+        ind = dpnp.argpartition(ia, kth, axis=axis)
+        p = dpnp.moveaxis(dpnp.take_along_axis(ia, ind, axis=axis), axis, -1)
+        expected = numpy.moveaxis(numpy.sort(a, axis=axis), axis, -1)
+        for k in kth:
+            assert_equal(p[..., k], expected[..., k])
+            assert (p[..., :k] <= p[..., k : k + 1]).all()
+            assert (p[..., k : k + 1] <= p[..., k + 1 :]).all()
+
+        # indices are a permutation of the ones along the axis
+        ind = dpnp.sort(dpnp.moveaxis(ind, axis, -1), axis=-1)
+        expected = numpy.broadcast_to(numpy.arange(p.shape[-1]), p.shape)
+        assert_array_equal(ind, expected)
+
+    @pytest.mark.parametrize("axis", [None, 0, 1])
+    def test_method(self, axis):
+        a = generate_random_numpy_array((4, 5))
+        ia = dpnp.array(a)
+
+        result = ia.argpartition(2, axis=axis)
+        expected = dpnp.argpartition(ia, 2, axis=axis)
+        assert_array_equal(result, expected)
+
+    def test_empty(self):
+        a = numpy.empty((3, 0))
+        ia = dpnp.array(a)
+
+        result = dpnp.argpartition(ia, 0, axis=0)
+        expected = numpy.argpartition(a, 0, axis=0)
+        assert_equal(result, expected)
+
+    @pytest.mark.parametrize("xp", [dpnp, numpy])
+    def test_errors(self, xp):
+        a = xp.arange(10)
+        assert_raises(ValueError, xp.argpartition, a, 10)
+        assert_raises(ValueError, xp.argpartition, a, -11)
+        assert_raises(TypeError, xp.argpartition, a, 9.0)
+        assert_raises(AxisError, xp.argpartition, a, 2, axis=1)
+
+    def test_not_implemented_kwargs(self):
+        a = dpnp.arange(10)
+        assert_raises(NotImplementedError, a.argpartition, 2, kind="nonsense")
+        assert_raises(NotImplementedError, a.argpartition, 2, order=[])
+
+
 class TestArgsort:
     @pytest.mark.parametrize("kind", [None, "stable", "mergesort", "radixsort"])
     @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
@@ -444,6 +514,47 @@ class TestPartition:
         assert (p[..., 0:kth] <= p[..., kth : kth + 1]).all()
         assert (p[..., kth : kth + 1] <= p[..., kth + 1 :]).all()
 
+    @pytest.mark.parametrize(
+        "shape, axis", [((4001,), 0), ((3, 2500), -1), ((2600, 2, 2), 0)]
+    )
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("kth", [[0], [-1, 5], [1300, 1299], [7, 99, 2047]])
+    def test_selection(self, shape, axis, dtype, kth):
+        a = generate_random_numpy_array(shape, dtype)
+        ia = dpnp.array(a)
+
+        result = dpnp.partition(ia, kth, axis=axis)
+        expected = numpy.partition(a, kth, axis=axis)
+        p = numpy.moveaxis(result.asnumpy(), axis, -1)
+        expected = numpy.moveaxis(expected, axis, -1)
+        assert_array_equal(p[..., kth], expected[..., kth])
+        assert_array_equal(
+            numpy.sort(p, axis=-1), numpy.sort(expected, axis=-1)
+        )
+
+    @pytest.mark.parametrize("dtype", get_integer_dtypes())
+    def test_selection_duplicates(self, dtype):
+        a = generate_random_numpy_array((2, 5000), dtype, low=0, high=5)
+        ia = dpnp.array(a)
+        kth = [10, 2500, 4990]
+
+        result = dpnp.partition(ia, kth)
+        expected = numpy.partition(a, kth)
+        assert_array_equal(result[:, kth], expected[:, kth])
+        for k in kth:
+            assert (result[:, :k] <= result[:, k : k + 1]).all()
+            assert (result[:, k : k + 1] <= result[:, k + 1 :]).all()
+
+    def test_selection_nan(self):
+        a = generate_random_numpy_array(3000)
+        a[[5, 100, 2500]] = numpy.nan
+        ia = dpnp.array(a)
+        kth = [1500, 2999]
+
+        result = dpnp.partition(ia, kth)
+        expected = numpy.partition(a, kth)
+        assert_array_equal(result[kth], expected[kth])
+
     @pytest.mark.parametrize("axis", list(range(-4, 4)) + [None])
     def test_empty_array(self, axis):
         a = numpy.empty((3, 2, 1, 0))
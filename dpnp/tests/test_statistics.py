@@ -612,6 +612,30 @@ class TestCov:
         result = dpnp.cov(ia, ddof=1)
         assert_allclose(result, expected)
 
+    @pytest.mark.parametrize("dt", get_float_complex_dtypes())
+    @pytest.mark.parametrize("rowvar", [True, False])
+    @pytest.mark.parametrize("weighted", [True, False])
+    def test_chunked(self, monkeypatch, dt, rowvar, weighted):
+        # process the samples in chunks of 3 samples
+        monkeypatch.setattr(
+            dpnp.dpnp_utils.dpnp_utils_statistics, "_COV_CHUNK_SIZE", 12
+        )
+
+        shape = (3, 10) if rowvar else (10, 3)
+        a = generate_random_numpy_array(shape, dt, seed_value=81)
+        y = generate_random_numpy_array(10, dt, seed_value=76)
+        ia, iy = dpnp.array(a), dpnp.array(y)
+
+        kw, ikw = {}, {}
+        if weighted:
+            freq = numpy.arange(1, 11)
+            kw = {"fweights": freq, "aweights": freq / 10}
+            ikw = {key: dpnp.array(val) for key, val in kw.items()}
+
+        expected = numpy.cov(a, y, rowvar=rowvar, **kw)
+        result = dpnp.cov(ia, iy, rowvar=rowvar, **ikw)
+        assert_dtype_allclose(result, expected)
+
     @pytest.mark.parametrize("freq_data", [[1, 4, 1], [1, 1, 1]])
     def test_fweights(self, freq_data):
         a = numpy.array([0.0, 1.0, 2.0], ndmin=2)
@@ -908,6 +932,42 @@ class TestMean:
             dpnp.mean(ia, where=False)
 
 
+class TestMeanVar:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("axis", [None, 0, (0, 2)])
+    @pytest.mark.parametrize("keepdims", [True, False])
+    @pytest.mark.parametrize("ddof", [0, 1])
+    def test_basic(self, dtype, axis, keepdims, ddof):
+        a = generate_random_numpy_array((4, 3, 5), dtype)
+        ia = dpnp.array(a)
+
+        mean, var = dpnp.mean_var(ia, axis=axis, keepdims=keepdims, ddof=ddof)
+        assert_dtype_allclose(mean, numpy.mean(a, axis=axis, keepdims=keepdims))
+        assert_dtype_allclose(
+            var, numpy.var(a, axis=axis, keepdims=keepdims, ddof=ddof)
+        )
+
+    @pytest.mark.parametrize("dt_out", get_float_complex_dtypes())
+    def test_dtype(self, dt_out):
+        ia = dpnp.array([[0, 1, 2], [3, 4, 0]])
+        a = dpnp.asnumpy(ia)
+
+        mean, var = dpnp.mean_var(ia, axis=1, dtype=dt_out)
+        assert_allclose(mean, numpy.mean(a, axis=1, dtype=dt_out), rtol=1e-6)
+        assert_allclose(var, numpy.var(a, axis=1, dtype=dt_out), rtol=1e-6)
+
+    def test_error(self):
+        ia = dpnp.arange(5)
+        with pytest.raises(NotImplementedError):
+            dpnp.mean_var(ia, where=False)
+
+        with pytest.raises(ValueError):
+            dpnp.mean_var(ia, ddof=1, correction=1)
+
+        with pytest.raises(TypeError):
+            dpnp.mean_var(ia, ddof="1")
+
+
 class TestMedian:
     @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
     @pytest.mark.parametrize("size", [1, 2, 3, 4, 8, 9])
@@ -1065,6 +1125,153 @@ class TestPtp:
 
 
 @pytest.mark.parametrize("func", ["std", "var"])
+@pytest.mark.parametrize("func", ["percentile", "quantile"])
+class TestQuantile:
+    methods = [
+        "inverted_cdf",
+        "averaged_inverted_cdf",
+        "closest_observation",
+        "interpolated_inverted_cdf",
+        "hazen",
+        "weibull",
+        "linear",
+        "median_unbiased",
+        "normal_unbiased",
+        "lower",
+        "higher",
+        "midpoint",
+        "nearest",
+    ]
+
+    @staticmethod
+    def _get_q(func, q):
+        return numpy.asarray(q) * 100 if func == "percentile" else q
+
+    @pytest.mark.parametrize(
+        "dtype", get_all_dtypes(no_none=True, no_bool=True, no_complex=True)
+    )
+    @pytest.mark.parametrize("method", methods)
+    def test_basic(self, func, dtype, method):
+        a = generate_random_numpy_array((2, 3, 8), dtype)
+        ia = dpnp.array(a)
+        q = self._get_q(func, [0.0, 0.13, 0.5, 0.77, 1.0])
+
+        expected = getattr(numpy, func)(a, q, method=method)
+        result = getattr(dpnp, func)(ia, q, method=method)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("axis", [None, 0, (-1,), [0, 1], (0, -2, -1)])
+    @pytest.mark.parametrize("keepdims", [True, False])
+    @pytest.mark.parametrize("q", [0.25, [0.1, 0.9], [[0.3], [0.6]]])
+    def test_axis(self, func, axis, keepdims, q):
+        a = generate_random_numpy_array((2, 3, 4))
+        ia = dpnp.array(a)
+        q = self._get_q(func, q)
+
+        expected = getattr(numpy, func)(a, q, axis=axis, keepdims=keepdims)
+        result = getattr(dpnp, func)(ia, q, axis=axis, keepdims=keepdims)
+        assert_dtype_allclose(result, expected)
+
+    # few quantiles close to both ends are computed by selection
+    @pytest.mark.parametrize("method", methods)
+    @pytest.mark.parametrize(
+        "q", [0.01, [0.999, 0.99], [0.0, 0.02, 0.98, 1.0], [0.05, 0.5]]
+    )
+    def test_selection(self, func, method, q):
+        a = generate_random_numpy_array((3, 1001), low=-100, high=100)
+        ia = dpnp.array(a)
+        q = self._get_q(func, q)
+
+        expected = getattr(numpy, func)(a, q, axis=-1, method=method)
+        result = getattr(dpnp, func)(ia, q, axis=-1, method=method)
+        assert_dtype_allclose(result, expected)
+
+    # few interior quantiles of large data are computed by selection
+    @pytest.mark.parametrize("dtype", [numpy.int32, numpy.float32])
+    @pytest.mark.parametrize("method", ["linear", "lower", "midpoint"])
+    @pytest.mark.parametrize("q", [0.5, [0.25, 0.5, 0.75], [0.1, 0.9]])
+    def test_selection_interior(self, func, dtype, method, q):
+        a = generate_random_numpy_array((3, 4001), dtype, low=-50, high=50)
+        ia = dpnp.array(a)
+        q = self._get_q(func, q)
+
+        expected = getattr(numpy, func)(a, q, axis=-1, method=method)
+        result = getattr(dpnp, func)(ia, q, axis=-1, method=method)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("axis", [None, 0, -1])
+    def test_nan(self, func, axis):
+        a = generate_random_numpy_array((3, 1001))
+        a[0, 10] = a[2, -1] = numpy.nan
+        ia = dpnp.array(a)
+        q = self._get_q(func, [0.0, 0.01, 0.5])
+
+        expected = getattr(numpy, func)(a, q, axis=axis)
+        result = getattr(dpnp, func)(ia, q, axis=axis)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("axis", [None, 0, -1, (0, -2, -1)])
+    def test_overwrite_input(self, func, axis):
+        a = generate_random_numpy_array((2, 3, 4))
+        ia = dpnp.array(a)
+        q = self._get_q(func, [0.3, 0.7])
+
+        b = a.copy()
+        ib = ia.copy()
+        expected = getattr(numpy, func)(b, q, axis=axis, overwrite_input=True)
+        result = getattr(dpnp, func)(ib, q, axis=axis, overwrite_input=True)
+        assert not dpnp.all(ia == ib)
+        assert_dtype_allclose(result, expected)
+
+    @pytest.mark.parametrize("dtype", get_float_dtypes())
+    def test_out(self, func, dtype):
+        a = generate_random_numpy_array((4, 5), dtype)
+        ia = dpnp.array(a)
+        q = self._get_q(func, [0.3, 0.7])
+
+        out_np = numpy.empty((2, 5), dtype=dtype)
+        out_dp = dpnp.empty((2, 5), dtype=dtype)
+        expected = getattr(numpy, func)(a, q, axis=0, out=out_np)
+        result = getattr(dpnp, func)(ia, q, axis=0, out=out_dp)
+        assert result is out_dp
+        assert_dtype_allclose(result, expected)
+
+    def test_q_device_array(self, func):
+        a = generate_random_numpy_array(10)
+        ia = dpnp.array(a)
+        q = self._get_q(func, numpy.array([0.2, 0.4]))
+
+        expected = getattr(numpy, func)(a, q)
+        result = getattr(dpnp, func)(ia, dpnp.array(q))
+        assert_dtype_allclose(result, expected)
+
+    def test_error(self, func):
+        ia = dpnp.arange(10.0)
+        dpnp_func = getattr(dpnp, func)
+
+        # q is out of range
+        assert_raises(ValueError, dpnp_func, ia, self._get_q(func, 1.1))
+        assert_raises(ValueError, dpnp_func, ia, self._get_q(func, -0.1))
+
+        # q has too many dimensions
+        assert_raises(ValueError, dpnp_func, ia, dpnp.zeros((2, 2)))
+
+        # unknown method
+        assert_raises(ValueError, dpnp_func, ia, 0, method="deadbeef")
+
+        # complex input
+        assert_raises(TypeError, dpnp_func, ia.astype(dpnp.complex64), 0)
+
+        # weights are not supported
+        assert_raises(
+            NotImplementedError, dpnp_func, ia, 0, weights=dpnp.ones(10)
+        )
+
+        # q has a different queue
+        q = dpnp.array(0.5, sycl_queue=dpctl.SyclQueue())
+        assert_raises(ValueError, dpnp_func, ia, q)
+
+
 class TestStdVar:
     @pytest.mark.usefixtures(
         "suppress_divide_invalid_numpy_warnings", "suppress_dof_numpy_warnings"
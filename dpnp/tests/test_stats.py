@@ -0,0 +1,195 @@
+import numpy
+import pytest
+from numpy.testing import assert_array_equal, assert_raises
+
+import dpnp
+
+from .helper import (
+    assert_dtype_allclose,
+    generate_random_numpy_array,
+    get_all_dtypes,
+    get_float_complex_dtypes,
+    get_float_dtypes,
+    get_integer_float_dtypes,
+)
+
+
+def _chunks(a, n_chunks, axis=0):
+    return numpy.array_split(a, n_chunks, axis=axis)
+
+
+class TestOnlineMoments:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_bool=True))
+    @pytest.mark.parametrize("axis", [None, 0, 1])
+    def test_update(self, dtype, axis):
+        a = generate_random_numpy_array((10, 3), dtype)
+
+        m = dpnp.stats.OnlineMoments(axis=axis)
+        for chunk in _chunks(a, 4, axis=axis or 0):
+            m = m.update(dpnp.array(chunk))
+
+        assert m.count == (a.size if axis is None else a.shape[axis])
+        assert_dtype_allclose(m.mean(), numpy.mean(a, axis=axis))
+        assert_dtype_allclose(m.var(), numpy.var(a, axis=axis))
+        assert_dtype_allclose(m.std(ddof=1), numpy.std(a, axis=axis, ddof=1))
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_merge(self, dtype):
+        a = generate_random_numpy_array((12, 4), dtype)
+        parts = _chunks(a, 3)
+
+        m = dpnp.stats.OnlineMoments(axis=0)
+        for part in parts:
+            other = dpnp.stats.OnlineMoments(axis=0).update(dpnp.array(part))
+            m = m.merge(other)
+        m.merge(dpnp.stats.OnlineMoments(axis=0))
+
+        assert m.count == 12
+        assert_dtype_allclose(m.mean(), numpy.mean(a, axis=0))
+        assert_dtype_allclose(m.var(ddof=1), numpy.var(a, axis=0, ddof=1))
+
+    def test_host_chunks(self):
+        a = numpy.arange(20.0)
+
+        m = dpnp.stats.OnlineMoments()
+        for chunk in _chunks(a, 3):
+            m.update(chunk)
+
+        assert isinstance(m.mean(), dpnp.ndarray)
+        assert_dtype_allclose(m.mean(), numpy.mean(a))
+        assert_dtype_allclose(m.var(), numpy.var(a))
+
+    def test_error(self):
+        m = dpnp.stats.OnlineMoments(axis=0)
+        # no data has been accumulated
+        assert_raises(ValueError, m.mean)
+
+        m.update(dpnp.ones((2, 3)))
+        # chunk with different number of columns
+        assert_raises(ValueError, m.update, dpnp.ones((2, 4)))
+        # different axes
+        assert_raises(ValueError, m.merge, dpnp.stats.OnlineMoments())
+        # different types
+        assert_raises(TypeError, m.merge, dpnp.stats.OnlineHistogram(2, (0, 1)))
+
+
+class TestOnlineCovariance:
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_bool=True))
+    @pytest.mark.parametrize("rowvar", [True, False])
+    def test_update(self, dtype, rowvar):
+        shape = (3, 10) if rowvar else (10, 3)
+        a = generate_random_numpy_array(shape, dtype)
+
+        c = dpnp.stats.OnlineCovariance(rowvar=rowvar)
+        for chunk in _chunks(a, 4, axis=1 if rowvar else 0):
+            c = c.update(dpnp.array(chunk))
+
+        assert c.count == 10
+        axis = 1 if rowvar else 0
+        assert_dtype_allclose(c.mean(), numpy.mean(a, axis=axis))
+        assert_dtype_allclose(c.cov(), numpy.cov(a, rowvar=rowvar))
+        assert_dtype_allclose(
+            c.cov(ddof=0), numpy.cov(a, rowvar=rowvar, ddof=0)
+        )
+        assert_dtype_allclose(c.corrcoef(), numpy.corrcoef(a, rowvar=rowvar))
+
+    @pytest.mark.parametrize("dtype", get_float_complex_dtypes())
+    def test_merge(self, dtype):
+        a = generate_random_numpy_array((12, 3), dtype)
+
+        c = dpnp.stats.OnlineCovariance(rowvar=False)
+        for part in _chunks(a, 3):
+            other = dpnp.stats.OnlineCovariance(rowvar=False)
+            c.merge(other.update(dpnp.array(part)))
+
+        assert c.count == 12
+        assert_dtype_allclose(c.cov(), numpy.cov(a, rowvar=False))
+
+    def test_1d(self):
+        a = numpy.array([1.0, 4.0, 2.0, 8.0, 5.0])
+
+        c = dpnp.stats.OnlineCovariance()
+        c.update(a[:2]).update(a[2:])
+
+        assert_dtype_allclose(c.cov(), numpy.cov(a))
+        assert_dtype_allclose(c.corrcoef(), numpy.corrcoef(a))
+
+    def test_error(self):
+        c = dpnp.stats.OnlineCovariance()
+        # no data has been accumulated
+        assert_raises(ValueError, c.cov)
+        # more than 2 dimensions
+        assert_raises(ValueError, c.update, dpnp.ones((2, 2, 2)))
+
+        c.update(dpnp.ones((2, 3)))
+        # chunk with different number of variables
+        assert_raises(ValueError, c.update, dpnp.ones((3, 3)))
+
+
+class TestOnlineHistogram:
+    @pytest.mark.parametrize("dtype", get_integer_float_dtypes())
+    @pytest.mark.parametrize("density", [False, True])
+    def test_update(self, dtype, density):
+        a = generate_random_numpy_array(40, dtype, low=-5, high=5)
+        bins, range = 7, (-4, 4)
+
+        h = dpnp.stats.OnlineHistogram(bins, range)
+        for chunk in _chunks(a, 3):
+            h = h.update(dpnp.array(chunk))
+
+        result = h.histogram(density=density)
+        expected = numpy.histogram(a, bins, range, density=density)
+        assert h.count == 40
+        assert_dtype_allclose(result[0], expected[0])
+        assert_dtype_allclose(result[1], expected[1])
+
+    @pytest.mark.parametrize("dtype", get_float_dtypes())
+    def test_weights(self, dtype):
+        a = generate_random_numpy_array(30, dtype, low=0, high=10)
+        w = generate_random_numpy_array(30, dtype, low=0, high=1)
+        bins = numpy.array([0, 1, 2.5, 4, 10])
+
+        h = dpnp.stats.OnlineHistogram(dpnp.array(bins))
+        for chunk, w_chunk in zip(_chunks(a, 4), _chunks(w, 4)):
+            h.update(dpnp.array(chunk), weights=dpnp.array(w_chunk))
+
+        result, _ = h.histogram()
+        expected, _ = numpy.histogram(a, bins, weights=w)
+        assert_dtype_allclose(result, expected)
+
+    def test_merge(self):
+        a = numpy.arange(20) % 7
+        bins = [0, 2, 4, 6, 8]
+
+        h = dpnp.stats.OnlineHistogram(bins)
+        for part in _chunks(a, 3):
+            h.merge(dpnp.stats.OnlineHistogram(bins).update(part))
+
+        result, _ = h.histogram()
+        expected, _ = numpy.histogram(a, bins)
+        assert_array_equal(result, expected)
+
+    def test_empty(self):
+        h = dpnp.stats.OnlineHistogram(4, (0, 1))
+        result, bin_edges = h.histogram()
+        expected, expected_edges = numpy.histogram([], 4, (0, 1))
+        assert_array_equal(result, expected)
+        assert_dtype_allclose(bin_edges, expected_edges)
+
+    def test_error(self):
+        # range is required for integer bins
+        assert_raises(ValueError, dpnp.stats.OnlineHistogram, 4)
+        # bins must be positive
+        assert_raises(ValueError, dpnp.stats.OnlineHistogram, 0, (0, 1))
+        # bins must increase monotonically
+        assert_raises(ValueError, dpnp.stats.OnlineHistogram, [0, 2, 1])
+        # bins must be 1d
+        assert_raises(ValueError, dpnp.stats.OnlineHistogram, [[0, 1]])
+
+        h = dpnp.stats.OnlineHistogram([0, 1, 2])
+        # different bins
+        other = dpnp.stats.OnlineHistogram(2, (0, 2.5))
+        assert_raises(ValueError, h.merge, other)
+        # different number of bins
+        other = dpnp.stats.OnlineHistogram(3, (0, 2))
+        assert_raises(ValueError, h.merge, other)
@@ -1,3 +1,4 @@
+import dpctl
 import numpy
 import pytest
 from numpy.testing import (
@@ -10,6 +11,7 @@ from numpy.testing import (
 
 import dpnp
 import dpnp.backend.extensions.vm._vm_impl as vmi
+from dpnp.dpnp_algo.dpnp_elementwise_common import _DISPATCH_CACHE_SIZE
 from dpnp.dpnp_utils import map_dtype_to_device
 
 from .helper import (
@@ -643,3 +645,215 @@ def test_trigonometric_hyperbolic_aliases():
 
     a = dpnp.array([1, 1.5, 2])
     assert_array_equal(dpnp.arccosh(a), dpnp.acosh(a))
+
+
+class TestDispatchCache:
+    @pytest.mark.parametrize("func", ["sin", "negative", "sqrt", "isnan"])
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    def test_unary(self, func, dtype):
+        a = dpnp.array(generate_random_numpy_array(10, dtype))
+        dpnp_func = getattr(dpnp, func)
+
+        # `order="C"` bypasses the dispatch cache
+        try:
+            expected = dpnp_func(a, order="C")
+        except (TypeError, ValueError) as e:
+            assert_raises(type(e), dpnp_func, a)
+            return
+
+        for _ in range(2):
+            result = dpnp_func(a)
+            assert result.dtype == expected.dtype
+            assert_array_equal(result, expected)
+        assert len(dpnp_func._dispatch_cache) > 0
+
+    @pytest.mark.parametrize("func", ["add", "multiply", "less", "power"])
+    @pytest.mark.parametrize("dtype1", get_all_dtypes(no_none=True))
+    @pytest.mark.parametrize("dtype2", get_all_dtypes(no_none=True))
+    def test_binary(self, func, dtype1, dtype2):
+        a = dpnp.array(generate_random_numpy_array((3, 4), dtype1, low=0))
+        b = dpnp.array(generate_random_numpy_array((3, 4), dtype2, low=0))
+        dpnp_func = getattr(dpnp, func)
+
+        try:
+            expected = dpnp_func(a, b, order="C")
+        except ValueError:
+            assert_raises(ValueError, dpnp_func, a, b)
+            return
+
+        for _ in range(2):
+            result = dpnp_func(a, b)
+            assert result.dtype == expected.dtype
+            assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize("func", ["add", "subtract", "equal", "divide"])
+    @pytest.mark.parametrize("scalar", [True, 3, -2.5, 1 + 2j, 2**40])
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    def test_scalar(self, func, scalar, dtype):
+        a = dpnp.array(generate_random_numpy_array(7, dtype, low=0))
+        dpnp_func = getattr(dpnp, func)
+
+        for args in [(a, scalar), (scalar, a)]:
+            try:
+                expected = dpnp_func(*args, order="C")
+            except (TypeError, ValueError, OverflowError) as e:
+                assert_raises(type(e), dpnp_func, *args)
+                continue
+
+            for _ in range(2):
+                result = dpnp_func(*args)
+                assert result.dtype == expected.dtype
+                assert_array_equal(result, expected)
+
+    def test_not_cached_layouts(self):
+        a = dpnp.arange(12.0).reshape(3, 4)
+        b = dpnp.arange(4.0)
+
+        # broadcasting, F-contiguous and strided arrays use generic path
+        assert_array_equal(dpnp.add(a, b), a.asnumpy() + b.asnumpy())
+        assert dpnp.sin(a.T).flags.f_contiguous
+        assert_array_equal(dpnp.sin(a.T), numpy.sin(a.asnumpy().T))
+        assert_array_equal(dpnp.add(a[:, ::2], 1), a.asnumpy()[:, ::2] + 1)
+
+        # different USM types
+        c = dpnp.arange(12.0, usm_type="host").reshape(3, 4)
+        result = dpnp.add(a, c)
+        assert result.usm_type == "device"
+        assert_array_equal(result, 2 * a.asnumpy())
+
+    def test_bounded(self):
+        a = dpnp.arange(10.0)
+        size = _DISPATCH_CACHE_SIZE
+
+        # every new queue adds an entry, the least recently used is evicted
+        for _ in range(size + 5):
+            b = dpnp.asarray(a, sycl_queue=dpctl.SyclQueue())
+            assert_array_equal(dpnp.cos(b), numpy.cos(a.asnumpy()))
+            assert_array_equal(dpnp.add(b, b), 2 * a.asnumpy())
+        assert len(dpnp.cos._dispatch_cache) <= size
+        assert len(dpnp.add._dispatch_cache) <= size
+
+
+class TestWhere:
+    @pytest.mark.parametrize("func", ["sqrt", "negative", "isnan"])
+    @pytest.mark.parametrize("dtype", get_float_dtypes())
+    def test_unary_out(self, func, dtype):
+        a = generate_random_numpy_array((4, 5), dtype, low=0)
+        mask = numpy.arange(20).reshape(4, 5) % 3 == 0
+        ia, imask = dpnp.array(a), dpnp.array(mask)
+
+        expected = getattr(numpy, func)(a)
+        out = numpy.zeros_like(expected)
+        iout = dpnp.array(out)
+
+        result = getattr(dpnp, func)(ia, out=iout, where=imask)
+        assert result is iout
+        getattr(numpy, func)(a, out=out, where=mask)
+        assert_dtype_allclose(result, out)
+
+    @pytest.mark.parametrize("func", ["add", "multiply", "less"])
+    @pytest.mark.parametrize("dtype", get_all_dtypes(no_none=True))
+    def test_binary_out(self, func, dtype):
+        a = generate_random_numpy_array((3, 4), dtype)
+        b = generate_random_numpy_array((3, 4), dtype)
+        mask = numpy.array([True, False, False, True])
+        ia, ib, imask = dpnp.array(a), dpnp.array(b), dpnp.array(mask)
+
+        expected = getattr(numpy, func)(a, b)
+        out = numpy.ones_like(expected)
+        iout = dpnp.array(out)
+
+        # the mask is broadcast over the inputs
+        result = getattr(dpnp, func)(ia, ib, out=iout, where=imask)
+        assert result is iout
+        getattr(numpy, func)(a, b, out=out, where=mask)
+        assert_array_equal(result, out)
+
+    @pytest.mark.parametrize("scalar", [2, 2.5])
+    def test_scalar(self, scalar):
+        a = numpy.arange(10, dtype="f4")
+        mask = a > 4
+        ia, imask = dpnp.array(a), dpnp.array(mask)
+
+        out = numpy.zeros_like(a)
+        iout = dpnp.array(out)
+        result = dpnp.multiply(scalar, ia, out=iout, where=imask)
+        numpy.multiply(scalar, a, out=out, where=mask)
+        assert_array_equal(result, out)
+
+    def test_inplace(self):
+        a = numpy.arange(12, dtype="i4").reshape(3, 4)
+        b = numpy.full((3, 4), 5, dtype="i4")
+        mask = a % 2 == 0
+        ia, ib, imask = dpnp.array(a), dpnp.array(b), dpnp.array(mask)
+
+        result = dpnp.add(ia, ib, out=ia, where=imask)
+        assert result is ia
+        numpy.add(a, b, out=a, where=mask)
+        assert_array_equal(ia, a)
+
+    @pytest.mark.parametrize("where", [False, numpy.False_])
+    def test_scalar_false(self, where):
+        a = dpnp.arange(5, dtype="f4")
+        out = dpnp.full(5, -1, dtype="f4")
+
+        result = dpnp.sin(a, out=out, where=where)
+        assert result is out
+        assert (out == -1).all()
+
+        result = dpnp.sin(a, where=where)
+        assert result.shape == a.shape
+        assert result.dtype == dpnp.sin(a).dtype
+
+    @pytest.mark.parametrize("where", [True, numpy.True_])
+    def test_scalar_true(self, where):
+        a = dpnp.arange(5, dtype="f4")
+        assert_array_equal(dpnp.cos(a, where=where), dpnp.cos(a))
+
+    def test_no_out(self):
+        a = numpy.arange(6, dtype="f4")
+        mask = a > 2
+        ia, imask = dpnp.array(a), dpnp.array(mask)
+
+        result = dpnp.exp(ia, where=imask)
+        assert result.shape == a.shape
+        assert_dtype_allclose(result[imask], numpy.exp(a[mask]))
+
+    def test_dtype(self):
+        a = numpy.arange(6, dtype="i4")
+        mask = a < 4
+        ia, imask = dpnp.array(a), dpnp.array(mask)
+
+        result = dpnp.sqrt(ia, where=imask, dtype="f4")
+        assert result.dtype == numpy.float32
+        assert_dtype_allclose(result[imask], numpy.sqrt(a[mask], dtype="f4"))
+
+    def test_usm_type(self):
+        a = dpnp.arange(6, dtype="f4", usm_type="host")
+        mask = dpnp.array([True, False] * 3, usm_type="shared")
+        result = dpnp.square(a, where=mask)
+        assert result.usm_type == "shared"
+
+    def test_error(self):
+        a = dpnp.arange(6, dtype="f4")
+        out = dpnp.empty(6, dtype="f4")
+
+        # non-boolean mask
+        assert_raises(TypeError, dpnp.sin, a, where=dpnp.ones(6, dtype="i4"))
+        assert_raises(TypeError, dpnp.add, a, a, where=1)
+        assert_raises(TypeError, dpnp.add, a, a, where=[True] * 6)
+
+        # the mask can't be broadcast to the result shape
+        mask = dpnp.ones(4, dtype="?")
+        assert_raises(ValueError, dpnp.sin, a, where=mask)
+
+        # output array of wrong shape or data type
+        mask = dpnp.ones(6, dtype="?")
+        out = dpnp.empty(5, dtype="f4")
+        assert_raises(ValueError, dpnp.sin, a, out=out, where=mask)
+        out = dpnp.empty(6, dtype="i4")
+        assert_raises(ValueError, dpnp.add, a, a, out=out, where=mask)
+
+        # arrays allocated on different queues
+        mask = dpnp.ones(6, dtype="?", sycl_queue=dpctl.SyclQueue())
+        assert_raises(ValueError, dpnp.sin, a, where=mask)
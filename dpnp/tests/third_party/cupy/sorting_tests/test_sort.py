@@ -610,7 +610,6 @@ class TestPartition(unittest.TestCase):
         }
     )
 )
-@pytest.mark.skip("not supported yet")
 class TestArgpartition(unittest.TestCase):
 
     def argpartition(self, a, kth, axis=-1):
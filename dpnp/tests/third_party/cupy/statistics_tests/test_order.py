@@ -12,10 +12,10 @@ import dpnp as cupy
 from dpnp.tests.third_party.cupy import testing
 
 _all_methods = (
-    # 'inverted_cdf',               # TODO(takagi) Not implemented
-    # 'averaged_inverted_cdf',      # TODO(takagi) Not implemented
-    # 'closest_observation',        # TODO(takagi) Not implemented
-    # 'interpolated_inverted_cdf',  # TODO(takagi) Not implemented
+    "inverted_cdf",
+    "averaged_inverted_cdf",
+    "closest_observation",
+    "interpolated_inverted_cdf",
     "hazen",
     "weibull",
     "linear",
@@ -51,7 +51,6 @@ def for_all_methods(name="method"):
     return pytest.mark.parametrize(name, _all_methods)
 
 
-@pytest.mark.skip("dpnp.quantile() is not implemented yet")
 @testing.with_requires("numpy>=1.22.0rc1")
 class TestQuantile:
 
@@ -64,6 +63,7 @@ class TestQuantile:
                 xp.percentile(a, q, axis=-1, method="deadbeef")
 
     # See gh-4453
+    @pytest.mark.skip("CUDA allocator is not supported")
     @testing.for_float_dtypes()
     def test_percentile_memory_access(self, dtype):
         # Create an allocator that guarantees array allocated in
@@ -101,7 +101,6 @@ class TestQuantile:
                 xp.quantile(a, q, axis=-1, method="deadbeef")
 
 
-@pytest.mark.skip("dpnp.quantile() is not implemented yet")
 @pytest.mark.usefixtures("_fix_gamma")
 @testing.with_requires("numpy>=2.0")
 @for_all_methods()
@@ -432,7 +431,6 @@ class TestOrder:
 # See gh-4607
 # "Magic" values used in this test were empirically found to result in
 # non-monotonicity for less accurate linear interpolation formulas
-@pytest.mark.skip("dpnp.percentile() is not implemented yet")
 @testing.parameterize(
     *testing.product(
         {
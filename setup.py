@@ -42,8 +42,10 @@ skbuild.setup(
         "dpnp.memory",
         "dpnp.random",
         "dpnp.scipy",
+        "dpnp.scipy.fft",
         "dpnp.scipy.linalg",
         "dpnp.scipy.special",
+        "dpnp.stats",
     ],
     package_data={
         "dpnp": [